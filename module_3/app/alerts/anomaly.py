@@ -0,0 +1,184 @@
+"""수집 경로에서 실행되는 온라인 이상 탐지 (EWMA z-score)"""
+import math
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.alerts.engine import extract
+from app.storage.base import to_epoch
+
+# 메트릭 타입별 이상 점수를 계산할 필드 (누적 카운터 대신 수집기가 계산한 초당 변화량 사용)
+ANOMALY_FIELDS: Dict[str, tuple] = {
+    'cpu': ('cpu_percent', 'cpu_freq_current'),
+    'memory': ('memory_percent', 'swap_percent'),
+    'disk': tuple(f'io_{rate}' for rate in (
+        'read_bytes_per_sec', 'write_bytes_per_sec', 'read_ops_per_sec', 'write_ops_per_sec'
+    )),
+    'network': tuple(f'{counter}_per_sec' for counter in (
+        'bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv', 'errin', 'errout', 'dropin', 'dropout'
+    )),
+}
+
+# 표준편차 하한 (평균 크기에 대한 비율 + 필드 단위의 절대값). 값이 거의 일정한 필드의 작은 변화가
+# 무한대 점수가 되지 않도록 함
+_MIN_STD_RATIO = 0.01
+_MIN_STD = 1e-6
+
+# 필드별 표준편차 절대 하한 (필드 단위). 에러/드롭처럼 거의 항상 0인 카운터는 분산이 0에 머물러
+# 초당 1건에도 큰 점수가 나오므로, 이 값 이하의 변화는 의미 있는 이상으로 보지 않음
+_FIELD_MIN_STD: Dict[str, float] = {
+    'cpu_percent': 0.5,
+    'cpu_freq_current': 50.0,
+    'memory_percent': 0.5,
+    'swap_percent': 0.5,
+    'io_read_bytes_per_sec': 64 * 1024,
+    'io_write_bytes_per_sec': 64 * 1024,
+    'io_read_ops_per_sec': 5.0,
+    'io_write_ops_per_sec': 5.0,
+    'bytes_sent_per_sec': 16 * 1024,
+    'bytes_recv_per_sec': 16 * 1024,
+    'packets_sent_per_sec': 10.0,
+    'packets_recv_per_sec': 10.0,
+    'errin_per_sec': 1.0,
+    'errout_per_sec': 1.0,
+    'dropin_per_sec': 1.0,
+    'dropout_per_sec': 1.0,
+}
+
+
+class EWStats:
+    """
+    필드 하나의 지수 가중 이동 평균과 분산 (고정 메모리).
+
+    처음에는 가중치를 1/n으로 두어 단순 누적 평균/분산과 같게 시작하고, 1/n이 alpha보다
+    작아지면 alpha로 고정하여 최근 값 위주로 기준선을 따라갑니다.
+    """
+
+    __slots__ = ('mean', 'var', 'count', 'min_std')
+
+    def __init__(self, min_std: float = _MIN_STD):
+        """
+        Args:
+            min_std: 표준편차 절대 하한 (필드 단위)
+        """
+        self.mean = 0.0
+        self.var = 0.0
+        self.count = 0
+        self.min_std = min_std
+
+    def score(self, value: float) -> float:
+        """현재 기준선에 대한 값의 z-score (값을 반영하기 전에 계산)"""
+        std = max(math.sqrt(self.var), abs(self.mean) * _MIN_STD_RATIO + self.min_std)
+        return (value - self.mean) / std
+
+    def update(self, value: float, alpha: float):
+        """값을 기준선에 반영합니다."""
+        self.count += 1
+        weight = max(alpha, 1.0 / self.count)
+        diff = value - self.mean
+        increment = weight * diff
+        self.mean += increment
+        self.var = (1.0 - weight) * (self.var + diff * increment)
+
+
+class AnomalyDetector:
+    """
+    저장되는 샘플마다 필드별 이상 점수(z-score)를 계산합니다.
+
+    필드마다 EWStats 하나만 보관하므로 메모리는 필드 수에 비례하고 이력 길이와 무관합니다.
+    점수는 샘플을 반영하기 전의 기준선으로 계산하며, 반영할 때는 값을 기준선 ±clip 표준편차로
+    잘라 한 번의 급등이 분산을 키워 이후의 이상을 가리지 않도록 합니다 (지속되는 수준 변화는
+    분산이 점차 커지며 따라감). 샘플이 warmup개 쌓이기 전에는 점수를 0으로 둡니다.
+
+    수집 틱마다 score()가 반환하는 행을 'anomaly' 메트릭으로 저장하면 다른 메트릭처럼
+    조회하고 알림 규칙(예: ``anomaly.max_score > 6 for 30s``)에 사용할 수 있습니다.
+    수집 스레드에서만 호출된다고 가정합니다.
+    """
+
+    def __init__(self, alpha: float = 0.02, warmup: int = 30, clip: float = 6.0):
+        """
+        Args:
+            alpha: 기준선 가중치 (클수록 최근 값을 빨리 따라감)
+            warmup: 점수를 내기 전에 쌓을 샘플 수 (최소 2)
+            clip: 기준선에 반영할 때 값을 자를 표준편차 배수
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha = alpha
+        self.warmup = max(warmup, 2)
+        self.clip = clip
+        self._stats: Dict[str, Dict[str, EWStats]] = {
+            metric_type: {field: EWStats(_FIELD_MIN_STD.get(field, _MIN_STD)) for field in fields}
+            for metric_type, fields in ANOMALY_FIELDS.items()
+        }
+
+    def observe(self, metric_type: str, data: Dict[str, Any]) -> Dict[str, float]:
+        """
+        샘플 하나의 필드별 점수를 계산하고 기준선에 반영합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            data: 메트릭 데이터
+
+        Returns:
+            Dict[str, float]: 필드별 z-score (값이 없거나 warmup 중이면 0.0)
+        """
+        stats = self._stats.get(metric_type)
+        if stats is None:
+            return {}
+
+        scores = {}
+        for field, field_stats in stats.items():
+            value = extract(data, (field,))
+            if value is None or value != value or value in (math.inf, -math.inf):
+                scores[field] = 0.0
+                continue
+            if field_stats.count < self.warmup:
+                scores[field] = 0.0
+                field_stats.update(value, self.alpha)
+                continue
+            score = field_stats.score(value)
+            scores[field] = score
+            if abs(score) > self.clip:
+                # 기준선 ±clip 표준편차로 잘라 반영 ((value - mean) / score가 표준편차)
+                value = field_stats.mean + math.copysign(self.clip, score) * (value - field_stats.mean) / score
+            field_stats.update(value, self.alpha)
+        return scores
+
+    def score(self, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        수집 틱 하나의 결과로 'anomaly' 행을 만듭니다.
+
+        빠진 메트릭 타입도 점수 0으로 채우므로 행의 필드 구성은 항상 같습니다.
+
+        Args:
+            results: 메트릭 타입별 이번 틱의 데이터
+
+        Returns:
+            Dict[str, Any]: timestamp, max_score(절대값이 가장 큰 점수의 절대값),
+                메트릭 타입별 {필드: z-score}
+        """
+        timestamps = [to_epoch(data['timestamp']) for data in results.values() if 'timestamp' in data]
+        row: Dict[str, Any] = {
+            'timestamp': datetime.fromtimestamp(max(timestamps)) if timestamps else datetime.now()
+        }
+        max_score = 0.0
+        for metric_type, fields in ANOMALY_FIELDS.items():
+            data = results.get(metric_type)
+            scores = self.observe(metric_type, data) if data is not None else dict.fromkeys(fields, 0.0)
+            row[metric_type] = scores
+            for value in scores.values():
+                max_score = max(max_score, abs(value))
+        row['max_score'] = max_score
+        return row
+
+    def get_baseline(self, metric_type: str, field: str) -> Optional[Dict[str, float]]:
+        """
+        필드의 현재 기준선을 반환합니다.
+
+        Returns:
+            Optional[Dict[str, float]]: mean, std, count (알 수 없는 필드면 None)
+        """
+        field_stats = self._stats.get(metric_type, {}).get(field)
+        if field_stats is None:
+            return None
+        return {'mean': field_stats.mean, 'std': math.sqrt(field_stats.var), 'count': field_stats.count}
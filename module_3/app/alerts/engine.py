@@ -0,0 +1,324 @@
+"""수집 경로에서 실행되는 스트리밍 알림 평가기"""
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from app.alerts.rules import OPERATORS, AlertRule
+from app.alerts.windows import create_window
+from app.storage.base import to_epoch
+
+logger = logging.getLogger(__name__)
+
+# 알림 상태
+INACTIVE = 'inactive'
+PENDING = 'pending'
+FIRING = 'firing'
+STATES = (INACTIVE, PENDING, FIRING)
+
+
+def extract(data: Any, path: Tuple[str, ...]) -> Optional[float]:
+    """
+    메트릭 데이터에서 경로의 숫자 값을 꺼냅니다.
+
+    Args:
+        data: 메트릭 데이터 (중첩된 딕셔너리/리스트)
+        path: 필드 경로 (리스트 인덱스는 숫자 문자열)
+
+    Returns:
+        Optional[float]: 숫자 값 (경로가 없거나 숫자가 아니면 None)
+    """
+    for key in path:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    value_type = type(data)
+    if value_type is int or value_type is float:
+        return data
+    return None
+
+
+class AlertState:
+    """규칙 하나의 현재 상태"""
+
+    __slots__ = ('rule', 'signal', 'state', 'since', 'active_since', 'clear_since')
+
+    def __init__(self, rule: AlertRule):
+        self.rule = rule
+        self.signal: Optional['_Signal'] = None
+        self.state = INACTIVE
+        # 현재 상태가 시작된 시각
+        self.since: Optional[float] = None
+        # 조건이 참이 된 시각 (pending/firing 동안 유지)
+        self.active_since: Optional[float] = None
+        # 발생 중 조건이 거짓이 된 시각 (해제 대기)
+        self.clear_since: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        evaluated_at = self.signal.evaluated_at if self.signal else None
+        return {
+            **self.rule.to_dict(),
+            'state': self.state,
+            'since': datetime.fromtimestamp(self.since) if self.since is not None else None,
+            'active_since': datetime.fromtimestamp(self.active_since) if self.active_since is not None else None,
+            'value': self.signal.value if self.signal else None,
+            'evaluated_at': datetime.fromtimestamp(evaluated_at) if evaluated_at is not None else None
+        }
+
+
+class _Signal:
+    """
+    신호 하나(메트릭 타입, 필드, 함수, 윈도우)의 실행 윈도우와 규칙 인덱스.
+
+    규칙을 연산자별 임계값 정렬 배열에 넣어 두므로, 조건이 참인 규칙은 신호 값으로 이진 탐색한
+    구간으로 바로 얻습니다. 조건이 거짓일 때 상태가 바뀔 수 있는 규칙은 pending/firing 규칙뿐이므로
+    그 집합(active)만 따로 확인합니다.
+    """
+
+    __slots__ = ('key', 'path', 'window', 'value', 'evaluated_at', '_thresholds', '_members', 'active')
+
+    def __init__(self, key: tuple, window: Any, states: List[AlertState]):
+        self.key = key
+        self.path = key[1]
+        self.window = window
+        self.value: Optional[float] = None
+        self.evaluated_at: Optional[float] = None
+        self._thresholds: Dict[str, List[float]] = {}
+        self._members: Dict[str, List[AlertState]] = {}
+        for op in OPERATORS:
+            members = sorted((state for state in states if state.rule.op == op), key=lambda state: state.rule.threshold)
+            self._thresholds[op] = [state.rule.threshold for state in members]
+            self._members[op] = members
+        self.active = {state for state in states if state.state != INACTIVE}
+        for state in states:
+            state.signal = self
+
+    def matching(self, value: float) -> List[AlertState]:
+        """신호 값에 대해 조건이 참인 규칙 (연산자별 정렬 배열을 이진 탐색)"""
+        thresholds = self._thresholds
+        members = self._members
+        return (
+            members['>'][:bisect_left(thresholds['>'], value)]
+            + members['>='][:bisect_right(thresholds['>='], value)]
+            + members['<'][bisect_right(thresholds['<'], value):]
+            + members['<='][bisect_left(thresholds['<='], value):]
+        )
+
+
+class AlertEngine:
+    """
+    저장되는 샘플마다 알림 규칙을 증분 평가합니다.
+
+    같은 신호(필드, 함수, 윈도우)를 쓰는 규칙은 실행 윈도우 하나를 공유하며(샘플당 분할 상환 O(1)),
+    신호마다 규칙을 임계값 정렬 배열로 색인합니다. 샘플 하나의 비용은 신호 수 x log(규칙 수)에
+    조건이 참이거나 pending/firing 상태인 규칙 수를 더한 만큼이며, 스토리지를 다시 조회하지 않습니다.
+
+    상태는 inactive -> pending(조건 참, for 대기) -> firing(발생) -> inactive(해제) 순으로 바뀌며,
+    전이마다 이벤트를 최근 max_events개까지 보관합니다.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule] = (), max_events: int = 1000):
+        """
+        Args:
+            rules: 알림 규칙 목록
+            max_events: 보관할 최근 상태 전이 이벤트 수
+        """
+        self._lock = threading.Lock()
+        self._events: deque = deque(maxlen=max_events)
+        self._event_id = 0
+        self._evaluations = 0
+        self._states: Dict[str, AlertState] = {}
+        self._signals: Dict[tuple, _Signal] = {}
+        # 메트릭 타입별 신호 목록
+        self._groups: Dict[str, List[_Signal]] = {}
+        self.set_rules(rules)
+
+    def set_rules(self, rules: Iterable[AlertRule]):
+        """
+        규칙 목록을 교체합니다.
+
+        이름과 규칙 식이 같은 규칙은 상태를 유지하고, 신호가 같은 윈도우는 누적값을 유지합니다.
+
+        Raises:
+            ValueError: 규칙 이름이 중복된 경우
+        """
+        rules = list(rules)
+        names = [rule.name for rule in rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate alert rule names")
+
+        with self._lock:
+            states: Dict[str, AlertState] = {}
+            members: Dict[tuple, List[AlertState]] = {}
+            for rule in rules:
+                previous = self._states.get(rule.name)
+                if previous is not None and previous.rule.expression == rule.expression:
+                    previous.rule = rule
+                    state = previous
+                else:
+                    state = AlertState(rule)
+                states[rule.name] = state
+                members.setdefault(rule.signal, []).append(state)
+
+            signals: Dict[tuple, _Signal] = {}
+            groups: Dict[str, List[_Signal]] = {}
+            for key, signal_states in members.items():
+                previous = self._signals.get(key)
+                rule = signal_states[0].rule
+                window = previous.window if previous else create_window(rule.function, rule.window)
+                signal = _Signal(key, window, signal_states)
+                if previous is not None:
+                    signal.value = previous.value
+                    signal.evaluated_at = previous.evaluated_at
+                signals[key] = signal
+                groups.setdefault(rule.metric_type, []).append(signal)
+
+            self._states = states
+            self._signals = signals
+            self._groups = groups
+
+    def observe(self, metric_type: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        저장된 샘플로 해당 메트릭 타입의 규칙을 평가합니다 (save_metric 직후 호출).
+
+        Args:
+            metric_type: 메트릭 타입
+            data: 메트릭 데이터 ('timestamp' 포함, 없으면 현재 시각)
+
+        Returns:
+            List[Dict[str, Any]]: 이번 샘플로 발생한 상태 전이 이벤트
+        """
+        signals = self._groups.get(metric_type)
+        if not signals:
+            return []
+        timestamp = to_epoch(data['timestamp']) if 'timestamp' in data else datetime.now().timestamp()
+
+        events = []
+        with self._lock:
+            for signal in signals:
+                value = extract(data, signal.path)
+                if value is None:
+                    continue
+                value = signal.window.update(timestamp, value)
+                if value is None or value != value:
+                    continue
+                signal.value = value
+                signal.evaluated_at = timestamp
+
+                matching = signal.matching(value)
+                # 조건이 거짓이 된 pending/firing 규칙 (평가 전에 구해야 이번에 참이 된 규칙이 섞이지 않음)
+                unmatched = signal.active.difference(matching) if signal.active else ()
+                for state in matching:
+                    event = self._evaluate(state, timestamp, True)
+                    if event is not None:
+                        events.append(event)
+                for state in unmatched:
+                    event = self._evaluate(state, timestamp, False)
+                    if event is not None:
+                        events.append(event)
+                self._evaluations += len(matching) + len(unmatched)
+        return events
+
+    def _evaluate(self, state: AlertState, timestamp: float, matched: bool) -> Optional[Dict[str, Any]]:
+        rule = state.rule
+
+        if matched:
+            state.clear_since = None
+            if state.state == FIRING:
+                return None
+            if state.active_since is None:
+                state.active_since = timestamp
+            if timestamp - state.active_since >= rule.for_seconds:
+                return self._transition(state, FIRING, timestamp)
+            if state.state == INACTIVE:
+                return self._transition(state, PENDING, timestamp)
+            return None
+
+        if state.state == FIRING:
+            if state.clear_since is None:
+                state.clear_since = timestamp
+            if timestamp - state.clear_since < rule.clear_seconds:
+                return None
+        if state.state == INACTIVE:
+            return None
+        state.active_since = None
+        state.clear_since = None
+        return self._transition(state, INACTIVE, timestamp)
+
+    def _transition(self, state: AlertState, new_state: str, timestamp: float) -> Dict[str, Any]:
+        self._event_id += 1
+        event = {
+            'id': self._event_id,
+            'rule': state.rule.name,
+            'from': state.state,
+            'to': new_state,
+            'value': state.signal.value,
+            'timestamp': datetime.fromtimestamp(timestamp)
+        }
+        state.state = new_state
+        state.since = timestamp
+        if new_state == INACTIVE:
+            state.signal.active.discard(state)
+        else:
+            state.signal.active.add(state)
+        self._events.append(event)
+        if new_state == FIRING:
+            logger.warning(f"Alert firing: {state.rule.name} (value={state.signal.value})")
+        elif event['from'] == FIRING:
+            logger.info(f"Alert resolved: {state.rule.name}")
+        return event
+
+    def get_alerts(self, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        규칙별 현재 상태를 반환합니다.
+
+        Args:
+            state: 이 상태의 규칙만 반환 (None이면 전체)
+
+        Returns:
+            List[Dict[str, Any]]: 규칙 정의와 state, since, active_since, value, evaluated_at
+        """
+        with self._lock:
+            return [
+                alert.to_dict() for alert in self._states.values()
+                if state is None or alert.state == state
+            ]
+
+    def get_events(self, since_id: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        since_id 이후의 상태 전이 이벤트를 오래된 순으로 반환합니다.
+
+        Args:
+            since_id: 클라이언트가 마지막으로 받은 이벤트 id (처음이면 0)
+            limit: 최대 반환 개수 (초과하면 최근 이벤트 우선)
+
+        Returns:
+            List[Dict[str, Any]]: id, rule, from, to, value, timestamp
+        """
+        with self._lock:
+            events = [event for event in self._events if event['id'] > since_id]
+        if limit and limit > 0:
+            events = events[-limit:]
+        return events
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        평가기 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: rules(규칙 수), signals(실행 윈도우 수), evaluations(누적 규칙 평가 수),
+                firing(발생 중인 규칙 수), events(누적 이벤트 수)
+        """
+        with self._lock:
+            return {
+                'rules': len(self._states),
+                'signals': len(self._signals),
+                'evaluations': self._evaluations,
+                'firing': sum(1 for state in self._states.values() if state.state == FIRING),
+                'events': self._event_id
+            }
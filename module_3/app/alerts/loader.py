@@ -0,0 +1,135 @@
+"""알림 규칙 파일 로더 (재시작 없이 다시 읽기)"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from app.alerts.engine import AlertEngine
+from app.alerts.rules import AlertRule, parse_rule
+
+logger = logging.getLogger(__name__)
+
+
+def load_rules(path: str) -> List[AlertRule]:
+    """
+    JSON 규칙 파일을 읽습니다.
+
+    파일은 규칙 식 문자열 또는 {"name": 이름, "rule": 규칙 식} 객체의 배열입니다.
+    예: ``["cpu_percent > 90 for 60s", {"name": "swap-growth", "rule": "swap_percent rate > 0.5"}]``
+
+    Args:
+        path: 규칙 파일 경로
+
+    Returns:
+        List[AlertRule]: 파싱된 규칙 목록
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        ValueError: JSON 또는 규칙 식 형식이 잘못된 경우
+    """
+    with open(path, encoding='utf-8') as file:
+        entries = json.load(file)
+    if not isinstance(entries, list):
+        raise ValueError("Alert rule file must contain a JSON array")
+
+    rules = []
+    for entry in entries:
+        if isinstance(entry, str):
+            rules.append(parse_rule(entry))
+        elif isinstance(entry, dict) and isinstance(entry.get('rule'), str):
+            rules.append(parse_rule(entry['rule'], name=entry.get('name')))
+        else:
+            raise ValueError(f"Invalid alert rule entry: {entry!r}")
+    return rules
+
+
+class RuleFileLoader:
+    """
+    규칙 파일이 바뀌면(수정 시각, 크기) 다시 읽어 평가기의 규칙을 교체합니다.
+
+    파일의 규칙은 설정의 기본 규칙(base_rules) 뒤에 추가됩니다. 다시 읽다가 실패하면
+    기존 규칙을 그대로 유지하며, 같은 이름과 규칙 식의 규칙은 알림 상태가 이어집니다.
+    """
+
+    def __init__(self, engine: AlertEngine, path: str, base_rules: Iterable[AlertRule] = ()):
+        """
+        Args:
+            engine: 규칙을 교체할 알림 평가기
+            path: JSON 규칙 파일 경로
+            base_rules: 파일과 함께 적용할 기본 규칙
+        """
+        self.path = path
+        self._engine = engine
+        self._base_rules = list(base_rules)
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[float, int]] = None
+        self._loaded_at: Optional[datetime] = None
+        self._rules = 0
+        self._reloads = 0
+        self._last_error: Optional[str] = None
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        파일이 바뀌었으면(force이면 항상) 다시 읽어 규칙을 교체합니다.
+
+        Args:
+            force: 변경 여부와 관계없이 다시 읽을지 여부
+
+        Returns:
+            bool: 규칙을 교체했는지 여부
+
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+            ValueError: 형식이 잘못되었거나 규칙 이름이 중복된 경우
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+                signature = (stat.st_mtime, stat.st_size)
+                if not force and signature == self._signature:
+                    return False
+                # 실패해도 같은 내용을 주기마다 다시 읽지 않도록 먼저 기록
+                self._signature = signature
+                rules = self._base_rules + load_rules(self.path)
+                self._engine.set_rules(rules)
+            except (OSError, ValueError) as e:
+                self._last_error = str(e)
+                raise
+            self._loaded_at = datetime.now()
+            self._rules = len(rules)
+            self._reloads += 1
+            self._last_error = None
+            logger.info(f"Alert rules loaded from {self.path} ({len(rules)} rules)")
+            return True
+
+    def poll(self) -> bool:
+        """
+        스케줄러 작업용 reload(). 실패하면 오류를 기록하고 기존 규칙을 유지합니다.
+
+        Returns:
+            bool: 규칙을 교체했는지 여부
+        """
+        try:
+            return self.reload()
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load alert rules from {self.path}: {e}")
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        로더 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: path, rules(적용 중인 규칙 수), reloads(교체 횟수),
+                loaded_at(마지막 교체 시각), last_error(마지막 실패 메시지)
+        """
+        with self._lock:
+            return {
+                'path': self.path,
+                'rules': self._rules,
+                'reloads': self._reloads,
+                'loaded_at': self._loaded_at,
+                'last_error': self._last_error
+            }
@@ -0,0 +1,186 @@
+"""알림 규칙 정의와 규칙 식 파싱"""
+import operator
+import re
+from typing import Dict, Any, Optional, Tuple
+
+from app.models.metrics import CPUMetrics, MemoryMetrics, DiskMetrics, NetworkMetrics
+from app.storage.base import METRIC_TYPES
+
+# 규칙 식의 첫 필드 이름으로 메트릭 타입을 찾기 위한 표 (예: swap_percent -> memory)
+FIELD_METRIC_TYPES: Dict[str, str] = {
+    field: metric_type
+    for metric_type, model in (
+        ('cpu', CPUMetrics), ('memory', MemoryMetrics), ('disk', DiskMetrics), ('network', NetworkMetrics)
+    )
+    for field in model.model_fields
+    if field != 'timestamp'
+}
+
+OPERATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+
+FUNCTIONS = ('value', 'rate', 'avg', 'min', 'max')
+
+# avg/min/max에 윈도우를 지정하지 않았을 때의 기본 크기 (초)
+DEFAULT_WINDOW = 60.0
+
+_DURATION = r'\d+(?:\.\d+)?[smh]?'
+_EXPRESSION = re.compile(
+    r'^\s*(?P<path>[A-Za-z_][\w.\-]*)'
+    r'(?:\s+(?P<function>rate|avg|min|max)(?:\((?P<window>' + _DURATION + r')\))?)?'
+    r'\s*(?P<op>>=|<=|>|<)\s*(?P<threshold>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)'
+    r'(?:\s+for\s+(?P<for>' + _DURATION + r'))?'
+    r'(?:\s+clear\s+(?P<clear>' + _DURATION + r'))?\s*$'
+)
+
+_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+
+def parse_duration(text: str) -> float:
+    """'90', '60s', '5m', '1h' 형식의 기간을 초로 변환합니다."""
+    unit = _UNITS.get(text[-1])
+    if unit is None:
+        return float(text)
+    return float(text[:-1]) * unit
+
+
+class AlertRule:
+    """
+    메트릭 필드 하나에 대한 임계값 규칙.
+
+    신호(signal)는 (메트릭 타입, 필드 경로, 함수, 윈도우)로 정해지며, 같은 신호를 쓰는 규칙은
+    실행 윈도우를 공유합니다. 조건이 for_seconds 동안 계속 참이어야 발생(firing)하고,
+    발생 중에는 조건이 clear_seconds 동안 계속 거짓이어야 해제됩니다.
+    """
+
+    __slots__ = ('name', 'expression', 'metric_type', 'path', 'function', 'window',
+                 'op', 'threshold', 'for_seconds', 'clear_seconds')
+
+    def __init__(
+        self,
+        metric_type: str,
+        path: Tuple[str, ...],
+        op: str,
+        threshold: float,
+        function: str = 'value',
+        window: Optional[float] = None,
+        for_seconds: float = 0.0,
+        clear_seconds: float = 0.0,
+        name: Optional[str] = None,
+        expression: Optional[str] = None
+    ):
+        """
+        Args:
+            metric_type: 메트릭 타입 (cpu, memory, disk, network, anomaly)
+            path: 필드 경로 (예: ('interface_rates', 'eth0', 'bytes_recv_per_sec'))
+            op: 비교 연산자 (>, >=, <, <=)
+            threshold: 임계값
+            function: 신호 함수 (value, rate, avg, min, max)
+            window: 함수의 윈도우 크기 (초)
+            for_seconds: 발생까지 조건이 유지되어야 하는 시간 (초)
+            clear_seconds: 해제까지 조건이 거짓으로 유지되어야 하는 시간 (초)
+            name: 규칙 이름 (None이면 규칙 식)
+            expression: 원래 규칙 식 (None이면 인자로 생성)
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        if function not in FUNCTIONS:
+            raise ValueError(f"Unknown function: {function}")
+        if function in ('avg', 'min', 'max') and window is None:
+            window = DEFAULT_WINDOW
+        if window is not None and window <= 0:
+            raise ValueError("Window must be positive")
+        if for_seconds < 0 or clear_seconds < 0:
+            raise ValueError("Durations must not be negative")
+
+        self.metric_type = metric_type
+        self.path = tuple(path)
+        self.op = op
+        self.threshold = float(threshold)
+        self.function = function
+        self.window = window
+        self.for_seconds = for_seconds
+        self.clear_seconds = clear_seconds
+        self.expression = expression or self._format()
+        self.name = name or self.expression
+
+    def _format(self) -> str:
+        signal = '.'.join((self.metric_type,) + self.path)
+        if self.function != 'value':
+            signal += f' {self.function}' + (f'({self.window:g}s)' if self.window else '')
+        text = f'{signal} {self.op} {self.threshold:g}'
+        if self.for_seconds:
+            text += f' for {self.for_seconds:g}s'
+        if self.clear_seconds:
+            text += f' clear {self.clear_seconds:g}s'
+        return text
+
+    @property
+    def signal(self) -> Tuple[str, Tuple[str, ...], str, Optional[float]]:
+        """실행 윈도우를 공유하는 단위 (메트릭 타입, 경로, 함수, 윈도우)"""
+        return self.metric_type, self.path, self.function, self.window
+
+    def matches(self, value: float) -> bool:
+        """신호 값이 조건을 만족하는지 여부"""
+        return OPERATORS[self.op](value, self.threshold)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """규칙 정의를 딕셔너리로 반환합니다."""
+        return {
+            'name': self.name,
+            'expression': self.expression,
+            'metric_type': self.metric_type,
+            'field': '.'.join(self.path),
+            'function': self.function,
+            'window': self.window,
+            'op': self.op,
+            'threshold': self.threshold,
+            'for_seconds': self.for_seconds,
+            'clear_seconds': self.clear_seconds
+        }
+
+
+def parse_rule(expression: str, name: Optional[str] = None) -> AlertRule:
+    """
+    규칙 식을 파싱합니다.
+
+    형식: ``[메트릭 타입.]필드[.하위 필드...] [rate|avg|min|max[(윈도우)]] <op> <임계값> [for <기간>] [clear <기간>]``
+    예: ``cpu_percent > 90 for 60s``, ``swap_percent rate > 0.5``,
+    ``network.interface_rates.eth0.bytes_recv_per_sec avg(5m) > 1e8 for 2m clear 1m``
+
+    메트릭 타입을 생략하면 첫 필드 이름으로 찾습니다 (CPUMetrics 등 모델의 필드).
+    이상 점수는 메트릭 타입을 붙여 씁니다 (예: ``anomaly.max_score > 6 for 30s``, ``anomaly.cpu.cpu_percent > 4``).
+
+    Args:
+        expression: 규칙 식
+        name: 규칙 이름 (None이면 규칙 식)
+
+    Returns:
+        AlertRule: 파싱된 규칙
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 필드의 메트릭 타입을 알 수 없는 경우
+    """
+    match = _EXPRESSION.match(expression)
+    if match is None:
+        raise ValueError(f"Invalid alert rule: {expression!r}")
+
+    path = tuple(match['path'].split('.'))
+    if path[0] in METRIC_TYPES and len(path) > 1:
+        metric_type, path = path[0], path[1:]
+    else:
+        metric_type = FIELD_METRIC_TYPES.get(path[0])
+        if metric_type is None:
+            raise ValueError(f"Unknown metric field in alert rule: {path[0]!r}")
+
+    return AlertRule(
+        metric_type,
+        path,
+        match['op'],
+        float(match['threshold']),
+        function=match['function'] or 'value',
+        window=parse_duration(match['window']) if match['window'] else None,
+        for_seconds=parse_duration(match['for']) if match['for'] else 0.0,
+        clear_seconds=parse_duration(match['clear']) if match['clear'] else 0.0,
+        name=name,
+        expression=expression.strip()
+    )
@@ -0,0 +1,113 @@
+"""알림 규칙 평가용 실행 윈도우 (샘플당 분할 상환 O(1))"""
+from collections import deque
+from typing import Optional
+
+
+class LatestValue:
+    """마지막 값을 그대로 반환합니다."""
+
+    __slots__ = ()
+
+    def update(self, timestamp: float, value: float) -> Optional[float]:
+        return value
+
+
+class RateWindow:
+    """
+    초당 변화율.
+
+    window가 없으면 직전 샘플과의 차이를, 있으면 window초 안의 가장 오래된 샘플과의 차이를
+    경과 시간으로 나눕니다. 게이지(swap_percent 등)에도 쓰므로 감소는 음수 변화율입니다.
+    """
+
+    __slots__ = ('window', '_samples')
+
+    def __init__(self, window: Optional[float] = None):
+        self.window = window
+        self._samples: deque = deque()
+
+    def update(self, timestamp: float, value: float) -> Optional[float]:
+        samples = self._samples
+        samples.append((timestamp, value))
+        if self.window is None:
+            while len(samples) > 2:
+                samples.popleft()
+        else:
+            # 윈도우 시작 직전 샘플 하나는 남겨 window초에 가까운 구간을 유지
+            while len(samples) > 2 and samples[1][0] <= timestamp - self.window:
+                samples.popleft()
+        first_time, first_value = samples[0]
+        if timestamp <= first_time:
+            return None
+        return (value - first_value) / (timestamp - first_time)
+
+
+class MeanWindow:
+    """window초 동안의 평균 (합계를 누적하고 밀려난 샘플만 빼므로 샘플당 O(1))"""
+
+    __slots__ = ('window', '_samples', '_total')
+
+    def __init__(self, window: float):
+        self.window = window
+        self._samples: deque = deque()
+        self._total = 0.0
+
+    def update(self, timestamp: float, value: float) -> Optional[float]:
+        samples = self._samples
+        samples.append((timestamp, value))
+        self._total += value
+        cutoff = timestamp - self.window
+        while samples[0][0] <= cutoff:
+            self._total -= samples.popleft()[1]
+        return self._total / len(samples)
+
+
+class ExtremeWindow:
+    """
+    window초 동안의 최댓값 또는 최솟값.
+
+    단조 deque(값이 내림차순/오름차순인 후보만 보관)를 사용하므로 샘플당 분할 상환 O(1)입니다.
+    """
+
+    __slots__ = ('window', 'maximum', '_candidates')
+
+    def __init__(self, window: float, maximum: bool = True):
+        self.window = window
+        self.maximum = maximum
+        self._candidates: deque = deque()
+
+    def update(self, timestamp: float, value: float) -> Optional[float]:
+        candidates = self._candidates
+        if self.maximum:
+            while candidates and candidates[-1][1] <= value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= value:
+                candidates.pop()
+        candidates.append((timestamp, value))
+        cutoff = timestamp - self.window
+        while candidates[0][0] <= cutoff:
+            candidates.popleft()
+        return candidates[0][1]
+
+
+def create_window(function: str, window: Optional[float]):
+    """
+    규칙의 함수 이름으로 실행 윈도우를 만듭니다.
+
+    Args:
+        function: value, rate, avg, min, max
+        window: 윈도우 크기 (초, value/rate는 None 가능)
+
+    Returns:
+        update(timestamp, value) 메서드를 가진 윈도우
+    """
+    if function == 'value':
+        return LatestValue()
+    if function == 'rate':
+        return RateWindow(window)
+    if function == 'avg':
+        return MeanWindow(window)
+    if function in ('min', 'max'):
+        return ExtremeWindow(window, maximum=function == 'max')
+    raise ValueError(f"Unknown function: {function}")
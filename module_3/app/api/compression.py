@@ -0,0 +1,258 @@
+"""응답 압축 (gzip, zstd 선택 사용)"""
+import gzip
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.responses import parse_qvalues
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 선택 의존성 (requirements-level4.txt)
+    zstandard = None
+
+# 인코딩별 기본 압축 레벨
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 3}
+
+# 이 크기 이상의 본문은 이벤트 루프를 막지 않도록 스레드 풀에서 압축
+OFFLOAD_SIZE = 256 * 1024
+
+# 압축하지 않는 응답 (스트리밍 프레임은 청크 단위로 바로 전달해야 함)
+_SKIP_CONTENT_TYPES = ('text/event-stream',)
+
+
+def available_encodings() -> List[str]:
+    """현재 환경에서 사용할 수 있는 압축 인코딩 (선호 순)"""
+    encodings = ['gzip']
+    if zstandard is not None:
+        encodings.insert(0, 'zstd')
+    return encodings
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 압축 인코딩을 고릅니다.
+
+    q 값이 가장 높은 인코딩을 고르고, 같으면 서버 선호 순서(zstd, gzip)를 따릅니다.
+
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+
+    Returns:
+        Optional[str]: 'zstd', 'gzip' 또는 압축하지 않으면 None
+    """
+    if not accept_encoding:
+        return None
+
+    available = available_encodings()
+    qualities: Dict[str, float] = {}
+    wildcard = None
+    for encoding, quality in parse_qvalues(accept_encoding):
+        if encoding == '*':
+            wildcard = quality
+        elif encoding in available:
+            qualities[encoding] = quality
+    if wildcard is not None:
+        for encoding in available:
+            qualities.setdefault(encoding, wildcard)
+
+    best = None
+    for encoding in available:
+        quality = qualities.get(encoding, 0.0)
+        if quality > 0 and (best is None or quality > best[0]):
+            best = (quality, encoding)
+    return best[1] if best else None
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    본문을 지정한 인코딩으로 압축합니다.
+
+    Args:
+        body: 원본 본문
+        encoding: 'gzip' 또는 'zstd'
+        level: 압축 레벨 (None이면 인코딩별 기본값)
+
+    Returns:
+        bytes: 압축된 본문
+    """
+    if level is None:
+        level = DEFAULT_LEVELS[encoding]
+    if encoding == 'gzip':
+        # mtime을 고정해 같은 본문은 항상 같은 바이트로 압축
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def _append_vary(headers: MutableHeaders):
+    vary = headers.get('vary')
+    if not vary:
+        headers['Vary'] = 'Accept-Encoding'
+    elif 'accept-encoding' not in vary.lower():
+        headers['Vary'] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 따라 응답 본문을 gzip 또는 zstd로 압축하는 ASGI 미들웨어.
+
+    minimum_size 미만의 작은 본문, 이미 Content-Encoding이 지정된 응답(미리 압축된 스냅샷 등),
+    SSE처럼 여러 청크로 나뉘어 전달되는 스트리밍 응답은 압축하지 않고 그대로 전달합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+            minimum_size: 압축할 최소 본문 크기 (bytes)
+            levels: 인코딩별 압축 레벨 (지정하지 않은 인코딩은 기본값)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get('accept-encoding'))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message['headers'])
+                content_type = headers.get('content-type', '')
+                if 'content-encoding' in headers or content_type.startswith(_SKIP_CONTENT_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 본문을 보고 압축 여부를 정하기 위해 시작 메시지를 보류
+                    start_message = message
+                return
+
+            if message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            headers = MutableHeaders(raw=start_message['headers'])
+            if message.get('more_body', False):
+                # 스트리밍 응답은 압축하지 않고 청크를 그대로 전달
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            _append_vary(headers)
+            if len(body) >= self.minimum_size:
+                if len(body) >= OFFLOAD_SIZE:
+                    body = await run_in_threadpool(compress, body, encoding, self.levels[encoding])
+                else:
+                    body = compress(body, encoding, self.levels[encoding])
+                headers['Content-Encoding'] = encoding
+                headers['Content-Length'] = str(len(body))
+                message = {**message, 'body': body}
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class EncodedBodyCache:
+    """
+    같은 키(스냅샷 버전 등)의 응답 본문을 한 번만 렌더링하고 인코딩별로 한 번만 압축해 재사용하는 캐시.
+
+    한 틱 안에 여러 클라이언트가 같은 스냅샷을 요청해도 직렬화와 압축은 키당 한 번씩만 수행됩니다.
+    가장 최근 키 하나만 보관하므로 메모리는 스냅샷 한 개 분량으로 제한됩니다.
+    """
+
+    def __init__(self, minimum_size: int = 1024, levels: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            minimum_size: 압축할 최소 본문 크기 (bytes)
+            levels: 인코딩별 압축 레벨
+        """
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self._lock = threading.Lock()
+        self._key: Optional[Hashable] = None
+        self._bodies: Dict[Optional[str], bytes] = {}
+        self._renders = 0
+        self._compressions = 0
+        self._hits = 0
+
+    def get(
+        self,
+        key: Hashable,
+        render: Callable[[], bytes],
+        encoding: Optional[str] = None
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        키에 해당하는 본문을 반환합니다. 처음 요청된 키와 인코딩이면 렌더링/압축 후 저장합니다.
+
+        Args:
+            key: 본문을 식별하는 키 (내용이 바뀌면 달라져야 함)
+            render: 원본 본문을 만드는 함수
+            encoding: 압축 인코딩 (None이면 원본)
+
+        Returns:
+            Tuple[bytes, Optional[str]]: (본문, 적용된 인코딩). 본문이 minimum_size 미만이면 인코딩은 None
+        """
+        with self._lock:
+            if key != self._key:
+                self._key = key
+                self._bodies = {}
+
+            identity = self._bodies.get(None)
+            if identity is None:
+                identity = self._bodies[None] = render()
+                self._renders += 1
+            elif encoding is None or len(identity) < self.minimum_size:
+                self._hits += 1
+            if encoding is None or len(identity) < self.minimum_size:
+                return identity, None
+
+            body = self._bodies.get(encoding)
+            if body is None:
+                body = self._bodies[encoding] = compress(identity, encoding, self.levels[encoding])
+                self._compressions += 1
+            else:
+                self._hits += 1
+            return body, encoding
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: key(현재 키), renders(렌더링 횟수), compressions(압축 횟수),
+                hits(렌더링/압축 없이 저장된 본문을 재사용한 횟수)
+        """
+        with self._lock:
+            return {
+                'key': self._key,
+                'renders': self._renders,
+                'compressions': self._compressions,
+                'hits': self._hits
+            }
@@ -0,0 +1,62 @@
+"""ETag과 조건부 요청(If-None-Match) 처리"""
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi.responses import Response
+
+
+def make_etag(version: str, *query: Any) -> str:
+    """
+    데이터 버전과 요청 파라미터로 약한(weak) ETag을 만듭니다.
+
+    같은 데이터 버전과 같은 파라미터는 항상 같은 본문을 만들므로, 행을 읽거나 직렬화하지 않고
+    ETag을 계산할 수 있습니다. 압축 여부와 무관하게 같은 값이므로 약한 ETag을 사용합니다.
+
+    Args:
+        version: 데이터 버전 (예: 스토리지 epoch와 시퀀스 번호)
+        *query: 응답 본문에 영향을 주는 파라미터 (미디어 타입, 조회 구간 등)
+
+    Returns:
+        str: W/"<버전>-<파라미터 해시>" 형식의 ETag
+    """
+    digest = hashlib.blake2b(repr(query).encode('utf-8'), digest_size=6).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag과 일치하는지 약한 비교로 확인합니다.
+
+    Args:
+        if_none_match: If-None-Match 헤더 값 (쉼표로 구분된 ETag 목록 또는 *)
+        etag: 현재 ETag
+
+    Returns:
+        bool: 일치하면 True (304 응답 가능)
+    """
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    본문 없는 304 Not Modified 응답을 만듭니다.
+
+    Args:
+        etag: 현재 ETag
+        headers: 함께 보낼 헤더 (Vary 등)
+
+    Returns:
+        Response: 304 응답
+    """
+    return Response(status_code=304, headers={**(headers or {}), 'ETag': etag})
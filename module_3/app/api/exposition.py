@@ -0,0 +1,178 @@
+"""Prometheus 텍스트 형식(exposition format 0.0.4) 렌더링"""
+import math
+from typing import Dict, List, Any, Optional, Tuple
+
+PROMETHEUS_MEDIA_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+PREFIX = 'sysmon_'
+
+_DISK_RATES = ('read_bytes', 'write_bytes', 'read_ops', 'write_ops')
+_NETWORK_COUNTERS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                     'errin', 'errout', 'dropin', 'dropout')
+
+# 스칼라 필드: (메트릭 이름, 타입, 설명, 메트릭 타입, 필드, 배율)
+SCALAR_FAMILIES: Tuple[Tuple[str, str, str, str, str, float], ...] = (
+    ('cpu_usage_percent', 'gauge', 'CPU usage across all cores.', 'cpu', 'cpu_percent', 1),
+    ('cpu_logical_cores', 'gauge', 'Number of logical CPUs.', 'cpu', 'cpu_count_logical', 1),
+    ('cpu_physical_cores', 'gauge', 'Number of physical CPU cores.', 'cpu', 'cpu_count_physical', 1),
+    ('cpu_frequency_mhz', 'gauge', 'Current CPU frequency.', 'cpu', 'cpu_freq_current', 1),
+    ('cpu_frequency_min_mhz', 'gauge', 'Minimum CPU frequency.', 'cpu', 'cpu_freq_min', 1),
+    ('cpu_frequency_max_mhz', 'gauge', 'Maximum CPU frequency.', 'cpu', 'cpu_freq_max', 1),
+    ('memory_total_bytes', 'gauge', 'Total physical memory.', 'memory', 'memory_total', 1),
+    ('memory_available_bytes', 'gauge', 'Memory available without swapping.', 'memory', 'memory_available', 1),
+    ('memory_used_bytes', 'gauge', 'Used memory.', 'memory', 'memory_used', 1),
+    ('memory_free_bytes', 'gauge', 'Free memory.', 'memory', 'memory_free', 1),
+    ('memory_usage_percent', 'gauge', 'Memory usage.', 'memory', 'memory_percent', 1),
+    ('swap_total_bytes', 'gauge', 'Total swap space.', 'memory', 'swap_total', 1),
+    ('swap_used_bytes', 'gauge', 'Used swap space.', 'memory', 'swap_used', 1),
+    ('swap_free_bytes', 'gauge', 'Free swap space.', 'memory', 'swap_free', 1),
+    ('swap_usage_percent', 'gauge', 'Swap usage.', 'memory', 'swap_percent', 1),
+    ('disk_read_bytes_total', 'counter', 'Bytes read from all disks.', 'disk', 'io_read_bytes', 1),
+    ('disk_written_bytes_total', 'counter', 'Bytes written to all disks.', 'disk', 'io_write_bytes', 1),
+    ('disk_reads_completed_total', 'counter', 'Reads completed on all disks.', 'disk', 'io_read_count', 1),
+    ('disk_writes_completed_total', 'counter', 'Writes completed on all disks.', 'disk', 'io_write_count', 1),
+    ('disk_read_time_seconds_total', 'counter', 'Time spent reading.', 'disk', 'io_read_time', 0.001),
+    ('disk_write_time_seconds_total', 'counter', 'Time spent writing.', 'disk', 'io_write_time', 0.001),
+    *(
+        (f'disk_{rate}_per_second', 'gauge', f'Disk {rate.replace("_", " ")} per second across all disks.',
+         'disk', f'io_{rate}_per_sec', 1)
+        for rate in _DISK_RATES
+    ),
+    *(
+        (f'network_{counter}_total', 'counter', f'Network {counter} across all interfaces.',
+         'network', counter, 1)
+        for counter in _NETWORK_COUNTERS
+    ),
+    *(
+        (f'network_{counter}_per_second', 'gauge', f'Network {counter} per second across all interfaces.',
+         'network', f'{counter}_per_sec', 1)
+        for counter in _NETWORK_COUNTERS
+    ),
+)
+
+# 키별 딕셔너리 필드: (메트릭 이름, 타입, 설명, 메트릭 타입, 필드, 레이블, 하위 필드)
+KEYED_FAMILIES: Tuple[Tuple[str, str, str, str, str, str, str], ...] = (
+    *(
+        (f'disk_device_{rate}_per_second', 'gauge', f'Disk {rate.replace("_", " ")} per second.',
+         'disk', 'disks', 'device', f'{rate}_per_sec')
+        for rate in _DISK_RATES
+    ),
+    *(
+        (f'network_interface_{counter}_total', 'counter', f'Network {counter} per interface.',
+         'network', 'interfaces', 'interface', counter)
+        for counter in _NETWORK_COUNTERS
+    ),
+    *(
+        (f'network_interface_{counter}_per_second', 'gauge', f'Network {counter} per second per interface.',
+         'network', 'interface_rates', 'interface', f'{counter}_per_sec')
+        for counter in _NETWORK_COUNTERS
+    ),
+)
+
+# 파티션 필드: (메트릭 이름, 설명, 필드)
+PARTITION_FAMILIES: Tuple[Tuple[str, str, str], ...] = (
+    ('filesystem_size_bytes', 'Filesystem size.', 'total'),
+    ('filesystem_used_bytes', 'Filesystem used space.', 'used'),
+    ('filesystem_free_bytes', 'Filesystem free space.', 'free'),
+    ('filesystem_usage_percent', 'Filesystem usage.', 'percent'),
+)
+
+
+def format_value(value: Any, scale: float = 1) -> Optional[str]:
+    """
+    샘플 값을 텍스트 형식으로 변환합니다.
+
+    Returns:
+        Optional[str]: 값 문자열 (숫자가 아니면 None)
+    """
+    value_type = type(value)
+    if value_type is bool or (value_type is not int and value_type is not float):
+        return None
+    if scale != 1:
+        value = value * scale
+    elif value_type is int:
+        return str(value)
+    if value != value:
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def escape_label(value: Any) -> str:
+    """레이블 값의 역슬래시, 큰따옴표, 줄바꿈을 이스케이프합니다."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _family(lines: List[str], name: str, metric_kind: str, description: str, samples: List[str]):
+    """샘플이 있을 때만 HELP/TYPE 줄과 함께 추가합니다."""
+    if samples:
+        lines.append(f'# HELP {PREFIX}{name} {description}')
+        lines.append(f'# TYPE {PREFIX}{name} {metric_kind}')
+        lines.extend(samples)
+
+
+def render_exposition(data: Dict[str, Dict[str, Any]], collected_at: Optional[float] = None,
+                      type_collected_at: Optional[Dict[str, float]] = None) -> bytes:
+    """
+    메트릭 스냅샷을 Prometheus 텍스트 형식으로 렌더링합니다.
+
+    전체 합계는 레이블 없는 메트릭으로, 코어/디스크/인터페이스/파티션별 값은 레이블이 붙은
+    별도 메트릭으로 내보내므로 같은 메트릭 안에서 합계와 항목이 섞여 중복 합산되지 않습니다.
+    값이 없는 필드(첫 수집의 초당 변화량 등)는 생략합니다.
+
+    Args:
+        data: 메트릭 타입별 데이터 (정적 값이 채워진 스냅샷)
+        collected_at: 스냅샷 수집 시각 (epoch 초, sysmon_snapshot_timestamp_seconds로 노출)
+        type_collected_at: 메트릭 타입별 수집 시각 (epoch 초, sysmon_metric_timestamp_seconds{type=...}로 노출).
+            수집기가 타임아웃되어 이전 값을 이어받은 타입은 스냅샷 시각보다 이릅니다.
+
+    Returns:
+        bytes: UTF-8 텍스트 본문
+    """
+    lines: List[str] = []
+
+    if collected_at is not None:
+        _family(lines, 'snapshot_timestamp_seconds', 'gauge', 'Unix time the exposed snapshot was collected.',
+                [f'{PREFIX}snapshot_timestamp_seconds {format_value(float(collected_at))}'])
+    if type_collected_at:
+        _family(lines, 'metric_timestamp_seconds', 'gauge', 'Unix time each metric type was last collected.', [
+            f'{PREFIX}metric_timestamp_seconds{{type="{escape_label(metric_type)}"}} {format_value(float(value))}'
+            for metric_type, value in sorted(type_collected_at.items())
+        ])
+
+    for name, metric_kind, description, metric_type, field, scale in SCALAR_FAMILIES:
+        value = format_value(data.get(metric_type, {}).get(field), scale)
+        _family(lines, name, metric_kind, description, [f'{PREFIX}{name} {value}'] if value is not None else [])
+
+    per_core = data.get('cpu', {}).get('cpu_percent_per_core') or []
+    _family(lines, 'cpu_core_usage_percent', 'gauge', 'CPU usage per logical core.', [
+        f'{PREFIX}cpu_core_usage_percent{{core="{core}"}} {value}'
+        for core, value in ((core, format_value(value)) for core, value in enumerate(per_core))
+        if value is not None
+    ])
+
+    for name, metric_kind, description, metric_type, field, label, key in KEYED_FAMILIES:
+        entries = data.get(metric_type, {}).get(field) or {}
+        samples = []
+        for item in sorted(entries):
+            value = format_value((entries[item] or {}).get(key))
+            if value is not None:
+                samples.append(f'{PREFIX}{name}{{{label}="{escape_label(item)}"}} {value}')
+        _family(lines, name, metric_kind, description, samples)
+
+    partitions = data.get('disk', {}).get('partitions') or []
+    for name, description, field in PARTITION_FAMILIES:
+        samples = []
+        for partition in partitions:
+            value = format_value(partition.get(field))
+            if value is not None:
+                labels = ','.join(
+                    f'{label}="{escape_label(partition.get(label, ""))}"'
+                    for label in ('device', 'mountpoint', 'fstype')
+                )
+                samples.append(f'{PREFIX}{name}{{{labels}}} {value}')
+        _family(lines, name, 'gauge', description, samples)
+
+    lines.append('')
+    return '\n'.join(lines).encode('utf-8')
@@ -0,0 +1,266 @@
+"""응답 직렬화 (빠른 JSON, MessagePack, 패킹된 컬럼 형식)"""
+import json
+import math
+import struct
+import sys
+from array import array
+from datetime import datetime, date
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (requirements-level5.txt)
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack은 선택 의존성 (requirements-level5.txt)
+    msgpack = None
+
+# 시계열 엔드포인트가 Accept 헤더로 협상하는 미디어 타입
+JSON_MEDIA_TYPE = 'application/json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+COLUMNS_MEDIA_TYPE = 'application/vnd.sysmon.columns'
+
+_MEDIA_ALIASES = {
+    'application/json': JSON_MEDIA_TYPE,
+    'application/msgpack': MSGPACK_MEDIA_TYPE,
+    'application/x-msgpack': MSGPACK_MEDIA_TYPE,
+    'application/vnd.msgpack': MSGPACK_MEDIA_TYPE,
+    COLUMNS_MEDIA_TYPE: COLUMNS_MEDIA_TYPE,
+}
+
+# 패킹된 컬럼 형식의 array 타입 코드와 헤더 dtype 이름
+_DTYPES = {'d': 'f8', 'q': 'i8'}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """NaN과 무한대 float를 None으로 바꾼 사본을 반환합니다 (orjson과 같은 null 출력용)."""
+    value_type = type(value)
+    if value_type is float:
+        return value if math.isfinite(value) else None
+    if value_type is dict:
+        return {key: _finite(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_finite(item) for item in value]
+    return value
+
+
+def json_dumps(content: Any) -> bytes:
+    """
+    스토리지 행(딕셔너리, 리스트, datetime 포함)을 JSON 바이트로 직렬화합니다.
+
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 같은 형식을 만듭니다.
+    datetime은 두 경우 모두 ISO 8601 문자열로, NaN과 무한대는 두 경우 모두 null로 직렬화됩니다.
+
+    Args:
+        content: 직렬화할 값
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    try:
+        text = json.dumps(content, default=_json_default, ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+    except ValueError:
+        # 유한하지 않은 값이 있을 때만 전체를 한 번 더 순회하여 null로 바꿈
+        text = json.dumps(
+            _finite(content), default=_json_default, ensure_ascii=False, allow_nan=False, separators=(',', ':')
+        )
+    return text.encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    jsonable_encoder와 pydantic 변환을 거치지 않고 바로 직렬화하는 JSON 응답.
+
+    엔드포인트가 이 응답 객체를 직접 반환하면 FastAPI는 행마다 수행하던
+    jsonable_encoder 변환을 건너뛰므로, 1000행 시계열 응답의 직렬화 비용이 크게 줄어듭니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def available_media_types() -> List[str]:
+    """현재 환경에서 제공할 수 있는 시계열 응답 미디어 타입 (선호 순)"""
+    media_types = [JSON_MEDIA_TYPE, COLUMNS_MEDIA_TYPE]
+    if msgpack is not None:
+        media_types.append(MSGPACK_MEDIA_TYPE)
+    return media_types
+
+
+def parse_qvalues(header: str) -> List[Tuple[str, float]]:
+    """
+    Accept 계열 헤더를 (값, q) 목록으로 해석합니다 (헤더 순서 유지, 값은 소문자).
+
+    Args:
+        header: Accept 또는 Accept-Encoding 헤더 값
+
+    Returns:
+        List[Tuple[str, float]]: (미디어 범위 또는 인코딩, 선호도 q)
+    """
+    items = []
+    for item in header.split(','):
+        value, _, params = item.strip().partition(';')
+        value = value.strip().lower()
+        if not value:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, param_value = param.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        items.append((value, quality))
+    return items
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """
+    Accept 헤더에서 제공 가능한 미디어 타입 중 가장 선호도(q)가 높은 것을 고릅니다.
+
+    Args:
+        accept: Accept 헤더 값 (None이거나 비어 있으면 JSON)
+
+    Returns:
+        Optional[str]: 선택된 미디어 타입 또는 제공 가능한 형식이 없으면 None
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    available = available_media_types()
+    best: Optional[Tuple[float, str]] = None
+    for media_range, quality in parse_qvalues(accept):
+        if quality <= 0:
+            continue
+        if media_range in ('*/*', 'application/*'):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            candidate = _MEDIA_ALIASES.get(media_range)
+            if candidate not in available:
+                continue
+        # 같은 q 값이면 헤더에 먼저 나온 형식 우선
+        if best is None or quality > best[0]:
+            best = (quality, candidate)
+
+    return best[1] if best else None
+
+
+class MsgPackResponse(Response):
+    """MessagePack 응답 (datetime은 JSON과 같은 ISO 8601 문자열)"""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        return msgpack.packb(content, default=_json_default, use_bin_type=True)
+
+
+def pack_columns(timestamps, columns: Dict[tuple, Any]) -> bytes:
+    """
+    컬럼 단위 시계열을 패킹된 바이너리 형식으로 인코딩합니다.
+
+    형식:
+        [uint32 little-endian 헤더 길이 N][N바이트 UTF-8 JSON 헤더][8바이트 정렬 데이터 영역]
+
+        헤더: {"rows": 행 수, "byteorder": "little", "columns": [
+                  {"path": ["timestamp"], "dtype": "f8", "offset": 0},
+                  {"path": ["cpu_percent_per_core", 0], "dtype": "f8", "offset": ...},
+                  {"path": ["name"], "dtype": "json", "values": [...]}, ...]}
+
+        숫자 컬럼(f8: float64, i8: int64)은 데이터 영역의 offset부터 rows개가 연속으로 놓이며,
+        timestamp 컬럼은 epoch 초입니다. 문자열 등 숫자가 아닌 컬럼은 헤더에 값 목록으로 들어갑니다.
+        데이터 영역은 8바이트 정렬되어 numpy.frombuffer 등으로 복사 없이 읽을 수 있습니다.
+
+    Args:
+        timestamps: epoch 타임스탬프 시퀀스
+        columns: 경로 튜플별 값 (array('d'/'q') 또는 리스트)
+
+    Returns:
+        bytes: 인코딩된 본문
+    """
+    rows = len(timestamps)
+    descriptors = []
+    chunks = []
+    offset = 0
+
+    for path, values in [(('timestamp',), timestamps)] + list(columns.items()):
+        if not isinstance(values, array):
+            values = _as_array(values)
+        if values is None or values.typecode not in _DTYPES:
+            descriptors.append({'path': list(path), 'dtype': 'json', 'values': list(columns[path])})
+            continue
+        if sys.byteorder != 'little':
+            values = array(values.typecode, values)
+            values.byteswap()
+        descriptors.append({'path': list(path), 'dtype': _DTYPES[values.typecode], 'offset': offset})
+        chunk = values.tobytes()
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    header = json_dumps({'rows': rows, 'byteorder': 'little', 'columns': descriptors})
+    # 데이터 영역이 8바이트 경계에서 시작하도록 헤더를 공백으로 채움
+    header += b' ' * (-(4 + len(header)) % 8)
+    return struct.pack('<I', len(header)) + header + b''.join(chunks)
+
+
+def _as_array(values) -> Optional[array]:
+    """숫자로만 이루어진 리스트를 array로 변환합니다 (불가능하면 None)."""
+    if all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            return None
+    if all(type(value) in (int, float) for value in values):
+        return array('d', values)
+    return None
+
+
+def unpack_columns(body: bytes) -> Tuple[Dict[str, Any], Dict[tuple, list]]:
+    """
+    pack_columns()로 인코딩된 본문을 해석합니다 (클라이언트 구현 참고용).
+
+    Args:
+        body: 응답 본문
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[tuple, list]]: (헤더, 경로 튜플별 값 리스트)
+    """
+    (length,) = struct.unpack_from('<I', body)
+    header = json.loads(body[4:4 + length])
+    data = memoryview(body)[4 + length:]
+    columns = {}
+    for column in header['columns']:
+        path = tuple(column['path'])
+        if column['dtype'] == 'json':
+            columns[path] = column['values']
+            continue
+        values = array('d' if column['dtype'] == 'f8' else 'q')
+        values.frombytes(data[column['offset']:column['offset'] + header['rows'] * 8])
+        if sys.byteorder != 'little':
+            values.byteswap()
+        columns[path] = values.tolist()
+    return header, columns
+
+
+class PackedColumnsResponse(Response):
+    """pack_columns() 형식의 컬럼 단위 바이너리 응답 (content는 (timestamps, columns) 튜플)"""
+
+    media_type = COLUMNS_MEDIA_TYPE
+
+    def render(self, content: Tuple[Any, Dict[tuple, Any]]) -> bytes:
+        timestamps, columns = content
+        return pack_columns(timestamps, columns)
@@ -0,0 +1,75 @@
+"""알림 상태 API 라우트"""
+from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, Query, HTTPException
+
+from app.alerts.engine import AlertEngine, STATES
+from app.alerts.loader import RuleFileLoader
+
+router = APIRouter(prefix="/api/v1/alerts", tags=["alerts"])
+
+# 전역 변수로 알림 평가기와 규칙 파일 로더 저장
+_engine: Optional[AlertEngine] = None
+_loader: Optional[RuleFileLoader] = None
+
+STATE_PATTERN = '^(' + '|'.join(STATES) + ')$'
+
+
+def set_dependencies(engine: AlertEngine, loader: Optional[RuleFileLoader] = None):
+    """알림 평가기와 규칙 파일 로더(선택)를 설정합니다."""
+    global _engine, _loader
+    _engine = engine
+    _loader = loader
+
+
+def _get_engine() -> AlertEngine:
+    if _engine is None:
+        raise HTTPException(status_code=503, detail="Alert engine not initialized")
+    return _engine
+
+
+@router.get("")
+async def get_alerts(
+    state: Optional[str] = Query(None, pattern=STATE_PATTERN, description="이 상태의 규칙만 반환")
+) -> List[Dict[str, Any]]:
+    """
+    규칙별 현재 알림 상태(inactive, pending, firing)와 마지막 평가 값을 반환합니다.
+    """
+    return _get_engine().get_alerts(state)
+
+
+@router.get("/events")
+async def get_alert_events(
+    since_id: int = Query(0, ge=0, description="마지막으로 받은 이벤트 id (이후 이벤트만 반환)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="최대 반환 개수 (최근 이벤트 우선)")
+) -> List[Dict[str, Any]]:
+    """
+    알림 상태 전이 이벤트를 오래된 순으로 반환합니다.
+
+    마지막 이벤트의 id를 since_id로 넘기면 새 이벤트만 받을 수 있습니다.
+    """
+    return _get_engine().get_events(since_id, limit)
+
+
+@router.get("/stats")
+async def get_alert_stats() -> Dict[str, int]:
+    """
+    규칙 수, 실행 윈도우 수, 누적 평가 수, 발생 중인 규칙 수를 반환합니다.
+    """
+    return _get_engine().get_stats()
+
+
+@router.post("/reload")
+async def reload_alert_rules() -> Dict[str, Any]:
+    """
+    규칙 파일(ALERT_RULES_FILE)을 즉시 다시 읽어 규칙을 교체합니다.
+
+    파일 형식이 잘못되었으면 400을 반환하고 기존 규칙을 유지합니다.
+    """
+    _get_engine()
+    if _loader is None:
+        raise HTTPException(status_code=404, detail="Alert rule file not configured")
+    try:
+        _loader.reload(force=True)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _loader.get_stats()
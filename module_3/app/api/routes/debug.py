@@ -0,0 +1,37 @@
+"""자체 계측 디버그 라우트"""
+from typing import Optional, Dict, Any
+from fastapi import APIRouter, Query, HTTPException
+
+from app.utils.instrumentation import Instrumentation
+
+router = APIRouter(prefix="/api/v1/debug", tags=["debug"])
+
+# 전역 변수로 계측 저장
+_instrumentation: Optional[Instrumentation] = None
+
+
+def set_dependencies(instrumentation: Instrumentation):
+    """계측을 설정합니다."""
+    global _instrumentation
+    _instrumentation = instrumentation
+
+
+@router.get("/timings")
+async def get_timings(
+    group: Optional[str] = Query(None, pattern='^(collector|storage|route)$', description="이 그룹만 반환")
+) -> Dict[str, Any]:
+    """
+    서비스 내부 지연 시간 히스토그램 요약을 반환합니다 (시간 단위: 초).
+
+    - collector: 수집기별 collect() 소요 시간
+    - storage: 스토리지 메서드별 잠금 대기('<메서드>.wait')와 보유('<메서드>.hold') 시간
+    - route: 라우트별 요청 수신부터 응답 시작까지의 시간
+
+    항목마다 count, mean, max와 p50, p90, p99, p99.9를 담으며, 백분위는 버킷 상한이므로 최대 1/16 크게 나올 수 있습니다.
+    """
+    if _instrumentation is None:
+        raise HTTPException(status_code=503, detail="Instrumentation not initialized")
+    return {
+        'enabled': _instrumentation.enabled,
+        'timings': _instrumentation.get_timings(group)
+    }
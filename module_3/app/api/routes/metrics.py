@@ -1,25 +1,62 @@
 """메트릭 API 라우트"""
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
+from app.api.responses import (
+    FastJSONResponse, MsgPackResponse, PackedColumnsResponse,
+    MSGPACK_MEDIA_TYPE, COLUMNS_MEDIA_TYPE,
+    available_media_types, negotiate
+)
+from app.api.compression import EncodedBodyCache, choose_encoding
+from app.api.conditional import etag_matches, make_etag, not_modified
 from app.models.metrics import (
     CPUMetrics, MemoryMetrics, DiskMetrics, NetworkMetrics,
     ProcessMetrics, AllMetrics, HealthCheck
 )
+from app.storage.snapshot_cache import SnapshotCache
+from app.storage.columnar import AGGREGATIONS, columns_from_rows
+from app.collectors.pipeline import CollectionPipeline
+from app.collectors.host_inventory import HostInventory
 
 router = APIRouter(prefix="/api/v1", tags=["metrics"])
 
 # 전역 변수로 수집기와 스토리지 저장 (의존성 주입 대신 간단하게)
 _collectors = None
 _storage = None
+_snapshot_cache = None
+_pipeline = None
+_inventory = None
+_body_cache = None
+
+# /metrics/current 스냅샷에 포함되는 메트릭 타입
+SNAPSHOT_METRIC_TYPES = ('cpu', 'memory', 'disk', 'network')
 
+# 시계열 집계 방식 (avg, min, max, p95, last)
+AGG_PATTERN = '^(' + '|'.join(AGGREGATIONS) + ')$'
 
-def set_dependencies(collectors, storage):
-    """수집기와 스토리지를 설정합니다."""
-    global _collectors, _storage
+
+def set_dependencies(collectors, storage, snapshot_cache=None, pipeline=None, inventory=None, body_cache=None):
+    """수집기와 스토리지, 스냅샷 캐시, 수집 파이프라인, 호스트 인벤토리, 응답 본문 캐시를 설정합니다."""
+    global _collectors, _storage, _snapshot_cache, _pipeline, _inventory, _body_cache
     _collectors = collectors
     _storage = storage
+    _snapshot_cache = snapshot_cache or SnapshotCache()
+    _pipeline = pipeline or CollectionPipeline(
+        {metric_type: collectors[metric_type] for metric_type in SNAPSHOT_METRIC_TYPES}
+    )
+    _inventory = inventory or HostInventory()
+    _body_cache = body_cache or EncodedBodyCache()
+
+
+def _collect_snapshot() -> Dict[str, Any]:
+    """스냅샷 캐시 미스 시 현재 메트릭을 직접 수집합니다."""
+    results = _pipeline.run()
+    missing = [metric_type for metric_type in SNAPSHOT_METRIC_TYPES if metric_type not in results]
+    if missing:
+        raise RuntimeError(f"Collectors failed: {', '.join(missing)}")
+    return results
 
 
 @router.get("/health", response_model=HealthCheck)
@@ -31,83 +68,273 @@ async def health_check():
 
 
 @router.get("/metrics/current", response_model=AllMetrics)
-async def get_current_metrics():
+async def get_current_metrics(request: Request):
     """
     모든 메트릭의 현재 스냅샷을 반환합니다.
+
+    스케줄러가 채운 스냅샷 캐시에서 읽으며, 스냅샷이 최대 허용 경과 시간보다
+    오래된 경우에만 한 번 수집합니다. 스냅샷 경과 시간(초)은
+    X-Snapshot-Age 헤더로, 수집 시각은 timestamp 필드로 전달됩니다. 수집기가 타임아웃되어 이전 틱의
+    값을 이어받은 타입이 있으면 X-Snapshot-Age는 그 타입의 원래 수집 시각 기준이며,
+    해당 타입은 X-Stale-Metrics 헤더에 쉼표로 구분하여 표시합니다.
+    샘플에 없는 정적 값(코어 수, 전체 메모리, 파티션 장치 등)은 호스트 인벤토리에서 채웁니다.
+    응답 본문은 스냅샷마다 한 번만 직렬화하고 Accept-Encoding별로 한 번만 압축해 재사용합니다.
+    스냅샷이 바뀌지 않았다면 If-None-Match 요청에 본문 없이 304로 응답합니다.
     """
     if not _collectors:
         raise HTTPException(status_code=503, detail="Collectors not initialized")
 
-    return AllMetrics(
-        cpu=_collectors['cpu'].collect(),
-        memory=_collectors['memory'].collect(),
-        disk=_collectors['disk'].collect(),
-        network=_collectors['network'].collect()
+    snapshot = _snapshot_cache.get_fresh()
+    if snapshot is None:
+        # 수집은 블로킹 호출이므로 이벤트 루프 밖에서 실행
+        try:
+            snapshot = await run_in_threadpool(_snapshot_cache.get, _collect_snapshot)
+        except RuntimeError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+
+    facts = _inventory.peek()
+    if facts is None:
+        # 정적 정보를 다시 읽어야 하면 파티션별 조회가 블로킹될 수 있으므로 이벤트 루프 밖에서 실행
+        facts = await run_in_threadpool(_inventory.get)
+
+    # 스냅샷과 인벤토리가 같으면 본문도 같으므로 렌더링 전에 조건부 요청 처리
+    refreshed_at = facts['refreshed_at']
+    etag = make_etag(f"s{snapshot.version}", snapshot.timestamp, refreshed_at)
+    headers = {
+        'X-Snapshot-Age': f"{snapshot.age():.3f}",
+        'Vary': 'Accept-Encoding',
+        'ETag': etag,
+        'Cache-Control': 'no-cache'
+    }
+    if snapshot.stale:
+        headers['X-Stale-Metrics'] = ','.join(snapshot.stale)
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return not_modified(etag, headers)
+
+    def render() -> bytes:
+        return AllMetrics(
+            timestamp=snapshot.timestamp,
+            cpu=_inventory.merge('cpu', snapshot.data['cpu'], facts),
+            memory=_inventory.merge('memory', snapshot.data['memory'], facts),
+            disk=_inventory.merge('disk', snapshot.data['disk'], facts),
+            network=snapshot.data['network']
+        ).model_dump_json().encode('utf-8')
+
+    # 인벤토리가 다시 읽히면 합쳐지는 정적 값이 바뀌므로 키에 포함
+    key = (snapshot, refreshed_at)
+    body, encoding = _body_cache.get(key, render, choose_encoding(request.headers.get('accept-encoding')))
+
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return Response(body, media_type='application/json', headers=headers)
+
+
+@router.get("/inventory")
+async def get_inventory(
+    refresh: bool = Query(False, description="주기와 관계없이 다시 읽을지 여부")
+) -> Dict[str, Any]:
+    """
+    호스트 정적 정보(코어 수, 최소/최대 주파수, 전체 메모리, 파티션, 네트워크 인터페이스)를 반환합니다.
+    """
+    if not _inventory:
+        raise HTTPException(status_code=503, detail="Inventory not initialized")
+
+    # 정적 정보를 다시 읽는 경우 파티션별 조회가 블로킹될 수 있으므로 이벤트 루프 밖에서 실행
+    return await run_in_threadpool(_inventory.get, refresh)
+
+
+@router.get("/collectors/stats")
+async def get_collector_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    수집기별 실행 횟수, 소요 시간(초), 실패/타임아웃 카운터를 반환합니다.
+    """
+    if not _pipeline:
+        raise HTTPException(status_code=503, detail="Collectors not initialized")
+
+    return _pipeline.get_stats()
+
+
+# 시계열 엔드포인트의 응답 형식 (Accept 헤더로 협상)
+HISTORY_RESPONSES = {
+    200: {
+        'content': {
+            MSGPACK_MEDIA_TYPE: {},
+            COLUMNS_MEDIA_TYPE: {},
+        },
+        'description': "JSON(기본), MessagePack(msgpack 설치 시) 또는 패킹된 컬럼 형식",
+    },
+    304: {'description': "If-None-Match의 ETag 이후 데이터가 바뀌지 않음"},
+    406: {'description': "Accept 헤더의 형식을 제공할 수 없음"},
+}
+
+
+def _query_history(
+    request: Request,
+    metric_type: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: Optional[int],
+    step: Optional[int],
+    agg: str,
+    since_seq: Optional[int] = None
+) -> Response:
+    """
+    시계열 조회 공통 처리 (step이 있으면 서버에서 버킷 집계).
+
+    SQLite 등 스토리지 조회가 블로킹되므로 라우트는 이 함수를 이벤트 루프 밖(run_in_threadpool)에서 호출합니다.
+
+    Accept 헤더에 따라 JSON, MessagePack, 패킹된 컬럼 형식 중 하나로 응답합니다.
+    스토리지 행을 응답 객체로 바로 직렬화하여 행별 jsonable_encoder 변환을 건너뛰며,
+    컬럼 형식은 행 딕셔너리로 복원하지 않고 스토리지 컬럼을 그대로 내보냅니다.
+    응답에는 스토리지 시퀀스 번호 기반 ETag을 붙이며, If-None-Match가 일치하면
+    스토리지를 읽거나 직렬화하지 않고 304로 응답합니다.
+
+    since_seq가 있으면 그 이후에 저장된 원본 행만 {"items", "next_seq", "gap"} 형태로 반환합니다
+    (컬럼 형식은 본문 대신 X-Next-Seq, X-Gap 헤더로 커서를 전달).
+    """
+    if not _storage:
+        raise HTTPException(status_code=503, detail="Storage not initialized")
+    if since_seq is not None and (start or end or step):
+        raise HTTPException(status_code=400, detail="since_seq cannot be combined with start, end or step")
+
+    media_type = negotiate(request.headers.get('accept'))
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Supported media types: {', '.join(available_media_types())}"
+        )
+
+    # 같은 시퀀스 번호와 파라미터면 본문이 같으므로 행을 읽기 전에 조건부 요청 처리
+    # (버전은 조회 전에 읽어야 새 데이터에 이전 ETag이 붙지 않음)
+    etag = make_etag(
+        _storage.get_version(metric_type),
+        metric_type, media_type, start, end, limit, step, agg, since_seq
     )
+    headers = {'Vary': 'Accept', 'ETag': etag, 'Cache-Control': 'no-cache'}
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return not_modified(etag, headers)
 
+    if since_seq is not None:
+        items, next_seq, gap = _storage.get_since(
+            metric_type, since_seq, limit=limit, columns=media_type == COLUMNS_MEDIA_TYPE
+        )
+        headers.update({'X-Next-Seq': str(next_seq), 'X-Gap': 'true' if gap else 'false'})
+        if media_type == COLUMNS_MEDIA_TYPE:
+            return PackedColumnsResponse(items, headers=headers)
+        envelope = {'items': items, 'next_seq': next_seq, 'gap': gap}
+        if media_type == MSGPACK_MEDIA_TYPE:
+            return MsgPackResponse(envelope, headers=headers)
+        return FastJSONResponse(envelope, headers=headers)
 
-@router.get("/metrics/cpu")
+    if media_type == COLUMNS_MEDIA_TYPE and not step:
+        columns = _storage.get_columns(metric_type, start=start, end=end, limit=limit)
+        return PackedColumnsResponse(columns, headers=headers)
+
+    if step:
+        rows = _storage.get_downsampled(metric_type, start=start, end=end,
+                                        step=step, agg=agg, limit=limit)
+    else:
+        rows = _storage.get_range(metric_type, start=start, end=end, limit=limit)
+
+    if media_type == COLUMNS_MEDIA_TYPE:
+        return PackedColumnsResponse(columns_from_rows(rows), headers=headers)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return MsgPackResponse(rows, headers=headers)
+    return FastJSONResponse(rows, headers=headers)
+
+
+@router.get("/metrics/cpu", response_class=FastJSONResponse, responses=HISTORY_RESPONSES)
 async def get_cpu_metrics(
+    request: Request,
     start: Optional[datetime] = Query(None, description="시작 시간"),
     end: Optional[datetime] = Query(None, description="종료 시간"),
-    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수")
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수"),
+    step: Optional[int] = Query(None, ge=1, le=86400, description="집계 버킷 크기 (초)"),
+    agg: str = Query('avg', pattern=AGG_PATTERN, description="집계 방식 (step 지정 시)"),
+    since_seq: Optional[int] = Query(None, ge=0, description="이 시퀀스 번호 이후에 저장된 데이터만 반환 (증분 폴링 커서)")
 ) -> List[Dict[str, Any]]:
     """
     CPU 시계열 메트릭을 반환합니다.
+    step을 지정하면 step 초 단위 버킷으로 집계된 데이터를 반환합니다.
+    Accept 헤더로 MessagePack(application/msgpack) 또는 컬럼 형식(application/vnd.sysmon.columns)을 요청할 수 있습니다.
+    since_seq를 지정하면 그 이후의 새 데이터와 다음 커서(next_seq)를 반환합니다.
     """
-    if not _storage:
-        raise HTTPException(status_code=503, detail="Storage not initialized")
-
-    data = _storage.get_range('cpu', start=start, end=end, limit=limit)
-    return data
+    return await run_in_threadpool(_query_history, request, 'cpu', start, end, limit, step, agg, since_seq)
 
 
-@router.get("/metrics/memory")
+@router.get("/metrics/memory", response_class=FastJSONResponse, responses=HISTORY_RESPONSES)
 async def get_memory_metrics(
+    request: Request,
     start: Optional[datetime] = Query(None, description="시작 시간"),
     end: Optional[datetime] = Query(None, description="종료 시간"),
-    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수")
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수"),
+    step: Optional[int] = Query(None, ge=1, le=86400, description="집계 버킷 크기 (초)"),
+    agg: str = Query('avg', pattern=AGG_PATTERN, description="집계 방식 (step 지정 시)"),
+    since_seq: Optional[int] = Query(None, ge=0, description="이 시퀀스 번호 이후에 저장된 데이터만 반환 (증분 폴링 커서)")
 ) -> List[Dict[str, Any]]:
     """
     메모리 시계열 메트릭을 반환합니다.
+    step을 지정하면 step 초 단위 버킷으로 집계된 데이터를 반환합니다.
+    Accept 헤더로 MessagePack(application/msgpack) 또는 컬럼 형식(application/vnd.sysmon.columns)을 요청할 수 있습니다.
+    since_seq를 지정하면 그 이후의 새 데이터와 다음 커서(next_seq)를 반환합니다.
     """
-    if not _storage:
-        raise HTTPException(status_code=503, detail="Storage not initialized")
+    return await run_in_threadpool(_query_history, request, 'memory', start, end, limit, step, agg, since_seq)
 
-    data = _storage.get_range('memory', start=start, end=end, limit=limit)
-    return data
 
-
-@router.get("/metrics/disk")
+@router.get("/metrics/disk", response_class=FastJSONResponse, responses=HISTORY_RESPONSES)
 async def get_disk_metrics(
+    request: Request,
     start: Optional[datetime] = Query(None, description="시작 시간"),
     end: Optional[datetime] = Query(None, description="종료 시간"),
-    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수")
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수"),
+    step: Optional[int] = Query(None, ge=1, le=86400, description="집계 버킷 크기 (초)"),
+    agg: str = Query('avg', pattern=AGG_PATTERN, description="집계 방식 (step 지정 시)"),
+    since_seq: Optional[int] = Query(None, ge=0, description="이 시퀀스 번호 이후에 저장된 데이터만 반환 (증분 폴링 커서)")
 ) -> List[Dict[str, Any]]:
     """
     디스크 시계열 메트릭을 반환합니다.
+    step을 지정하면 step 초 단위 버킷으로 집계된 데이터를 반환합니다.
+    Accept 헤더로 MessagePack(application/msgpack) 또는 컬럼 형식(application/vnd.sysmon.columns)을 요청할 수 있습니다.
+    since_seq를 지정하면 그 이후의 새 데이터와 다음 커서(next_seq)를 반환합니다.
     """
-    if not _storage:
-        raise HTTPException(status_code=503, detail="Storage not initialized")
-
-    data = _storage.get_range('disk', start=start, end=end, limit=limit)
-    return data
+    return await run_in_threadpool(_query_history, request, 'disk', start, end, limit, step, agg, since_seq)
 
 
-@router.get("/metrics/network")
+@router.get("/metrics/network", response_class=FastJSONResponse, responses=HISTORY_RESPONSES)
 async def get_network_metrics(
+    request: Request,
     start: Optional[datetime] = Query(None, description="시작 시간"),
     end: Optional[datetime] = Query(None, description="종료 시간"),
-    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수")
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수"),
+    step: Optional[int] = Query(None, ge=1, le=86400, description="집계 버킷 크기 (초)"),
+    agg: str = Query('avg', pattern=AGG_PATTERN, description="집계 방식 (step 지정 시)"),
+    since_seq: Optional[int] = Query(None, ge=0, description="이 시퀀스 번호 이후에 저장된 데이터만 반환 (증분 폴링 커서)")
 ) -> List[Dict[str, Any]]:
     """
     네트워크 시계열 메트릭을 반환합니다.
+    step을 지정하면 step 초 단위 버킷으로 집계된 데이터를 반환합니다.
+    Accept 헤더로 MessagePack(application/msgpack) 또는 컬럼 형식(application/vnd.sysmon.columns)을 요청할 수 있습니다.
+    since_seq를 지정하면 그 이후의 새 데이터와 다음 커서(next_seq)를 반환합니다.
     """
-    if not _storage:
-        raise HTTPException(status_code=503, detail="Storage not initialized")
+    return await run_in_threadpool(_query_history, request, 'network', start, end, limit, step, agg, since_seq)
+
 
-    data = _storage.get_range('network', start=start, end=end, limit=limit)
-    return data
+@router.get("/metrics/anomaly", response_class=FastJSONResponse, responses=HISTORY_RESPONSES)
+async def get_anomaly_scores(
+    request: Request,
+    start: Optional[datetime] = Query(None, description="시작 시간"),
+    end: Optional[datetime] = Query(None, description="종료 시간"),
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="최대 반환 개수"),
+    step: Optional[int] = Query(None, ge=1, le=86400, description="집계 버킷 크기 (초)"),
+    agg: str = Query('avg', pattern=AGG_PATTERN, description="집계 방식 (step 지정 시)"),
+    since_seq: Optional[int] = Query(None, ge=0, description="이 시퀀스 번호 이후에 저장된 데이터만 반환 (증분 폴링 커서)")
+) -> List[Dict[str, Any]]:
+    """
+    이상 점수 시계열을 반환합니다.
+    수집 틱마다 메트릭 타입별 필드의 z-score(기준선 대비 표준편차 배수)와 그 절대값의 최대(max_score)를 담습니다.
+    step, agg, Accept 헤더, since_seq는 다른 메트릭 조회와 같습니다.
+    """
+    return await run_in_threadpool(_query_history, request, 'anomaly', start, end, limit, step, agg, since_seq)
 
 
 @router.get("/metrics/processes")
@@ -121,5 +348,5 @@ async def get_processes(
     if not _collectors:
         raise HTTPException(status_code=503, detail="Collectors not initialized")
 
-    processes = _collectors['process'].collect(limit=limit, sort_by=sort_by)
-    return processes
+    # 전체 프로세스를 순회하는 블로킹 호출이므로 이벤트 루프 밖에서 실행
+    return await run_in_threadpool(_collectors['process'].collect, limit=limit, sort_by=sort_by)
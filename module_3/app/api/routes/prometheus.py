@@ -0,0 +1,72 @@
+"""Prometheus 스크랩 라우트"""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.compression import EncodedBodyCache, choose_encoding
+from app.api.exposition import PROMETHEUS_MEDIA_TYPE, render_exposition
+from app.collectors.host_inventory import HostInventory
+from app.storage.snapshot_cache import SnapshotCache
+
+router = APIRouter(tags=["prometheus"])
+
+# 전역 변수로 스냅샷 캐시와 인벤토리, 렌더링된 본문 캐시 저장
+_snapshot_cache: Optional[SnapshotCache] = None
+_inventory: Optional[HostInventory] = None
+_body_cache: Optional[EncodedBodyCache] = None
+
+
+def set_dependencies(snapshot_cache: SnapshotCache, inventory: Optional[HostInventory] = None,
+                     body_cache: Optional[EncodedBodyCache] = None):
+    """스냅샷 캐시와 호스트 인벤토리, 본문 캐시(/api/v1/metrics/current와 별도)를 설정합니다."""
+    global _snapshot_cache, _inventory, _body_cache
+    _snapshot_cache = snapshot_cache
+    _inventory = inventory or HostInventory()
+    _body_cache = body_cache or EncodedBodyCache()
+
+
+@router.get("/metrics", response_class=Response, responses={
+    200: {'content': {PROMETHEUS_MEDIA_TYPE: {}}, 'description': "Prometheus 텍스트 형식"},
+    503: {'description': "아직 수집된 스냅샷이 없음"},
+})
+async def get_prometheus_metrics(request: Request) -> Response:
+    """
+    최신 스냅샷의 CPU, 메모리, 디스크, 네트워크 값과 초당 변화량을 Prometheus 텍스트 형식으로 반환합니다.
+
+    코어(core), 디스크(device), 인터페이스(interface), 파티션(device, mountpoint, fstype)별 값은 레이블로 구분합니다.
+    본문은 스냅샷마다 한 번만 렌더링하고 Accept-Encoding별로 한 번만 압축하므로, 같은 틱 안의 스크랩은
+    저장된 본문을 그대로 반환합니다. 수집 시각은 sysmon_snapshot_timestamp_seconds로 노출되어
+    스케줄러가 멈춘 경우를 감지할 수 있으며, 타입별 수집 시각(sysmon_metric_timestamp_seconds)으로
+    타임아웃되어 이전 값을 이어받은 타입도 구분할 수 있습니다.
+    """
+    if _snapshot_cache is None:
+        raise HTTPException(status_code=503, detail="Snapshot cache not initialized")
+    snapshot = _snapshot_cache.peek()
+    if snapshot is None:
+        raise HTTPException(status_code=503, detail="No metrics collected yet")
+
+    facts = _inventory.peek()
+    if facts is None:
+        # 정적 정보를 다시 읽어야 하면 파티션별 조회가 블로킹될 수 있으므로 이벤트 루프 밖에서 실행
+        facts = await run_in_threadpool(_inventory.get)
+
+    def render() -> bytes:
+        data = {
+            metric_type: _inventory.merge(metric_type, snapshot.data.get(metric_type, {}), facts)
+            for metric_type in ('cpu', 'memory', 'disk', 'network')
+        }
+        type_collected_at = {
+            metric_type: snapshot.type_timestamps[metric_type].timestamp()
+            for metric_type in data if metric_type in snapshot.type_timestamps
+        }
+        return render_exposition(data, snapshot.timestamp.timestamp(), type_collected_at)
+
+    # 인벤토리가 다시 읽히면 합쳐지는 정적 값이 바뀌므로 키에 포함
+    key = (snapshot, facts['refreshed_at'])
+    body, encoding = _body_cache.get(key, render, choose_encoding(request.headers.get('accept-encoding')))
+
+    # media_type으로 넘기면 charset이 한 번 더 붙으므로 헤더로 지정
+    headers = {'Content-Type': PROMETHEUS_MEDIA_TYPE, 'Vary': 'Accept-Encoding', 'Cache-Control': 'no-cache'}
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return Response(body, headers=headers)
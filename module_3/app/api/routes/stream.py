@@ -0,0 +1,145 @@
+"""실시간 메트릭 스트림 라우트 (WebSocket / Server-Sent Events)"""
+import asyncio
+import logging
+from typing import Optional, Dict, Any, FrozenSet
+from fastapi import APIRouter, Query, HTTPException, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.api.routes.metrics import SNAPSHOT_METRIC_TYPES
+from app.streaming.hub import ENCODINGS, StreamHub
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/stream", tags=["stream"])
+
+# 전역 변수로 스트림 허브 저장
+_hub: Optional[StreamHub] = None
+
+# SSE 연결 유지를 위한 주석 프레임 전송 간격 (초)
+SSE_KEEPALIVE = 15.0
+
+# 스트림 인코딩 방식 (full, delta)
+ENCODING_PATTERN = '^(' + '|'.join(ENCODINGS) + ')$'
+
+
+def set_dependencies(hub: StreamHub):
+    """스트림 허브를 설정합니다."""
+    global _hub
+    _hub = hub
+
+
+def _parse_types(types: Optional[str]) -> FrozenSet[str]:
+    """쉼표로 구분된 메트릭 타입 목록을 검증합니다 (비어 있으면 전체)."""
+    if not types:
+        return frozenset(SNAPSHOT_METRIC_TYPES)
+    requested = frozenset(item.strip() for item in types.split(',') if item.strip())
+    unknown = requested - set(SNAPSHOT_METRIC_TYPES)
+    if unknown or not requested:
+        raise ValueError(f"Unknown metric types: {', '.join(sorted(unknown))}")
+    return requested
+
+
+@router.websocket("/ws")
+async def stream_websocket(websocket: WebSocket, types: Optional[str] = None, encoding: str = 'full'):
+    """
+    스케줄러가 수집한 스냅샷을 WebSocket 텍스트 프레임으로 전달합니다.
+
+    types 쿼리 파라미터(예: ?types=cpu,memory)로 구독할 메트릭 타입을 고를 수 있으며,
+    연결 직후 최신 스냅샷을 한 번 받은 뒤 수집 주기마다 새 스냅샷을 받습니다.
+    encoding=delta이면 연결 직후 키프레임을, 이후에는 변경된 필드만 받습니다.
+    """
+    if _hub is None:
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        return
+    try:
+        metric_types = _parse_types(types)
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding: {encoding}")
+    except ValueError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    subscription = _hub.subscribe(metric_types, encoding)
+
+    async def send_frames():
+        while True:
+            await websocket.send_text(await subscription.next())
+
+    async def receive_until_disconnect():
+        # 클라이언트 메시지는 사용하지 않지만, 연결 종료를 감지하기 위해 수신 대기
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+
+    await websocket.accept()
+    sender = asyncio.create_task(send_frames())
+    receiver = asyncio.create_task(receive_until_disconnect())
+    try:
+        # 어느 한쪽이 끝나면(연결 종료 또는 전송 실패) 다른 쪽을 취소하고 두 작업의 결과를 모두 회수
+        done, pending = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (sender, receiver):
+            task.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+        _hub.unsubscribe(subscription)
+
+    error = sender.exception() if sender in done and not sender.cancelled() else None
+    if error is None and receiver in done and not receiver.cancelled():
+        error = receiver.exception()
+    if error is not None:
+        logger.warning(f"WebSocket stream failed: {error!r}")
+        try:
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        except Exception:
+            # 이미 끊긴 연결
+            pass
+
+
+@router.get("/sse")
+async def stream_sse(
+    request: Request,
+    types: Optional[str] = Query(None, description="구독할 메트릭 타입 (쉼표 구분, 기본값: 전체)"),
+    encoding: str = Query('full', pattern=ENCODING_PATTERN, description="full(전체 스냅샷) 또는 delta(변경분)")
+):
+    """
+    스케줄러가 수집한 스냅샷을 Server-Sent Events(text/event-stream)로 전달합니다.
+    encoding=delta이면 연결 직후 키프레임을, 이후에는 변경된 필드만 받습니다.
+    """
+    if _hub is None:
+        raise HTTPException(status_code=503, detail="Stream hub not initialized")
+    try:
+        metric_types = _parse_types(types)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    subscription = _hub.subscribe(metric_types, encoding)
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                frame = await subscription.next(timeout=SSE_KEEPALIVE)
+                if frame is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield f"data: {frame}\n\n"
+        finally:
+            _hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@router.get("/stats")
+async def get_stream_stats() -> Dict[str, Any]:
+    """
+    현재 구독자 수와 전달/인코딩/버린 프레임 수를 반환합니다.
+    """
+    if _hub is None:
+        raise HTTPException(status_code=503, detail="Stream hub not initialized")
+
+    return _hub.get_stats()
@@ -0,0 +1,60 @@
+"""라우트별 응답 지연 시간 계측 미들웨어"""
+import time
+from typing import Dict, Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.instrumentation import Instrumentation, LatencyHistogram
+
+# 어떤 라우트와도 일치하지 않은 요청 (404 등)
+UNMATCHED = '<unmatched>'
+
+
+class TimingMiddleware:
+    """
+    요청 수신부터 응답 시작(http.response.start)까지의 시간을 라우트별 히스토그램('route' 그룹)에 기록하는 ASGI 미들웨어.
+
+    히스토그램 이름은 ``GET /api/v1/metrics/cpu``처럼 메서드와 라우트 경로 템플릿이므로 경로 파라미터 값마다
+    늘어나지 않습니다. 응답 시작까지만 재므로 SSE처럼 오래 이어지는 스트리밍 응답도 첫 응답까지의 지연 시간만
+    기록됩니다. WebSocket과 lifespan 이벤트는 그대로 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp, instrumentation: Optional[Instrumentation] = None):
+        """
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+            instrumentation: 히스토그램을 기록할 계측 (None이거나 비활성화면 그대로 전달)
+        """
+        self.app = app
+        self.instrumentation = instrumentation
+        # (메서드, 엔드포인트) -> 히스토그램
+        self._histograms: Dict[Any, LatencyHistogram] = {}
+
+    def _histogram(self, scope: Scope) -> LatencyHistogram:
+        endpoint = scope.get('endpoint')
+        key = (scope['method'], endpoint)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            name = UNMATCHED
+            router = scope.get('router')
+            for route in getattr(router, 'routes', ()):
+                if endpoint is not None and getattr(route, 'endpoint', None) is endpoint:
+                    name = f"{scope['method']} {route.path}"
+                    break
+            histogram = self._histograms[key] = self.instrumentation.histogram('route', name)
+        return histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or self.instrumentation is None or not self.instrumentation.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            if message['type'] == 'http.response.start':
+                # 라우팅이 끝난 뒤이므로 scope에 엔드포인트가 채워져 있음
+                self._histogram(scope).record(time.perf_counter() - started)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
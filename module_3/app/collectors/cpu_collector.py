@@ -1,15 +1,108 @@
 """CPU 메트릭 수집기"""
+import threading
 import psutil
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.collectors.host_inventory import HostInventory
+
+
+def _split_cpu_times(times) -> Tuple[float, float]:
+    """
+    cpu_times 튜플을 (busy, total) 누적 시간으로 분리합니다.
+
+    psutil.cpu_percent와 동일한 방식으로 계산합니다. Linux의 guest 시간은
+    이미 user/nice에 포함되어 있으므로 total에서 제외하고, iowait는 idle로 취급합니다.
+    """
+    total = sum(times)
+    total -= getattr(times, 'guest', 0.0) + getattr(times, 'guest_nice', 0.0)
+    idle = times.idle + getattr(times, 'iowait', 0.0)
+    return total - idle, total
+
+
+def _percent(busy: float, total: float) -> float:
+    """busy/total 델타를 0-100 범위의 사용률로 변환합니다."""
+    if total <= 0:
+        return 0.0
+    return round(min(max(busy / total * 100.0, 0.0), 100.0), 1)
+
+
+class CPUSampler:
+    """
+    cpu_times 스냅샷 간의 델타로 CPU 사용률을 계산하는 샘플러.
+
+    psutil.cpu_percent(interval=1)처럼 1초 동안 대기하지 않고, 직전 샘플링 시점의
+    코어별 cpu_times 스냅샷과 현재 스냅샷을 비교합니다. 한 번의 cpu_times 호출로
+    전체 사용률과 코어별 사용률을 함께 계산하므로 수집은 수 마이크로초 내에 끝납니다.
+
+    - 첫 샘플은 부팅 이후 누적 시간 기준의 평균 사용률을 반환합니다.
+    - 직전 샘플 이후 누적 시간이 변하지 않았다면 (같은 클럭 틱 내 재호출)
+      스냅샷을 갱신하지 않고 직전 값을 그대로 반환합니다.
+    """
+
+    def __init__(self):
+        """CPU 샘플러 초기화 (기준 스냅샷 저장)"""
+        self._lock = threading.Lock()
+        self._last_times = None
+        self._last_total = 0.0
+        self._last_per_core: List[float] = []
+        self.sample()
+
+    def sample(self) -> Tuple[float, List[float]]:
+        """
+        직전 샘플 이후의 CPU 사용률을 계산합니다.
+
+        Returns:
+            Tuple[float, List[float]]: (전체 CPU 사용률, 코어별 CPU 사용률)
+        """
+        current = [_split_cpu_times(times) for times in psutil.cpu_times(percpu=True)]
+
+        with self._lock:
+            previous = self._last_times
+            if previous is None or len(previous) != len(current):
+                # 첫 호출 또는 코어 수 변경: 부팅 이후 누적 시간 기준으로 계산
+                previous = [(0.0, 0.0)] * len(current)
+                last_per_core = [0.0] * len(current)
+            else:
+                last_per_core = self._last_per_core
+
+            busy_sum = total_sum = 0.0
+            per_core = []
+            for (prev_busy, prev_total), (busy, total), last in zip(previous, current, last_per_core):
+                delta_busy = busy - prev_busy
+                delta_total = total - prev_total
+                busy_sum += delta_busy
+                total_sum += delta_total
+                per_core.append(_percent(delta_busy, delta_total) if delta_total > 0 else last)
+
+            if total_sum <= 0:
+                return self._last_total, list(self._last_per_core)
+
+            self._last_times = current
+            self._last_total = _percent(busy_sum, total_sum)
+            self._last_per_core = per_core
+            return self._last_total, list(per_core)
 
 
 class CPUCollector:
     """CPU 사용률 및 관련 메트릭을 수집하는 클래스"""
 
-    def __init__(self):
-        """CPU 수집기 초기화"""
-        # 첫 호출 시 interval을 설정하기 위해 한 번 호출
-        psutil.cpu_percent(interval=None)
+    def __init__(
+        self,
+        sampler: Optional[CPUSampler] = None,
+        inventory: Optional[HostInventory] = None,
+        include_static: bool = True
+    ):
+        """
+        CPU 수집기 초기화
+
+        Args:
+            sampler: 사용할 CPU 샘플러 (None이면 새로 생성)
+            inventory: 코어 수와 최소/최대 주파수를 제공할 호스트 인벤토리 (None이면 새로 생성)
+            include_static: 정적 값(코어 수, 최소/최대 주파수)을 샘플에 포함할지 여부
+        """
+        self._sampler = sampler or CPUSampler()
+        self._inventory = inventory or HostInventory()
+        self._include_static = include_static
 
     def collect(self) -> Dict[str, Any]:
         """
@@ -19,36 +112,34 @@ class CPUCollector:
             Dict[str, Any]: CPU 메트릭 딕셔너리
                 - cpu_percent: 전체 CPU 사용률 (%)
                 - cpu_percent_per_core: 코어별 CPU 사용률 (%)
-                - cpu_count_logical: 논리 CPU 코어 수
-                - cpu_count_physical: 물리 CPU 코어 수
                 - cpu_freq_current: 현재 CPU 주파수 (MHz)
-                - cpu_freq_min: 최소 CPU 주파수 (MHz)
-                - cpu_freq_max: 최대 CPU 주파수 (MHz)
+                - cpu_count_logical: 논리 CPU 코어 수 (include_static인 경우)
+                - cpu_count_physical: 물리 CPU 코어 수 (include_static인 경우)
+                - cpu_freq_min: 최소 CPU 주파수 (MHz, include_static인 경우)
+                - cpu_freq_max: 최대 CPU 주파수 (MHz, include_static인 경우)
         """
         metrics = {}
 
-        # 전체 CPU 사용률
-        metrics['cpu_percent'] = psutil.cpu_percent(interval=1)
-
-        # 코어별 CPU 사용률
-        metrics['cpu_percent_per_core'] = psutil.cpu_percent(interval=None, percpu=True)
+        # 전체 및 코어별 CPU 사용률 (직전 수집 이후 델타, 대기 없음)
+        metrics['cpu_percent'], metrics['cpu_percent_per_core'] = self._sampler.sample()
 
-        # CPU 코어 수
-        metrics['cpu_count_logical'] = psutil.cpu_count(logical=True)
-        metrics['cpu_count_physical'] = psutil.cpu_count(logical=False)
+        # 코어 수, 최소/최대 주파수는 인벤토리에서 (코어 수가 바뀌면 다시 읽음)
+        static = self._inventory.get()['cpu']
+        if static['cpu_count_logical'] and len(metrics['cpu_percent_per_core']) != static['cpu_count_logical']:
+            self._inventory.invalidate()
+            static = self._inventory.get()['cpu']
+        if self._include_static:
+            metrics.update(static)
 
-        # CPU 주파수 정보 (지원되는 경우)
+        # 현재 CPU 주파수 (지원되는 경우)
+        metrics['cpu_freq_current'] = None
         try:
             cpu_freq = psutil.cpu_freq()
             if cpu_freq:
                 metrics['cpu_freq_current'] = cpu_freq.current
-                metrics['cpu_freq_min'] = cpu_freq.min
-                metrics['cpu_freq_max'] = cpu_freq.max
         except (AttributeError, NotImplementedError):
             # 일부 플랫폼에서는 지원되지 않음
-            metrics['cpu_freq_current'] = None
-            metrics['cpu_freq_min'] = None
-            metrics['cpu_freq_max'] = None
+            pass
 
         return metrics
 
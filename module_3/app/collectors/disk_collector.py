@@ -1,15 +1,65 @@
 """디스크 메트릭 수집기"""
 import psutil
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from app.collectors.host_inventory import HostInventory
+from app.collectors.rates import CounterRates
+
+
+def _io_counters(counters) -> Dict[str, int]:
+    """psutil 디스크 I/O 카운터에서 변화율을 계산할 값만 추출합니다."""
+    return {
+        'read_bytes': counters.read_bytes,
+        'write_bytes': counters.write_bytes,
+        'read_ops': counters.read_count,
+        'write_ops': counters.write_count
+    }
 
 
 class DiskCollector:
     """디스크 사용률 및 I/O 메트릭을 수집하는 클래스"""
 
-    def __init__(self):
-        """디스크 수집기 초기화"""
-        # 초기 I/O 카운터 읽기 (델타 계산을 위해)
-        self._last_io_counters = psutil.disk_io_counters()
+    def __init__(self, inventory: Optional[HostInventory] = None, include_static: bool = True):
+        """
+        디스크 수집기 초기화
+
+        Args:
+            inventory: 파티션 목록을 제공할 호스트 인벤토리 (None이면 새로 생성)
+            include_static: 정적 값(장치, 파일 시스템, 전체 용량)을 파티션 정보에 포함할지 여부
+        """
+        self._inventory = inventory or HostInventory()
+        self._include_static = include_static
+        # 초기 I/O 카운터 기록 (첫 수집부터 변화율을 계산하기 위해)
+        self._rates = CounterRates()
+        self._read_io_rates()
+
+    def _read_io_rates(self) -> Optional[Dict[str, Any]]:
+        """
+        디스크 I/O 카운터를 읽고 전체 및 디스크별 초당 변화율을 계산합니다.
+
+        Returns:
+            Optional[Dict[str, Any]]: 'total'(전체 카운터), 'total_rates', 'disks'(디스크별 변화율)
+                또는 지원되지 않는 경우 None
+        """
+        try:
+            total = psutil.disk_io_counters()
+            per_disk = psutil.disk_io_counters(perdisk=True) or {}
+        except (AttributeError, RuntimeError):
+            return None
+        if not total:
+            return None
+
+        disks = {
+            name: self._rates.update(name, _io_counters(counters))
+            for name, counters in per_disk.items()
+        }
+        self._rates.prune(list(per_disk) + ['__total__'])
+
+        return {
+            'total': total,
+            'total_rates': self._rates.update('__total__', _io_counters(total)),
+            'disks': disks
+        }
 
     def collect(self) -> Dict[str, Any]:
         """
@@ -18,44 +68,58 @@ class DiskCollector:
         Returns:
             Dict[str, Any]: 디스크 메트릭 딕셔너리
                 - partitions: 파티션별 사용률 정보 리스트
+                    (mountpoint, used, free, percent, include_static이면 device, fstype, total 포함)
                 - io_read_bytes: 읽은 바이트 수
                 - io_write_bytes: 쓴 바이트 수
                 - io_read_count: 읽기 횟수
                 - io_write_count: 쓰기 횟수
+                - io_read_bytes_per_sec, io_write_bytes_per_sec: 초당 읽기/쓰기 바이트
+                - io_read_ops_per_sec, io_write_ops_per_sec: 초당 읽기/쓰기 횟수
+                - disks: 디스크별 초당 변화율 (위와 같은 항목, 'io_' 접두사 없음)
         """
         metrics = {}
 
-        # 파티션별 사용률
+        # 파티션별 사용률 (파티션 목록은 인벤토리에서, 매 틱 다시 나열하지 않음)
         partitions = []
-        for partition in psutil.disk_partitions():
+        for partition in self._inventory.get()['disk']['partitions']:
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                partitions.append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent
-                })
+                usage = psutil.disk_usage(partition['mountpoint'])
             except PermissionError:
                 # 접근 권한이 없는 파티션은 건너뛰기
                 continue
+            except OSError:
+                # 마운트 해제된 파티션: 다음 수집 때 목록을 다시 읽음
+                self._inventory.invalidate()
+                continue
+            sample = {
+                'mountpoint': partition['mountpoint'],
+                'used': usage.used,
+                'free': usage.free,
+                'percent': usage.percent
+            }
+            if self._include_static:
+                sample = {**partition, 'total': usage.total, **sample}
+            elif usage.total != partition['total']:
+                # 파일 시스템 크기가 바뀜
+                self._inventory.invalidate()
+            partitions.append(sample)
 
         metrics['partitions'] = partitions
 
-        # 디스크 I/O 카운터
-        try:
-            io_counters = psutil.disk_io_counters()
-            if io_counters:
-                metrics['io_read_bytes'] = io_counters.read_bytes
-                metrics['io_write_bytes'] = io_counters.write_bytes
-                metrics['io_read_count'] = io_counters.read_count
-                metrics['io_write_count'] = io_counters.write_count
-                metrics['io_read_time'] = io_counters.read_time
-                metrics['io_write_time'] = io_counters.write_time
-        except (AttributeError, RuntimeError):
+        # 디스크 I/O 카운터 및 초당 변화율
+        io = self._read_io_rates()
+        if io:
+            io_counters = io['total']
+            metrics['io_read_bytes'] = io_counters.read_bytes
+            metrics['io_write_bytes'] = io_counters.write_bytes
+            metrics['io_read_count'] = io_counters.read_count
+            metrics['io_write_count'] = io_counters.write_count
+            metrics['io_read_time'] = io_counters.read_time
+            metrics['io_write_time'] = io_counters.write_time
+            for name, rate in io['total_rates'].items():
+                metrics[f'io_{name}'] = rate
+            metrics['disks'] = io['disks']
+        else:
             # 일부 플랫폼에서는 지원되지 않음
             metrics['io_read_bytes'] = None
             metrics['io_write_bytes'] = None
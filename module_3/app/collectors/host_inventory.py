@@ -0,0 +1,150 @@
+"""호스트 정적 정보(인벤토리) 수집기"""
+import platform
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import psutil
+
+
+class HostInventory:
+    """
+    샘플마다 다시 읽을 필요가 없는 호스트 정적 정보를 보관하는 클래스.
+
+    코어 수, CPU 최소/최대 주파수, 전체 메모리, 파티션 목록(장치, 파일 시스템, 전체 용량),
+    네트워크 인터페이스 속성처럼 거의 변하지 않는 값을 한 번 읽어 두고,
+    refresh_interval이 지나거나 수집기가 변화를 감지해 invalidate()를 호출했을 때만
+    다시 읽습니다. 수집기는 변하는 값만 샘플에 담고, API 응답에서 merge()로 합칩니다.
+    """
+
+    def __init__(self, refresh_interval: float = 300.0):
+        """
+        Args:
+            refresh_interval: 정적 정보를 다시 읽는 주기 (초)
+        """
+        self._refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._facts: Optional[Dict[str, Any]] = None
+        self._refreshed_at = 0.0
+        self._stale = True
+
+    def invalidate(self):
+        """다음 조회 시 정적 정보를 다시 읽도록 표시합니다 (장치/인터페이스 변경 감지 시)."""
+        self._stale = True
+
+    def get(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        정적 정보를 반환합니다. 필요하면 다시 읽습니다.
+
+        Args:
+            refresh: True이면 주기와 관계없이 다시 읽음
+
+        Returns:
+            Dict[str, Any]: 호스트 정적 정보
+                - hostname, platform, boot_time, refreshed_at
+                - cpu: cpu_count_logical, cpu_count_physical, cpu_freq_min, cpu_freq_max
+                - memory: memory_total
+                - disk: partitions (device, mountpoint, fstype, total)
+                - network: interfaces (인터페이스별 isup, speed, mtu)
+        """
+        with self._lock:
+            expired = time.monotonic() - self._refreshed_at >= self._refresh_interval
+            if refresh or self._stale or expired or self._facts is None:
+                self._facts = self._read()
+                self._refreshed_at = time.monotonic()
+                self._stale = False
+            return self._facts
+
+    def peek(self) -> Optional[Dict[str, Any]]:
+        """
+        다시 읽을 필요가 없으면 보관 중인 정적 정보를 잠금 없이 반환합니다.
+
+        이벤트 루프에서 호출해도 블로킹되지 않으며, None이면 get()을 이벤트 루프 밖에서 호출해야 합니다.
+
+        Returns:
+            Optional[Dict[str, Any]]: 호스트 정적 정보 (다시 읽어야 하면 None)
+        """
+        facts = self._facts
+        if facts is None or self._stale or time.monotonic() - self._refreshed_at >= self._refresh_interval:
+            return None
+        return facts
+
+    def _read(self) -> Dict[str, Any]:
+        """정적 정보를 시스템에서 읽습니다."""
+        cpu = {
+            'cpu_count_logical': psutil.cpu_count(logical=True),
+            'cpu_count_physical': psutil.cpu_count(logical=False),
+            'cpu_freq_min': None,
+            'cpu_freq_max': None
+        }
+        try:
+            cpu_freq = psutil.cpu_freq()
+            if cpu_freq:
+                cpu['cpu_freq_min'] = cpu_freq.min
+                cpu['cpu_freq_max'] = cpu_freq.max
+        except (AttributeError, NotImplementedError):
+            # 일부 플랫폼에서는 지원되지 않음
+            pass
+
+        partitions = []
+        for partition in psutil.disk_partitions():
+            try:
+                total = psutil.disk_usage(partition.mountpoint).total
+            except OSError:
+                # 접근 권한이 없거나 사라진 파티션은 건너뛰기
+                continue
+            partitions.append({
+                'device': partition.device,
+                'mountpoint': partition.mountpoint,
+                'fstype': partition.fstype,
+                'total': total
+            })
+
+        try:
+            interfaces = {
+                name: {'isup': stats.isup, 'speed': stats.speed, 'mtu': stats.mtu}
+                for name, stats in psutil.net_if_stats().items()
+            }
+        except (OSError, NotImplementedError):
+            interfaces = {}
+
+        return {
+            'hostname': socket.gethostname(),
+            'platform': platform.platform(),
+            'boot_time': datetime.fromtimestamp(psutil.boot_time()),
+            'refreshed_at': datetime.now(),
+            'cpu': cpu,
+            'memory': {'memory_total': psutil.virtual_memory().total},
+            'disk': {'partitions': partitions},
+            'network': {'interfaces': interfaces}
+        }
+
+    def merge(self, metric_type: str, data: Dict[str, Any],
+              facts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        변하는 값만 담긴 샘플에 정적 정보를 합친 새 딕셔너리를 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            data: 수집기 샘플
+            facts: 합칠 정적 정보 (None이면 get()으로 조회하므로 다시 읽을 때 블로킹될 수 있음)
+
+        Returns:
+            Dict[str, Any]: 정적 필드가 채워진 샘플 (샘플의 값이 우선)
+        """
+        if facts is None:
+            facts = self.get()
+        if metric_type in ('cpu', 'memory'):
+            return {**facts[metric_type], **data}
+        if metric_type == 'disk' and 'partitions' in data:
+            static = {partition['mountpoint']: partition for partition in facts['disk']['partitions']}
+            return {
+                **data,
+                'partitions': [
+                    {**static.get(partition.get('mountpoint'), {}), **partition}
+                    for partition in data['partitions']
+                ]
+            }
+        return data
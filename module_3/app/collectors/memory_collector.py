@@ -6,13 +6,23 @@ from typing import Dict, Any
 class MemoryCollector:
     """메모리 사용률 및 관련 메트릭을 수집하는 클래스"""
 
+    def __init__(self, include_static: bool = True):
+        """
+        메모리 수집기 초기화
+
+        Args:
+            include_static: 정적 값(전체 메모리)을 샘플에 포함할지 여부
+                (제외하면 HostInventory에서 제공)
+        """
+        self._include_static = include_static
+
     def collect(self) -> Dict[str, Any]:
         """
         현재 메모리 메트릭을 수집합니다.
 
         Returns:
             Dict[str, Any]: 메모리 메트릭 딕셔너리
-                - memory_total: 전체 메모리 (bytes)
+                - memory_total: 전체 메모리 (bytes, include_static인 경우)
                 - memory_available: 사용 가능한 메모리 (bytes)
                 - memory_used: 사용 중인 메모리 (bytes)
                 - memory_percent: 메모리 사용률 (%)
@@ -26,7 +36,8 @@ class MemoryCollector:
 
         # 가상 메모리 정보
         vmem = psutil.virtual_memory()
-        metrics['memory_total'] = vmem.total
+        if self._include_static:
+            metrics['memory_total'] = vmem.total
         metrics['memory_available'] = vmem.available
         metrics['memory_used'] = vmem.used
         metrics['memory_percent'] = vmem.percent
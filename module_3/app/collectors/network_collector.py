@@ -1,15 +1,38 @@
 """네트워크 메트릭 수집기"""
 import psutil
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from app.collectors.host_inventory import HostInventory
+from app.collectors.rates import CounterRates
+
+# 초당 변화율을 계산하는 카운터
+_COUNTERS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+             'errin', 'errout', 'dropin', 'dropout')
 
 
 class NetworkCollector:
     """네트워크 I/O 메트릭을 수집하는 클래스"""
 
-    def __init__(self):
-        """네트워크 수집기 초기화"""
-        # 초기 I/O 카운터 읽기 (델타 계산을 위해)
-        self._last_io_counters = psutil.net_io_counters()
+    def __init__(self, inventory: Optional[HostInventory] = None):
+        """
+        네트워크 수집기 초기화
+
+        Args:
+            inventory: 인터페이스 목록이 바뀌었을 때 알려줄 호스트 인벤토리 (선택)
+        """
+        self._inventory = inventory
+        per_nic = psutil.net_io_counters(pernic=True)
+        self._interface_names = set(per_nic)
+        # 초기 I/O 카운터 기록 (첫 수집부터 변화율을 계산하기 위해)
+        self._rates = CounterRates()
+        self._rates.update('__total__', self._counters(psutil.net_io_counters()))
+        for interface_name, interface_stats in per_nic.items():
+            self._rates.update(interface_name, self._counters(interface_stats))
+
+    @staticmethod
+    def _counters(stats) -> Dict[str, int]:
+        """psutil 네트워크 카운터를 딕셔너리로 변환합니다."""
+        return {counter: getattr(stats, counter) for counter in _COUNTERS}
 
     def collect(self) -> Dict[str, Any]:
         """
@@ -26,36 +49,34 @@ class NetworkCollector:
                 - dropin: 수신 드롭 수
                 - dropout: 송신 드롭 수
                 - interfaces: 인터페이스별 상세 정보
+                - <카운터>_per_sec: 위 카운터들의 초당 변화율 (예: bytes_sent_per_sec)
+                - interface_rates: 인터페이스별 초당 변화율
         """
         metrics = {}
 
-        # 전체 네트워크 I/O 카운터
-        io_counters = psutil.net_io_counters()
-        metrics['bytes_sent'] = io_counters.bytes_sent
-        metrics['bytes_recv'] = io_counters.bytes_recv
-        metrics['packets_sent'] = io_counters.packets_sent
-        metrics['packets_recv'] = io_counters.packets_recv
-        metrics['errin'] = io_counters.errin
-        metrics['errout'] = io_counters.errout
-        metrics['dropin'] = io_counters.dropin
-        metrics['dropout'] = io_counters.dropout
+        # 전체 네트워크 I/O 카운터 및 초당 변화율
+        io_counters = self._counters(psutil.net_io_counters())
+        metrics.update(io_counters)
+        metrics.update(self._rates.update('__total__', io_counters))
 
-        # 인터페이스별 네트워크 I/O 카운터
+        # 인터페이스별 네트워크 I/O 카운터 및 초당 변화율
         interfaces = {}
+        interface_rates = {}
         per_nic = psutil.net_io_counters(pernic=True)
         for interface_name, interface_stats in per_nic.items():
-            interfaces[interface_name] = {
-                'bytes_sent': interface_stats.bytes_sent,
-                'bytes_recv': interface_stats.bytes_recv,
-                'packets_sent': interface_stats.packets_sent,
-                'packets_recv': interface_stats.packets_recv,
-                'errin': interface_stats.errin,
-                'errout': interface_stats.errout,
-                'dropin': interface_stats.dropin,
-                'dropout': interface_stats.dropout
-            }
+            counters = self._counters(interface_stats)
+            interfaces[interface_name] = counters
+            interface_rates[interface_name] = self._rates.update(interface_name, counters)
+        self._rates.prune(list(per_nic) + ['__total__'])
+
+        # 인터페이스가 추가/삭제되면 인벤토리의 인터페이스 속성을 다시 읽도록 표시
+        if set(per_nic) != self._interface_names:
+            self._interface_names = set(per_nic)
+            if self._inventory is not None:
+                self._inventory.invalidate()
 
         metrics['interfaces'] = interfaces
+        metrics['interface_rates'] = interface_rates
 
         return metrics
 
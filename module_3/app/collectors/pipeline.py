@@ -0,0 +1,155 @@
+"""수집기 동시 실행 파이프라인"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, Iterable
+
+from app.utils.instrumentation import Instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+class CollectorStats:
+    """수집기 하나의 실행 횟수, 소요 시간, 실패 카운터"""
+
+    __slots__ = ('runs', 'failures', 'timeouts', 'skipped',
+                 'last_duration', 'max_duration', 'total_duration', 'last_error')
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.last_duration: Optional[float] = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """통계를 딕셔너리로 반환합니다 (시간 단위: 초)"""
+        return {
+            'runs': self.runs,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'skipped': self.skipped,
+            'last_duration': self.last_duration,
+            'max_duration': self.max_duration,
+            'avg_duration': self.total_duration / self.runs if self.runs else None,
+            'last_error': self.last_error
+        }
+
+
+class CollectionPipeline:
+    """
+    여러 수집기를 제한된 스레드 풀에서 동시에 실행하는 파이프라인.
+
+    한 틱의 소요 시간은 각 수집기 시간의 합이 아니라 가장 느린 수집기의 시간이 되며,
+    수집기별 타임아웃을 넘긴 수집기는 그 틱에서 제외될 뿐 다른 수집기의 결과에는
+    영향을 주지 않습니다. 이전 실행이 아직 끝나지 않은 수집기는 다시 제출하지 않아
+    멈춘 수집기(예: 응답 없는 원격 마운트)가 스레드 풀을 모두 점유하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        collectors: Dict[str, Any],
+        max_workers: int = 4,
+        timeout: float = 3.0,
+        timeouts: Optional[Dict[str, float]] = None,
+        instrumentation: Optional[Instrumentation] = None
+    ):
+        """
+        Args:
+            collectors: 메트릭 타입별 수집기 (collect() 메서드 필요)
+            max_workers: 스레드 풀 크기
+            timeout: 수집기별 기본 타임아웃 (초)
+            timeouts: 메트릭 타입별 타임아웃 재정의 (초)
+            instrumentation: collect() 소요 시간 히스토그램을 기록할 계측 ('collector' 그룹)
+        """
+        self._collectors = collectors
+        self._timeout = timeout
+        self._timeouts = timeouts or {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collector')
+        self._in_flight: Dict[str, Future] = {}
+        self._stats = {metric_type: CollectorStats() for metric_type in collectors}
+        self._lock = threading.Lock()
+        self._histograms = {
+            metric_type: instrumentation.histogram('collector', metric_type)
+            for metric_type in collectors
+        } if instrumentation else {}
+
+    def _timed_collect(self, metric_type: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            return self._collectors[metric_type].collect()
+        finally:
+            duration = time.perf_counter() - started
+            with self._lock:
+                stats = self._stats[metric_type]
+                stats.runs += 1
+                stats.last_duration = duration
+                stats.total_duration += duration
+                stats.max_duration = max(stats.max_duration, duration)
+            histogram = self._histograms.get(metric_type)
+            if histogram is not None:
+                histogram.record(duration)
+
+    def run(self, metric_types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        수집기들을 동시에 실행하고 제시간에 끝난 결과를 반환합니다.
+
+        Args:
+            metric_types: 실행할 메트릭 타입 (None이면 전체)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 성공한 메트릭 타입별 수집 데이터
+                (실패, 타임아웃, 건너뛴 수집기는 포함되지 않음)
+        """
+        submitted_at = time.monotonic()
+        futures: Dict[str, Future] = {}
+
+        with self._lock:
+            for metric_type in metric_types or self._collectors:
+                previous = self._in_flight.get(metric_type)
+                if previous is not None and not previous.done():
+                    # 이전 틱의 수집이 아직 진행 중
+                    self._stats[metric_type].skipped += 1
+                    continue
+                future = self._executor.submit(self._timed_collect, metric_type)
+                self._in_flight[metric_type] = future
+                futures[metric_type] = future
+
+        results = {}
+        for metric_type, future in futures.items():
+            deadline = submitted_at + self._timeouts.get(metric_type, self._timeout)
+            try:
+                results[metric_type] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                with self._lock:
+                    self._stats[metric_type].timeouts += 1
+                logger.warning(f"Collector '{metric_type}' timed out")
+            except Exception as e:
+                with self._lock:
+                    stats = self._stats[metric_type]
+                    stats.failures += 1
+                    stats.last_error = f"{type(e).__name__}: {e}"
+                logger.error(f"Collector '{metric_type}' failed: {e}")
+
+        return results
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        수집기별 실행 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 메트릭 타입별 통계
+        """
+        with self._lock:
+            return {
+                metric_type: stats.to_dict()
+                for metric_type, stats in self._stats.items()
+            }
+
+    def shutdown(self):
+        """스레드 풀을 종료합니다 (진행 중인 수집은 기다리지 않음)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
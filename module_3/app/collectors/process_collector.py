@@ -1,10 +1,134 @@
 """프로세스 메트릭 수집기"""
+import heapq
+import threading
+import time
 import psutil
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+# 이보다 짧은 간격의 재호출은 CPU 사용률을 다시 계산하지 않음 (초)
+_MIN_CPU_INTERVAL = 0.1
+
+
+class _ProcessEntry:
+    """프로세스 테이블의 한 항목 (불변 속성 캐시와 직전 CPU 시간)"""
+
+    __slots__ = ('process', 'key', 'name', 'username', 'cpu_time', 'sampled_at', 'cpu_percent', 'rss')
+
+    def __init__(self, process: psutil.Process):
+        self.process = process
+        # (pid, create_time)으로 PID 재사용을 구분
+        try:
+            create_time = process.create_time()
+        except psutil.AccessDenied:
+            create_time = 0.0
+        self.key: Tuple[int, float] = (process.pid, create_time)
+        self.name: Optional[str] = None
+        self.username: Optional[str] = None
+        self.cpu_time: Optional[float] = None
+        self.sampled_at = 0.0
+        self.cpu_percent = 0.0
+        self.rss = 0
 
 
 class ProcessCollector:
-    """상위 프로세스 정보를 수집하는 클래스"""
+    """
+    상위 프로세스 정보를 수집하는 클래스.
+
+    호출마다 Process 객체를 새로 만들면 CPU 사용률의 기준 시점이 없어 항상 0.0이 되므로,
+    PID별 프로세스 테이블을 (pid, create_time)으로 검증하며 유지하고 직전 CPU 시간과의 델타로
+    사용률을 계산합니다. 정렬 기준 값만 전체 프로세스에서 읽고 힙으로 상위 N개를 고른 뒤,
+    선택된 프로세스에 대해서만 상세 정보를 조회합니다. 이름과 사용자처럼 변하지 않는
+    속성은 처음 조회할 때 캐시합니다.
+    """
+
+    def __init__(self):
+        """프로세스 수집기 초기화 (CPU 기준 시점을 위해 테이블을 한 번 채움)"""
+        self._table: Dict[int, _ProcessEntry] = {}
+        self._lock = threading.Lock()
+        self._memory_total = psutil.virtual_memory().total
+        with self._lock:
+            now = time.monotonic()
+            for entry in self._sync_table():
+                try:
+                    self._sample_cpu(entry, now)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+
+    def _sync_table(self) -> List[_ProcessEntry]:
+        """
+        현재 프로세스 목록에 맞춰 테이블을 갱신하고 살아 있는 항목을 반환합니다.
+
+        psutil.process_iter()는 PID별 Process 객체를 캐시하고, 이전 호출 이후 사라졌다가
+        다시 쓰인 PID는 생성 시 create_time을 읽은 새 객체로 바꿔 돌려줍니다. 따라서 항목의
+        Process가 돌려받은 객체와 다를 때만 항목을 새로 만들며, 프로세스마다 /proc을 다시 읽는
+        is_running() 확인은 하지 않습니다. 두 호출 사이에 종료와 재사용이 모두 일어난 경우는
+        _sample_cpu()가 CPU 시간 감소로 감지합니다.
+        """
+        table: Dict[int, _ProcessEntry] = {}
+        for process in psutil.process_iter():
+            entry = self._table.get(process.pid)
+            if entry is None or entry.process is not process:
+                try:
+                    entry = _ProcessEntry(process)
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    continue
+            table[process.pid] = entry
+        self._table = table
+        return list(table.values())
+
+    def _sample_cpu(self, entry: _ProcessEntry, now: float) -> float:
+        """
+        직전 샘플 이후의 CPU 시간 델타로 사용률을 계산합니다.
+
+        처음 본 프로세스는 기준 시점만 기록하고 0.0을 반환합니다.
+        """
+        if entry.cpu_time is not None and now - entry.sampled_at < _MIN_CPU_INTERVAL:
+            return entry.cpu_percent
+
+        times = entry.process.cpu_times()
+        cpu_time = times.user + times.system
+        if entry.cpu_time is not None:
+            delta = cpu_time - entry.cpu_time
+            if delta >= 0:
+                entry.cpu_percent = round(delta / (now - entry.sampled_at) * 100.0, 1)
+            else:
+                # 두 수집 사이에 PID가 재사용되어 CPU 시간이 줄었다면 기준 시점과 캐시된 속성을 다시 기록
+                entry.name = None
+                entry.username = None
+
+        entry.cpu_time = cpu_time
+        entry.sampled_at = now
+        return entry.cpu_percent
+
+    def _describe(self, entry: _ProcessEntry, now: float, sort_by: str) -> Dict[str, Any]:
+        """선택된 프로세스의 상세 정보를 조회합니다."""
+        process = entry.process
+        with process.oneshot():
+            if entry.name is None:
+                try:
+                    entry.name = process.name()
+                except psutil.AccessDenied:
+                    entry.name = ''
+                try:
+                    entry.username = process.username()
+                except (psutil.AccessDenied, KeyError):
+                    entry.username = None
+            if sort_by == 'cpu':
+                entry.rss = process.memory_info().rss
+            else:
+                self._sample_cpu(entry, now)
+            status = process.status()
+
+        return {
+            'pid': entry.key[0],
+            'name': entry.name,
+            'cpu_percent': entry.cpu_percent,
+            'memory_percent': entry.rss / self._memory_total * 100.0 if self._memory_total else 0,
+            'memory_info_rss': entry.rss,
+            'status': status,
+            'username': entry.username,
+            'create_time': entry.key[1]
+        }
 
     def collect(self, limit: int = 10, sort_by: str = 'cpu') -> List[Dict[str, Any]]:
         """
@@ -19,42 +143,45 @@ class ProcessCollector:
                 각 프로세스는 다음 정보를 포함:
                 - pid: 프로세스 ID
                 - name: 프로세스 이름
-                - cpu_percent: CPU 사용률 (%)
+                - cpu_percent: 직전 수집 이후 CPU 사용률 (%)
                 - memory_percent: 메모리 사용률 (%)
                 - memory_info_rss: RSS 메모리 (bytes)
                 - status: 프로세스 상태
                 - username: 프로세스 소유자
                 - create_time: 프로세스 생성 시간 (timestamp)
         """
-        processes = []
-
-        # 모든 프로세스 정보 수집
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent',
-                                         'memory_info', 'status', 'username', 'create_time']):
-            try:
-                pinfo = proc.info
-                processes.append({
-                    'pid': pinfo['pid'],
-                    'name': pinfo['name'],
-                    'cpu_percent': pinfo['cpu_percent'] or 0,
-                    'memory_percent': pinfo['memory_percent'] or 0,
-                    'memory_info_rss': pinfo['memory_info'].rss if pinfo['memory_info'] else 0,
-                    'status': pinfo['status'],
-                    'username': pinfo['username'],
-                    'create_time': pinfo['create_time']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                # 프로세스가 종료되었거나 접근 권한이 없는 경우 건너뛰기
-                continue
-
-        # 정렬 기준에 따라 정렬
-        if sort_by == 'cpu':
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-        elif sort_by == 'memory':
-            processes.sort(key=lambda x: x['memory_percent'], reverse=True)
-
-        # 상위 N개만 반환
-        return processes[:limit]
+        with self._lock:
+            now = time.monotonic()
+
+            # 정렬 기준 값만 읽어서 후보 목록 구성
+            candidates = []
+            for entry in self._sync_table():
+                try:
+                    if sort_by == 'memory':
+                        entry.rss = entry.process.memory_info().rss
+                        sort_key = entry.rss
+                    else:
+                        sort_key = self._sample_cpu(entry, now)
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    self._table.pop(entry.key[0], None)
+                    continue
+                except psutil.AccessDenied:
+                    sort_key = 0
+                candidates.append((sort_key, entry.key[0]))
+
+            # 상위 N개만 선택한 뒤 상세 정보 조회
+            processes = []
+            for _, pid in heapq.nlargest(limit, candidates):
+                entry = self._table.get(pid)
+                if entry is None:
+                    continue
+                try:
+                    processes.append(self._describe(entry, now, sort_by))
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    # 프로세스가 종료되었거나 접근 권한이 없는 경우 건너뛰기
+                    continue
+
+            return processes
 
     def get_metric_type(self) -> str:
         """메트릭 타입 반환"""
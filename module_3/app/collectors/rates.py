@@ -0,0 +1,77 @@
+"""누적 카운터의 초당 변화율 계산"""
+import threading
+import time
+from typing import Dict, Optional, Iterable, Tuple
+
+
+def counter_delta(previous: int, current: int) -> int:
+    """
+    누적 카운터의 증가량을 계산합니다.
+
+    카운터가 줄었다면 리셋(인터페이스 재생성, 드라이버 재적재 등)으로 보고
+    0부터 다시 증가한 것으로 취급합니다. 32비트 카운터 랩어라운드는 psutil이
+    nowrap=True(기본값)로 이미 보정합니다.
+    """
+    if current >= previous:
+        return current - previous
+    return current
+
+
+class CounterRates:
+    """
+    키(디스크, 인터페이스 등)별 직전 카운터 값을 보관하고 초당 변화율을 계산합니다.
+
+    여러 수집기가 공유하는 파생 단계로, 클라이언트가 연속된 샘플의 차이를
+    직접 계산하지 않아도 되도록 서버에서 한 번만 계산합니다.
+    """
+
+    def __init__(self):
+        self._previous: Dict[str, Tuple[float, Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        key: str,
+        counters: Dict[str, int],
+        now: Optional[float] = None
+    ) -> Dict[str, Optional[float]]:
+        """
+        카운터를 기록하고 직전 기록 이후의 초당 변화율을 반환합니다.
+
+        Args:
+            key: 카운터 묶음 이름 (예: 'total', 'eth0')
+            counters: 카운터 이름별 누적 값
+            now: 측정 시각 (time.monotonic 기준, None이면 현재)
+
+        Returns:
+            Dict[str, Optional[float]]: '<카운터 이름>_per_sec' 키의 변화율
+                (처음 본 키나 경과 시간이 0이면 None)
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self._lock:
+            previous = self._previous.get(key)
+            self._previous[key] = (now, counters)
+
+        rates: Dict[str, Optional[float]] = {}
+        elapsed = now - previous[0] if previous else 0.0
+        for name, value in counters.items():
+            last = previous[1].get(name) if previous else None
+            if last is None or value is None or elapsed <= 0:
+                rates[f'{name}_per_sec'] = None
+            else:
+                rates[f'{name}_per_sec'] = counter_delta(last, value) / elapsed
+        return rates
+
+    def prune(self, keys: Iterable[str]):
+        """
+        주어진 키 외의 기록을 삭제합니다 (사라진 디스크/인터페이스 정리).
+
+        Args:
+            keys: 유지할 키 목록
+        """
+        keep = set(keys)
+        with self._lock:
+            for key in [key for key in self._previous if key not in keep]:
+                del self._previous[key]
@@ -0,0 +1,87 @@
+"""애플리케이션 설정"""
+from typing import Dict, List, Optional, Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    환경 변수(.env 포함)에서 읽어오는 애플리케이션 설정.
+    변수 이름은 필드 이름의 대문자 형태입니다 (예: COLLECTION_INTERVAL).
+    """
+    model_config = SettingsConfigDict(env_file='.env', extra='ignore')
+
+    # 메트릭 수집 주기 (초)
+    collection_interval: int = 5
+
+    # /metrics/current 스냅샷의 최대 허용 경과 시간 (초)
+    snapshot_max_staleness: float = 10.0
+
+    # 수집기 동시 실행 스레드 수와 수집기별 타임아웃 (초)
+    collector_workers: int = 4
+    collector_timeout: float = 3.0
+    collector_timeouts: Dict[str, float] = {}  # 예: COLLECTOR_TIMEOUTS='{"disk": 5.0}'
+
+    # 호스트 정적 정보(코어 수, 파티션 목록 등)를 다시 읽는 주기 (초)
+    inventory_refresh_interval: float = 300.0
+
+    # 실시간 스트림 구독자별 최대 대기 프레임 수 (초과 시 가장 오래된 프레임을 버림)
+    stream_queue_size: int = 8
+
+    # 델타 스트림의 주기적 키프레임 간격 (스냅샷 수, 기본 12 = 수집 주기 5초 기준 1분)
+    stream_keyframe_interval: int = 12
+
+    # 원본 데이터 보관 기간 (초). 보관 포인트 수는 raw_retention / collection_interval
+    raw_retention: int = 3600
+
+    # 롤업 계층 [(버킷 크기(초), 보관 버킷 수), ...]. 기본: 1분 평균 1일치, 10분 평균 30일치
+    rollup_tiers: List[Tuple[int, int]] = [(60, 1440), (600, 4320)]
+
+    # 스토리지 백엔드: 'memory'(인메모리, 재시작 시 초기화), 'sqlite' 또는 'segment'(파일, 재시작 후에도 이력 유지)
+    storage_backend: str = 'memory'
+
+    # sqlite 백엔드의 파일 경로, 보관 기간(초), 쓰기 배치 간격(초)과 즉시 기록할 대기 샘플 수
+    storage_path: str = 'data/metrics.db'
+    storage_retention: int = 7 * 86400
+    storage_flush_interval: float = 1.0
+    storage_batch_size: int = 500
+
+    # memory 백엔드의 WAL 사용 여부, 디렉토리, 스냅샷(compaction) 주기(초), 레코드마다 fsync 여부
+    # 사용하면 재시작 시 마지막 스냅샷과 이후 로그로 버퍼를 복원
+    wal_enabled: bool = False
+    wal_dir: str = 'data/wal'
+    wal_compact_interval: int = 300
+    wal_fsync: bool = False
+
+    # segment 백엔드의 세그먼트 디렉토리와 세그먼트 하나가 담는 기간(초). 보관 기간은 storage_retention 사용
+    segment_dir: str = 'data/segments'
+    segment_duration: int = 3600
+
+    # 응답 압축 최소 본문 크기 (bytes)와 인코딩별 압축 레벨 (zstd는 zstandard 설치 시 사용)
+    compression_min_size: int = 1024
+    compression_levels: Dict[str, int] = {'gzip': 6, 'zstd': 3}
+
+    # 알림 규칙 식 목록 (예: "cpu_percent > 90 for 60s", "swap_percent rate > 0.5")과 보관할 상태 전이 이벤트 수
+    alert_rules: List[str] = ['cpu_percent > 90 for 60s', 'memory_percent > 90 for 60s']
+    alert_max_events: int = 1000
+
+    # 알림 규칙 JSON 파일 (설정의 규칙에 추가, 바뀌면 재시작 없이 다시 읽음)과 변경 확인 주기(초)
+    alert_rules_file: Optional[str] = None
+    alert_rules_reload_interval: int = 10
+
+    # 이상 탐지 (필드별 EWMA 기준선 z-score를 'anomaly' 메트릭으로 저장)
+    # 기준선 가중치(클수록 최근 값을 빨리 따라감), 점수를 내기 전 샘플 수, 기준선 반영 시 값을 자를 표준편차 배수
+    anomaly_enabled: bool = True
+    anomaly_alpha: float = 0.02
+    anomaly_warmup: int = 30
+    anomaly_clip: float = 6.0
+
+    # 자체 계측 (수집기 collect(), 스토리지 잠금 대기/보유, 라우트별 지연 시간 히스토그램, /api/v1/debug/timings)
+    instrumentation_enabled: bool = True
+
+    @property
+    def max_data_points(self) -> int:
+        """메트릭 타입당 원본 데이터 포인트 수"""
+        return max(1, self.raw_retention // max(1, self.collection_interval))
+
+
+settings = Settings()
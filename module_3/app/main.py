@@ -10,8 +10,24 @@ from app.collectors.memory_collector import MemoryCollector
 from app.collectors.disk_collector import DiskCollector
 from app.collectors.network_collector import NetworkCollector
 from app.collectors.process_collector import ProcessCollector
+from app.collectors.host_inventory import HostInventory
+from app.collectors.pipeline import CollectionPipeline
+from app.alerts.anomaly import AnomalyDetector
+from app.alerts.engine import AlertEngine
+from app.alerts.loader import RuleFileLoader
+from app.alerts.rules import parse_rule
+from app.storage.base import MetricStorage
 from app.storage.memory_storage import MemoryStorage
-from app.api.routes import metrics
+from app.storage.segment_storage import SegmentStorage
+from app.storage.sqlite_storage import SQLiteStorage
+from app.storage.snapshot_cache import SnapshotCache
+from app.storage.wal import WriteAheadLog
+from app.streaming.hub import StreamHub
+from app.api.routes import alerts, debug, metrics, prometheus, stream
+from app.api.compression import CompressionMiddleware, EncodedBodyCache
+from app.api.timing import TimingMiddleware
+from app.utils.instrumentation import Instrumentation
+from app.config import settings
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,26 +40,70 @@ logger = logging.getLogger(__name__)
 scheduler = None
 storage = None
 collectors = None
+snapshot_cache = None
+pipeline = None
+stream_hub = None
+inventory = None
+alert_engine = None
+rule_loader = None
+anomaly_detector = None
+# 수집기, 스토리지 잠금, 라우트별 지연 시간 히스토그램 (/api/v1/debug/timings)
+instrumentation = Instrumentation(enabled=settings.instrumentation_enabled)
+
+
+def create_storage() -> MetricStorage:
+    """설정된 백엔드의 스토리지를 생성합니다."""
+    if settings.storage_backend == 'sqlite':
+        # 이력은 파일에 보관하고, 쓰기는 백그라운드 스레드가 배치로 기록
+        return SQLiteStorage(
+            settings.storage_path,
+            retention=settings.storage_retention,
+            flush_interval=settings.storage_flush_interval,
+            batch_size=settings.storage_batch_size
+        )
+    if settings.storage_backend == 'segment':
+        # 고정 폭 레코드를 순환 세그먼트 파일에 기록하고 mmap으로 조회
+        return SegmentStorage(
+            settings.segment_dir,
+            retention=settings.storage_retention,
+            segment_duration=settings.segment_duration
+        )
+    if settings.storage_backend != 'memory':
+        raise ValueError(f"Unknown storage backend: {settings.storage_backend}")
+    # 원본 1시간 (수집 주기 5초 기준 720개) + 1분/10분 롤업 계층
+    return MemoryStorage(
+        max_data_points=settings.max_data_points,
+        rollups=settings.rollup_tiers,
+        wal=WriteAheadLog(settings.wal_dir, fsync=settings.wal_fsync) if settings.wal_enabled else None,
+        instrumentation=instrumentation
+    )
 
 
 def collect_metrics():
     """주기적으로 메트릭을 수집하여 스토리지에 저장"""
     try:
-        # CPU 메트릭 수집 및 저장
-        cpu_data = collectors['cpu'].collect()
-        storage.save_metric('cpu', cpu_data)
+        # 수집기를 동시에 실행 (실패하거나 타임아웃된 수집기는 결과에서 제외)
+        results = pipeline.run()
 
-        # 메모리 메트릭 수집 및 저장
-        memory_data = collectors['memory'].collect()
-        storage.save_metric('memory', memory_data)
+        for metric_type, data in results.items():
+            storage.save_metric(metric_type, data)
+            # 저장된 샘플로 알림 규칙 증분 평가
+            alert_engine.observe(metric_type, data)
 
-        # 디스크 메트릭 수집 및 저장
-        disk_data = collectors['disk'].collect()
-        storage.save_metric('disk', disk_data)
+        if anomaly_detector and results:
+            # 필드별 이상 점수를 별도 시계열로 저장하고 같은 방식으로 알림 평가
+            scores = anomaly_detector.score(results)
+            storage.save_metric('anomaly', scores)
+            alert_engine.observe('anomaly', scores)
 
-        # 네트워크 메트릭 수집 및 저장
-        network_data = collectors['network'].collect()
-        storage.save_metric('network', network_data)
+        # /metrics/current 요청이 읽을 스냅샷 갱신
+        # 이번 틱에 빠진 메트릭은 직전 스냅샷 값과 그 수집 시각을 유지 (stale로 표시)
+        previous = snapshot_cache.peek()
+        snapshot = {**previous.data, **results} if previous else results
+        carried = [metric_type for metric_type in snapshot if metric_type not in results]
+        if all(metric_type in snapshot for metric_type in metrics.SNAPSHOT_METRIC_TYPES):
+            # 실시간 구독자에게도 같은 스냅샷 전달
+            stream_hub.publish(snapshot_cache.update(snapshot, carried))
 
         logger.debug("Metrics collected successfully")
 
@@ -54,38 +114,99 @@ def collect_metrics():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클 관리"""
-    global scheduler, storage, collectors
+    global scheduler, storage, collectors, snapshot_cache, pipeline, stream_hub, inventory, alert_engine, rule_loader, anomaly_detector
 
     logger.info("Starting System Monitoring Application...")
 
     # 스토리지 초기화
-    storage = MemoryStorage(max_data_points=3600)  # 1시간 데이터 (1초당 1개)
-    logger.info("Storage initialized")
+    storage = create_storage()
+    if isinstance(storage, MemoryStorage) and storage.wal is not None:
+        # 재시작 전 버퍼를 마지막 스냅샷과 이후 로그로 복원
+        replayed = storage.restore()
+        logger.info(f"Storage restored from WAL ({replayed} records replayed, {storage.get_stats()})")
+    snapshot_cache = SnapshotCache(max_staleness=settings.snapshot_max_staleness)
+    stream_hub = StreamHub(
+        queue_size=settings.stream_queue_size,
+        keyframe_interval=settings.stream_keyframe_interval
+    )
+    logger.info(f"Storage initialized ({settings.storage_backend})")
 
     # 수집기 초기화
+    # 정적 값(코어 수, 전체 메모리, 파티션 장치 등)은 인벤토리가 보관하고 샘플에는 변하는 값만 저장
+    inventory = HostInventory(refresh_interval=settings.inventory_refresh_interval)
     collectors = {
-        'cpu': CPUCollector(),
-        'memory': MemoryCollector(),
-        'disk': DiskCollector(),
-        'network': NetworkCollector(),
+        'cpu': CPUCollector(inventory=inventory, include_static=False),
+        'memory': MemoryCollector(include_static=False),
+        'disk': DiskCollector(inventory=inventory, include_static=False),
+        'network': NetworkCollector(inventory=inventory),
         'process': ProcessCollector()
     }
+    pipeline = CollectionPipeline(
+        {metric_type: collectors[metric_type] for metric_type in metrics.SNAPSHOT_METRIC_TYPES},
+        max_workers=settings.collector_workers,
+        timeout=settings.collector_timeout,
+        timeouts=settings.collector_timeouts,
+        instrumentation=instrumentation
+    )
     logger.info("Collectors initialized")
 
     # API 라우트에 의존성 주입
-    metrics.set_dependencies(collectors, storage)
+    # /metrics/current 본문은 스냅샷마다 한 번만 직렬화/압축
+    body_cache = EncodedBodyCache(
+        minimum_size=settings.compression_min_size,
+        levels=settings.compression_levels
+    )
+    metrics.set_dependencies(collectors, storage, snapshot_cache, pipeline, inventory, body_cache)
+    stream.set_dependencies(stream_hub)
+    debug.set_dependencies(instrumentation)
+    # Prometheus 본문도 스냅샷마다 한 번만 렌더링 (캐시는 키 하나만 보관하므로 별도 인스턴스)
+    prometheus.set_dependencies(snapshot_cache, inventory, EncodedBodyCache(
+        minimum_size=settings.compression_min_size,
+        levels=settings.compression_levels
+    ))
+
+    # 알림 평가기 초기화 (설정의 잘못된 규칙 식은 시작 시 오류, 규칙 파일 오류는 기록 후 계속)
+    base_rules = [parse_rule(expression) for expression in settings.alert_rules]
+    alert_engine = AlertEngine(base_rules, max_events=settings.alert_max_events)
+    if settings.alert_rules_file:
+        rule_loader = RuleFileLoader(alert_engine, settings.alert_rules_file, base_rules)
+        rule_loader.poll()
+    alerts.set_dependencies(alert_engine, rule_loader)
+    logger.info(f"Alert engine initialized ({alert_engine.get_stats()['rules']} rules)")
+    if settings.anomaly_enabled:
+        anomaly_detector = AnomalyDetector(
+            alpha=settings.anomaly_alpha,
+            warmup=settings.anomaly_warmup,
+            clip=settings.anomaly_clip
+        )
 
     # 스케줄러 시작
     scheduler = BackgroundScheduler()
     scheduler.add_job(
         collect_metrics,
         'interval',
-        seconds=5,  # 5초마다 수집
+        seconds=settings.collection_interval,
         id='metric_collection',
         replace_existing=True
     )
+    if isinstance(storage, MemoryStorage) and storage.wal is not None:
+        scheduler.add_job(
+            storage.compact,
+            'interval',
+            seconds=settings.wal_compact_interval,
+            id='wal_compaction',
+            replace_existing=True
+        )
+    if rule_loader:
+        scheduler.add_job(
+            rule_loader.poll,
+            'interval',
+            seconds=settings.alert_rules_reload_interval,
+            id='alert_rules_reload',
+            replace_existing=True
+        )
     scheduler.start()
-    logger.info("Scheduler started (collecting every 5 seconds)")
+    logger.info(f"Scheduler started (collecting every {settings.collection_interval} seconds)")
 
     # 첫 번째 메트릭 수집 (즉시)
     collect_metrics()
@@ -97,6 +218,11 @@ async def lifespan(app: FastAPI):
     if scheduler:
         scheduler.shutdown()
         logger.info("Scheduler stopped")
+    if pipeline:
+        pipeline.shutdown()
+    if storage:
+        # 대기 중인 쓰기를 기록하고 파일을 닫음
+        storage.close()
 
 
 # FastAPI 애플리케이션 생성
@@ -116,8 +242,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 추가 (작은 응답, 이미 압축된 응답, 스트리밍 응답은 그대로 전달)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    levels=settings.compression_levels
+)
+
+# 라우트별 지연 시간 계측 미들웨어 추가 (가장 바깥에서 압축 시간까지 포함해 응답 시작까지 측정)
+app.add_middleware(TimingMiddleware, instrumentation=instrumentation)
+
 # 라우터 등록
 app.include_router(metrics.router)
+app.include_router(stream.router)
+app.include_router(alerts.router)
+app.include_router(prometheus.router)
+app.include_router(debug.router)
 
 
 @app.get("/")
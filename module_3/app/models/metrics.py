@@ -51,6 +51,11 @@ class DiskMetrics(BaseModel):
     io_write_count: Optional[int]
     io_read_time: Optional[int] = None
     io_write_time: Optional[int] = None
+    io_read_bytes_per_sec: Optional[float] = None
+    io_write_bytes_per_sec: Optional[float] = None
+    io_read_ops_per_sec: Optional[float] = None
+    io_write_ops_per_sec: Optional[float] = None
+    disks: Dict[str, Dict[str, Optional[float]]] = {}
 
 
 class NetworkMetrics(BaseModel):
@@ -65,6 +70,15 @@ class NetworkMetrics(BaseModel):
     dropin: int
     dropout: int
     interfaces: Dict[str, Dict[str, int]]
+    bytes_sent_per_sec: Optional[float] = None
+    bytes_recv_per_sec: Optional[float] = None
+    packets_sent_per_sec: Optional[float] = None
+    packets_recv_per_sec: Optional[float] = None
+    errin_per_sec: Optional[float] = None
+    errout_per_sec: Optional[float] = None
+    dropin_per_sec: Optional[float] = None
+    dropout_per_sec: Optional[float] = None
+    interface_rates: Dict[str, Dict[str, Optional[float]]] = {}
 
 
 class ProcessInfo(BaseModel):
@@ -0,0 +1,163 @@
+"""스토리지 공통 인터페이스"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from app.storage.columnar import ColumnarSeries, columns_from_rows
+
+# 저장 가능한 메트릭 타입
+METRIC_TYPES = ('cpu', 'memory', 'disk', 'network', 'process', 'anomaly')
+
+
+def to_epoch(value: Union[datetime, float, int]) -> float:
+    """datetime 또는 epoch 값을 epoch float로 변환합니다."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class MetricStorage(ABC):
+    """
+    메트릭 스토리지 인터페이스.
+
+    API 라우트와 스케줄러는 이 인터페이스만 사용하므로 인메모리(MemoryStorage)와
+    파일 기반(SQLiteStorage) 등 다른 구현으로 교체할 수 있습니다.
+
+    구현은 메트릭 타입별 시퀀스 번호(get_sequence)를 저장/삭제할 때마다 증가시켜야 하며,
+    epoch 속성은 시퀀스 번호가 다시 시작될 수 있는 경우(새 인스턴스 등) 달라져야 합니다.
+    보관 기간 만료처럼 시퀀스 번호와 무관하게 행이 사라지는 구현은 get_version을 재정의해야 합니다.
+    조회 결과 행은 'timestamp'(datetime)를 포함한 딕셔너리입니다.
+    """
+
+    epoch: str = ''
+
+    @abstractmethod
+    def save_metric(self, metric_type: str, data: Dict[str, Any]) -> bool:
+        """
+        메트릭 데이터를 저장합니다. 수집 경로에서 호출되므로 디스크 I/O로 블로킹되어서는 안 됩니다.
+
+        Args:
+            metric_type: 메트릭 타입 (cpu, memory, disk, network, process)
+            data: 저장할 메트릭 데이터
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+
+    @abstractmethod
+    def get_sequence(self, metric_type: str) -> int:
+        """메트릭 타입의 현재 시퀀스 번호를 반환합니다 (알 수 없는 타입이면 0)."""
+
+    def get_version(self, metric_type: str) -> str:
+        """
+        메트릭 타입의 조회 결과 버전을 반환합니다 (ETag 생성용).
+
+        버전이 같으면 같은 파라미터의 조회 결과도 같아야 합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            str: epoch와 시퀀스 번호로 만든 버전 문자열
+        """
+        return f"{self.epoch}.{self.get_sequence(metric_type)}"
+
+    @abstractmethod
+    def get_latest(self, metric_type: str) -> Optional[Dict[str, Any]]:
+        """특정 메트릭 타입의 최신 데이터를 반환합니다."""
+
+    @abstractmethod
+    def get_range(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """특정 메트릭 타입의 시간 범위 데이터를 시간순으로 반환합니다 (limit 초과 시 최근 행 우선)."""
+
+    @abstractmethod
+    def get_since(
+        self,
+        metric_type: str,
+        since_seq: int,
+        limit: Optional[int] = None,
+        columns: bool = False
+    ) -> Tuple[Any, int, bool]:
+        """시퀀스 번호 since_seq 이후에 저장된 데이터와 다음 커서, gap 여부를 반환합니다."""
+
+    @abstractmethod
+    def clear(self, metric_type: Optional[str] = None):
+        """저장된 데이터를 삭제합니다 (None이면 전체)."""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, int]:
+        """메트릭 타입별 데이터 포인트 수를 반환합니다."""
+
+    def get_columns(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[Any, Dict[tuple, Any]]:
+        """
+        get_range()와 같은 구간을 컬럼 단위로 반환합니다.
+
+        기본 구현은 행을 조회한 뒤 변환하며, 컬럼 단위로 보관하는 구현은 재정의합니다.
+        """
+        return columns_from_rows(self.get_range(metric_type, start=start, end=end, limit=limit))
+
+    def get_downsampled(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        step: float = 60,
+        agg: str = 'avg',
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        시간 범위 데이터를 step 초 단위 버킷으로 집계하여 반환합니다.
+
+        기본 구현은 구간의 행을 임시 ColumnarSeries에 담아 MemoryStorage와 같은 방식으로 집계합니다.
+        """
+        rows = self.get_range(metric_type, start=start, end=end)
+        series = ColumnarSeries(max(1, len(rows)))
+        for row in rows:
+            series.append(to_epoch(row['timestamp']), row)
+
+        lo, hi = 0, len(series)
+        if limit and limit > 0 and lo < hi:
+            # 최근 limit개 버킷에 해당하는 구간만 집계
+            last_bucket = (series.timestamp(hi - 1) // step) * step
+            lo = series.search(start=last_bucket - (limit - 1) * step)[0]
+        return series.downsample(lo, hi, step, agg)
+
+    def get_all_latest(self) -> Dict[str, Any]:
+        """
+        모든 메트릭 타입의 최신 데이터를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 메트릭 타입별 최신 데이터
+        """
+        result = {}
+        for metric_type in METRIC_TYPES:
+            latest = self.get_latest(metric_type)
+            if latest:
+                result[metric_type] = latest
+        return result
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """메트릭 타입별 메모리 사용량 (bytes, 메모리에 보관하지 않는 구현은 빈 딕셔너리)"""
+        return {}
+
+    def get_tier_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """메트릭 타입별 저장 계층 현황 (계층이 없는 구현은 빈 딕셔너리)"""
+        return {}
+
+    def flush(self):
+        """대기 중인 쓰기를 영구 저장소에 반영합니다 (기본: 할 일 없음)."""
+
+    def close(self):
+        """대기 중인 쓰기를 반영하고 리소스를 정리합니다 (기본: 할 일 없음)."""
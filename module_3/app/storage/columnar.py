@@ -0,0 +1,874 @@
+"""컬럼 기반 링 버퍼 시계열 저장소"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+import math
+import operator
+import sys
+
+# 빈 컨테이너는 평탄화하면 사라지므로 오브젝트 컬럼에 표식으로 저장
+_EMPTY_LIST = object()
+_EMPTY_DICT = object()
+
+# int64 컬럼에 저장할 수 있는 정수 범위
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+Path = Tuple[Any, ...]
+
+
+def flatten(data: Dict[str, Any], skip: Tuple[str, ...] = ('timestamp',)) -> Dict[Path, Any]:
+    """
+    중첩된 딕셔너리/리스트를 경로 튜플을 키로 하는 평탄한 딕셔너리로 변환합니다.
+
+    딕셔너리 키는 문자열, 리스트 인덱스는 정수로 경로에 기록됩니다.
+    예: {'interfaces': {'eth0': {'bytes_sent': 1}}} -> {('interfaces', 'eth0', 'bytes_sent'): 1}
+
+    Args:
+        data: 평탄화할 메트릭 딕셔너리
+        skip: 최상위에서 제외할 키
+
+    Returns:
+        Dict[Path, Any]: 경로별 스칼라 값
+    """
+    out: Dict[Path, Any] = {}
+    for key, value in data.items():
+        if key not in skip:
+            _flatten_into(out, (key,), value)
+    return out
+
+
+def _flatten_into(out: Dict[Path, Any], prefix: Path, value: Any):
+    if isinstance(value, dict):
+        if not value:
+            out[prefix] = _EMPTY_DICT
+        for key, item in value.items():
+            _flatten_into(out, prefix + (key,), item)
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            out[prefix] = _EMPTY_LIST
+        for index, item in enumerate(value):
+            _flatten_into(out, prefix + (index,), item)
+    else:
+        out[prefix] = value
+
+
+def unflatten(flat: Dict[Path, Any]) -> Dict[str, Any]:
+    """
+    flatten()의 역변환. 정수 키만 가진 단계는 리스트로 복원합니다.
+
+    Args:
+        flat: 경로 튜플을 키로 하는 값
+
+    Returns:
+        Dict[str, Any]: 중첩된 딕셔너리
+    """
+    tree: Dict[Any, Any] = {}
+    for path, value in flat.items():
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return _listify(tree)
+
+
+def _listify(node):
+    if not isinstance(node, dict):
+        if node is _EMPTY_LIST:
+            return []
+        if node is _EMPTY_DICT:
+            return {}
+        return node
+    if node and all(type(key) is int for key in node):
+        return [_listify(node[key]) for key in sorted(node)]
+    return {key: _listify(child) for key, child in node.items()}
+
+
+def _aggregate(values, agg: str):
+    """숫자 시퀀스를 집계합니다 (avg, min, max, p95, last)"""
+    if agg == 'avg':
+        return sum(values) / len(values)
+    if agg == 'min':
+        return min(values)
+    if agg == 'max':
+        return max(values)
+    if agg == 'p95':
+        # nearest-rank 방식
+        ordered = sorted(values)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return values[-1]
+
+
+def _weighted_average(values, weights, total: float):
+    """행별 샘플 수로 가중한 평균 (샘플 수 합이 0이면 단순 평균)"""
+    if not total:
+        return sum(values) / len(values)
+    return sum(map(operator.mul, values, weights)) / total
+
+
+AGGREGATIONS = ('avg', 'min', 'max', 'p95', 'last')
+
+# 롤업 계층 행의 원본 샘플 수 컬럼
+SAMPLE_COUNT_PATH: Path = ('sample_count',)
+
+
+def bucket_bounds(timestamps, step: float) -> List[Tuple[float, int, int]]:
+    """
+    정렬된 타임스탬프 시퀀스를 step 초 단위의 시간 버킷으로 나눕니다.
+
+    버킷 경계는 epoch 기준으로 정렬되며(예: step=60이면 매 분 정각), 빈 버킷은 생략됩니다.
+
+    Returns:
+        List[Tuple[float, int, int]]: (버킷 시작 epoch, 시작 오프셋, 끝 오프셋) 목록
+    """
+    result = []
+    position = 0
+    while position < len(timestamps):
+        bucket_start = math.floor(timestamps[position] / step) * step
+        end = bisect_left(timestamps, bucket_start + step, position)
+        result.append((bucket_start, position, end))
+        position = end
+    return result
+
+
+def downsample_columns(timestamps, columns: Dict[Path, Any], step: float,
+                       agg: str = 'avg') -> List[Dict[str, Any]]:
+    """
+    컬럼 단위 데이터를 행으로 복원하지 않고 시간 버킷별로 집계합니다.
+
+    ColumnarSeries.downsample()과 같은 규칙으로, 숫자 컬럼(array)은 버킷 구간을 잘라 집계하고
+    오브젝트 컬럼(리스트)은 버킷의 마지막 값을 사용합니다.
+
+    Args:
+        timestamps: 정렬된 epoch 타임스탬프
+        columns: 경로별 값 (array 또는 리스트, 길이는 timestamps와 같음)
+        step: 버킷 크기 (초)
+        agg: 집계 방식 (avg, min, max, p95, last)
+
+    Returns:
+        List[Dict[str, Any]]: 버킷별 집계 행 ('timestamp'는 버킷 시작 시각,
+            'sample_count'는 버킷의 샘플 수)
+    """
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation: {agg}")
+
+    buckets = bucket_bounds(timestamps, step)
+    aggregated = {}
+    for path, values in columns.items():
+        if isinstance(values, array):
+            aggregated[path] = [_aggregate(values[begin:end], agg) for _, begin, end in buckets]
+        else:
+            aggregated[path] = [values[end - 1] for _, _, end in buckets]
+
+    rows = []
+    for index, (bucket_start, begin, end) in enumerate(buckets):
+        # 빈 컨테이너 값은 행마다 새로 만들어 공유되지 않도록 함
+        row = unflatten({
+            path: type(values[index])() if isinstance(values[index], (list, dict)) else values[index]
+            for path, values in aggregated.items()
+        })
+        row['timestamp'] = datetime.fromtimestamp(bucket_start)
+        row['sample_count'] = end - begin
+        rows.append(row)
+    return rows
+
+
+def columns_from_rows(rows: List[Dict[str, Any]]) -> Tuple[array, Dict[Path, list]]:
+    """
+    행 딕셔너리 목록을 컬럼 단위로 변환합니다 (집계 결과 등 이미 복원된 행용).
+
+    모든 행에 값이 있는 경로만 포함합니다.
+
+    Args:
+        rows: 'timestamp'(datetime)를 포함한 행 목록
+
+    Returns:
+        Tuple[array, Dict[Path, list]]: (epoch 타임스탬프 array('d'), 경로별 값 리스트)
+    """
+    timestamps = array('d', (row['timestamp'].timestamp() for row in rows))
+    flat_rows = [flatten(row) for row in rows]
+    if not flat_rows:
+        return timestamps, {}
+    common = [
+        path for path, value in flat_rows[0].items()
+        if value is not None and all(flat.get(path) is not None for flat in flat_rows)
+    ]
+    return timestamps, {path: [_listify(flat[path]) for flat in flat_rows] for path in common}
+
+
+# 상태 직렬화(marshal) 시 빈 컨테이너 표식을 대신하는 값 (평탄화된 값은 튜플이 될 수 없음)
+_STATE_MARKERS = {id(_EMPTY_LIST): ('[]',), id(_EMPTY_DICT): ('{}',)}
+_STATE_SENTINELS = {('[]',): _EMPTY_LIST, ('{}',): _EMPTY_DICT}
+
+
+def encode_state_value(value: Any) -> Any:
+    """평탄화된 값을 marshal로 직렬화할 수 있는 값으로 바꿉니다 (빈 컨테이너 표식 처리)."""
+    return _STATE_MARKERS.get(id(value), value) if type(value) is object else value
+
+
+def decode_state_value(value: Any) -> Any:
+    """encode_state_value()의 역변환"""
+    return _STATE_SENTINELS[value] if type(value) is tuple else value
+
+
+def restore_value(value: Any) -> Any:
+    """평탄화된 값의 빈 컨테이너 표식을 실제 값([] 또는 {})으로 복원합니다."""
+    return _listify(value)
+
+
+def schema_kind(schema: Dict[Path, str], path: Path, value: Any) -> str:
+    """
+    스키마와 값으로 컬럼 타입 코드를 정합니다.
+
+    스키마의 경로 패턴('*'는 임의의 키/인덱스)과 일치하면 그 타입을 사용하되,
+    숫자가 아닌 값은 항상 오브젝트('o')입니다.
+
+    Args:
+        schema: 경로 패턴별 컬럼 타입
+        path: 값의 경로
+        value: 값
+
+    Returns:
+        str: 'q', 'd' 또는 'o'
+    """
+    kind = schema.get(path)
+    if kind is None:
+        for pattern, pattern_kind in schema.items():
+            if len(pattern) == len(path) and all(
+                expected == '*' or expected == actual
+                for expected, actual in zip(pattern, path)
+            ):
+                kind = pattern_kind
+                break
+    value_kind = _kind_of(value)
+    if kind is None or value_kind == 'o':
+        return value_kind
+    return kind
+
+
+def _kind_of(value: Any) -> str:
+    """값에 맞는 컬럼 타입 코드를 반환합니다 ('q': int64, 'd': float64, 'o': 오브젝트)"""
+    value_type = type(value)
+    if value_type is int and _INT_MIN <= value <= _INT_MAX:
+        return 'q'
+    if value_type is float:
+        return 'd'
+    return 'o'
+
+
+def _allocate(kind: str, capacity: int):
+    if kind == 'q':
+        return array('q', [0]) * capacity
+    if kind == 'd':
+        return array('d', [0.0]) * capacity
+    return [None] * capacity
+
+
+class _Column:
+    """
+    단일 필드의 링 버퍼 컬럼.
+
+    지금까지 저장된 값이 모두 같으면 버퍼를 할당하지 않고 상수 하나만 보관하며,
+    다른 값이 처음 들어올 때 버퍼를 할당합니다 (코어 수, 디바이스 이름 등).
+    """
+
+    __slots__ = ('path', 'kind', 'capacity', 'values', 'constant')
+
+    def __init__(self, path: Path, kind: str, capacity: int, value: Any):
+        self.path = path
+        self.kind = kind
+        self.capacity = capacity
+        self.values = None
+        self.constant = self._coerce(value)
+
+    def _coerce(self, value: Any) -> Any:
+        if self.kind == 'd':
+            return float(value)
+        if self.kind == 'q' and type(value) is float:
+            # 정수 스키마에 float가 먼저 들어오면 정수로 바꾸고, 표현할 수 없으면 float64로 승격
+            if value.is_integer() and _INT_MIN <= value <= _INT_MAX:
+                return int(value)
+            self.kind = 'd'
+            return value
+        if type(value) is str:
+            return sys.intern(value)
+        return value
+
+    def _matches_constant(self, value: Any) -> bool:
+        kind = _kind_of(value)
+        if self.kind == 'o':
+            return type(value) is type(self.constant) and value == self.constant
+        if self.kind == 'q':
+            return kind == 'q' and value == self.constant
+        return kind in ('q', 'd') and value == self.constant
+
+    def set(self, index: int, value: Any) -> bool:
+        """
+        값을 저장합니다. 컬럼 타입으로 표현할 수 없으면 타입을 승격합니다.
+
+        Returns:
+            bool: 컬럼 버퍼가 새로 할당되거나 교체되었는지 여부
+        """
+        if self.values is None:
+            if self._matches_constant(value):
+                return False
+            # 이전 행들은 모두 상수 값이었으므로 상수로 채운 버퍼 할당
+            self.values = (
+                [self.constant] * self.capacity if self.kind == 'o'
+                else array(self.kind, [self.constant]) * self.capacity
+            )
+            self.set(index, value)
+            return True
+
+        if self.kind == 'o':
+            self.values[index] = sys.intern(value) if type(value) is str else value
+            return False
+        kind = _kind_of(value)
+        if kind == self.kind or (kind == 'q' and self.kind == 'd'):
+            self.values[index] = value
+            return False
+
+        # int64 -> float64 -> 오브젝트 순으로 승격
+        target = 'd' if kind == 'd' and self.kind == 'q' else 'o'
+        self.values = array('d', self.values) if target == 'd' else list(self.values)
+        self.kind = target
+        self.set(index, value)
+        return True
+
+    def nbytes(self) -> int:
+        if self.values is None:
+            return 0
+        if self.kind == 'o':
+            return sys.getsizeof(self.values)
+        return self.values.buffer_info()[1] * self.values.itemsize
+
+
+def _build_plan(entries: List[Tuple[Path, Optional[_Column]]]):
+    """
+    shape의 (경로, 컬럼) 목록으로 행 복원 계획(트리)을 만듭니다.
+
+    노드 형식:
+        ('v', values)  숫자 값
+        ('o', values)  오브젝트 값 (빈 컨테이너 표식 처리 필요)
+        ('c', value)   상수 컬럼 값
+        ('n', None)    None 값
+        ('d', [(key, node), ...])  딕셔너리
+        ('l', [node, ...])         리스트
+    """
+    tree: Dict[Any, Any] = {}
+    for path, column in entries:
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = column
+    return _plan_node(tree)
+
+
+def _plan_node(node):
+    if isinstance(node, dict):
+        children = [(key, _plan_node(child)) for key, child in node.items()]
+        if children and all(type(key) is int for key, _ in children):
+            children.sort(key=lambda item: item[0])
+            return ('l', [child for _, child in children])
+        return ('d', children)
+    if node is None:
+        return ('n', None)
+    if node.values is None:
+        return ('c', node.constant)
+    return ('o' if node.kind == 'o' else 'v', node.values)
+
+
+def _materialize(node, index: int):
+    kind, payload = node
+    if kind == 'v':
+        return payload[index]
+    if kind == 'd':
+        return {key: _materialize(child, index) for key, child in payload}
+    if kind == 'l':
+        return [_materialize(child, index) for child in payload]
+    if kind == 'o' or kind == 'c':
+        value = payload[index] if kind == 'o' else payload
+        if value is _EMPTY_LIST:
+            return []
+        if value is _EMPTY_DICT:
+            return {}
+        return value
+    return None
+
+
+class ColumnarSeries:
+    """
+    메트릭 타입 하나의 시계열을 컬럼 단위 링 버퍼로 저장합니다.
+
+    샘플마다 딕셔너리를 보관하는 대신, 중첩된 필드를 경로별로 평탄화하여
+    미리 할당된 array('d'/'q') 링 버퍼에 저장하고 타임스탬프는 epoch float로 보관합니다.
+    각 행은 어떤 컬럼이 존재하는지(shape)를 가리키는 번호만 가지며, 대부분의 행이
+    같은 shape을 공유하므로 행당 오버헤드는 필드 수 x 8바이트 수준입니다.
+
+    shape은 보관 중인 행 수를, 컬럼은 자신을 포함하는 shape 수를 세어 두고, 마지막 행이
+    밀려나면 shape을 해제하고 더 이상 어떤 shape에도 없는 컬럼을 삭제합니다. 따라서
+    인터페이스나 마운트 포인트가 계속 바뀌어도 메모리는 보관 중인 행의 경로만큼으로 유지됩니다.
+
+    스레드 안전하지 않으며, 호출자(MemoryStorage)가 잠금을 책임집니다.
+    """
+
+    def __init__(self, capacity: int, schema: Optional[Dict[Path, str]] = None):
+        """
+        Args:
+            capacity: 최대 보관 행 수
+            schema: 경로 패턴별 컬럼 타입 ('q', 'd', 'o'). '*'는 임의의 키/인덱스와 일치
+        """
+        self.capacity = capacity
+        self._schema = schema or {}
+        # 버퍼는 첫 행이 추가될 때 용량만큼 할당
+        self._timestamps = array('d')
+        self._shape_ids = array('I')
+        self._columns: Dict[Path, _Column] = {}
+        self._shape_index: Dict[Tuple[Tuple[Path, ...], Tuple[Path, ...]], int] = {}
+        self._shapes: List[Optional[Tuple[Tuple[Path, ...], Tuple[Path, ...]]]] = []
+        self._plans: List[Any] = []
+        # shape별 보관 중인 행 수, 컬럼별 그 경로를 포함하는 살아 있는 shape 수, 재사용할 shape 번호
+        self._shape_refs: List[int] = []
+        self._column_refs: Dict[Path, int] = {}
+        self._free_shapes: List[int] = []
+        # drop_last()로 행이 0개가 된 shape (바로 다음 행이 같은 shape이면 해제하지 않음)
+        self._orphan: Optional[int] = None
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _schema_kind(self, path: Path, value: Any) -> str:
+        return schema_kind(self._schema, path, value)
+
+    def _physical(self, position: int) -> int:
+        """논리 위치(0이 가장 오래된 행)를 버퍼 인덱스로 변환합니다."""
+        return (self._next - self._size + position) % self.capacity
+
+    def append(self, timestamp: float, data: Dict[str, Any]):
+        """
+        행을 추가합니다. 가득 찬 경우 가장 오래된 행을 덮어씁니다.
+
+        Args:
+            timestamp: epoch 초 단위 타임스탬프
+            data: 메트릭 데이터 ('timestamp' 키는 무시)
+        """
+        self.append_flat(timestamp, flatten(data))
+
+    def append_flat(self, timestamp: float, flat: Dict[Path, Any]):
+        """
+        이미 평탄화된 행을 추가합니다 (flatten() 결과를 재사용하는 경우).
+
+        Args:
+            timestamp: epoch 초 단위 타임스탬프
+            flat: 경로 튜플을 키로 하는 값
+        """
+        if not self._timestamps:
+            self._timestamps = array('d', [0.0]) * self.capacity
+            self._shape_ids = array('I', [0]) * self.capacity
+
+        index = self._next
+        # 가득 찼다면 이 위치의 가장 오래된 행이 밀려남
+        evicted = self._shape_ids[index] if self._size == self.capacity else None
+        paths = []
+        nulls = []
+        promoted = False
+
+        for path, value in flat.items():
+            if value is None:
+                nulls.append(path)
+                continue
+            column = self._columns.get(path)
+            if column is None:
+                column = _Column(path, self._schema_kind(path, value), self.capacity, value)
+                self._columns[path] = column
+            else:
+                promoted |= column.set(index, value)
+            paths.append(path)
+
+        if promoted:
+            # 컬럼 버퍼가 교체되었으므로 캐시된 복원 계획 폐기
+            self._plans = [None] * len(self._shapes)
+
+        shape = (tuple(paths), tuple(nulls))
+        shape_id = self._shape_index.get(shape)
+        if shape_id is None:
+            shape_id = self._add_shape(shape)
+        self._shape_refs[shape_id] += 1
+
+        self._timestamps[index] = timestamp
+        self._shape_ids[index] = shape_id
+        self._next = (index + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+        # 새 행의 shape을 먼저 세어야 같은 shape의 컬럼을 지웠다가 다시 만들지 않음
+        if evicted is not None:
+            self._release(evicted)
+        orphan, self._orphan = self._orphan, None
+        if orphan is not None and not self._shape_refs[orphan]:
+            self._free_shape(orphan)
+
+    def _add_shape(self, shape: Tuple[Tuple[Path, ...], Tuple[Path, ...]]) -> int:
+        """shape을 등록하고 번호를 반환합니다 (해제된 번호가 있으면 재사용)."""
+        if self._free_shapes:
+            shape_id = self._free_shapes.pop()
+            self._shapes[shape_id] = shape
+            self._plans[shape_id] = None
+        else:
+            shape_id = len(self._shapes)
+            self._shapes.append(shape)
+            self._plans.append(None)
+            self._shape_refs.append(0)
+        self._shape_index[shape] = shape_id
+        column_refs = self._column_refs
+        for path in shape[0]:
+            column_refs[path] = column_refs.get(path, 0) + 1
+        return shape_id
+
+    def _release(self, shape_id: int):
+        """행 하나가 밀려났음을 기록하고, shape의 마지막 행이었다면 해제합니다."""
+        self._shape_refs[shape_id] -= 1
+        if not self._shape_refs[shape_id]:
+            self._free_shape(shape_id)
+
+    def _free_shape(self, shape_id: int):
+        """보관 중인 행이 없는 shape과, 다른 shape에 없는 컬럼을 삭제합니다."""
+        shape = self._shapes[shape_id]
+        del self._shape_index[shape]
+        self._shapes[shape_id] = None
+        self._plans[shape_id] = None
+        self._free_shapes.append(shape_id)
+        column_refs = self._column_refs
+        for path in shape[0]:
+            column_refs[path] -= 1
+            if not column_refs[path]:
+                del column_refs[path]
+                del self._columns[path]
+
+    def _plan(self, shape_id: int):
+        plan = self._plans[shape_id]
+        if plan is None:
+            paths, nulls = self._shapes[shape_id]
+            entries = [(path, self._columns[path]) for path in paths]
+            entries.extend((path, None) for path in nulls)
+            plan = _build_plan(entries)
+            self._plans[shape_id] = plan
+        return plan
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """
+        논리 위치의 행을 딕셔너리로 복원합니다.
+
+        Args:
+            position: 0(가장 오래된 행)부터 len-1(최신 행)까지의 위치
+
+        Returns:
+            Dict[str, Any]: 'timestamp'(datetime)를 포함한 메트릭 데이터
+        """
+        index = self._physical(position)
+        plan = self._plan(self._shape_ids[index])
+        row = _materialize(plan, index)
+        row['timestamp'] = datetime.fromtimestamp(self._timestamps[index])
+        return row
+
+    def rows(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """논리 위치 [start, stop) 범위의 행 목록을 반환합니다."""
+        return [self.row(position) for position in range(start, stop)]
+
+    def timestamp(self, position: int) -> float:
+        """논리 위치의 epoch 타임스탬프를 반환합니다."""
+        return self._timestamps[self._physical(position)]
+
+    def search(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[int, int]:
+        """
+        [start, end] 시간 범위에 해당하는 논리 위치 구간을 이진 탐색으로 찾습니다.
+
+        행은 시간 순서대로 추가된다고 가정합니다 (스케줄러가 유일한 기록자).
+
+        Args:
+            start: 시작 epoch 시간 (포함, None이면 처음부터)
+            end: 종료 epoch 시간 (포함, None이면 끝까지)
+
+        Returns:
+            Tuple[int, int]: 논리 위치 구간 [lo, hi)
+        """
+        timestamps = _TimestampView(self)
+        lo = 0 if start is None else bisect_left(timestamps, start)
+        hi = self._size if end is None else bisect_right(timestamps, end)
+        return lo, max(lo, hi)
+
+    def covers(self, start: float) -> bool:
+        """
+        start 시점 이후의 행을 빠짐없이 보관하고 있는지 여부.
+
+        아직 한 바퀴 돌지 않았다면 덮어쓴 행이 없으므로 항상 True입니다.
+        """
+        if self._size < self.capacity:
+            return True
+        return self.timestamp(0) <= start
+
+    def _slice(self, buffer, start: int, stop: int):
+        """논리 위치 [start, stop) 구간을 연속된 버퍼 복사본으로 반환합니다."""
+        count = stop - start
+        first = self._physical(start)
+        if first + count <= self.capacity:
+            return buffer[first:first + count]
+        return buffer[first:] + buffer[:first + count - self.capacity]
+
+    def buckets(self, start: int, stop: int, step: float) -> List[Tuple[float, int, int]]:
+        """
+        논리 위치 구간을 step 초 단위의 시간 버킷으로 나눕니다.
+
+        버킷 경계는 epoch 기준으로 정렬되며(예: step=60이면 매 분 정각), 빈 버킷은 생략됩니다.
+
+        Returns:
+            List[Tuple[float, int, int]]: (버킷 시작 epoch, 구간 내 시작 오프셋, 끝 오프셋) 목록
+        """
+        return bucket_bounds(self._slice(self._timestamps, start, stop), step)
+
+    def _common_paths(self, start: int, stop: int) -> set:
+        """논리 위치 구간 내 모든 행(shape)에 공통으로 값이 있는 컬럼 경로"""
+        common = None
+        for shape_id in set(self._slice(self._shape_ids, start, stop)):
+            paths = set(self._shapes[shape_id][0])
+            common = paths if common is None else common & paths
+        return common or set()
+
+    def columns(self, start: int, stop: int) -> Tuple[array, Dict[Path, Any]]:
+        """
+        논리 위치 구간을 행으로 복원하지 않고 컬럼 단위로 반환합니다.
+
+        구간 내 모든 행에 값이 있는 컬럼만 포함하며, 숫자 컬럼은 array('q'/'d') 복사본,
+        오브젝트 컬럼은 리스트입니다. 상수 컬럼은 구간 길이만큼 채워서 반환합니다.
+
+        Args:
+            start: 시작 논리 위치
+            stop: 끝 논리 위치 (미포함)
+
+        Returns:
+            Tuple[array, Dict[Path, Any]]: (epoch 타임스탬프 array('d'), 경로별 값)
+        """
+        if start >= stop:
+            return array('d'), {}
+
+        count = stop - start
+        common = self._common_paths(start, stop)
+        columns: Dict[Path, Any] = {}
+        for path, column in self._columns.items():
+            if path not in common:
+                continue
+            if column.kind == 'o':
+                # 빈 컨테이너 표식을 실제 값으로 복원
+                values = [column.constant] * count if column.values is None else self._slice(column.values, start, stop)
+                columns[path] = [_listify(value) for value in values]
+            elif column.values is not None:
+                columns[path] = self._slice(column.values, start, stop)
+            else:
+                columns[path] = array(column.kind, [column.constant]) * count
+        return self._slice(self._timestamps, start, stop), columns
+
+    def downsample(self, start: int, stop: int, step: float, agg: str = 'avg',
+                   weighted: bool = False) -> List[Dict[str, Any]]:
+        """
+        논리 위치 구간을 시간 버킷별로 집계합니다.
+
+        숫자 컬럼은 버퍼 구간을 잘라 내장 함수(sum/min/max/sorted)로 한 번에 집계하며,
+        문자열 등 오브젝트 컬럼은 버킷의 마지막 값을 사용합니다. 구간 내 모든 행에
+        값이 있는 컬럼만 집계 대상입니다.
+
+        롤업 계층처럼 행마다 ('sample_count',)에 원본 샘플 수가 있는 시계열은 weighted=True로
+        호출합니다. 이때 'sample_count'는 버킷 행 수가 아니라 그 값의 합이며, avg는 샘플 수로
+        가중 평균합니다. min, max, p95는 행(이미 평균된 값) 기준이므로 원본 샘플의 값보다
+        완만하게 나오며, 특히 p95는 근사값입니다.
+
+        Args:
+            start: 시작 논리 위치
+            stop: 끝 논리 위치 (미포함)
+            step: 버킷 크기 (초)
+            agg: 집계 방식 (avg, min, max, p95, last)
+            weighted: 행별 ('sample_count',) 값을 샘플 수로 사용할지 여부
+
+        Returns:
+            List[Dict[str, Any]]: 버킷별 집계 행 ('timestamp'는 버킷 시작 시각,
+                'sample_count'는 버킷의 원본 샘플 수)
+        """
+        if agg not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation: {agg}")
+        if start >= stop:
+            return []
+
+        buckets = self.buckets(start, stop, step)
+        common = self._common_paths(start, stop)
+
+        weights = None
+        if weighted and SAMPLE_COUNT_PATH in common:
+            column = self._columns[SAMPLE_COUNT_PATH]
+            if column.values is None:
+                weights = [column.constant] * (stop - start)
+            else:
+                weights = self._slice(column.values, start, stop)
+            counts = [sum(weights[begin:end]) for _, begin, end in buckets]
+        else:
+            counts = [end - begin for _, begin, end in buckets]
+
+        columns = {}
+        for path, column in self._columns.items():
+            if path not in common:
+                continue
+            if column.values is None:
+                columns[path] = [column.constant] * len(buckets)
+                continue
+            values = self._slice(column.values, start, stop)
+            if column.kind == 'o':
+                columns[path] = [values[end - 1] for _, _, end in buckets]
+            elif weights is not None and agg == 'avg':
+                columns[path] = [
+                    _weighted_average(values[begin:end], weights[begin:end], counts[index])
+                    for index, (_, begin, end) in enumerate(buckets)
+                ]
+            else:
+                columns[path] = [_aggregate(values[begin:end], agg) for _, begin, end in buckets]
+
+        rows = []
+        for index, (bucket_start, _, _) in enumerate(buckets):
+            row = unflatten({path: values[index] for path, values in columns.items()})
+            row['timestamp'] = datetime.fromtimestamp(bucket_start)
+            row['sample_count'] = counts[index]
+            rows.append(row)
+        return rows
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        보관 중인 행을 marshal로 직렬화할 수 있는 상태로 반환합니다 (스냅샷용).
+
+        숫자 버퍼는 논리 순서의 bytes로 복사하므로 행 수에 비례하는 메모리 복사만 발생합니다.
+
+        Returns:
+            Dict[str, Any]: load_state()에 전달할 상태
+        """
+        start, stop = 0, self._size
+        columns = []
+        for path, column in self._columns.items():
+            if column.values is None:
+                values = None
+            elif column.kind == 'o':
+                values = [encode_state_value(value) for value in self._slice(column.values, start, stop)]
+            else:
+                values = self._slice(column.values, start, stop).tobytes()
+            columns.append((path, column.kind, encode_state_value(column.constant), values))
+        return {
+            'size': self._size,
+            'timestamps': self._slice(self._timestamps, start, stop).tobytes() if self._size else b'',
+            'shape_ids': self._slice(self._shape_ids, start, stop).tobytes() if self._size else b'',
+            'shapes': list(self._shapes),
+            'columns': columns,
+        }
+
+    def load_state(self, state: Dict[str, Any]):
+        """
+        get_state()로 저장한 행을 복원합니다 (기존 행은 삭제).
+
+        저장 당시보다 용량이 작으면 최근 행만 복원합니다.
+
+        Args:
+            state: get_state()가 반환한 상태
+        """
+        size = state['size']
+        skip = max(0, size - self.capacity)
+        count = size - skip
+
+        def fill(typecode: str, data: bytes) -> array:
+            buffer = array(typecode, [0]) * self.capacity
+            values = array(typecode)
+            values.frombytes(data)
+            buffer[:count] = values[skip:]
+            return buffer
+
+        self._timestamps = fill('d', state['timestamps'])
+        self._shape_ids = fill('I', state['shape_ids'])
+        self._shapes = [
+            None if shape is None else (tuple(shape[0]), tuple(shape[1])) for shape in state['shapes']
+        ]
+        self._shape_index = {shape: shape_id for shape_id, shape in enumerate(self._shapes) if shape is not None}
+        self._plans = [None] * len(self._shapes)
+        self._columns = {}
+        for path, kind, constant, values in state['columns']:
+            column = _Column(path, kind, self.capacity, decode_state_value(constant))
+            if kind == 'o' and values is not None:
+                column.values = [decode_state_value(value) for value in values[skip:]]
+                column.values.extend([None] * (self.capacity - count))
+            elif values is not None:
+                column.values = fill(kind, values)
+            self._columns[path] = column
+        self._size = count
+        self._next = count % self.capacity
+        self._recount()
+
+    def _recount(self):
+        """보관 중인 행으로 참조 수를 다시 세고, 행이 없는 shape과 컬럼을 삭제합니다."""
+        self._shape_refs = [0] * len(self._shapes)
+        for shape_id in self._slice(self._shape_ids, 0, self._size) if self._size else ():
+            self._shape_refs[shape_id] += 1
+        self._column_refs = {}
+        self._free_shapes = []
+        self._orphan = None
+        for shape_id, shape in enumerate(self._shapes):
+            if shape is None:
+                self._free_shapes.append(shape_id)
+                continue
+            for path in shape[0]:
+                self._column_refs[path] = self._column_refs.get(path, 0) + 1
+        for shape_id, refs in enumerate(self._shape_refs):
+            if not refs and self._shapes[shape_id] is not None:
+                self._free_shape(shape_id)
+        for path in [path for path in self._columns if path not in self._column_refs]:
+            del self._columns[path]
+
+    def drop_last(self):
+        """최신 행을 삭제합니다 (진행 중인 집계 행을 갱신하기 위해 사용)."""
+        if self._size:
+            self._next = (self._next - 1) % self.capacity
+            self._size -= 1
+            shape_id = self._shape_ids[self._next]
+            self._shape_refs[shape_id] -= 1
+            if not self._shape_refs[shape_id]:
+                if self._orphan is not None and not self._shape_refs[self._orphan]:
+                    self._free_shape(self._orphan)
+                self._orphan = shape_id
+
+    def clear(self):
+        """모든 행과 컬럼, shape을 삭제합니다 (타임스탬프 버퍼는 재사용)."""
+        self._next = 0
+        self._size = 0
+        self._columns = {}
+        self._shape_index = {}
+        self._shapes = []
+        self._plans = []
+        self._shape_refs = []
+        self._column_refs = {}
+        self._free_shapes = []
+        self._orphan = None
+
+    def nbytes(self) -> int:
+        """버퍼가 차지하는 대략적인 메모리 크기 (bytes)"""
+        total = self._timestamps.buffer_info()[1] * self._timestamps.itemsize
+        total += self._shape_ids.buffer_info()[1] * self._shape_ids.itemsize
+        return total + sum(column.nbytes() for column in self._columns.values())
+
+
+class _TimestampView:
+    """bisect 모듈이 링 버퍼 타임스탬프를 논리 순서로 탐색하기 위한 읽기 전용 뷰"""
+
+    __slots__ = ('_series',)
+
+    def __init__(self, series: ColumnarSeries):
+        self._series = series
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __getitem__(self, position: int) -> float:
+        return self._series.timestamp(position)
@@ -1,29 +1,126 @@
 """인메모리 스토리지 구현"""
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+import logging
 import threading
+import uuid
 
+from app.storage.base import MetricStorage, to_epoch
+from app.storage.columnar import ColumnarSeries, flatten
+from app.storage.rollup import DEFAULT_ROLLUPS, RollupTier, build_tiers
+from app.storage.wal import WriteAheadLog
+from app.utils.instrumentation import Instrumentation, TimedLock
 
-class MemoryStorage:
+logger = logging.getLogger(__name__)
+
+# 메트릭 타입별 컬럼 스키마 ('*'는 임의의 리스트 인덱스/딕셔너리 키)
+# 스키마에 없는 필드도 저장되며, 첫 값의 타입으로 컬럼 타입이 결정됩니다.
+_NETWORK_COUNTERS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                     'errin', 'errout', 'dropin', 'dropout')
+_DISK_RATES = ('read_bytes_per_sec', 'write_bytes_per_sec', 'read_ops_per_sec', 'write_ops_per_sec')
+
+METRIC_SCHEMAS: Dict[str, Dict[tuple, str]] = {
+    'cpu': {
+        ('cpu_percent',): 'd',
+        ('cpu_percent_per_core', '*'): 'd',
+        ('cpu_count_logical',): 'q',
+        ('cpu_count_physical',): 'q',
+        ('cpu_freq_current',): 'd',
+        ('cpu_freq_min',): 'd',
+        ('cpu_freq_max',): 'd',
+    },
+    'memory': {
+        ('memory_total',): 'q',
+        ('memory_available',): 'q',
+        ('memory_used',): 'q',
+        ('memory_percent',): 'd',
+        ('memory_free',): 'q',
+        ('swap_total',): 'q',
+        ('swap_used',): 'q',
+        ('swap_free',): 'q',
+        ('swap_percent',): 'd',
+    },
+    'disk': {
+        ('partitions', '*', 'total'): 'q',
+        ('partitions', '*', 'used'): 'q',
+        ('partitions', '*', 'free'): 'q',
+        ('partitions', '*', 'percent'): 'd',
+        ('io_read_bytes',): 'q',
+        ('io_write_bytes',): 'q',
+        ('io_read_count',): 'q',
+        ('io_write_count',): 'q',
+        ('io_read_time',): 'q',
+        ('io_write_time',): 'q',
+        **{(f'io_{rate}',): 'd' for rate in _DISK_RATES},
+        **{('disks', '*', rate): 'd' for rate in _DISK_RATES},
+    },
+    'network': {
+        **{(counter,): 'q' for counter in _NETWORK_COUNTERS},
+        **{('interfaces', '*', counter): 'q' for counter in _NETWORK_COUNTERS},
+        **{(f'{counter}_per_sec',): 'd' for counter in _NETWORK_COUNTERS},
+        **{('interface_rates', '*', f'{counter}_per_sec'): 'd' for counter in _NETWORK_COUNTERS},
+    },
+    'process': {},
+    # 이상 점수 (메트릭 타입별 필드 z-score와 최대 절대값)
+    'anomaly': {
+        ('*', '*'): 'd',
+        ('max_score',): 'd',
+    },
+}
+
+
+class MemoryStorage(MetricStorage):
     """
     시계열 메트릭을 메모리에 저장하는 간단한 스토리지.
     Level 1 (최소 구성)용으로 설계됨.
+
+    메트릭 타입별로 ColumnarSeries(컬럼 단위 링 버퍼)에 저장하므로
+    샘플마다 딕셔너리와 datetime 객체를 보관하지 않습니다.
+    조회 시에는 기존과 같은 딕셔너리 형태로 복원하여 반환합니다.
+
+    원본 링 버퍼 외에 롤업 계층(기본: 1분 평균 1일치, 10분 평균 30일치)을
+    저장 시점에 함께 갱신하므로, 보관 기간이 늘어나도 메모리 사용량은 고정됩니다.
+    시간 범위 조회는 요청한 시작 시점을 온전히 보관하는 가장 세밀한 계층에서 읽습니다.
+
+    메트릭 타입별 시퀀스 번호는 저장/삭제할 때마다 증가하므로, API는 이 번호로
+    데이터가 바뀌었는지 행을 읽지 않고 판단할 수 있습니다 (ETag).
+
+    WAL(선택)을 지정하면 저장/삭제를 로그에 함께 기록하고, compact()로 버퍼 전체를 스냅샷으로
+    남깁니다. 재시작 시 restore()가 스냅샷과 이후 로그만 읽어 버퍼를 다시 채웁니다.
     """
 
-    def __init__(self, max_data_points: int = 3600):
+    def __init__(
+        self,
+        max_data_points: int = 3600,
+        rollups: Optional[List[Tuple[int, int]]] = DEFAULT_ROLLUPS,
+        wal: Optional[WriteAheadLog] = None,
+        instrumentation: Optional[Instrumentation] = None
+    ):
         """
         Args:
-            max_data_points: 메트릭 타입당 최대 저장 데이터 포인트 수 (기본값: 3600)
-        """
-        self._data: Dict[str, deque] = {
-            'cpu': deque(maxlen=max_data_points),
-            'memory': deque(maxlen=max_data_points),
-            'disk': deque(maxlen=max_data_points),
-            'network': deque(maxlen=max_data_points),
-            'process': deque(maxlen=max_data_points)
+            max_data_points: 메트릭 타입당 최대 저장 원본 데이터 포인트 수 (기본값: 3600)
+            rollups: 롤업 계층 목록 [(버킷 크기(초), 보관 버킷 수), ...] (None 또는 빈 값이면 사용 안 함)
+            wal: 저장/삭제를 기록할 WAL (None이면 사용 안 함)
+            instrumentation: 메서드별 잠금 대기/보유 시간을 기록할 계측 (None이면 기록 안 함)
+        """
+        self._data: Dict[str, ColumnarSeries] = {
+            metric_type: ColumnarSeries(max_data_points, schema)
+            for metric_type, schema in METRIC_SCHEMAS.items()
+        }
+        self._tiers: Dict[str, List[RollupTier]] = {
+            metric_type: build_tiers(rollups or [], schema)
+            for metric_type, schema in METRIC_SCHEMAS.items()
         }
+        # 메트릭 타입별 변경 시퀀스 번호 (저장/삭제 시 증가)
+        self._seq: Dict[str, int] = {metric_type: 0 for metric_type in METRIC_SCHEMAS}
+        # 스토리지 인스턴스 식별자 (재시작 후 같은 시퀀스 번호와 구분하기 위함)
+        self.epoch = uuid.uuid4().hex[:8]
+        self.wal = wal
         self._lock = threading.Lock()
+        # 메서드별 잠금 대기/보유 시간 기록 ('storage' 그룹)
+        self._timed = TimedLock(self._lock, instrumentation, 'storage')
+        # 스냅샷이 순서대로 기록되도록 compact() 호출을 직렬화
+        self._compact_lock = threading.Lock()
 
     def save_metric(self, metric_type: str, data: Dict[str, Any]) -> bool:
         """
@@ -43,11 +140,54 @@ class MemoryStorage:
         if 'timestamp' not in data:
             data['timestamp'] = datetime.now()
 
-        with self._lock:
-            self._data[metric_type].append(data)
+        timestamp = to_epoch(data['timestamp'])
+
+        flat = flatten(data)
+
+        with self._timed('save_metric'):
+            self._append(metric_type, timestamp, flat)
+            if self.wal is not None:
+                payload = {key: value for key, value in data.items() if key != 'timestamp'}
+                self.wal.append(('save', metric_type, timestamp, payload))
 
         return True
 
+    def _append(self, metric_type: str, timestamp: float, flat: Dict[tuple, Any]):
+        self._data[metric_type].append_flat(timestamp, flat)
+        for tier in self._tiers[metric_type]:
+            tier.add(timestamp, flat)
+        self._seq[metric_type] += 1
+
+    def _select(self, metric_type: str, start: Optional[float]) -> ColumnarSeries:
+        """
+        start 시점부터의 데이터를 온전히 보관하는 가장 세밀한 계층을 고릅니다.
+
+        어느 계층도 충분히 오래 보관하지 않았다면 가장 긴 계층을 사용합니다.
+        """
+        series = self._data[metric_type]
+        if start is None or series.covers(start):
+            return series
+        for tier in self._tiers[metric_type]:
+            series = tier.series
+            if series.covers(start):
+                break
+        return series
+
+    def get_sequence(self, metric_type: str) -> int:
+        """
+        메트릭 타입의 현재 시퀀스 번호를 반환합니다.
+
+        같은 번호라면 해당 타입의 저장 데이터(원본, 롤업 계층)가 바뀌지 않았음을 보장합니다.
+        조회 결과와 함께 쓸 때는 조회 전에 읽어야 새 데이터에 이전 번호가 붙지 않습니다.
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            int: 시퀀스 번호 (알 수 없는 타입이면 0)
+        """
+        return self._seq.get(metric_type, 0)
+
     def get_latest(self, metric_type: str) -> Optional[Dict[str, Any]]:
         """
         특정 메트릭 타입의 최신 데이터를 반환합니다.
@@ -61,10 +201,11 @@ class MemoryStorage:
         if metric_type not in self._data:
             return None
 
-        with self._lock:
-            if len(self._data[metric_type]) == 0:
+        with self._timed('get_latest'):
+            series = self._data[metric_type]
+            if len(series) == 0:
                 return None
-            return dict(self._data[metric_type][-1])
+            return series.row(len(series) - 1)
 
     def get_range(
         self,
@@ -84,49 +225,143 @@ class MemoryStorage:
 
         Returns:
             List[Dict[str, Any]]: 메트릭 데이터 리스트
+                원본 보관 기간보다 이전부터 조회하면 롤업 계층의 버킷 평균 행을 반환하며,
+                이 행의 timestamp는 버킷 시작 시각이고 sample_count 필드를 포함합니다.
         """
         if metric_type not in self._data:
             return []
 
-        with self._lock:
-            data_list = list(self._data[metric_type])
+        start_ts = to_epoch(start) if start else None
+        end_ts = to_epoch(end) if end else None
+
+        with self._timed('get_range'):
+            series = self._select(metric_type, start_ts)
 
-        # 시간 범위 필터링
-        if start or end:
-            filtered = []
-            for item in data_list:
-                timestamp = item.get('timestamp')
-                if not timestamp:
-                    continue
+            # 시간 범위 경계를 이진 탐색으로 찾고, 제한 개수만큼만 복원
+            lo, hi = series.search(start_ts, end_ts)
+            if limit and limit > 0:
+                lo = max(lo, hi - limit)
 
-                if start and timestamp < start:
-                    continue
-                if end and timestamp > end:
-                    continue
+            return series.rows(lo, hi)
 
-                filtered.append(item)
-            data_list = filtered
+    def get_columns(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[float], Dict[tuple, Any]]:
+        """
+        get_range()와 같은 구간을 행 딕셔너리로 복원하지 않고 컬럼 단위로 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            limit: 최대 반환 개수 (None이면 제한 없음)
+
+        Returns:
+            Tuple[List[float], Dict[tuple, Any]]: (epoch 타임스탬프 array, 경로 튜플별 값 array/list)
+                구간 내 모든 행에 값이 있는 필드만 포함
+        """
+        if metric_type not in self._data:
+            return [], {}
 
-        # 제한 적용
-        if limit and limit > 0:
-            data_list = data_list[-limit:]
+        start_ts = to_epoch(start) if start else None
+        end_ts = to_epoch(end) if end else None
 
-        return data_list
+        with self._timed('get_columns'):
+            series = self._select(metric_type, start_ts)
+            lo, hi = series.search(start_ts, end_ts)
+            if limit and limit > 0:
+                lo = max(lo, hi - limit)
+            return series.columns(lo, hi)
 
-    def get_all_latest(self) -> Dict[str, Any]:
+    def get_since(
+        self,
+        metric_type: str,
+        since_seq: int,
+        limit: Optional[int] = None,
+        columns: bool = False
+    ) -> Tuple[Any, int, bool]:
         """
-        모든 메트릭 타입의 최신 데이터를 반환합니다.
+        시퀀스 번호 since_seq 이후에 저장된 원본 데이터만 반환합니다 (증분 폴링용 커서).
+
+        원본 링 버퍼의 행은 저장 순서대로 연속된 시퀀스 번호를 가지므로(마지막 행 = 현재 번호),
+        커서 위치를 이진 탐색 없이 산술로 찾고 새 행만 복원합니다. 비용은 새 행 수에만 비례합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            since_seq: 클라이언트가 마지막으로 받은 시퀀스 번호 (처음이면 0)
+            limit: 최대 반환 개수 (초과하면 최근 행 우선)
+            columns: True이면 행 대신 get_columns()와 같은 컬럼 형식으로 반환
 
         Returns:
-            Dict[str, Any]: 메트릭 타입별 최신 데이터
+            Tuple[Any, int, bool]: (행 리스트 또는 컬럼, 다음 커서(next_seq), gap)
+                gap은 커서 이후의 일부 행을 돌려주지 못했음(링 버퍼에서 밀려났거나 limit 초과,
+                삭제 또는 재시작)을 뜻하며, 이 경우 클라이언트는 차트를 다시 그려야 합니다.
         """
-        result = {}
-        for metric_type in self._data.keys():
-            latest = self.get_latest(metric_type)
-            if latest:
-                result[metric_type] = latest
+        if metric_type not in self._data:
+            return ((([], {}) if columns else []), 0, False)
 
-        return result
+        with self._timed('get_since'):
+            series = self._data[metric_type]
+            last_seq = self._seq[metric_type]
+            count = len(series)
+            first_seq = last_seq - count + 1
+
+            if since_seq > last_seq:
+                # 다른 스토리지 인스턴스(재시작 전)의 커서
+                lo, gap = 0, True
+            else:
+                lo = max(0, since_seq - first_seq + 1)
+                gap = since_seq < first_seq - 1
+            if limit and limit > 0 and count - lo > limit:
+                lo, gap = count - limit, True
+
+            items = series.columns(lo, count) if columns else series.rows(lo, count)
+            return items, last_seq, gap
+
+    def get_downsampled(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        step: float = 60,
+        agg: str = 'avg',
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 메트릭 타입의 시간 범위 데이터를 step 초 단위 버킷으로 집계하여 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            step: 버킷 크기 (초)
+            agg: 집계 방식 (avg, min, max, p95, last)
+            limit: 최대 반환 버킷 수 (None이면 제한 없음, 최근 버킷 우선)
+
+        Returns:
+            List[Dict[str, Any]]: 버킷별 집계 데이터 리스트
+        """
+        if metric_type not in self._data:
+            return []
+
+        start_ts = to_epoch(start) if start else None
+        end_ts = to_epoch(end) if end else None
+
+        with self._timed('get_downsampled'):
+            series = self._select(metric_type, start_ts)
+            lo, hi = series.search(start_ts, end_ts)
+
+            if limit and limit > 0 and lo < hi:
+                # 최근 limit개 버킷에 해당하는 구간만 집계
+                last_bucket = (series.timestamp(hi - 1) // step) * step
+                lo = max(lo, series.search(start=last_bucket - (limit - 1) * step)[0])
+
+            # 롤업 계층의 행은 이미 평균된 버킷이므로 샘플 수로 가중
+            return series.downsample(lo, hi, step, agg, weighted=series is not self._data[metric_type])
 
     def clear(self, metric_type: Optional[str] = None):
         """
@@ -135,13 +370,97 @@ class MemoryStorage:
         Args:
             metric_type: 삭제할 메트릭 타입 (None이면 전체 삭제)
         """
-        with self._lock:
-            if metric_type:
-                if metric_type in self._data:
-                    self._data[metric_type].clear()
-            else:
-                for key in self._data.keys():
-                    self._data[key].clear()
+        with self._timed('clear'):
+            self._clear(metric_type)
+            if self.wal is not None:
+                self.wal.append(('clear', metric_type))
+
+    def _clear(self, metric_type: Optional[str]):
+        metric_types = [metric_type] if metric_type else list(self._data.keys())
+        for key in metric_types:
+            if key in self._data:
+                self._data[key].clear()
+                for tier in self._tiers[key]:
+                    tier.clear()
+                self._seq[key] += 1
+
+    def restore(self) -> int:
+        """
+        WAL의 마지막 스냅샷과 그 이후 로그를 재생하여 버퍼를 복원합니다 (시작 시 한 번 호출).
+
+        스냅샷은 버퍼를 bytes로 그대로 복원하므로 보관 행 수와 무관하게 빠르며,
+        행 단위로 재생하는 것은 마지막 스냅샷 이후의 로그뿐입니다.
+        롤업 계층은 설정과 버킷 크기가 같은 계층만 복원합니다.
+
+        Returns:
+            int: 재생한 로그 레코드 수 (WAL이 없으면 0)
+        """
+        if self.wal is None:
+            return 0
+
+        snapshot = self.wal.load_snapshot()
+        replayed = 0
+        with self._timed('restore'):
+            if snapshot is not None:
+                self._load_state(snapshot['state'])
+            for record in self.wal.replay(snapshot['generation'] if snapshot else 0):
+                if record[0] == 'save':
+                    _, metric_type, timestamp, data = record
+                    if metric_type in self._data:
+                        self._append(metric_type, timestamp, flatten(data))
+                elif record[0] == 'clear':
+                    self._clear(record[1])
+                replayed += 1
+        return replayed
+
+    def compact(self) -> bool:
+        """
+        현재 버퍼를 WAL 스냅샷으로 기록하고 스냅샷에 포함된 로그 파일을 삭제합니다.
+
+        잠금 안에서는 버퍼를 복사하고 로그 세대를 넘기기만 하며, 파일 기록은 잠금 밖에서 합니다.
+
+        Returns:
+            bool: 스냅샷 기록 여부 (WAL이 없으면 False)
+        """
+        if self.wal is None:
+            return False
+
+        with self._compact_lock:
+            with self._timed('compact'):
+                state = self._get_state()
+                generation = self.wal.rotate()
+            self.wal.write_snapshot(state, generation)
+        return True
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            'seq': dict(self._seq),
+            'data': {metric_type: series.get_state() for metric_type, series in self._data.items()},
+            'tiers': {
+                metric_type: [(tier.step, tier.get_state()) for tier in tiers]
+                for metric_type, tiers in self._tiers.items()
+            },
+        }
+
+    def _load_state(self, state: Dict[str, Any]):
+        for metric_type, series_state in state['data'].items():
+            if metric_type in self._data:
+                self._data[metric_type].load_state(series_state)
+                self._seq[metric_type] = state['seq'].get(metric_type, 0)
+        for metric_type, tier_states in state['tiers'].items():
+            steps = dict(tier_states)
+            for tier in self._tiers.get(metric_type, []):
+                if tier.step in steps:
+                    tier.load_state(steps[tier.step])
+
+    def close(self):
+        """WAL이 있으면 마지막 스냅샷을 기록하고 로그 파일을 닫습니다."""
+        if self.wal is not None:
+            try:
+                self.compact()
+            except OSError as e:
+                logger.error(f"Failed to write snapshot: {e}")
+            self.wal.close()
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -150,8 +469,44 @@ class MemoryStorage:
         Returns:
             Dict[str, int]: 메트릭 타입별 데이터 포인트 수
         """
-        with self._lock:
+        with self._timed('get_stats'):
             return {
                 metric_type: len(data)
                 for metric_type, data in self._data.items()
             }
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        메트릭 타입별 버퍼 메모리 사용량을 반환합니다.
+
+        Returns:
+            Dict[str, int]: 메트릭 타입별 대략적인 바이트 수 (롤업 계층 포함)
+        """
+        with self._timed('get_memory_usage'):
+            return {
+                metric_type: data.nbytes() + sum(tier.nbytes() for tier in self._tiers[metric_type])
+                for metric_type, data in self._data.items()
+            }
+
+    def get_tier_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        메트릭 타입별 저장 계층 현황을 반환합니다.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 계층별 step(초, 원본은 None),
+                capacity, points, oldest(가장 오래된 시각 또는 None)
+        """
+        with self._timed('get_tier_stats'):
+            result = {}
+            for metric_type, data in self._data.items():
+                tiers = [(None, data)] + [(tier.step, tier.series) for tier in self._tiers[metric_type]]
+                result[metric_type] = [
+                    {
+                        'step': step,
+                        'capacity': series.capacity,
+                        'points': len(series),
+                        'oldest': datetime.fromtimestamp(series.timestamp(0)) if len(series) else None
+                    }
+                    for step, series in tiers
+                ]
+            return result
@@ -0,0 +1,133 @@
+"""시계열 롤업(다운샘플 집계) 계층"""
+import math
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.storage.columnar import SAMPLE_COUNT_PATH, ColumnarSeries, Path, decode_state_value, encode_state_value
+
+# 기본 롤업 계층: (버킷 크기(초), 보관 버킷 수)
+# 1분 집계 1일치, 10분 집계 30일치
+DEFAULT_ROLLUPS: Tuple[Tuple[int, int], ...] = ((60, 1440), (600, 4320))
+
+
+class _Bucket:
+    """진행 중인 버킷 하나의 경로별 누적값 (합계, 개수, 정수 여부, 마지막 비숫자 값)"""
+
+    __slots__ = ('start', 'count', 'fields')
+
+    def __init__(self, start: float):
+        self.start = start
+        self.count = 0
+        self.fields: Dict[Path, list] = {}
+
+    def add(self, flat: Dict[Path, Any]):
+        self.count += 1
+        fields = self.fields
+        for path, value in flat.items():
+            acc = fields.get(path)
+            if acc is None:
+                acc = fields[path] = [0, 0, True, None]
+            value_type = type(value)
+            if value_type is int or value_type is float:
+                acc[0] += value
+                acc[1] += 1
+                acc[2] = acc[2] and value_type is int
+            else:
+                acc[3] = value
+
+    def result(self) -> Dict[Path, Any]:
+        """
+        버킷의 집계 행을 반환합니다.
+
+        숫자 필드는 평균(정수 필드는 반올림한 정수), 그 외 필드는 마지막 값이며
+        ('sample_count',)에 버킷의 샘플 수를 기록합니다.
+        """
+        out: Dict[Path, Any] = {}
+        for path, (total, count, integral, last) in self.fields.items():
+            if count:
+                out[path] = round(total / count) if integral else total / count
+            else:
+                out[path] = last
+        out[SAMPLE_COUNT_PATH] = self.count
+        return out
+
+
+class RollupTier:
+    """
+    고정 크기 시간 버킷의 평균을 보관하는 롤업 계층.
+
+    원본 샘플이 들어올 때마다 진행 중인 버킷의 누적값을 갱신하고, 그 버킷의 집계 행을
+    시계열의 마지막 행으로 덮어씁니다. 따라서 조회 시점에 진행 중인 버킷도
+    그때까지의 평균으로 포함되며, 보관 용량은 버킷 수로 고정됩니다.
+    """
+
+    def __init__(self, step: int, capacity: int, schema: Optional[Dict[Path, str]] = None):
+        """
+        Args:
+            step: 버킷 크기 (초)
+            capacity: 보관할 버킷 수
+            schema: 컬럼 스키마 (ColumnarSeries와 동일)
+        """
+        self.step = step
+        self.series = ColumnarSeries(capacity, schema)
+        self._bucket: Optional[_Bucket] = None
+
+    def add(self, timestamp: float, flat: Dict[Path, Any]):
+        """
+        평탄화된 원본 샘플을 진행 중인 버킷에 반영합니다.
+
+        버킷 시작보다 이른(순서가 뒤바뀐) 샘플은 진행 중인 버킷에 합산합니다.
+
+        Args:
+            timestamp: 샘플의 epoch 타임스탬프
+            flat: flatten()된 샘플 데이터
+        """
+        bucket_start = math.floor(timestamp / self.step) * self.step
+        bucket = self._bucket
+        if bucket is None or bucket_start > bucket.start:
+            bucket = self._bucket = _Bucket(bucket_start)
+        else:
+            # 같은 버킷의 집계 행을 새 값으로 교체
+            self.series.drop_last()
+        bucket.add(flat)
+        self.series.append_flat(bucket.start, bucket.result())
+
+    def get_state(self) -> Dict[str, Any]:
+        """보관 중인 버킷과 진행 중인 버킷의 누적값을 스냅샷용 상태로 반환합니다."""
+        bucket = self._bucket
+        return {
+            'series': self.series.get_state(),
+            'bucket': None if bucket is None else (
+                bucket.start,
+                bucket.count,
+                [(path, total, count, integral, encode_state_value(last))
+                 for path, (total, count, integral, last) in bucket.fields.items()]
+            ),
+        }
+
+    def load_state(self, state: Dict[str, Any]):
+        """get_state()로 저장한 상태를 복원합니다."""
+        self.series.load_state(state['series'])
+        self._bucket = None
+        if state['bucket'] is not None:
+            start, count, fields = state['bucket']
+            bucket = self._bucket = _Bucket(start)
+            bucket.count = count
+            for path, total, value_count, integral, last in fields:
+                bucket.fields[path] = [total, value_count, integral, decode_state_value(last)]
+
+    def clear(self):
+        """모든 버킷을 삭제합니다."""
+        self.series.clear()
+        self._bucket = None
+
+    def nbytes(self) -> int:
+        """버퍼가 차지하는 대략적인 메모리 크기 (bytes)"""
+        return self.series.nbytes()
+
+
+def build_tiers(
+    rollups: List[Tuple[int, int]],
+    schema: Optional[Dict[Path, str]] = None
+) -> List[RollupTier]:
+    """(버킷 크기, 버킷 수) 목록으로 버킷 크기 오름차순의 롤업 계층을 만듭니다."""
+    return [RollupTier(step, capacity, schema) for step, capacity in sorted(rollups)]
@@ -0,0 +1,804 @@
+"""메모리 맵 세그먼트 파일 기반 영구 스토리지 구현"""
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from app.storage.base import METRIC_TYPES, MetricStorage, to_epoch
+from app.storage.columnar import Path, downsample_columns, flatten, restore_value, schema_kind, unflatten
+from app.storage.memory_storage import METRIC_SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b'SMSEG01\n'
+_PREFIX = struct.Struct('<8sI')
+_TIMESTAMP = struct.Struct('<d')
+
+# 숫자 필드 값이 None일 때 기록하는 값 (float은 NaN)
+_MISSING_INT = -(1 << 63)
+_MISSING = object()
+
+# 보관 기간이 지난 세그먼트를 확인하는 주기 (초)
+_EXPIRE_INTERVAL = 60.0
+
+# 동시에 매핑해 두는 세그먼트 수 (매핑마다 파일 디스크립터를 하나씩 사용)
+_MAX_MAPPED = 32
+
+Part = Tuple['_Segment', int, int]
+# 잠금 안에서 복사한 구간 (레이아웃, 레코드 바이트)
+Chunk = Tuple['_Layout', bytes]
+
+
+class _Layout:
+    """
+    세그먼트 하나의 고정 폭 레코드 형식.
+
+    레코드는 [timestamp f8][seq i8][숫자 필드 f8/i8 ...]이며, 문자열이나 빈 컨테이너처럼
+    숫자가 아닌 필드는 세그먼트 안에서 같은 값이어야 하므로 헤더에 상수로 한 번만 기록합니다.
+    """
+
+    def __init__(self, paths: List[Path], kinds: str, constants: Dict[Path, Any]):
+        self.paths = paths
+        self.kinds = kinds
+        self.constants = constants
+        self.index = {path: slot for slot, path in enumerate(paths)}
+        self.record = struct.Struct('<dq' + kinds)
+        self.width = 2 + len(paths)
+        self.field_count = len(paths) + len(constants)
+
+    @classmethod
+    def from_sample(cls, schema: Dict[Path, str], flat: Dict[Path, Any]) -> '_Layout':
+        paths = []
+        kinds = ''
+        constants = {}
+        for path, value in flat.items():
+            kind = schema_kind(schema, path, value)
+            if kind == 'o':
+                constants[path] = restore_value(value)
+            else:
+                paths.append(path)
+                kinds += kind
+        return cls(paths, kinds, constants)
+
+    def pack(self, timestamp: float, seq: int, flat: Dict[Path, Any]) -> Optional[bytes]:
+        """샘플을 레코드로 인코딩합니다. 필드 구성이나 상수가 다르면 None."""
+        if len(flat) != self.field_count:
+            return None
+        values: List[Any] = [None] * len(self.paths)
+        for path, value in flat.items():
+            slot = self.index.get(path)
+            if slot is None:
+                constant = self.constants.get(path, _MISSING)
+                restored = restore_value(value)
+                if type(restored) is not type(constant) or restored != constant:
+                    return None
+                continue
+            kind = self.kinds[slot]
+            if value is None:
+                values[slot] = _MISSING_INT if kind == 'q' else math.nan
+            elif kind == 'q':
+                if type(value) is not int or not _MISSING_INT < value < (1 << 63):
+                    return None
+                values[slot] = value
+            elif type(value) in (int, float):
+                values[slot] = float(value)
+            else:
+                return None
+        return self.record.pack(timestamp, seq, *values)
+
+    def unpack(self, record: tuple) -> Dict[str, Any]:
+        # 상수 중 빈 컨테이너는 행마다 새로 만들어 공유되지 않도록 함
+        flat: Dict[Path, Any] = {
+            path: type(value)() if isinstance(value, (list, dict)) else value
+            for path, value in self.constants.items()
+        }
+        for path, kind, value in zip(self.paths, self.kinds, record[2:]):
+            if kind == 'q':
+                flat[path] = None if value == _MISSING_INT else value
+            else:
+                flat[path] = None if value != value else value
+        row = unflatten(flat)
+        row['timestamp'] = datetime.fromtimestamp(record[0])
+        return row
+
+    def header(self) -> Dict[str, Any]:
+        return {
+            'paths': [list(path) for path in self.paths],
+            'kinds': self.kinds,
+            'constants': [[list(path), value] for path, value in self.constants.items()],
+        }
+
+    @classmethod
+    def from_header(cls, header: Dict[str, Any]) -> '_Layout':
+        return cls(
+            [tuple(path) for path in header['paths']],
+            header['kinds'],
+            {tuple(path): value for path, value in header['constants']}
+        )
+
+
+class _MappingCache:
+    """
+    최근에 읽은 세그먼트의 매핑만 유지하는 LRU.
+
+    mmap은 파일 디스크립터를 복제해 보관하므로, 여러 날에 걸친 조회가 건드린 세그먼트를
+    모두 매핑해 두면 디스크립터 한도에 닿을 수 있습니다. capacity를 넘으면 가장 오래전에
+    읽은 세그먼트의 매핑을 해제합니다 (다시 읽으면 새로 매핑).
+    """
+
+    __slots__ = ('capacity', '_segments')
+
+    def __init__(self, capacity: int = _MAX_MAPPED):
+        self.capacity = capacity
+        self._segments: 'OrderedDict[_Segment, None]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def touch(self, segment: '_Segment'):
+        self._segments[segment] = None
+        self._segments.move_to_end(segment)
+        while len(self._segments) > self.capacity:
+            oldest, _ = self._segments.popitem(last=False)
+            oldest._unmap()
+
+    def discard(self, segment: '_Segment'):
+        self._segments.pop(segment, None)
+
+
+class _Segment:
+    """
+    메트릭 타입 하나의 세그먼트 파일.
+
+    한 세그먼트의 레코드는 시간순이고 시퀀스 번호가 연속이므로, 위치는 시퀀스 번호에서
+    산술로, 시간 범위는 매핑된 레코드의 타임스탬프를 이진 탐색해서 찾습니다.
+    읽기는 mmap으로 매핑한 페이지를 직접 잘라 사용하며, 활성 세그먼트는 커질 때만 다시 매핑합니다.
+    매핑은 maps(LRU)가 허용하는 동안만 유지됩니다.
+    """
+
+    def __init__(self, path: str, layout: _Layout, first_seq: int, data_offset: int, count: int,
+                 maps: Optional[_MappingCache] = None):
+        self.path = path
+        self.layout = layout
+        self.first_seq = first_seq
+        self.data_offset = data_offset
+        self.count = count
+        self.created_at = time.time()
+        self._maps = maps
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._mapped = 0
+
+    @classmethod
+    def create(cls, path: str, metric_type: str, layout: _Layout, first_seq: int,
+               maps: Optional[_MappingCache] = None) -> '_Segment':
+        header = json.dumps({
+            'metric_type': metric_type,
+            'first_seq': first_seq,
+            'created_at': time.time(),
+            **layout.header()
+        }, separators=(',', ':'), default=str).encode('utf-8')
+        # 레코드 영역이 8바이트 경계에서 시작하도록 헤더를 공백으로 채움
+        header += b' ' * (-(_PREFIX.size + len(header)) % 8)
+        segment = cls(path, layout, first_seq, _PREFIX.size + len(header), 0, maps)
+        segment._file = open(path, 'xb')
+        segment._file.write(_PREFIX.pack(_MAGIC, len(header)) + header)
+        segment._file.flush()
+        return segment
+
+    @classmethod
+    def open(cls, path: str, maps: Optional[_MappingCache] = None) -> '_Segment':
+        """기존 세그먼트를 엽니다. 마지막 레코드가 잘려 있으면(비정상 종료) 잘라냅니다."""
+        with open(path, 'rb') as file:
+            magic, length = _PREFIX.unpack(file.read(_PREFIX.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Not a segment file: {path}")
+            header = json.loads(file.read(length))
+        layout = _Layout.from_header(header)
+        data_offset = _PREFIX.size + length
+        size = os.path.getsize(path) - data_offset
+        count, partial = divmod(size, layout.record.size)
+        if partial:
+            logger.warning(f"Truncating partial record in {path}")
+            os.truncate(path, data_offset + count * layout.record.size)
+        segment = cls(path, layout, header['first_seq'], data_offset, count, maps)
+        segment.created_at = header.get('created_at', segment.created_at)
+        return segment
+
+    @property
+    def last_seq(self) -> int:
+        return self.first_seq + self.count - 1
+
+    def append(self, record: bytes):
+        self._file.write(record)
+        # 페이지 캐시에 반영해 매핑된 읽기에서 보이도록 함 (fsync는 하지 않음)
+        self._file.flush()
+        self.count += 1
+
+    def seal(self):
+        """쓰기를 마칩니다 (이후 읽기 전용)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def view(self, start: int, stop: int) -> memoryview:
+        """레코드 [start, stop) 구간의 매핑된 메모리 뷰 (복사 없음)"""
+        if self._mapped < self.count:
+            self._unmap()
+            with open(self.path, 'rb') as file:
+                self._map = mmap.mmap(file.fileno(), self.data_offset + self.count * self.layout.record.size,
+                                      access=mmap.ACCESS_READ)
+            self._mapped = self.count
+        if self._maps is not None:
+            self._maps.touch(self)
+        size = self.layout.record.size
+        return memoryview(self._map)[self.data_offset + start * size:self.data_offset + stop * size]
+
+    def timestamp(self, position: int) -> float:
+        return _TIMESTAMP.unpack_from(self.view(position, position + 1))[0]
+
+    def search(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """[start, end] 시간 범위의 레코드 구간을 이진 탐색으로 찾습니다."""
+        timestamps = _SegmentTimestamps(self)
+        lo = 0 if start is None else bisect_left(timestamps, start)
+        hi = self.count if end is None else bisect_right(timestamps, end)
+        return lo, max(lo, hi)
+
+    def read(self, start: int, stop: int) -> bytes:
+        """레코드 [start, stop) 구간의 복사본 (잠금 밖에서 해석하거나 매핑을 해제해도 안전)"""
+        return bytes(self.view(start, stop))
+
+    def _unmap(self):
+        if self._maps is not None:
+            self._maps.discard(self)
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # 아직 내보낸 뷰가 남아 있으면 마지막 뷰가 해제될 때 함께 해제됨
+                pass
+            self._map = None
+            self._mapped = 0
+
+    def close(self):
+        self.seal()
+        self._unmap()
+
+    def unlink(self):
+        self.close()
+        os.unlink(self.path)
+
+
+def _extend(columns: Dict[Path, Any], path: Path, values):
+    """컬럼에 값을 이어 붙입니다. 세그먼트마다 타입이 다르면 float64 또는 리스트로 승격합니다."""
+    column = columns.get(path)
+    if column is None:
+        columns[path] = values
+        return
+    kinds = {getattr(column, 'typecode', 'o'), getattr(values, 'typecode', 'o')}
+    if kinds == {'q', 'd'}:
+        column = columns[path] = array('d', column)
+        values = array('d', values)
+    elif len(kinds) > 1:
+        column = columns[path] = list(column)
+        values = list(values)
+    column.extend(values)
+
+
+class _SegmentTimestamps:
+    """bisect 모듈이 세그먼트의 타임스탬프를 탐색하기 위한 읽기 전용 뷰"""
+
+    __slots__ = ('_segment',)
+
+    def __init__(self, segment: _Segment):
+        self._segment = segment
+
+    def __len__(self) -> int:
+        return self._segment.count
+
+    def __getitem__(self, position: int) -> float:
+        return self._segment.timestamp(position)
+
+
+class SegmentStorage(MetricStorage):
+    """
+    메트릭 타입별 고정 폭 레코드를 순환 세그먼트 파일에 기록하고 mmap으로 읽는 영구 스토리지.
+
+    segment_duration마다(또는 샘플의 필드 구성이 바뀌면) 새 세그먼트 파일을 시작하고,
+    보관 기간이 지난 세그먼트는 파일을 삭제하는 것으로 만료합니다. 시작 시에는 각 세그먼트의
+    헤더만 읽으므로 보관 기간과 무관하게 재시작이 빠르며, 조회는 매핑된 페이지를 직접 잘라
+    사용하므로 여러 날에 걸친 구간도 페이지 캐시에서 바로 읽습니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        retention: Optional[float] = 7 * 86400,
+        segment_duration: float = 3600
+    ):
+        """
+        Args:
+            directory: 세그먼트 파일 디렉토리 (메트릭 타입별 하위 디렉토리 사용)
+            retention: 보관 기간 (초, None이면 삭제하지 않음)
+            segment_duration: 세그먼트 하나가 담는 기간 (초)
+        """
+        self.directory = directory
+        self._retention = retention
+        self._segment_duration = segment_duration
+        self._lock = threading.Lock()
+        self._last_expire = 0.0
+        self._maps = _MappingCache()
+        self._segments: Dict[str, List[_Segment]] = {}
+        self._active: Dict[str, Optional[_Segment]] = {metric_type: None for metric_type in METRIC_TYPES}
+
+        for metric_type in METRIC_TYPES:
+            os.makedirs(os.path.join(directory, metric_type), exist_ok=True)
+            self._segments[metric_type] = self._open_segments(metric_type)
+
+        meta = self._load_meta()
+        self.epoch = meta.get('epoch') or uuid.uuid4().hex[:8]
+        self._seq: Dict[str, int] = {}
+        for metric_type, segments in self._segments.items():
+            last = segments[-1].last_seq if segments else 0
+            self._seq[metric_type] = max(last, meta.get('seq', {}).get(metric_type, 0))
+        self._expired: Dict[str, int] = {
+            metric_type: meta.get('expired', {}).get(metric_type, 0) for metric_type in METRIC_TYPES
+        }
+        self._save_meta()
+
+    def _open_segments(self, metric_type: str) -> List[_Segment]:
+        segments = []
+        directory = os.path.join(self.directory, metric_type)
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith('.seg'):
+                continue
+            try:
+                segment = _Segment.open(os.path.join(directory, name), self._maps)
+            except (OSError, ValueError) as e:
+                logger.error(f"Skipping unreadable segment {name}: {e}")
+                continue
+            if segment.count:
+                segments.append(segment)
+            else:
+                os.unlink(segment.path)
+        segments.sort(key=lambda segment: segment.first_seq)
+        return segments
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.directory, 'meta.json')
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self._meta_path(), encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_meta(self):
+        """epoch, 시퀀스 번호, 만료 횟수를 기록합니다 (삭제 후 재시작해도 번호가 되돌아가지 않도록)."""
+        temporary = self._meta_path() + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump({'epoch': self.epoch, 'seq': self._seq, 'expired': self._expired}, file)
+        os.replace(temporary, self._meta_path())
+
+    def save_metric(self, metric_type: str, data: Dict[str, Any]) -> bool:
+        """
+        메트릭 데이터를 활성 세그먼트에 레코드 하나로 기록합니다.
+
+        Args:
+            metric_type: 메트릭 타입 (cpu, memory, disk, network, process)
+            data: 저장할 메트릭 데이터
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if metric_type not in self._segments:
+            return False
+
+        # 타임스탬프 추가 (없는 경우)
+        if 'timestamp' not in data:
+            data['timestamp'] = datetime.now()
+
+        timestamp = to_epoch(data['timestamp'])
+        flat = flatten(data)
+
+        with self._lock:
+            seq = self._seq[metric_type] + 1
+            active = self._active[metric_type]
+            record = None
+            if active is not None and time.time() - active.created_at < self._segment_duration:
+                record = active.layout.pack(timestamp, seq, flat)
+            if record is None:
+                # 기간이 지났거나 필드 구성이 바뀌면 새 세그먼트 시작
+                active = self._rotate(metric_type, flat, seq)
+                record = active.layout.pack(timestamp, seq, flat)
+            try:
+                active.append(record)
+            except OSError as e:
+                logger.error(f"Segment write failed: {e}")
+                return False
+            self._seq[metric_type] = seq
+            self._expire()
+        return True
+
+    def _rotate(self, metric_type: str, flat: Dict[Path, Any], first_seq: int) -> _Segment:
+        previous = self._active[metric_type]
+        if previous is not None:
+            previous.seal()
+        layout = _Layout.from_sample(METRIC_SCHEMAS[metric_type], flat)
+        path = os.path.join(self.directory, metric_type, f'{first_seq:016d}.seg')
+        segment = _Segment.create(path, metric_type, layout, first_seq, self._maps)
+        self._segments[metric_type].append(segment)
+        self._active[metric_type] = segment
+        return segment
+
+    def _expire(self):
+        """
+        보관 기간이 지난 세그먼트 파일을 삭제합니다 (활성 세그먼트 제외).
+
+        세그먼트가 삭제된 타입은 만료 횟수를 올려 이전 조회 결과의 ETag이 더 이상 일치하지 않게 합니다.
+        """
+        if not self._retention or time.monotonic() - self._last_expire < _EXPIRE_INTERVAL:
+            return
+        self._last_expire = time.monotonic()
+        cutoff = time.time() - self._retention
+        expired = False
+        for metric_type, segments in self._segments.items():
+            while segments and segments[0] is not self._active[metric_type] \
+                    and segments[0].timestamp(segments[0].count - 1) < cutoff:
+                segments.pop(0).unlink()
+                self._expired[metric_type] += 1
+                expired = True
+        if expired:
+            self._save_meta()
+
+    def get_sequence(self, metric_type: str) -> int:
+        """
+        메트릭 타입의 현재 시퀀스 번호를 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            int: 시퀀스 번호 (알 수 없는 타입이면 0)
+        """
+        return self._seq.get(metric_type, 0)
+
+    def get_version(self, metric_type: str) -> str:
+        """
+        메트릭 타입의 조회 결과 버전을 반환합니다 (ETag 생성용).
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            str: epoch, 보관 기간 만료 횟수, 시퀀스 번호로 만든 버전 문자열
+        """
+        return f"{self.epoch}.{self._expired.get(metric_type, 0)}.{self.get_sequence(metric_type)}"
+
+    def _time_parts(self, metric_type: str, start: Optional[float], end: Optional[float]) -> List[Part]:
+        parts = []
+        for segment in self._segments[metric_type]:
+            if not segment.count:
+                continue
+            if end is not None and segment.timestamp(0) > end:
+                break
+            if start is not None and segment.timestamp(segment.count - 1) < start:
+                continue
+            lo, hi = segment.search(start, end)
+            if lo < hi:
+                parts.append((segment, lo, hi))
+        return parts
+
+    @staticmethod
+    def _tail(parts: List[Part], limit: Optional[int]) -> List[Part]:
+        """구간 목록에서 최근 limit개 레코드만 남깁니다."""
+        if not limit or limit <= 0:
+            return parts
+        result = []
+        for segment, lo, hi in reversed(parts):
+            if limit <= 0:
+                break
+            lo = max(lo, hi - limit)
+            result.append((segment, lo, hi))
+            limit -= hi - lo
+        result.reverse()
+        return result
+
+    @staticmethod
+    def _read(parts: List[Part]) -> List[Chunk]:
+        """
+        구간 목록의 레코드를 복사합니다.
+
+        잠금 안에서는 복사만 하고 행/컬럼 해석은 잠금 밖에서 하므로, 긴 구간 조회가
+        같은 잠금을 쓰는 save_metric()의 기록을 막지 않습니다.
+        """
+        return [(segment.layout, segment.read(lo, hi)) for segment, lo, hi in parts if lo < hi]
+
+    @staticmethod
+    def _rows(chunks: List[Chunk]) -> List[Dict[str, Any]]:
+        rows = []
+        for layout, data in chunks:
+            rows.extend(layout.unpack(record) for record in layout.record.iter_unpack(data))
+        return rows
+
+    @staticmethod
+    def _columns(chunks: List[Chunk]) -> Tuple[array, Dict[Path, Any]]:
+        """
+        복사한 구간 목록을 컬럼 단위로 반환합니다.
+
+        숫자 필드는 레코드를 필드 폭 간격으로 잘라 array로 옮기며(행 복원 없음),
+        모든 구간에 값이 있고 누락 값이 없는 필드만 포함합니다.
+        """
+        timestamps = array('d')
+        columns: Dict[Path, Any] = {}
+        common = None
+        for index, (layout, data) in enumerate(chunks):
+            count = len(data) // layout.record.size
+            view = memoryview(data)
+            floats = view.cast('d')
+            integers = view.cast('q')
+            timestamps.extend(floats[0::layout.width])
+            seen = set()
+            for slot, (path, kind) in enumerate(zip(layout.paths, layout.kinds)):
+                values = array(kind, (floats if kind == 'd' else integers)[2 + slot::layout.width])
+                if kind == 'q' and _MISSING_INT in values:
+                    continue
+                if kind == 'd' and any(map(math.isnan, values)):
+                    continue
+                _extend(columns, path, values)
+                seen.add(path)
+            for path, value in layout.constants.items():
+                if value is not None:
+                    _extend(columns, path, [value] * count)
+                    seen.add(path)
+            common = seen if index == 0 else common & seen
+        return timestamps, {path: values for path, values in columns.items() if path in (common or ())}
+
+    def get_latest(self, metric_type: str) -> Optional[Dict[str, Any]]:
+        """
+        특정 메트릭 타입의 최신 데이터를 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            Optional[Dict[str, Any]]: 최신 메트릭 데이터 또는 None
+        """
+        if metric_type not in self._segments:
+            return None
+
+        with self._lock:
+            segment = next((segment for segment in reversed(self._segments[metric_type]) if segment.count), None)
+            if segment is None:
+                return None
+            chunks = self._read([(segment, segment.count - 1, segment.count)])
+        return self._rows(chunks)[0]
+
+    def get_range(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 메트릭 타입의 시간 범위 데이터를 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            limit: 최대 반환 개수 (None이면 제한 없음, 최근 행 우선)
+
+        Returns:
+            List[Dict[str, Any]]: 메트릭 데이터 리스트
+        """
+        if metric_type not in self._segments:
+            return []
+
+        start_ts = to_epoch(start) if start else None
+        end_ts = to_epoch(end) if end else None
+
+        with self._lock:
+            chunks = self._read(self._tail(self._time_parts(metric_type, start_ts, end_ts), limit))
+        return self._rows(chunks)
+
+    def get_columns(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[array, Dict[Path, Any]]:
+        """
+        get_range()와 같은 구간을 행으로 복원하지 않고 컬럼 단위로 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            limit: 최대 반환 개수 (None이면 제한 없음)
+
+        Returns:
+            Tuple[array, Dict[Path, Any]]: (epoch 타임스탬프 array, 경로 튜플별 값 array/list)
+        """
+        if metric_type not in self._segments:
+            return array('d'), {}
+
+        start_ts = to_epoch(start) if start else None
+        end_ts = to_epoch(end) if end else None
+
+        with self._lock:
+            chunks = self._read(self._tail(self._time_parts(metric_type, start_ts, end_ts), limit))
+        return self._columns(chunks)
+
+    def get_downsampled(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        step: float = 60,
+        agg: str = 'avg',
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 메트릭 타입의 시간 범위 데이터를 step 초 단위 버킷으로 집계하여 반환합니다.
+
+        복사한 레코드를 _columns()로 필드별 array로 옮겨 바로 집계하므로 행을 복원하지 않습니다.
+        limit이 있으면 최근 limit개 버킷에 해당하는 구간의 레코드만 읽습니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            step: 버킷 크기 (초)
+            agg: 집계 방식 (avg, min, max, p95, last)
+            limit: 최대 반환 버킷 수 (None이면 제한 없음, 최근 버킷 우선)
+
+        Returns:
+            List[Dict[str, Any]]: 버킷별 집계 데이터 리스트
+        """
+        if metric_type not in self._segments:
+            return []
+
+        start_ts = to_epoch(start) if start else None
+        end_ts = to_epoch(end) if end else None
+
+        with self._lock:
+            parts = self._time_parts(metric_type, start_ts, end_ts)
+            if limit and limit > 0 and parts:
+                # 최근 limit개 버킷에 해당하는 구간만 집계
+                segment, _, hi = parts[-1]
+                last_bucket = (segment.timestamp(hi - 1) // step) * step
+                lower = last_bucket - (limit - 1) * step
+                if start_ts is None or start_ts < lower:
+                    parts = self._time_parts(metric_type, lower, end_ts)
+            chunks = self._read(parts)
+
+        return downsample_columns(*self._columns(chunks), step, agg)
+
+    def get_since(
+        self,
+        metric_type: str,
+        since_seq: int,
+        limit: Optional[int] = None,
+        columns: bool = False
+    ) -> Tuple[Any, int, bool]:
+        """
+        시퀀스 번호 since_seq 이후에 저장된 데이터만 반환합니다 (증분 폴링용 커서).
+
+        세그먼트의 시퀀스 번호는 연속이므로 커서 위치는 세그먼트 목록을 이진 탐색한 뒤 산술로 찾습니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            since_seq: 클라이언트가 마지막으로 받은 시퀀스 번호 (처음이면 0)
+            limit: 최대 반환 개수 (초과하면 최근 행 우선)
+            columns: True이면 행 대신 컬럼 형식으로 반환
+
+        Returns:
+            Tuple[Any, int, bool]: (행 리스트 또는 컬럼, 다음 커서(next_seq), gap)
+        """
+        if metric_type not in self._segments:
+            return ((([], {}) if columns else []), 0, False)
+
+        with self._lock:
+            segments = self._segments[metric_type]
+            last_seq = self._seq[metric_type]
+            gap = since_seq > last_seq
+            if gap:
+                # 다른 스토리지의 커서
+                since_seq = 0
+
+            first_seqs = [segment.first_seq for segment in segments]
+            index = max(0, bisect_right(first_seqs, since_seq + 1) - 1)
+            parts = []
+            for segment in segments[index:]:
+                lo = min(segment.count, max(0, since_seq + 1 - segment.first_seq))
+                if lo < segment.count:
+                    parts.append((segment, lo, segment.count))
+            tail = self._tail(parts, limit)
+
+            # 커서 바로 다음 번호부터 연속으로 돌려주지 못했다면 (만료, 삭제, limit 초과) gap
+            if tail:
+                segment, lo, _ = tail[0]
+                gap = gap or segment.first_seq + lo != since_seq + 1
+            else:
+                gap = gap or last_seq > since_seq
+
+            chunks = self._read(tail)
+
+        items = self._columns(chunks) if columns else self._rows(chunks)
+        return items, last_seq, gap
+
+    def clear(self, metric_type: Optional[str] = None):
+        """
+        저장된 데이터를 삭제합니다 (세그먼트 파일 삭제).
+
+        Args:
+            metric_type: 삭제할 메트릭 타입 (None이면 전체 삭제)
+        """
+        with self._lock:
+            metric_types = [metric_type] if metric_type else list(self._segments)
+            for key in metric_types:
+                if key not in self._segments:
+                    continue
+                for segment in self._segments[key]:
+                    segment.unlink()
+                self._segments[key] = []
+                self._active[key] = None
+                self._seq[key] += 1
+            self._save_meta()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        저장된 데이터 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 메트릭 타입별 데이터 포인트 수
+        """
+        with self._lock:
+            return {
+                metric_type: sum(segment.count for segment in segments)
+                for metric_type, segments in self._segments.items()
+            }
+
+    def get_segment_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        메트릭 타입별 세그먼트 현황을 반환합니다.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 세그먼트별 file, first_seq, records, bytes
+        """
+        with self._lock:
+            return {
+                metric_type: [
+                    {
+                        'file': os.path.basename(segment.path),
+                        'first_seq': segment.first_seq,
+                        'records': segment.count,
+                        'bytes': segment.data_offset + segment.count * segment.layout.record.size
+                    }
+                    for segment in segments
+                ]
+                for metric_type, segments in self._segments.items()
+            }
+
+    def close(self):
+        """세그먼트 파일과 매핑을 닫고 시퀀스 번호를 기록합니다."""
+        with self._lock:
+            for segments in self._segments.values():
+                for segment in segments:
+                    segment.close()
+            self._active = {metric_type: None for metric_type in METRIC_TYPES}
+            self._save_meta()
@@ -0,0 +1,138 @@
+"""최신 메트릭 스냅샷 캐시"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """
+    한 번의 수집으로 얻은 메트릭 묶음.
+
+    이번 틱에 수집하지 못해 이전 스냅샷에서 이어받은 타입(stale)은 원래 수집 시각을
+    타입별로 유지하므로, 오래된 값이 새 스냅샷 시각으로 보고되지 않습니다.
+    """
+
+    __slots__ = ('data', 'timestamp', 'collected_at', 'version', 'type_timestamps', 'type_collected_at', 'stale')
+
+    def __init__(self, data: Dict[str, Any], version: int, previous: Optional['Snapshot'] = None,
+                 carried: Iterable[str] = ()):
+        """
+        Args:
+            data: 메트릭 타입별 수집 데이터
+            version: 캐시 내에서 단조 증가하는 스냅샷 번호
+            previous: carried 타입의 수집 시각을 이어받을 이전 스냅샷
+            carried: 이번 틱에 수집되지 않고 이전 스냅샷 값을 그대로 쓰는 타입
+        """
+        self.data = data
+        self.timestamp = datetime.now()
+        self.collected_at = time.monotonic()
+        self.version = version
+        self.type_timestamps: Dict[str, datetime] = dict.fromkeys(data, self.timestamp)
+        self.type_collected_at: Dict[str, float] = dict.fromkeys(data, self.collected_at)
+        stale = []
+        if previous is not None:
+            for metric_type in carried:
+                if metric_type in data and metric_type in previous.type_collected_at:
+                    self.type_timestamps[metric_type] = previous.type_timestamps[metric_type]
+                    self.type_collected_at[metric_type] = previous.type_collected_at[metric_type]
+                    stale.append(metric_type)
+        self.stale: Tuple[str, ...] = tuple(sorted(stale))
+
+    def age(self, metric_type: Optional[str] = None) -> float:
+        """
+        수집 후 경과 시간 (초).
+
+        Args:
+            metric_type: 이 타입의 경과 시간 (None이면 스냅샷에서 가장 오래된 타입 기준)
+        """
+        if metric_type is not None:
+            return time.monotonic() - self.type_collected_at[metric_type]
+        return time.monotonic() - min(self.type_collected_at.values(), default=self.collected_at)
+
+
+class SnapshotCache:
+    """
+    스케줄러가 채우고 API가 읽는 최신 메트릭 스냅샷 캐시.
+
+    스냅샷이 max_staleness보다 오래되었을 때만 refresh 함수를 호출하며,
+    동시에 여러 요청이 캐시 미스를 겪어도 수집은 한 번만 수행됩니다 (single-flight).
+    """
+
+    def __init__(self, max_staleness: float = 10.0):
+        """
+        Args:
+            max_staleness: 스냅샷의 최대 허용 경과 시간 (초)
+        """
+        self.max_staleness = max_staleness
+        self._snapshot: Optional[Snapshot] = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def update(self, data: Dict[str, Any], carried: Iterable[str] = ()) -> Snapshot:
+        """
+        새 스냅샷을 저장합니다.
+
+        Args:
+            data: 메트릭 타입별 수집 데이터
+            carried: 이번 틱에 수집되지 않고 현재 스냅샷 값을 이어받은 타입 (수집 시각도 이어받음)
+
+        Returns:
+            Snapshot: 저장된 스냅샷
+        """
+        with self._lock:
+            self._version += 1
+            snapshot = Snapshot(data, self._version, self._snapshot, carried)
+            self._snapshot = snapshot
+        return snapshot
+
+    def peek(self) -> Optional[Snapshot]:
+        """경과 시간과 관계없이 현재 스냅샷을 반환합니다."""
+        return self._snapshot
+
+    def get_fresh(self) -> Optional[Snapshot]:
+        """
+        max_staleness 이내의 스냅샷을 반환합니다.
+
+        Returns:
+            Optional[Snapshot]: 신선한 스냅샷 또는 None
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age() <= self.max_staleness:
+            return snapshot
+        return None
+
+    def get(self, refresh: Callable[[], Dict[str, Any]]) -> Snapshot:
+        """
+        신선한 스냅샷을 반환하고, 없으면 refresh 함수로 한 번만 수집합니다.
+
+        refresh 호출이 실패하면 오래된 스냅샷이라도 있는 경우 그것을 반환합니다.
+
+        Args:
+            refresh: 메트릭 타입별 데이터를 수집하는 함수
+
+        Returns:
+            Snapshot: 스냅샷
+        """
+        snapshot = self.get_fresh()
+        if snapshot is not None:
+            return snapshot
+
+        with self._refresh_lock:
+            # 대기하는 동안 다른 요청이나 스케줄러가 갱신했을 수 있음
+            snapshot = self.get_fresh()
+            if snapshot is not None:
+                return snapshot
+
+            try:
+                return self.update(refresh())
+            except Exception as e:
+                stale = self._snapshot
+                if stale is None:
+                    raise
+                logger.warning(f"Snapshot refresh failed, serving stale snapshot: {e}")
+                return stale
@@ -0,0 +1,540 @@
+"""SQLite(WAL) 기반 영구 스토리지 구현"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from app.storage.base import METRIC_TYPES, MetricStorage, to_epoch
+from app.storage.columnar import columns_from_rows
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS samples (
+        metric_type TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        ts REAL NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (metric_type, seq)
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS samples_ts ON samples (metric_type, ts)',
+    'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)',
+)
+
+# 보관 기간이 지난 행을 삭제하는 주기 (초)
+_EXPIRE_INTERVAL = 60.0
+
+
+def _encode(data: Dict[str, Any]) -> str:
+    """timestamp를 제외한 메트릭 데이터를 JSON 문자열로 인코딩합니다 (timestamp는 ts 컬럼에 저장)."""
+    return json.dumps(
+        {key: value for key, value in data.items() if key != 'timestamp'},
+        separators=(',', ':'), default=str
+    )
+
+
+def _decode(ts: float, data: str) -> Dict[str, Any]:
+    row = json.loads(data)
+    row['timestamp'] = datetime.fromtimestamp(ts)
+    return row
+
+
+class SQLiteStorage(MetricStorage):
+    """
+    시계열 메트릭을 SQLite 파일(WAL 모드)에 저장하는 영구 스토리지.
+
+    save_metric()은 시퀀스 번호만 매기고 메모리 대기열에 넣은 뒤 바로 반환하며,
+    백그라운드 쓰기 스레드가 flush_interval마다(또는 batch_size개가 쌓이면) 대기열을
+    한 트랜잭션으로 묶어 기록합니다. 따라서 수집 경로는 디스크 I/O로 블로킹되지 않습니다.
+    디스크가 멈춰 대기열이 max_pending을 넘으면 가장 오래된 샘플부터 버립니다.
+
+    조회는 먼저 대기 중인 쓰기를 반영한 뒤 스레드별 읽기 연결로 수행하므로 저장 직후의
+    데이터도 보입니다. 재시작하면 파일에 남은 이력과 시퀀스 번호, epoch를 그대로 이어서 사용합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        retention: Optional[float] = 7 * 86400,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_pending: int = 100000
+    ):
+        """
+        Args:
+            path: 데이터베이스 파일 경로 (디렉토리가 없으면 생성)
+            retention: 보관 기간 (초, None이면 삭제하지 않음)
+            flush_interval: 대기열을 기록하는 최대 간격 (초)
+            batch_size: 이 개수 이상 쌓이면 간격을 기다리지 않고 기록
+            max_pending: 최대 대기 샘플 수 (초과 시 가장 오래된 샘플을 버림)
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._retention = retention
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._pending: deque = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._last_expire = 0.0
+        self._written = 0
+        self._batches = 0
+        self._dropped = 0
+        self._errors = 0
+
+        self._writer = self._connect()
+        with self._writer:
+            for statement in _SCHEMA:
+                self._writer.execute(statement)
+        self.epoch = self._load_epoch()
+        self._seq: Dict[str, int] = self._load_sequences()
+        self._expired: Dict[str, int] = self._load_expirations()
+
+        self._thread = threading.Thread(target=self._run, name='sqlite-storage-writer', daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        # WAL 모드에서는 NORMAL도 충돌 시 손상되지 않으며, 커밋마다 fsync하지 않음
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.isolation_level = 'DEFERRED'
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        """스레드별 읽기 연결 (WAL 모드에서 읽기는 쓰기와 동시에 진행됨)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+            with self._lock:
+                self._readers.append(connection)
+        return connection
+
+    def _load_epoch(self) -> str:
+        row = self._writer.execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()
+        if row:
+            return row[0]
+        epoch = uuid.uuid4().hex[:8]
+        with self._writer:
+            self._writer.execute("INSERT INTO meta (key, value) VALUES ('epoch', ?)", (epoch,))
+        return epoch
+
+    def _load_sequences(self) -> Dict[str, int]:
+        """저장된 행과 삭제 기록에서 타입별 마지막 시퀀스 번호를 복원합니다."""
+        sequences = {metric_type: 0 for metric_type in METRIC_TYPES}
+        for metric_type, seq in self._writer.execute(
+            'SELECT metric_type, MAX(seq) FROM samples GROUP BY metric_type'
+        ):
+            if metric_type in sequences:
+                sequences[metric_type] = seq
+        for key, value in self._writer.execute("SELECT key, value FROM meta WHERE key LIKE 'seq:%'"):
+            metric_type = key[4:]
+            if metric_type in sequences:
+                sequences[metric_type] = max(sequences[metric_type], int(value))
+        return sequences
+
+    def _load_expirations(self) -> Dict[str, int]:
+        """타입별 보관 기간 만료 삭제 횟수를 복원합니다."""
+        expirations = {metric_type: 0 for metric_type in METRIC_TYPES}
+        for key, value in self._writer.execute("SELECT key, value FROM meta WHERE key LIKE 'expired:%'"):
+            metric_type = key[8:]
+            if metric_type in expirations:
+                expirations[metric_type] = int(value)
+        return expirations
+
+    def save_metric(self, metric_type: str, data: Dict[str, Any]) -> bool:
+        """
+        메트릭 데이터를 쓰기 대기열에 넣습니다 (인코딩과 기록은 쓰기 스레드가 수행).
+
+        Args:
+            metric_type: 메트릭 타입 (cpu, memory, disk, network, process)
+            data: 저장할 메트릭 데이터
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if metric_type not in self._seq or self._closed.is_set():
+            return False
+
+        # 타임스탬프 추가 (없는 경우)
+        if 'timestamp' not in data:
+            data['timestamp'] = datetime.now()
+
+        timestamp = to_epoch(data['timestamp'])
+
+        with self._lock:
+            self._seq[metric_type] += 1
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append((metric_type, self._seq[metric_type], timestamp, data))
+            pending = len(self._pending)
+
+        if pending >= self._batch_size:
+            self._wake.set()
+        return True
+
+    def _run(self):
+        """쓰기 스레드: flush_interval마다 또는 깨워질 때 대기열을 기록합니다."""
+        while not self._closed.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+                self._expire()
+            except sqlite3.Error as e:
+                logger.error(f"SQLite storage write failed: {e}")
+
+    def flush(self) -> int:
+        """
+        대기 중인 샘플을 한 트랜잭션으로 기록합니다.
+
+        Returns:
+            int: 기록한 샘플 수
+        """
+        with self._write_lock:
+            return self._flush()
+
+    def _flush(self) -> int:
+        """flush()의 본체 (_write_lock을 잡은 상태에서 호출)"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch = list(self._pending)
+            self._pending.clear()
+
+        rows = [(metric_type, seq, ts, _encode(data)) for metric_type, seq, ts, data in batch]
+        try:
+            with self._writer:
+                self._writer.executemany(
+                    'INSERT OR REPLACE INTO samples (metric_type, seq, ts, data) VALUES (?, ?, ?, ?)',
+                    rows
+                )
+        except sqlite3.Error:
+            # 다음 기록에서 다시 시도하도록 대기열 앞에 되돌림 (최대 크기를 넘는 오래된 샘플은 버려짐)
+            with self._lock:
+                self._errors += 1
+                retry = batch + list(self._pending)
+                overflow = max(0, len(retry) - self._pending.maxlen)
+                self._dropped += overflow
+                self._pending = deque(retry[overflow:], maxlen=self._pending.maxlen)
+            raise
+
+        with self._lock:
+            self._written += len(rows)
+            self._batches += 1
+        return len(rows)
+
+    def _expire(self):
+        """
+        보관 기간이 지난 행을 주기적으로 삭제합니다.
+
+        (metric_type, ts) 인덱스를 쓰도록 타입별로 삭제하고, 행이 삭제된 타입은
+        만료 횟수를 올려 이전 조회 결과의 ETag이 더 이상 일치하지 않게 합니다.
+        """
+        if not self._retention or time.monotonic() - self._last_expire < _EXPIRE_INTERVAL:
+            return
+        self._last_expire = time.monotonic()
+        cutoff = time.time() - self._retention
+        with self._write_lock, self._writer:
+            expired = [
+                metric_type for metric_type in list(self._seq)
+                if self._writer.execute('DELETE FROM samples WHERE metric_type = ? AND ts < ?',
+                                        (metric_type, cutoff)).rowcount > 0
+            ]
+            if not expired:
+                return
+            with self._lock:
+                for metric_type in expired:
+                    self._expired[metric_type] = self._expired.get(metric_type, 0) + 1
+                counts = [(f'expired:{key}', str(self._expired[key])) for key in expired]
+            # 재시작 후 같은 버전이 다른 결과를 가리키지 않도록 기록
+            self._writer.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', counts)
+
+    def get_sequence(self, metric_type: str) -> int:
+        """
+        메트릭 타입의 현재 시퀀스 번호를 반환합니다 (대기 중인 샘플 포함).
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            int: 시퀀스 번호 (알 수 없는 타입이면 0)
+        """
+        return self._seq.get(metric_type, 0)
+
+    def get_version(self, metric_type: str) -> str:
+        """
+        메트릭 타입의 조회 결과 버전을 반환합니다 (ETag 생성용).
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            str: epoch, 보관 기간 만료 횟수, 시퀀스 번호로 만든 버전 문자열
+        """
+        return f"{self.epoch}.{self._expired.get(metric_type, 0)}.{self.get_sequence(metric_type)}"
+
+    def _sync(self):
+        """조회 전에 대기 중인 샘플을 기록합니다 (실패해도 이미 기록된 데이터로 조회)."""
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite storage flush before read failed: {e}")
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        self._sync()
+        return self._reader().execute(sql, params).fetchall()
+
+    def get_latest(self, metric_type: str) -> Optional[Dict[str, Any]]:
+        """
+        특정 메트릭 타입의 최신 데이터를 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+
+        Returns:
+            Optional[Dict[str, Any]]: 최신 메트릭 데이터 또는 None
+        """
+        if metric_type not in self._seq:
+            return None
+
+        rows = self._query(
+            'SELECT ts, data FROM samples WHERE metric_type = ? ORDER BY seq DESC LIMIT 1',
+            (metric_type,)
+        )
+        return _decode(*rows[0]) if rows else None
+
+    def get_range(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 메트릭 타입의 시간 범위 데이터를 반환합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            limit: 최대 반환 개수 (None이면 제한 없음, 최근 행 우선)
+
+        Returns:
+            List[Dict[str, Any]]: 메트릭 데이터 리스트 (시간순)
+        """
+        if metric_type not in self._seq:
+            return []
+
+        sql = 'SELECT ts, data FROM samples WHERE metric_type = ?'
+        params: list = [metric_type]
+        if start:
+            sql += ' AND ts >= ?'
+            params.append(to_epoch(start))
+        if end:
+            sql += ' AND ts <= ?'
+            params.append(to_epoch(end))
+        # (metric_type, ts) 인덱스를 역순으로 읽어 최근 limit개만 가져옴
+        sql += ' ORDER BY ts DESC'
+        if limit and limit > 0:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        rows = self._query(sql, tuple(params))
+        return [_decode(ts, data) for ts, data in reversed(rows)]
+
+    def get_since(
+        self,
+        metric_type: str,
+        since_seq: int,
+        limit: Optional[int] = None,
+        columns: bool = False
+    ) -> Tuple[Any, int, bool]:
+        """
+        시퀀스 번호 since_seq 이후에 저장된 데이터만 반환합니다 (증분 폴링용 커서).
+
+        Args:
+            metric_type: 메트릭 타입
+            since_seq: 클라이언트가 마지막으로 받은 시퀀스 번호 (처음이면 0)
+            limit: 최대 반환 개수 (초과하면 최근 행 우선)
+            columns: True이면 행 대신 컬럼 형식으로 반환
+
+        Returns:
+            Tuple[Any, int, bool]: (행 리스트 또는 컬럼, 다음 커서(next_seq, 실제로 읽은 마지막 번호), gap)
+        """
+        if metric_type not in self._seq:
+            return ((([], {}) if columns else []), 0, False)
+
+        # 기록 전에 번호를 읽어야 그 사이 저장된 샘플이 기록되지 않은 채 커서를 넘어가지 않음
+        with self._lock:
+            last_seq = self._seq[metric_type]
+
+        with self._write_lock:
+            try:
+                self._flush()
+            except sqlite3.Error as e:
+                logger.warning(f"SQLite storage flush before read failed: {e}")
+            # 기록에 실패해 대기열에 남은 번호부터는 다음 조회에서 돌려줌
+            with self._lock:
+                pending = [seq for key, seq, _, _ in self._pending if key == metric_type and seq <= last_seq]
+        durable_seq = min(pending) - 1 if pending else last_seq
+
+        gap = since_seq > last_seq
+        if gap:
+            # 다른 데이터베이스의 커서
+            since_seq = 0
+
+        sql = 'SELECT seq, ts, data FROM samples WHERE metric_type = ? AND seq > ? AND seq <= ? ORDER BY seq DESC'
+        params: tuple = (metric_type, since_seq, durable_seq)
+        if limit and limit > 0:
+            sql += ' LIMIT ?'
+            params += (limit,)
+        rows = self._reader().execute(sql, params).fetchall()
+        rows.reverse()
+
+        # 커서 바로 다음 번호부터 연속으로 돌려주지 못했다면 (만료, 삭제, limit 초과, 대기열 초과) gap
+        if rows:
+            gap = gap or rows[0][0] != since_seq + 1
+            next_seq = rows[-1][0]
+        else:
+            # 읽은 행이 없으면 커서를 유지하되, 기록되어 있어야 할 번호가 모두 사라졌다면 건너뜀
+            gap = gap or durable_seq > since_seq
+            next_seq = durable_seq if durable_seq > since_seq else since_seq
+
+        items = [_decode(ts, data) for _, ts, data in rows]
+        return (columns_from_rows(items) if columns else items), next_seq, gap
+
+    def get_downsampled(
+        self,
+        metric_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        step: float = 60,
+        agg: str = 'avg',
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        시간 범위 데이터를 step 초 단위 버킷으로 집계하여 반환합니다.
+
+        샘플은 JSON으로 저장되어 필드별 집계를 SQL로 할 수 없으므로, limit이 있으면 먼저
+        (metric_type, ts) 인덱스로 마지막 샘플 시각을 찾아 최근 limit개 버킷(limit * step 초)
+        구간의 행만 읽은 뒤 기본 구현으로 집계합니다.
+
+        Args:
+            metric_type: 메트릭 타입
+            start: 시작 시간 (None이면 처음부터)
+            end: 종료 시간 (None이면 끝까지)
+            step: 버킷 크기 (초)
+            agg: 집계 방식 (avg, min, max, p95, last)
+            limit: 최대 반환 버킷 수 (None이면 제한 없음, 최근 버킷 우선)
+
+        Returns:
+            List[Dict[str, Any]]: 버킷별 집계 데이터 리스트
+        """
+        if metric_type not in self._seq:
+            return []
+
+        if limit and limit > 0:
+            sql = 'SELECT MAX(ts) FROM samples WHERE metric_type = ?'
+            params: list = [metric_type]
+            if start:
+                sql += ' AND ts >= ?'
+                params.append(to_epoch(start))
+            if end:
+                sql += ' AND ts <= ?'
+                params.append(to_epoch(end))
+            last_ts = self._query(sql, tuple(params))[0][0]
+            if last_ts is None:
+                return []
+            lower = (last_ts // step - (limit - 1)) * step
+            if not start or to_epoch(start) < lower:
+                start = datetime.fromtimestamp(lower)
+
+        return super().get_downsampled(metric_type, start=start, end=end, step=step, agg=agg, limit=limit)
+
+    def clear(self, metric_type: Optional[str] = None):
+        """
+        저장된 데이터를 삭제합니다.
+
+        Args:
+            metric_type: 삭제할 메트릭 타입 (None이면 전체 삭제)
+        """
+        metric_types = [metric_type] if metric_type else list(self._seq)
+        with self._write_lock:
+            with self._lock:
+                self._pending = deque(
+                    (item for item in self._pending if item[0] not in metric_types),
+                    maxlen=self._pending.maxlen
+                )
+                for key in metric_types:
+                    if key in self._seq:
+                        self._seq[key] += 1
+                sequences = [(f'seq:{key}', str(self._seq[key])) for key in metric_types if key in self._seq]
+
+            with self._writer:
+                self._writer.executemany('DELETE FROM samples WHERE metric_type = ?',
+                                         [(key,) for key in metric_types])
+                # 재시작 후에도 시퀀스 번호가 되돌아가지 않도록 기록
+                self._writer.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', sequences)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        저장된 데이터 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 메트릭 타입별 데이터 포인트 수
+        """
+        stats = {metric_type: 0 for metric_type in METRIC_TYPES}
+        for metric_type, count in self._query(
+            'SELECT metric_type, COUNT(*) FROM samples GROUP BY metric_type', ()
+        ):
+            if metric_type in stats:
+                stats[metric_type] = count
+        return stats
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """
+        쓰기 대기열 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: pending(대기 샘플 수), written(기록한 샘플 수), batches(트랜잭션 수),
+                dropped(대기열 초과로 버린 샘플 수), errors(기록 실패 횟수)
+        """
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'written': self._written,
+                'batches': self._batches,
+                'dropped': self._dropped,
+                'errors': self._errors
+            }
+
+    def close(self):
+        """쓰기 스레드를 멈추고 남은 샘플을 기록한 뒤 연결을 닫습니다."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._thread.join()
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.error(f"SQLite storage final flush failed: {e}")
+        with self._lock:
+            readers, self._readers = self._readers, []
+        for connection in readers:
+            connection.close()
+        self._writer.close()
@@ -0,0 +1,215 @@
+"""인메모리 스토리지용 WAL(write-ahead log)과 스냅샷"""
+import logging
+import marshal
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 레코드 헤더: 페이로드 길이, CRC32
+_RECORD = struct.Struct('<II')
+
+# 스냅샷 형식 버전 (상태 구조가 바뀌면 증가시켜 이전 스냅샷을 무시)
+SNAPSHOT_VERSION = 1
+
+_SNAPSHOT = 'snapshot.bin'
+
+
+class WriteAheadLog:
+    """
+    스토리지 변경(저장/삭제)을 순서대로 기록하는 로그와 주기적 스냅샷.
+
+    레코드는 [길이][CRC32][marshal 페이로드] 형식으로 세대(generation) 번호가 붙은 로그 파일에
+    추가됩니다. 스냅샷을 만들 때는 새 세대 파일로 넘어간 뒤, 스냅샷이 포함하는 이전 세대 파일을
+    삭제합니다(compaction). 복원은 마지막 스냅샷을 읽고 그 이후 세대의 레코드만 재생하며,
+    비정상 종료로 잘리거나 손상된 마지막 레코드는 잘라내고 멈춥니다.
+
+    스레드 안전하지 않으며, 호출자(MemoryStorage)가 잠금을 책임집니다.
+    """
+
+    def __init__(self, directory: str, fsync: bool = False):
+        """
+        Args:
+            directory: 로그와 스냅샷 파일 디렉토리
+            fsync: 레코드마다 fsync 호출 여부 (False이면 OS 페이지 캐시까지만 반영,
+                프로세스 비정상 종료에는 안전하지만 전원 장애 시 마지막 레코드가 유실될 수 있음)
+        """
+        self.directory = directory
+        self._fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+        generations = self._generations()
+        self.generation = (generations[-1] if generations else 0) + 1
+        self._file = self._open(self.generation)
+        self._snapshot_lock = threading.Lock()
+        self._appended = 0
+        self._bytes = 0
+        self._errors = 0
+        self._compactions = 0
+        self._replayed = 0
+
+    def _path(self, generation: int) -> str:
+        return os.path.join(self.directory, f'wal-{generation:08d}.log')
+
+    def _generations(self) -> List[int]:
+        generations = []
+        for name in os.listdir(self.directory):
+            if name.startswith('wal-') and name.endswith('.log'):
+                try:
+                    generations.append(int(name[4:-4]))
+                except ValueError:
+                    continue
+        return sorted(generations)
+
+    def _open(self, generation: int):
+        return open(self._path(generation), 'ab')
+
+    def append(self, record: Tuple[Any, ...]) -> bool:
+        """
+        레코드를 로그에 추가합니다.
+
+        직렬화하거나 기록하지 못하면 오류를 기록하고 False를 반환합니다
+        (메모리 저장은 계속되어야 하므로 예외를 전파하지 않음).
+
+        Args:
+            record: marshal로 직렬화할 수 있는 튜플
+
+        Returns:
+            bool: 기록 성공 여부
+        """
+        try:
+            payload = marshal.dumps(record)
+            self._file.write(_RECORD.pack(len(payload), zlib.crc32(payload)) + payload)
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+        except (ValueError, OSError) as e:
+            self._errors += 1
+            logger.error(f"WAL append failed: {e}")
+            return False
+        self._appended += 1
+        self._bytes += _RECORD.size + len(payload)
+        return True
+
+    def rotate(self) -> int:
+        """
+        새 세대 로그 파일로 넘어갑니다.
+
+        Returns:
+            int: 새 세대 번호 (이전 세대까지의 레코드는 이 번호의 스냅샷이 대신함)
+        """
+        self._file.close()
+        self.generation += 1
+        self._file = self._open(self.generation)
+        return self.generation
+
+    def write_snapshot(self, state: Dict[str, Any], generation: int):
+        """
+        스냅샷을 원자적으로 교체하고 스냅샷이 포함하는 이전 세대 로그 파일을 삭제합니다.
+
+        Args:
+            state: 스토리지 상태 (marshal로 직렬화할 수 있어야 함)
+            generation: rotate()가 반환한 세대 번호 (이 세대부터 재생)
+        """
+        with self._snapshot_lock:
+            current = self.load_snapshot(header_only=True)
+            if current is not None and current['generation'] >= generation:
+                # 더 최근의 스냅샷이 이미 기록됨
+                return
+            path = os.path.join(self.directory, _SNAPSHOT)
+            temporary = path + '.tmp'
+            with open(temporary, 'wb') as file:
+                marshal.dump({'version': SNAPSHOT_VERSION, 'generation': generation}, file)
+                marshal.dump(state, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, path)
+            for old in self._generations():
+                if old < generation:
+                    os.unlink(self._path(old))
+            self._compactions += 1
+
+    def load_snapshot(self, header_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        마지막 스냅샷을 읽습니다.
+
+        Args:
+            header_only: True이면 상태를 읽지 않고 version, generation만 반환
+
+        Returns:
+            Optional[Dict[str, Any]]: {'version', 'generation', 'state'} 또는 None (없거나 형식이 다름)
+        """
+        path = os.path.join(self.directory, _SNAPSHOT)
+        try:
+            with open(path, 'rb') as file:
+                header = marshal.load(file)
+                if header.get('version') != SNAPSHOT_VERSION:
+                    logger.warning(f"Ignoring snapshot with version {header.get('version')}")
+                    return None
+                if not header_only:
+                    header['state'] = marshal.load(file)
+                return header
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.error(f"Failed to read snapshot: {e}")
+            return None
+
+    def replay(self, generation: int = 0) -> Iterator[Tuple[Any, ...]]:
+        """
+        generation 세대부터 현재 세대 이전까지의 로그 레코드를 순서대로 반환합니다.
+
+        손상되었거나 잘린 레코드를 만나면 그 위치에서 파일을 잘라내고 해당 파일의 재생을 멈춥니다.
+
+        Args:
+            generation: 재생을 시작할 세대 번호 (스냅샷의 generation)
+
+        Yields:
+            Tuple[Any, ...]: append()로 기록한 레코드
+        """
+        for old in self._generations():
+            if old < generation or old >= self.generation:
+                continue
+            path = self._path(old)
+            with open(path, 'rb') as file:
+                data = file.read()
+            offset = 0
+            while offset + _RECORD.size <= len(data):
+                length, crc = _RECORD.unpack_from(data, offset)
+                payload = data[offset + _RECORD.size:offset + _RECORD.size + length]
+                if len(payload) != length or zlib.crc32(payload) != crc:
+                    break
+                try:
+                    record = marshal.loads(payload)
+                except (EOFError, ValueError, TypeError):
+                    break
+                offset += _RECORD.size + length
+                self._replayed += 1
+                yield record
+            if offset < len(data):
+                logger.warning(f"Truncating damaged WAL tail in {path} at byte {offset}")
+                os.truncate(path, offset)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        WAL 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: generation(현재 세대), appended(기록한 레코드 수), bytes(기록한 바이트 수),
+                errors(기록 실패 횟수), compactions(스냅샷 수), replayed(재생한 레코드 수)
+        """
+        return {
+            'generation': self.generation,
+            'appended': self._appended,
+            'bytes': self._bytes,
+            'errors': self._errors,
+            'compactions': self._compactions,
+            'replayed': self._replayed
+        }
+
+    def close(self):
+        """로그 파일을 닫습니다."""
+        if not self._file.closed:
+            self._file.close()
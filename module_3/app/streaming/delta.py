@@ -0,0 +1,69 @@
+"""스냅샷 델타 계산 및 적용"""
+import copy
+from typing import Dict, Any, List, Tuple
+
+Path = Tuple[Any, ...]
+
+
+def diff(previous: Dict[str, Any], current: Dict[str, Any]) -> Tuple[List[Tuple[Path, Any]], List[Path]]:
+    """
+    두 스냅샷 딕셔너리의 차이를 경로 단위로 계산합니다.
+
+    딕셔너리는 키별로, 길이가 같은 리스트는 인덱스별로 비교하며, 길이가 달라진 리스트나
+    타입이 바뀐 값은 통째로 교체합니다. 경로는 딕셔너리 키(문자열)와 리스트 인덱스(정수)의
+    튜플입니다. 예: ('cpu', 'cpu_percent_per_core', 3)
+
+    Args:
+        previous: 이전 스냅샷 데이터
+        current: 현재 스냅샷 데이터
+
+    Returns:
+        Tuple[List[Tuple[Path, Any]], List[Path]]: (변경/추가된 (경로, 값) 목록, 삭제된 경로 목록)
+    """
+    changes: List[Tuple[Path, Any]] = []
+    removed: List[Path] = []
+    _diff_into(previous, current, (), changes, removed)
+    return changes, removed
+
+
+def _diff_into(previous, current, path: Path, changes: list, removed: list):
+    if isinstance(previous, dict) and isinstance(current, dict):
+        for key, value in current.items():
+            if key in previous:
+                _diff_into(previous[key], value, path + (key,), changes, removed)
+            else:
+                changes.append((path + (key,), value))
+        for key in previous:
+            if key not in current:
+                removed.append(path + (key,))
+    elif isinstance(previous, list) and isinstance(current, list) and len(previous) == len(current):
+        for index, (before, after) in enumerate(zip(previous, current)):
+            _diff_into(before, after, path + (index,), changes, removed)
+    elif type(previous) is not type(current) or previous != current:
+        changes.append((path, current))
+
+
+def apply_delta(document: Dict[str, Any], changes: List[Tuple[Path, Any]], removed: List[Path]) -> Dict[str, Any]:
+    """
+    diff() 결과를 문서에 적용한 복사본을 반환합니다 (클라이언트 구현 참고용).
+
+    Args:
+        document: 기준 스냅샷 데이터
+        changes: 변경/추가된 (경로, 값) 목록
+        removed: 삭제된 경로 목록
+
+    Returns:
+        Dict[str, Any]: 델타가 적용된 새 문서
+    """
+    document = copy.deepcopy(document)
+    for path, value in changes:
+        node = document
+        for key in path[:-1]:
+            node = node[key]
+        node[path[-1]] = copy.deepcopy(value)
+    for path in removed:
+        node = document
+        for key in path[:-1]:
+            node = node[key]
+        del node[path[-1]]
+    return document
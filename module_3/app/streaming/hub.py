@@ -0,0 +1,305 @@
+"""실시간 메트릭 스트림 허브"""
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, Callable, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.api.responses import json_dumps
+from app.storage.snapshot_cache import Snapshot
+from app.streaming.delta import Path, diff
+
+logger = logging.getLogger(__name__)
+
+# 구독 인코딩 방식: 매 틱 전체 스냅샷 또는 키프레임 + 변경분
+ENCODINGS = ('full', 'delta')
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    return json_dumps(payload).decode('utf-8')
+
+
+def encode_snapshot(snapshot: Snapshot, types: Iterable[str], frame_type: str = 'snapshot') -> str:
+    """
+    스냅샷에서 지정한 메트릭 타입만 골라 스트림 프레임(JSON 문자열)으로 인코딩합니다.
+
+    Args:
+        snapshot: 스냅샷
+        types: 포함할 메트릭 타입
+        frame_type: 프레임 종류 ('snapshot' 또는 델타 구독의 'keyframe')
+
+    Returns:
+        str: {"type", "version", "timestamp", "metrics": {타입: 데이터}} 형식의 JSON
+    """
+    return _dumps({
+        'type': frame_type,
+        'version': snapshot.version,
+        'timestamp': snapshot.timestamp,
+        'metrics': {
+            metric_type: snapshot.data[metric_type]
+            for metric_type in sorted(types) if metric_type in snapshot.data
+        }
+    })
+
+
+def encode_delta(
+    snapshot: Snapshot,
+    base: int,
+    changes: List[Tuple[Path, Any]],
+    removed: List[Path],
+    types: Iterable[str]
+) -> str:
+    """
+    base 버전 대비 변경분을 델타 프레임(JSON 문자열)으로 인코딩합니다.
+
+    Args:
+        snapshot: 현재 스냅샷
+        base: 델타의 기준 스냅샷 버전
+        changes: diff()의 변경/추가 목록
+        removed: diff()의 삭제 목록
+        types: 포함할 메트릭 타입
+
+    Returns:
+        str: {"type": "delta", "version", "base", "timestamp",
+              "set": [[경로, 값], ...], "unset": [경로, ...]} 형식의 JSON
+              (경로의 첫 요소는 메트릭 타입)
+    """
+    return _dumps({
+        'type': 'delta',
+        'version': snapshot.version,
+        'base': base,
+        'timestamp': snapshot.timestamp,
+        'set': [[path, value] for path, value in changes if path[0] in types],
+        'unset': [path for path in removed if path[0] in types]
+    })
+
+
+class Subscription:
+    """
+    구독자 하나의 크기 제한 프레임 큐.
+
+    큐가 가득 차면(느린 소비자) 가장 오래된 프레임을 버리고 새 프레임을 넣으므로,
+    구독자별 메모리는 queue_size 프레임으로 제한되고 항상 최신 상태를 먼저 따라잡습니다.
+    델타 구독은 프레임 하나만 빠져도 이후 델타를 적용할 수 없으므로, 대기 중인 프레임을
+    모두 버리고 키프레임으로 다시 시작합니다. 이벤트 루프 스레드에서만 사용합니다.
+    """
+
+    def __init__(self, types: FrozenSet[str], queue_size: int, encoding: str = 'full'):
+        self.types = types
+        self.encoding = encoding
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.resyncs = 0
+        # 델타 구독이 마지막으로 받은(큐에 넣은) 스냅샷 버전
+        self.version: Optional[int] = None
+
+    @property
+    def key(self) -> Tuple[FrozenSet[str], str]:
+        """같은 프레임을 공유하는 구독 조합 (메트릭 타입, 인코딩)"""
+        return self.types, self.encoding
+
+    def offer(self, frame: str):
+        """프레임을 넣습니다. 큐가 가득 찼으면 가장 오래된 프레임을 버립니다."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+    def offer_delta(self, version: int, base: Optional[int], frame: Optional[str], keyframe: Callable[[], str]):
+        """
+        델타 프레임을 넣습니다.
+
+        기준 버전이 마지막으로 받은 버전과 다르거나(누락) 큐가 가득 찼다면 키프레임을 넣습니다.
+
+        Args:
+            version: 프레임의 스냅샷 버전
+            base: 델타의 기준 버전
+            frame: 델타 프레임 (None이면 키프레임 사용)
+            keyframe: 키프레임 문자열을 반환하는 함수
+        """
+        if self.version == version:
+            # 구독 직후 이미 같은 버전의 키프레임을 받음
+            return
+        resync = False
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            resync = True
+        elif frame is not None and self.version is not None and self.version != base:
+            resync = True
+        if resync or frame is None or self.version != base:
+            frame = keyframe()
+        self.resyncs += resync
+        self.queue.put_nowait(frame)
+        self.version = version
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        다음 프레임을 기다립니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            Optional[str]: 프레임 또는 타임아웃 시 None
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class StreamHub:
+    """
+    스케줄러 스냅샷을 WebSocket/SSE 구독자에게 전달하는 허브.
+
+    publish()는 스케줄러 스레드에서 호출되며, 구독 조합(메트릭 타입, 인코딩)마다 프레임을
+    한 번만 인코딩한 뒤 이벤트 루프로 넘겨 같은 조합의 모든 구독자에게 같은 문자열을
+    전달합니다. 따라서 구독자 수와 무관하게 틱당 수집 1회, 조합당 인코딩 1회입니다.
+
+    델타 구독은 연결 시 키프레임을 받고, 이후에는 직전 스냅샷 대비 변경된 필드만 받으며,
+    keyframe_interval 버전마다 전체 키프레임으로 다시 동기화합니다.
+    """
+
+    def __init__(self, queue_size: int = 8, keyframe_interval: int = 12):
+        """
+        Args:
+            queue_size: 구독자별 최대 대기 프레임 수
+            keyframe_interval: 델타 구독의 주기적 키프레임 간격 (스냅샷 버전 수)
+        """
+        self._queue_size = queue_size
+        self._keyframe_interval = max(1, keyframe_interval)
+        self._subscribers: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._latest: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        self._published = 0
+        self._encoded = 0
+        self._dropped = 0
+        self._resyncs = 0
+
+    def subscribe(self, types: Iterable[str], encoding: str = 'full') -> Subscription:
+        """
+        구독을 등록합니다. 이벤트 루프 안에서 호출해야 합니다.
+
+        최신 스냅샷이 있으면 첫 프레임(델타 구독은 키프레임)으로 바로 넣어 주므로
+        다음 틱을 기다리지 않습니다.
+
+        Args:
+            types: 구독할 메트릭 타입
+            encoding: 'full'(매 틱 전체 스냅샷) 또는 'delta'(키프레임 + 변경분)
+
+        Returns:
+            Subscription: 등록된 구독
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding: {encoding}")
+        subscription = Subscription(frozenset(types), self._queue_size, encoding)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(subscription)
+            latest = self._latest
+        if latest is not None:
+            if encoding == 'delta':
+                subscription.offer(encode_snapshot(latest, subscription.types, 'keyframe'))
+                subscription.version = latest.version
+            else:
+                subscription.offer(encode_snapshot(latest, subscription.types))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """구독을 해제합니다."""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.discard(subscription)
+                self._dropped += subscription.dropped
+                self._resyncs += subscription.resyncs
+
+    def publish(self, snapshot: Snapshot):
+        """
+        새 스냅샷을 모든 구독자에게 전달합니다. 어느 스레드에서나 호출할 수 있습니다.
+
+        Args:
+            snapshot: 전달할 스냅샷
+        """
+        with self._lock:
+            previous = self._latest
+            self._latest = snapshot
+            self._published += 1
+            loop = self._loop
+            keys = {subscription.key for subscription in self._subscribers}
+
+        if loop is None or not keys or loop.is_closed():
+            return
+
+        base = previous.version if previous is not None else None
+        periodic = base is None or snapshot.version % self._keyframe_interval == 0
+        changes = removed = None
+        if not periodic and any(encoding == 'delta' for _, encoding in keys):
+            # 변경분은 틱당 한 번만 계산하고 조합별로 메트릭 타입만 걸러서 인코딩
+            changes, removed = diff(previous.data, snapshot.data)
+
+        # 구독 조합마다 한 번만 인코딩 (이벤트 루프 밖에서 수행)
+        frames: Dict[Tuple[FrozenSet[str], str], Optional[str]] = {}
+        keyframes: Dict[FrozenSet[str], str] = {}
+        for types, encoding in keys:
+            if encoding == 'full':
+                frames[(types, encoding)] = encode_snapshot(snapshot, types)
+            elif periodic:
+                frames[(types, encoding)] = None  # 키프레임
+                keyframes[types] = encode_snapshot(snapshot, types, 'keyframe')
+            else:
+                frames[(types, encoding)] = encode_delta(snapshot, base, changes, removed, types)
+        with self._lock:
+            self._encoded += len(frames)
+
+        try:
+            loop.call_soon_threadsafe(self._deliver, snapshot, base, frames, keyframes)
+        except RuntimeError:
+            # 이벤트 루프가 종료됨
+            logger.debug("Stream hub event loop is closed")
+
+    def _deliver(
+        self,
+        snapshot: Snapshot,
+        base: Optional[int],
+        frames: Dict[Tuple[FrozenSet[str], str], Optional[str]],
+        keyframes: Dict[FrozenSet[str], str]
+    ):
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        def keyframe_for(types: FrozenSet[str]) -> Callable[[], str]:
+            # 재동기화가 필요한 구독자가 있을 때만 인코딩하고 조합별로 공유
+            def keyframe() -> str:
+                if types not in keyframes:
+                    keyframes[types] = encode_snapshot(snapshot, types, 'keyframe')
+                return keyframes[types]
+            return keyframe
+
+        for subscription in subscribers:
+            if subscription.key not in frames:
+                continue
+            frame = frames[subscription.key]
+            if subscription.encoding == 'delta':
+                subscription.offer_delta(snapshot.version, base, frame, keyframe_for(subscription.types))
+            else:
+                subscription.offer(frame)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        허브 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: subscribers(현재 구독자 수), published(전달한 스냅샷 수),
+                encoded(인코딩한 프레임 수), dropped(느린 구독자에게서 버린 프레임 수),
+                resyncs(누락으로 인해 델타 대신 보낸 키프레임 수)
+        """
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'published': self._published,
+                'encoded': self._encoded,
+                'dropped': self._dropped + sum(s.dropped for s in self._subscribers),
+                'resyncs': self._resyncs + sum(s.resyncs for s in self._subscribers)
+            }
@@ -0,0 +1,201 @@
+"""자체 계측: 고정 버킷 지연 시간 히스토그램"""
+import math
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# 2의 거듭제곱 구간마다 나누는 버킷 수 (상대 오차 1/16 이내)
+SUB_BUCKETS = 16
+# 기록할 수 있는 최대 지연 시간: 2**40 ns (약 18분). 이보다 길면 마지막 버킷에 기록
+MAX_EXPONENT = 40
+BUCKET_COUNT = (MAX_EXPONENT + 1) * SUB_BUCKETS
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+_BOUNDS = [
+    (0.5 + (index % SUB_BUCKETS + 1) / (2 * SUB_BUCKETS)) * 2.0 ** (index // SUB_BUCKETS) / 1e9
+    for index in range(BUCKET_COUNT - 1)
+] + [math.inf]
+
+
+class LatencyHistogram:
+    """
+    로그-선형 고정 버킷 지연 시간 히스토그램 (HDR 방식).
+
+    값(ns)을 2의 거듭제곱 구간으로 나누고 각 구간을 SUB_BUCKETS개로 다시 나눈 버킷에 세므로,
+    기록은 math.frexp 한 번과 리스트 증가 연산뿐이며 메모리는 기록 수와 관계없이 고정입니다.
+    백분위는 해당 버킷의 상한(관측 최대값 이하)으로 보고하므로 실제 값보다 최대 1/16 크게 나올 수 있습니다.
+
+    기록은 잠금 없이 수행하므로 여러 스레드가 동시에 기록하면 드물게 한 건이 누락될 수 있습니다
+    (통계용이므로 수집 경로에 잠금 비용을 더하지 않음).
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """지연 시간 하나를 기록합니다 (초)."""
+        mantissa, exponent = math.frexp(seconds * 1e9)
+        if exponent <= 0:
+            index = 0
+        elif exponent > MAX_EXPONENT:
+            index = BUCKET_COUNT - 1
+        else:
+            index = exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        백분위 지연 시간을 반환합니다.
+
+        Args:
+            percent: 백분위 (0~100)
+
+        Returns:
+            Optional[float]: 지연 시간 (초, 기록이 없으면 None)
+        """
+        counts = list(self.counts)
+        count = sum(counts)
+        if not count:
+            return None
+        rank = max(1, math.ceil(count * percent / 100))
+        seen = 0
+        for index, bucket in enumerate(counts):
+            seen += bucket
+            if seen >= rank:
+                return min(_BOUNDS[index], self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기록 수, 평균, 최대값과 백분위를 반환합니다 (시간 단위: 초)."""
+        count = self.count
+        return {
+            'count': count,
+            'mean': self.total / count if count else None,
+            'max': self.max if count else None,
+            **{f'p{percent:g}': self.percentile(percent) for percent in PERCENTILES}
+        }
+
+
+class Instrumentation:
+    """
+    그룹(collector, storage, route)과 이름별 지연 시간 히스토그램 모음.
+
+    비활성화하면 histogram()이 None을 반환하므로, 계측 지점은 None 확인 한 번 외의 비용이 없습니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: 계측 여부
+        """
+        self.enabled = enabled
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, group: str, name: str) -> Optional[LatencyHistogram]:
+        """
+        히스토그램을 반환합니다 (처음이면 생성). 계측 지점에서 미리 받아 두고 재사용하면 조회 비용도 없습니다.
+
+        Returns:
+            Optional[LatencyHistogram]: 히스토그램 (비활성화 상태면 None)
+        """
+        if not self.enabled:
+            return None
+        histograms = self._histograms.get(group)
+        if histograms is not None:
+            histogram = histograms.get(name)
+            if histogram is not None:
+                return histogram
+        with self._lock:
+            return self._histograms.setdefault(group, {}).setdefault(name, LatencyHistogram())
+
+    def get_timings(self, group: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        그룹별 히스토그램 요약을 반환합니다.
+
+        Args:
+            group: 이 그룹만 반환 (None이면 전체)
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: 그룹 -> 이름 -> count, mean, max, p50, p90, p99, p99.9
+        """
+        with self._lock:
+            groups = {name: dict(histograms) for name, histograms in self._histograms.items()
+                      if group is None or name == group}
+        return {
+            name: {key: histogram.to_dict() for key, histogram in sorted(histograms.items())}
+            for name, histograms in sorted(groups.items())
+        }
+
+
+class _LockTimer:
+    """잠금 하나를 한 작업 이름으로 획득할 때의 대기/보유 시간 기록기"""
+
+    __slots__ = ('_lock', '_wait', '_hold', '_local')
+
+    def __init__(self, lock, wait: LatencyHistogram, hold: LatencyHistogram, local: threading.local):
+        self._lock = lock
+        self._wait = wait
+        self._hold = hold
+        self._local = local
+
+    def __enter__(self):
+        started = time.perf_counter()
+        self._lock.acquire()
+        acquired = time.perf_counter()
+        self._local.acquired = acquired
+        self._wait.record(acquired - started)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        held = time.perf_counter() - self._local.acquired
+        self._lock.release()
+        self._hold.record(held)
+        return False
+
+
+class TimedLock:
+    """
+    작업 이름별로 잠금 대기 시간('<작업>.wait')과 보유 시간('<작업>.hold')을 기록하는 잠금 래퍼.
+
+    ``with timed_lock('get_range'):`` 형태로 사용하며, 계측이 비활성화되어 있으면 원래 잠금을
+    그대로 반환하므로 추가 비용이 없습니다. 재진입은 지원하지 않습니다 (threading.Lock 전용).
+    """
+
+    def __init__(self, lock, instrumentation: Optional[Instrumentation], group: str):
+        """
+        Args:
+            lock: 감쌀 잠금
+            instrumentation: 히스토그램을 기록할 계측 (None이면 기록하지 않음)
+            group: 히스토그램 그룹 이름
+        """
+        self._lock = lock
+        self._instrumentation = instrumentation
+        self._group = group
+        self._local = threading.local()
+        self._timers: Dict[str, _LockTimer] = {}
+
+    def __call__(self, operation: str):
+        timer = self._timers.get(operation)
+        if timer is not None:
+            return timer
+        if self._instrumentation is None or not self._instrumentation.enabled:
+            return self._lock
+        timer = _LockTimer(
+            self._lock,
+            self._instrumentation.histogram(self._group, f'{operation}.wait'),
+            self._instrumentation.histogram(self._group, f'{operation}.hold'),
+            self._local
+        )
+        self._timers[operation] = timer
+        return timer
@@ -0,0 +1,98 @@
+"""
+알림 규칙 평가 비용 벤치마크
+
+규칙 10개, 1,000개, 10,000개를 CPU/메모리 필드에 나누어 두고, 샘플 하나를 평가하는 시간(p50/p99)을
+AlertEngine(신호별 임계값 색인)과 모든 규칙을 차례로 비교하는 단순 방식으로 비교합니다.
+단순 방식은 값 추출과 비교만 하므로(상태 전이 없음) 실제보다 유리하게 측정됩니다.
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_alert_rules
+"""
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from app.alerts.engine import AlertEngine, extract
+from app.alerts.rules import AlertRule
+from benchmarks.bench_storage_memory import CORES, make_sample
+
+RULE_COUNTS = (10, 1000, 10000)
+SAMPLES = 2000
+FIELDS = {
+    'cpu': [('cpu_percent',)] + [('cpu_percent_per_core', str(core)) for core in range(CORES)],
+    'memory': [('memory_percent',), ('swap_percent',)],
+}
+
+
+def make_rules(count: int, rng: random.Random) -> List[AlertRule]:
+    """대부분 평소 값에서는 거짓인 임계값 규칙을 만듭니다 (상한 규칙과 하한 규칙)."""
+    fields = [(metric_type, path) for metric_type, paths in FIELDS.items() for path in paths]
+    rules = []
+    for i in range(count):
+        metric_type, path = fields[i % len(fields)]
+        if rng.random() < 0.8:
+            op, threshold = rng.choice(('>', '>=')), rng.uniform(90, 100)
+        else:
+            op, threshold = rng.choice(('<', '<=')), rng.uniform(0, 2)
+        rules.append(AlertRule(metric_type, path, op, threshold, for_seconds=60, name=f'rule-{i}'))
+    return rules
+
+
+class LinearRules:
+    """비교용: 샘플마다 해당 메트릭 타입의 모든 규칙을 차례로 비교하는 방식"""
+
+    def __init__(self, rules: List[AlertRule]):
+        self.rules = {}
+        for rule in rules:
+            self.rules.setdefault(rule.metric_type, []).append(rule)
+
+    def observe(self, metric_type: str, data: dict) -> list:
+        matched = []
+        for rule in self.rules.get(metric_type, ()):
+            value = extract(data, rule.path)
+            if value is not None and rule.matches(value):
+                matched.append(rule)
+        return matched
+
+
+def run(name: str, evaluator, samples) -> None:
+    latencies = []
+    for metric_type, sample in samples:
+        started = time.perf_counter()
+        evaluator.observe(metric_type, sample)
+        latencies.append((time.perf_counter() - started) * 1e6)
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"  {name:<12} p50 {percentiles[49]:>9.1f} us  p99 {percentiles[98]:>9.1f} us")
+
+
+def main():
+    rng = random.Random(0)
+    start = datetime.now() - timedelta(seconds=SAMPLES * 5)
+    samples = []
+    for i in range(SAMPLES):
+        for metric_type in FIELDS:
+            sample = make_sample(metric_type, rng)
+            if metric_type == 'cpu':
+                # 평소 부하 (20~70%)
+                sample['cpu_percent'] = rng.uniform(20, 70)
+                sample['cpu_percent_per_core'] = [rng.uniform(20, 70) for _ in range(CORES)]
+            else:
+                sample['memory_percent'] = rng.uniform(40, 70)
+                sample['swap_percent'] = rng.uniform(5, 20)
+            sample['timestamp'] = start + timedelta(seconds=i * 5)
+            samples.append((metric_type, sample))
+
+    for count in RULE_COUNTS:
+        rules = make_rules(count, random.Random(count))
+        print(f"{count} rules")
+        engine = AlertEngine(rules)
+        run("AlertEngine", engine, samples)
+        run("linear", LinearRules(rules), samples)
+        stats = engine.get_stats()
+        print(f"  evaluated {stats['evaluations'] / len(samples):.1f} rules/sample, {stats['events']} events")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+자체 계측 오버헤드 벤치마크
+
+히스토그램 기록 한 건의 비용과, 계측을 켠 MemoryStorage와 끈 MemoryStorage의 save_metric()/get_latest()
+호출당 시간을 비교합니다 (잠금 대기/보유 시간 기록 포함).
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_instrumentation
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from app.storage.memory_storage import MemoryStorage
+from app.utils.instrumentation import Instrumentation, LatencyHistogram
+from benchmarks.bench_storage_memory import make_sample
+
+CALLS = 20000
+ROUNDS = 5
+
+
+def best_of(function, calls: int) -> float:
+    """ROUNDS번 중 가장 빠른 회차의 호출당 시간 (us)"""
+    best = float('inf')
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e6
+
+
+def main():
+    histogram = LatencyHistogram()
+    print(f"LatencyHistogram.record     {best_of(lambda: histogram.record(0.000123), CALLS * 5) * 1000:>8.0f} ns")
+
+    rng = random.Random(0)
+    start = datetime.now() - timedelta(seconds=CALLS * 5)
+    samples = []
+    for i in range(CALLS):
+        sample = make_sample('cpu', rng)
+        sample['timestamp'] = start + timedelta(seconds=i * 5)
+        samples.append(sample)
+
+    for enabled in (False, True):
+        storage = MemoryStorage(max_data_points=720, instrumentation=Instrumentation(enabled=enabled))
+        iterator = iter(samples * ROUNDS)
+        save = best_of(lambda: storage.save_metric('cpu', next(iterator)), CALLS)
+        latest = best_of(lambda: storage.get_latest('cpu'), CALLS)
+        label = 'on ' if enabled else 'off'
+        print(f"instrumentation {label}  save_metric {save:>6.2f} us  get_latest {latest:>6.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+시계열 응답 직렬화 지연 시간 벤치마크
+
+1000행 /api/v1/metrics/cpu 응답을 기존 방식(List[Dict] 반환 -> jsonable_encoder -> 표준 json)과
+FastJSONResponse(행을 바로 직렬화, orjson 사용 가능 시 orjson)로 요청했을 때의 p50/p99 지연 시간을 비교합니다.
+Accept 헤더로 협상하는 바이너리 형식(패킹된 컬럼, msgpack 설치 시 MessagePack)의 지연 시간과 본문 크기도 함께 출력합니다.
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_json_response
+"""
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Tuple
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import responses
+from app.api.routes import metrics
+from app.storage.memory_storage import MemoryStorage
+from benchmarks.bench_storage_memory import make_sample
+
+ROWS = 1000
+REQUESTS = 300
+WARMUP = 20
+
+
+def build_storage() -> MemoryStorage:
+    """1000개 CPU 샘플이 저장된 스토리지를 만듭니다."""
+    rng = random.Random(0)
+    storage = MemoryStorage(max_data_points=ROWS)
+    start = datetime.now() - timedelta(seconds=ROWS)
+    for i in range(ROWS):
+        sample = make_sample('cpu', rng)
+        sample['timestamp'] = start + timedelta(seconds=i)
+        storage.save_metric('cpu', sample)
+    return storage
+
+
+def build_app(storage: MemoryStorage) -> FastAPI:
+    """실제 라우터와 기존 방식의 비교용 엔드포인트를 함께 등록한 앱"""
+    app = FastAPI()
+    metrics.set_dependencies({'cpu': None, 'memory': None, 'disk': None, 'network': None}, storage)
+    app.include_router(metrics.router)
+
+    @app.get("/legacy/metrics/cpu")
+    async def legacy_cpu(limit: int = 100) -> List[Dict[str, Any]]:
+        # 변경 전: FastAPI가 반환값을 jsonable_encoder로 변환한 뒤 표준 json으로 직렬화
+        return storage.get_range('cpu', limit=limit)
+
+    return app
+
+
+def measure(client: TestClient, url: str, accept: str = 'application/json') -> Tuple[List[float], int]:
+    """요청별 지연 시간(ms) 목록과 응답 본문 크기(bytes)를 반환합니다."""
+    headers = {'Accept': accept}
+    for _ in range(WARMUP):
+        client.get(url, headers=headers)
+    latencies = []
+    size = 0
+    for _ in range(REQUESTS):
+        started = time.perf_counter()
+        response = client.get(url, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+        size = len(response.content)
+    return latencies, size
+
+
+def report(name: str, result: Tuple[List[float], int]):
+    latencies, size = result
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<28} p50 {percentiles[49]:>7.2f} ms   p99 {percentiles[98]:>7.2f} ms   {size / 1024:>7.1f} KB")
+
+
+def main():
+    storage = build_storage()
+    client = TestClient(build_app(storage))
+    encoder = 'orjson' if responses.orjson is not None else 'json (orjson 미설치)'
+
+    legacy = client.get(f"/legacy/metrics/cpu?limit={ROWS}").json()
+    fast = client.get(f"/api/v1/metrics/cpu?limit={ROWS}").json()
+    assert legacy == fast, "두 응답의 내용이 달라서는 안 됩니다"
+
+    print(f"{ROWS} rows, {REQUESTS} requests, encoder: {encoder}")
+    report("before (jsonable_encoder)", measure(client, f"/legacy/metrics/cpu?limit={ROWS}"))
+    report("after (FastJSONResponse)", measure(client, f"/api/v1/metrics/cpu?limit={ROWS}"))
+    report("packed columns", measure(client, f"/api/v1/metrics/cpu?limit={ROWS}", responses.COLUMNS_MEDIA_TYPE))
+    if responses.msgpack is not None:
+        report("msgpack", measure(client, f"/api/v1/metrics/cpu?limit={ROWS}", responses.MSGPACK_MEDIA_TYPE))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Prometheus 스크랩 비용 벤치마크
+
+같은 스냅샷을 스크랩할 때마다 텍스트를 렌더링하는 방식과, 스냅샷마다 한 번만 렌더링/압축하고
+EncodedBodyCache의 본문을 재사용하는 방식(/metrics)의 스크랩당 시간을 비교합니다.
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_prometheus_exposition
+"""
+import random
+import time
+
+from app.api.compression import EncodedBodyCache
+from app.api.exposition import render_exposition
+from app.storage.snapshot_cache import SnapshotCache
+from benchmarks.bench_storage_memory import make_sample
+
+SCRAPES = 2000
+
+
+def measure(name: str, scrape) -> None:
+    started = time.perf_counter()
+    for _ in range(SCRAPES):
+        scrape()
+    elapsed = (time.perf_counter() - started) / SCRAPES * 1e6
+    print(f"{name:<28} {elapsed:>9.1f} us/scrape")
+
+
+def main():
+    rng = random.Random(0)
+    snapshot = SnapshotCache().update({
+        metric_type: make_sample(metric_type, rng) for metric_type in ('cpu', 'memory', 'disk', 'network')
+    })
+    body = render_exposition(snapshot.data, snapshot.timestamp.timestamp())
+    print(f"exposition body: {len(body)} bytes")
+
+    measure("render per scrape", lambda: render_exposition(snapshot.data, snapshot.timestamp.timestamp()))
+    cache = EncodedBodyCache()
+    render = lambda: render_exposition(snapshot.data, snapshot.timestamp.timestamp())  # noqa: E731
+    measure("cached (identity)", lambda: cache.get(snapshot, render))
+    measure("cached (gzip)", lambda: cache.get(snapshot, render, 'gzip'))
+
+
+if __name__ == '__main__':
+    main()
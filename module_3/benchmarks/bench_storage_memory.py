@@ -0,0 +1,129 @@
+"""
+MemoryStorage 메모리 사용량 벤치마크
+
+기존 deque-of-dicts 방식과 컬럼 기반 MemoryStorage가 같은 샘플을 보관할 때
+차지하는 메모리(tracemalloc 기준)를 비교합니다.
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_storage_memory
+"""
+import gc
+import random
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta
+
+from app.storage.memory_storage import MemoryStorage
+
+POINT_COUNTS = (3600, 86400)
+CORES = 8
+INTERFACES = ('lo', 'eth0', 'docker0')
+MOUNTPOINTS = ('/', '/boot', '/home')
+
+
+def make_sample(metric_type: str, rng: random.Random) -> dict:
+    """수집기 출력과 같은 형태의 샘플을 생성합니다."""
+    if metric_type == 'cpu':
+        return {
+            'cpu_percent': rng.uniform(0, 100),
+            'cpu_percent_per_core': [rng.uniform(0, 100) for _ in range(CORES)],
+            'cpu_count_logical': CORES,
+            'cpu_count_physical': CORES // 2,
+            'cpu_freq_current': rng.uniform(800, 3600),
+            'cpu_freq_min': 800.0,
+            'cpu_freq_max': 3600.0,
+        }
+    if metric_type == 'memory':
+        return {
+            'memory_total': 16 * 1024 ** 3,
+            'memory_available': rng.randrange(1 << 30, 1 << 34),
+            'memory_used': rng.randrange(1 << 30, 1 << 34),
+            'memory_percent': rng.uniform(0, 100),
+            'memory_free': rng.randrange(1 << 30, 1 << 34),
+            'swap_total': 2 * 1024 ** 3,
+            'swap_used': rng.randrange(1 << 20, 1 << 30),
+            'swap_free': rng.randrange(1 << 20, 1 << 30),
+            'swap_percent': rng.uniform(0, 100),
+        }
+    if metric_type == 'disk':
+        return {
+            'partitions': [
+                {
+                    'device': f'/dev/sda{i}',
+                    'mountpoint': mountpoint,
+                    'fstype': 'ext4',
+                    'total': 500 * 1024 ** 3,
+                    'used': rng.randrange(1 << 30, 1 << 38),
+                    'free': rng.randrange(1 << 30, 1 << 38),
+                    'percent': rng.uniform(0, 100),
+                }
+                for i, mountpoint in enumerate(MOUNTPOINTS)
+            ],
+            'io_read_bytes': rng.randrange(1 << 40),
+            'io_write_bytes': rng.randrange(1 << 40),
+            'io_read_count': rng.randrange(1 << 30),
+            'io_write_count': rng.randrange(1 << 30),
+            'io_read_time': rng.randrange(1 << 30),
+            'io_write_time': rng.randrange(1 << 30),
+        }
+    counters = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                'errin', 'errout', 'dropin', 'dropout')
+    sample = {counter: rng.randrange(1 << 40) for counter in counters}
+    sample['interfaces'] = {
+        name: {counter: rng.randrange(1 << 40) for counter in counters}
+        for name in INTERFACES
+    }
+    return sample
+
+
+def measure(fill) -> int:
+    """fill()이 만든 객체가 유지하는 메모리(bytes)를 측정합니다."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = fill()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return after - before
+
+
+def fill_legacy(metric_type: str, points: int):
+    """기존 방식: 샘플마다 dict + datetime을 deque에 보관"""
+    rng = random.Random(0)
+    data = deque(maxlen=points)
+    start = datetime.now()
+    for i in range(points):
+        sample = make_sample(metric_type, rng)
+        sample['timestamp'] = start + timedelta(seconds=i)
+        data.append(sample)
+    return data
+
+
+def fill_columnar(metric_type: str, points: int):
+    """컬럼 기반 MemoryStorage (원본 계층만 비교하기 위해 롤업 계층 제외)"""
+    rng = random.Random(0)
+    storage = MemoryStorage(max_data_points=points, rollups=None)
+    start = datetime.now()
+    for i in range(points):
+        sample = make_sample(metric_type, rng)
+        sample['timestamp'] = start + timedelta(seconds=i)
+        storage.save_metric(metric_type, sample)
+    return storage
+
+
+def main():
+    print(f"{'type':<8} {'points':>7} {'deque-of-dicts':>16} {'columnar':>12} {'B/pt old':>9} {'B/pt new':>9} {'ratio':>7}")
+    for points in POINT_COUNTS:
+        for metric_type in ('cpu', 'memory', 'disk', 'network'):
+            legacy = measure(lambda: fill_legacy(metric_type, points))
+            columnar = measure(lambda: fill_columnar(metric_type, points))
+            print(
+                f"{metric_type:<8} {points:>7} {legacy / 1024 ** 2:>13.1f} MB {columnar / 1024 ** 2:>9.1f} MB "
+                f"{legacy / points:>9.0f} {columnar / points:>9.0f} {legacy / columnar:>6.1f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
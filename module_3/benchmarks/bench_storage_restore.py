@@ -0,0 +1,81 @@
+"""
+MemoryStorage WAL 복원 시간 벤치마크
+
+수집 주기 5초 기준 24시간 원본 버퍼(메트릭 타입당 17,280개)를 채운 뒤, 재시작을 가정하여
+새 MemoryStorage가 (1) 스냅샷 + 5분치 로그, (2) 스냅샷 없이 전체 로그로 복원하는 시간을 비교합니다.
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_storage_restore
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from app.storage.memory_storage import MemoryStorage
+from app.storage.wal import WriteAheadLog
+from benchmarks.bench_storage_memory import make_sample
+
+INTERVAL = 5
+POINTS = 24 * 3600 // INTERVAL
+TAIL = 300 // INTERVAL
+METRIC_TYPES = ('cpu', 'memory', 'disk', 'network')
+
+
+def fill(storage: MemoryStorage, start: datetime, count: int, rng: random.Random):
+    for i in range(count):
+        timestamp = start + timedelta(seconds=i * INTERVAL)
+        for metric_type in METRIC_TYPES:
+            sample = make_sample(metric_type, rng)
+            sample['timestamp'] = timestamp
+            storage.save_metric(metric_type, sample)
+
+
+def restore(directory: str) -> Tuple[float, int, int]:
+    started = time.perf_counter()
+    storage = MemoryStorage(max_data_points=POINTS, wal=WriteAheadLog(directory))
+    replayed = storage.restore()
+    elapsed = time.perf_counter() - started
+    points = sum(storage.get_stats().values())
+    storage.wal.close()
+    return elapsed, replayed, points
+
+
+def directory_size(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def main():
+    rng = random.Random(0)
+    start = datetime.now() - timedelta(seconds=(POINTS + TAIL) * INTERVAL)
+    print(f"{POINTS} points x {len(METRIC_TYPES)} types (24h at {INTERVAL}s) + {TAIL} tail points")
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = MemoryStorage(max_data_points=POINTS, wal=WriteAheadLog(directory))
+        fill(storage, start, POINTS, rng)
+        full_log = directory_size(directory)
+
+        started = time.perf_counter()
+        storage.compact()
+        print(f"compact: {time.perf_counter() - started:.3f}s, snapshot {directory_size(directory) / 1e6:.1f} MB")
+
+        fill(storage, start + timedelta(seconds=POINTS * INTERVAL), TAIL, rng)
+        storage.wal.close()
+
+        elapsed, replayed, points = restore(directory)
+        print(f"snapshot + log tail: {elapsed:.3f}s ({points} points, {replayed} records replayed)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = MemoryStorage(max_data_points=POINTS, wal=WriteAheadLog(directory))
+        fill(storage, start, POINTS, random.Random(0))
+        storage.wal.close()
+
+        elapsed, replayed, points = restore(directory)
+        print(f"log only:            {elapsed:.3f}s ({points} points, {replayed} records replayed, "
+              f"log {full_log / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+스토리지 쓰기 처리량 벤치마크
+
+같은 샘플을 MemoryStorage, SQLiteStorage(배치 기록), 샘플마다 커밋하는 단순 SQLite 방식으로
+저장할 때의 save_metric() 호출 지연 시간(p50/p99)과, 디스크에 모두 기록될 때까지의 처리량을 비교합니다.
+SQLiteStorage의 save_metric()은 대기열에 넣기만 하므로 호출 지연 시간은 디스크와 무관해야 합니다.
+
+실행 (module_3 디렉토리에서):
+    python -m benchmarks.bench_storage_write
+"""
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from app.storage.memory_storage import MemoryStorage
+from app.storage.sqlite_storage import SQLiteStorage, _encode
+from benchmarks.bench_storage_memory import make_sample
+
+SAMPLES = 20000
+METRIC_TYPES = ('cpu', 'memory', 'disk', 'network')
+
+
+def make_samples() -> List[Tuple[str, dict]]:
+    """수집 순서대로 타입을 번갈아 가며 샘플을 만듭니다."""
+    rng = random.Random(0)
+    start = datetime.now() - timedelta(seconds=SAMPLES)
+    samples = []
+    for i in range(SAMPLES):
+        metric_type = METRIC_TYPES[i % len(METRIC_TYPES)]
+        sample = make_sample(metric_type, rng)
+        sample['timestamp'] = start + timedelta(seconds=i)
+        samples.append((metric_type, sample))
+    return samples
+
+
+class NaiveSQLite:
+    """비교용: 샘플마다 INSERT 후 바로 커밋하는 방식"""
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute(
+            'CREATE TABLE samples (metric_type TEXT, seq INTEGER, ts REAL, data TEXT)'
+        )
+        self.seq = 0
+
+    def save_metric(self, metric_type: str, data: dict) -> bool:
+        self.seq += 1
+        with self.connection:
+            self.connection.execute(
+                'INSERT INTO samples VALUES (?, ?, ?, ?)',
+                (metric_type, self.seq, data['timestamp'].timestamp(), _encode(data))
+            )
+        return True
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.connection.close()
+
+
+def run(name: str, storage, samples: List[Tuple[str, dict]], finish: Callable[[], None]):
+    latencies = []
+    started = time.perf_counter()
+    for metric_type, sample in samples:
+        call = time.perf_counter()
+        storage.save_metric(metric_type, dict(sample))
+        latencies.append((time.perf_counter() - call) * 1e6)
+    ingested = time.perf_counter() - started
+    finish()
+    durable = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<22} save p50 {percentiles[49]:>7.1f} us  p99 {percentiles[98]:>8.1f} us  "
+        f"ingest {len(samples) / ingested:>9,.0f}/s  durable {len(samples) / durable:>9,.0f}/s"
+    )
+
+
+def main():
+    samples = make_samples()
+    print(f"{SAMPLES} samples ({', '.join(METRIC_TYPES)})")
+
+    run("MemoryStorage", MemoryStorage(max_data_points=SAMPLES), samples, lambda: None)
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = SQLiteStorage(os.path.join(directory, 'batched.db'), retention=None)
+        run("SQLiteStorage (batch)", storage, samples, storage.close)
+
+        naive = NaiveSQLite(os.path.join(directory, 'naive.db'))
+        run("SQLite (commit/sample)", naive, samples, naive.close)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""온라인 이상 탐지 테스트"""
+import random
+from datetime import datetime
+
+from app.alerts.anomaly import ANOMALY_FIELDS, AnomalyDetector, EWStats
+from app.alerts.engine import AlertEngine
+from app.alerts.rules import parse_rule
+from app.storage.memory_storage import MemoryStorage
+
+BASE = 1_700_000_000
+
+
+def cpu_sample(i: int, value: float) -> dict:
+    return {'cpu_percent': value, 'timestamp': datetime.fromtimestamp(BASE + i * 5)}
+
+
+class TestAnomalyDetector:
+    """이상 탐지 테스트 클래스"""
+
+    def test_ewstats_starts_as_running_mean(self):
+        """초기 샘플은 단순 누적 평균/분산과 같게 반영되는지 테스트"""
+        stats = EWStats()
+        for value in (10.0, 20.0, 30.0):
+            stats.update(value, 0.02)
+
+        assert stats.mean == 20.0
+        assert abs(stats.var - 200 / 3) < 1e-9
+        assert stats.score(20.0) == 0.0
+
+    def test_spike_scores_high(self):
+        """warmup 동안은 0점이고, 평소 변동 범위는 낮은 점수, 급등은 높은 점수인지 테스트"""
+        rng = random.Random(0)
+        detector = AnomalyDetector(alpha=0.05, warmup=20)
+
+        scores = [detector.observe('cpu', cpu_sample(i, 50 + rng.gauss(0, 5)))['cpu_percent'] for i in range(200)]
+        assert scores[:20] == [0.0] * 20
+        assert max(abs(score) for score in scores[20:]) < 5
+
+        assert detector.observe('cpu', cpu_sample(200, 95.0))['cpu_percent'] > 6
+        assert detector.observe('cpu', cpu_sample(201, 5.0))['cpu_percent'] < -6
+
+    def test_clip_keeps_baseline(self):
+        """한 번의 급등은 잘라서 반영되어 기준선을 크게 흔들지 않는지 테스트"""
+        rng = random.Random(1)
+        detector = AnomalyDetector(alpha=0.05, warmup=20)
+        for i in range(100):
+            detector.observe('cpu', cpu_sample(i, 50 + rng.gauss(0, 1)))
+        before = detector.get_baseline('cpu', 'cpu_percent')
+
+        detector.observe('cpu', cpu_sample(100, 10_000.0))
+        after = detector.get_baseline('cpu', 'cpu_percent')
+        assert abs(after['mean'] - before['mean']) < before['std']
+        assert after['std'] < before['std'] * 2
+        assert detector.observe('cpu', cpu_sample(101, 50.0))['cpu_percent'] < 3
+
+    def test_sparse_counter_uses_field_floor(self):
+        """거의 항상 0인 카운터는 드문 에러 한 건에 큰 점수를 내지 않고, 폭증에만 반응하는지 테스트"""
+        detector = AnomalyDetector()
+
+        def tick(i: int, errin: float) -> dict:
+            return detector.score({'network': {'errin_per_sec': errin, 'timestamp': datetime.fromtimestamp(BASE + i * 5)}})
+
+        for i in range(40):
+            tick(i, 0.0)
+        first = tick(40, 1.0)
+        assert first['network']['errin_per_sec'] <= 1.0
+        assert first['max_score'] <= 1.0
+
+        for i in range(41, 80):
+            tick(i, 0.0)
+        assert tick(80, 1.0)['max_score'] <= 1.0
+        assert tick(81, 50.0)['network']['errin_per_sec'] > 6
+
+    def test_level_shift_is_learned(self):
+        """지속되는 수준 변화는 기준선이 따라가 점수가 다시 낮아지는지 테스트"""
+        rng = random.Random(2)
+        detector = AnomalyDetector(alpha=0.05, warmup=20)
+        for i in range(100):
+            detector.observe('cpu', cpu_sample(i, 30 + rng.gauss(0, 2)))
+
+        scores = [detector.observe('cpu', cpu_sample(i, 70 + rng.gauss(0, 2)))['cpu_percent'] for i in range(100, 400)]
+        assert scores[0] > 6
+        assert max(abs(score) for score in scores[-50:]) < 4
+
+    def test_score_row_shape(self):
+        """틱 행은 빠진 메트릭 타입과 값이 없는 필드도 0점으로 채워 구성이 같은지 테스트"""
+        detector = AnomalyDetector()
+        row = detector.score({'cpu': cpu_sample(0, 50.0), 'network': {'bytes_recv_per_sec': None}})
+
+        assert row['timestamp'] == datetime.fromtimestamp(BASE)
+        assert set(row) == {'timestamp', 'max_score', *ANOMALY_FIELDS}
+        for metric_type, fields in ANOMALY_FIELDS.items():
+            assert set(row[metric_type]) == set(fields)
+        assert row['max_score'] == 0.0
+        assert detector.get_baseline('network', 'bytes_recv_per_sec')['count'] == 0
+
+    def test_scores_are_stored_and_alertable(self):
+        """이상 점수 행을 anomaly 시계열로 저장/조회하고 알림 규칙으로 평가할 수 있는지 테스트"""
+        detector = AnomalyDetector(alpha=0.05, warmup=10)
+        storage = MemoryStorage()
+        engine = AlertEngine([parse_rule('anomaly.max_score > 6'), parse_rule('anomaly.cpu.cpu_percent < -6')])
+
+        for i, value in enumerate([50.0, 51.0, 49.0, 50.5] * 10 + [99.0]):
+            row = detector.score({'cpu': cpu_sample(i, value)})
+            storage.save_metric('anomaly', row)
+            engine.observe('anomaly', row)
+
+        rows = storage.get_range('anomaly')
+        assert len(rows) == 41
+        assert rows[-1]['cpu']['cpu_percent'] > 6
+        assert rows[-1]['max_score'] == rows[-1]['cpu']['cpu_percent']
+        assert [alert['name'] for alert in engine.get_alerts('firing')] == ['anomaly.max_score > 6']
+        assert storage.get_downsampled('anomaly', step=60, agg='max')[-1]['max_score'] > 6
@@ -0,0 +1,114 @@
+"""알림 평가기 테스트"""
+from datetime import datetime
+
+from app.alerts.engine import AlertEngine, extract
+from app.alerts.rules import parse_rule
+
+BASE = 1_700_000_000
+
+
+def feed(engine: AlertEngine, metric_type: str, values, field: str = 'cpu_percent', step: int = 5):
+    """step초 간격으로 샘플을 평가하고 발생한 이벤트의 (from, to) 목록을 반환합니다."""
+    events = []
+    for i, value in enumerate(values):
+        data = {field: value, 'timestamp': datetime.fromtimestamp(BASE + i * step)}
+        events.extend((event['from'], event['to']) for event in engine.observe(metric_type, data))
+    return events
+
+
+class TestAlertEngine:
+    """알림 평가기 테스트 클래스"""
+
+    def test_for_duration(self):
+        """조건이 for 기간 동안 유지되어야 발생하고, 중간에 거짓이면 대기가 취소되는지 테스트"""
+        engine = AlertEngine([parse_rule('cpu_percent > 90 for 10s')])
+
+        events = feed(engine, 'cpu', [95, 95, 50, 95, 95, 95, 50])
+        assert events == [
+            ('inactive', 'pending'), ('pending', 'inactive'),
+            ('inactive', 'pending'), ('pending', 'firing'), ('firing', 'inactive'),
+        ]
+
+    def test_clear_hysteresis(self):
+        """발생 중에는 조건이 clear 기간 동안 거짓이어야 해제되는지 테스트"""
+        engine = AlertEngine([parse_rule('cpu_percent > 90 clear 10s')])
+
+        events = feed(engine, 'cpu', [95, 50, 95, 50, 50, 50])
+        assert events == [('inactive', 'firing'), ('firing', 'inactive')]
+        assert engine.get_events()[-1]['timestamp'] == datetime.fromtimestamp(BASE + 25)
+
+    def test_shared_signal(self):
+        """같은 신호를 쓰는 규칙은 윈도우를 공유하고 다른 메트릭 타입 샘플은 평가하지 않는지 테스트"""
+        engine = AlertEngine([
+            parse_rule('cpu_percent avg(1m) > 50', name='warning'),
+            parse_rule('cpu_percent avg(1m) > 80', name='critical'),
+            parse_rule('memory_percent > 90'),
+        ])
+        feed(engine, 'cpu', [100, 60])
+
+        stats = engine.get_stats()
+        assert (stats['rules'], stats['signals'], stats['evaluations']) == (3, 2, 4)
+        states = {alert['name']: alert['state'] for alert in engine.get_alerts()}
+        assert states == {'warning': 'firing', 'critical': 'inactive', 'memory_percent > 90': 'inactive'}
+        assert [alert['name'] for alert in engine.get_alerts('firing')] == ['warning']
+
+    def test_missing_values_are_skipped(self):
+        """필드가 없거나 숫자가 아니면 평가하지 않는지 테스트"""
+        engine = AlertEngine([parse_rule('cpu_freq_current < 1000')])
+
+        assert feed(engine, 'cpu', [None, 'n/a'], field='cpu_freq_current') == []
+        assert engine.get_stats()['evaluations'] == 0
+        assert extract({'partitions': [{'percent': 81.0}]}, ('partitions', '0', 'percent')) == 81.0
+        assert extract({'partitions': []}, ('partitions', '0', 'percent')) is None
+
+    def test_set_rules_keeps_state(self):
+        """규칙을 교체해도 같은 규칙의 상태는 유지되는지 테스트"""
+        rule = parse_rule('cpu_percent > 90')
+        engine = AlertEngine([rule])
+        feed(engine, 'cpu', [95])
+
+        engine.set_rules([parse_rule('cpu_percent > 90'), parse_rule('memory_percent > 90')])
+        assert engine.get_stats()['firing'] == 1
+
+        engine.set_rules([parse_rule('cpu_percent > 95', name='cpu_percent > 90')])
+        assert engine.get_stats()['firing'] == 0
+
+    def test_events_cursor(self):
+        """since_id 이후 이벤트만 반환하는지 테스트"""
+        engine = AlertEngine([parse_rule('cpu_percent > 90')])
+        feed(engine, 'cpu', [95, 50, 95])
+
+        events = engine.get_events()
+        assert [event['id'] for event in events] == [1, 2, 3]
+        assert [event['id'] for event in engine.get_events(since_id=2)] == [3]
+        assert [event['id'] for event in engine.get_events(limit=1)] == [3]
+
+    def test_index_boundaries(self):
+        """연산자별 임계값 경계(>, >=, <, <=)가 규칙 정의와 같게 판정되는지 테스트"""
+        engine = AlertEngine([
+            parse_rule('cpu_percent > 50', name='gt'),
+            parse_rule('cpu_percent >= 50', name='ge'),
+            parse_rule('cpu_percent < 50', name='lt'),
+            parse_rule('cpu_percent <= 50', name='le'),
+        ])
+
+        for value, expected in ((50, {'ge', 'le'}), (50.5, {'gt', 'ge'}), (49.5, {'lt', 'le'})):
+            feed(engine, 'cpu', [value])
+            assert {alert['name'] for alert in engine.get_alerts('firing')} == expected
+
+    def test_only_matching_rules_are_evaluated(self):
+        """조건이 거짓인 inactive 규칙은 평가하지 않고, 발생 중인 규칙은 해제까지 확인하는지 테스트"""
+        engine = AlertEngine([parse_rule(f'cpu_percent > {threshold}') for threshold in range(50, 100)])
+
+        feed(engine, 'cpu', [10, 20])
+        assert engine.get_stats()['evaluations'] == 0
+
+        feed(engine, 'cpu', [97.5])
+        assert engine.get_stats()['evaluations'] == 48
+        assert engine.get_stats()['firing'] == 48
+
+        # 발생 중인 48개는 조건이 거짓이 되어도 평가되어 해제됨
+        assert len(feed(engine, 'cpu', [10])) == 48
+        assert engine.get_stats()['evaluations'] == 96
+        feed(engine, 'cpu', [10])
+        assert engine.get_stats()['evaluations'] == 96
@@ -0,0 +1,71 @@
+"""알림 규칙 파일 로더 테스트"""
+import json
+import os
+
+import pytest
+
+from app.alerts.engine import AlertEngine
+from app.alerts.loader import RuleFileLoader, load_rules
+from app.alerts.rules import parse_rule
+
+
+def write_rules(path, entries, mtime=None):
+    """규칙 파일을 쓰고 수정 시각을 지정합니다 (같은 초 안의 변경도 감지되도록)."""
+    path.write_text(json.dumps(entries), encoding='utf-8')
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class TestRuleFileLoader:
+    """규칙 파일 로더 테스트 클래스"""
+
+    def test_load_rules(self, tmp_path):
+        """문자열과 이름 있는 객체 항목을 읽고, 잘못된 형식은 ValueError인지 테스트"""
+        path = tmp_path / 'rules.json'
+        write_rules(path, ['cpu_percent > 90', {'name': 'swap', 'rule': 'swap_percent rate > 0.5'}])
+
+        rules = load_rules(str(path))
+        assert [rule.name for rule in rules] == ['cpu_percent > 90', 'swap']
+        assert rules[1].metric_type == 'memory'
+
+        for entries in ({'rule': 'cpu_percent > 90'}, [42], ['cpu_percent >> 90']):
+            write_rules(path, entries)
+            with pytest.raises(ValueError):
+                load_rules(str(path))
+
+    def test_reload_on_change(self, tmp_path):
+        """파일이 바뀔 때만 다시 읽고 기본 규칙과 합쳐 교체하는지 테스트"""
+        path = tmp_path / 'rules.json'
+        write_rules(path, ['cpu_percent > 90'], mtime=1_700_000_000)
+        engine = AlertEngine()
+        loader = RuleFileLoader(engine, str(path), base_rules=[parse_rule('memory_percent > 90')])
+
+        assert loader.reload() is True
+        assert loader.reload() is False
+        assert engine.get_stats()['rules'] == 2
+
+        write_rules(path, ['cpu_percent > 90', 'cpu_percent > 95'], mtime=1_700_000_010)
+        assert loader.poll() is True
+        stats = loader.get_stats()
+        assert (stats['rules'], stats['reloads'], stats['last_error']) == (3, 2, None)
+        assert loader.reload(force=True) is True
+
+    def test_invalid_file_keeps_rules(self, tmp_path):
+        """잘못된 파일은 기존 규칙을 유지하고 오류를 기록하며, 같은 파일을 다시 읽지 않는지 테스트"""
+        path = tmp_path / 'rules.json'
+        write_rules(path, ['cpu_percent > 90'], mtime=1_700_000_000)
+        engine = AlertEngine()
+        loader = RuleFileLoader(engine, str(path))
+        loader.reload()
+
+        path.write_text('[not json', encoding='utf-8')
+        os.utime(path, (1_700_000_010, 1_700_000_010))
+        with pytest.raises(ValueError):
+            loader.reload()
+        assert loader.poll() is False
+        assert engine.get_stats()['rules'] == 1
+        assert loader.get_stats()['last_error']
+
+        os.remove(path)
+        assert loader.poll() is False
+        assert engine.get_stats()['rules'] == 1
@@ -0,0 +1,82 @@
+"""알림 규칙 파싱과 실행 윈도우 테스트"""
+import pytest
+
+from app.alerts.rules import AlertRule, parse_duration, parse_rule
+from app.alerts.windows import ExtremeWindow, MeanWindow, RateWindow
+
+
+class TestParseRule:
+    """규칙 식 파싱 테스트 클래스"""
+
+    def test_simple_rule(self):
+        """필드 이름으로 메트릭 타입을 찾고 for 기간을 초로 변환하는지 테스트"""
+        rule = parse_rule('cpu_percent > 90 for 1m')
+
+        assert (rule.metric_type, rule.path, rule.op, rule.threshold) == ('cpu', ('cpu_percent',), '>', 90.0)
+        assert (rule.function, rule.window, rule.for_seconds) == ('value', None, 60.0)
+        assert rule.name == 'cpu_percent > 90 for 1m'
+
+    def test_function_and_nested_path(self):
+        """명시적 메트릭 타입, 중첩 경로, 함수/윈도우, clear 기간 테스트"""
+        rule = parse_rule('network.interface_rates.eth0.bytes_recv_per_sec avg(5m) >= 1e8 for 2m clear 30s')
+
+        assert rule.metric_type == 'network'
+        assert rule.path == ('interface_rates', 'eth0', 'bytes_recv_per_sec')
+        assert (rule.function, rule.window, rule.threshold) == ('avg', 300.0, 1e8)
+        assert (rule.for_seconds, rule.clear_seconds) == (120.0, 30.0)
+
+    def test_default_window(self):
+        """avg/min/max 윈도우를 생략하면 기본 60초, rate는 직전 샘플 기준인지 테스트"""
+        assert parse_rule('memory_percent max > 95').window == 60.0
+        assert parse_rule('swap_percent rate > 0.5').window is None
+        assert parse_rule('swap_percent rate > 0.5').metric_type == 'memory'
+
+    @pytest.mark.parametrize('expression', [
+        'cpu_percent 90',
+        'cpu_percent >> 90',
+        'gpu_percent > 90',
+        'cpu_percent median > 90',
+        'cpu_percent avg(0s) > 90',
+    ])
+    def test_invalid_rules(self, expression):
+        """잘못된 규칙 식은 ValueError인지 테스트"""
+        with pytest.raises(ValueError):
+            parse_rule(expression)
+
+    def test_format_expression(self):
+        """인자로 만든 규칙의 식 문자열 테스트"""
+        rule = AlertRule('disk', ('partitions', '0', 'percent'), '>', 80, for_seconds=300)
+        assert rule.expression == 'disk.partitions.0.percent > 80 for 300s'
+        assert parse_duration('1h') == 3600.0
+        assert parse_duration('90') == 90.0
+
+
+class TestWindows:
+    """실행 윈도우 테스트 클래스"""
+
+    def test_rate(self):
+        """직전 샘플 기준과 윈도우 기준 변화율 테스트"""
+        previous = RateWindow()
+        windowed = RateWindow(window=10)
+        results = [(previous.update(t, t * 2.0), windowed.update(t, t * t)) for t in range(0, 30, 5)]
+
+        assert results[0] == (None, None)
+        assert [rate for rate, _ in results[1:]] == [2.0] * 5
+        # t=25: 윈도우 시작 직전 샘플(t=15) 기준 (625 - 225) / 10
+        assert results[-1][1] == 40.0
+
+    def test_mean(self):
+        """윈도우를 벗어난 샘플이 평균에서 빠지는지 테스트"""
+        window = MeanWindow(window=10)
+        values = [window.update(t, value) for t, value in [(0, 10.0), (5, 20.0), (10, 30.0), (15, 40.0)]]
+
+        assert values == [10.0, 15.0, 25.0, 35.0]
+
+    def test_extremes(self):
+        """단조 deque 기반 최댓값/최솟값 테스트"""
+        maximum = ExtremeWindow(window=10)
+        minimum = ExtremeWindow(window=10, maximum=False)
+        samples = [(0, 5.0), (4, 9.0), (8, 1.0), (12, 3.0), (16, 2.0), (20, 0.5)]
+
+        assert [maximum.update(t, value) for t, value in samples] == [5.0, 9.0, 9.0, 9.0, 3.0, 3.0]
+        assert [minimum.update(t, value) for t, value in samples] == [5.0, 5.0, 1.0, 1.0, 1.0, 0.5]
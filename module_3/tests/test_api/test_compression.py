@@ -0,0 +1,159 @@
+"""응답 압축 테스트"""
+import gzip
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api import compression
+from app.api.compression import CompressionMiddleware, EncodedBodyCache, choose_encoding, compress
+
+BODY = b'{"cpu_percent": 12.5}' * 200
+
+
+def make_client(minimum_size: int = 1024) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/large")
+    async def large():
+        return Response(BODY, media_type='application/json', headers={'Vary': 'Accept'})
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse('ok')
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(compress(BODY, 'gzip'), media_type='application/json',
+                        headers={'Content-Encoding': 'gzip'})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b'data: 1\n\n'
+            yield b'data: 2\n\n'
+        return StreamingResponse(chunks(), media_type='text/plain')
+
+    return TestClient(app)
+
+
+class TestChooseEncoding:
+    """Accept-Encoding 협상 테스트"""
+
+    def test_gzip(self):
+        """gzip을 허용하면 gzip을 선택하는지 테스트"""
+        with patch.object(compression, 'zstandard', None):
+            assert choose_encoding('gzip, deflate, br') == 'gzip'
+
+    def test_none(self):
+        """헤더가 없거나 지원하는 인코딩이 없으면 압축하지 않는지 테스트"""
+        assert choose_encoding(None) is None
+        assert choose_encoding('br') is None
+        assert choose_encoding('gzip;q=0') is None
+
+    def test_wildcard(self):
+        """*는 지원하는 인코딩 중 서버 선호 순서로 선택하는지 테스트"""
+        with patch.object(compression, 'zstandard', None):
+            assert choose_encoding('*') == 'gzip'
+
+    def test_prefers_zstd_when_available(self):
+        """zstandard가 있으면 같은 q 값에서 zstd를 우선하는지 테스트"""
+        with patch.object(compression, 'zstandard', object()):
+            assert choose_encoding('gzip, zstd') == 'zstd'
+            assert choose_encoding('gzip, zstd;q=0.5') == 'gzip'
+
+
+class TestCompressionMiddleware:
+    """압축 미들웨어 테스트"""
+
+    def test_compresses_large_body(self):
+        """임계값 이상의 본문을 gzip으로 압축하는지 테스트"""
+        client = make_client()
+        response = client.get("/large", headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['content-encoding'] == 'gzip'
+        assert int(response.headers['content-length']) < len(BODY)
+        assert response.headers['vary'] == 'Accept, Accept-Encoding'
+        assert response.content == BODY  # 클라이언트가 자동으로 해제
+
+    def test_skips_small_body(self):
+        """임계값 미만의 본문은 압축하지 않는지 테스트"""
+        client = make_client()
+        response = client.get("/small", headers={'Accept-Encoding': 'gzip'})
+
+        assert 'content-encoding' not in response.headers
+        assert response.text == 'ok'
+
+    def test_threshold_is_configurable(self):
+        """최소 크기 설정이 적용되는지 테스트"""
+        client = make_client(minimum_size=1)
+        response = client.get("/small", headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['content-encoding'] == 'gzip'
+
+    def test_skips_without_accept_encoding(self):
+        """Accept-Encoding이 없으면 압축하지 않는지 테스트"""
+        client = make_client()
+        response = client.get("/large", headers={'Accept-Encoding': 'identity'})
+
+        assert 'content-encoding' not in response.headers
+        assert response.content == BODY
+
+    def test_passes_encoded_response(self):
+        """이미 압축된 응답을 다시 압축하지 않는지 테스트"""
+        client = make_client()
+        response = client.get("/encoded", headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.content == BODY
+
+    def test_passes_streaming_response(self):
+        """여러 청크로 나뉜 스트리밍 응답은 압축하지 않는지 테스트"""
+        client = make_client(minimum_size=1)
+        response = client.get("/stream", headers={'Accept-Encoding': 'gzip'})
+
+        assert 'content-encoding' not in response.headers
+        assert response.content == b'data: 1\n\ndata: 2\n\n'
+
+
+class TestEncodedBodyCache:
+    """인코딩된 본문 캐시 테스트"""
+
+    def test_render_and_compress_once_per_key(self):
+        """같은 키는 한 번만 렌더링하고 인코딩별로 한 번만 압축하는지 테스트"""
+        cache = EncodedBodyCache()
+        renders = []
+
+        def render():
+            renders.append(1)
+            return BODY
+
+        for _ in range(3):
+            body, encoding = cache.get(1, render, 'gzip')
+        identity, _ = cache.get(1, render)
+
+        assert encoding == 'gzip'
+        assert gzip.decompress(body) == BODY
+        assert identity == BODY
+        assert len(renders) == 1
+        assert cache.get_stats()['compressions'] == 1
+        assert cache.get_stats()['hits'] == 3
+
+    def test_new_key_replaces_bodies(self):
+        """키가 바뀌면 다시 렌더링하는지 테스트"""
+        cache = EncodedBodyCache()
+        cache.get(1, lambda: BODY, 'gzip')
+        body, _ = cache.get(2, lambda: b'x' * 2048, 'gzip')
+
+        assert gzip.decompress(body) == b'x' * 2048
+        assert cache.get_stats()['renders'] == 2
+
+    def test_small_body_not_compressed(self):
+        """최소 크기 미만의 본문은 원본을 반환하는지 테스트"""
+        cache = EncodedBodyCache(minimum_size=1024)
+        body, encoding = cache.get(1, lambda: b'{}', 'gzip')
+
+        assert body == b'{}'
+        assert encoding is None
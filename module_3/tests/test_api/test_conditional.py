@@ -0,0 +1,55 @@
+"""ETag/조건부 요청 테스트"""
+from datetime import datetime
+
+from app.api.conditional import etag_matches, make_etag, not_modified
+
+
+class TestMakeEtag:
+    """ETag 생성 테스트"""
+
+    def test_stable_for_same_input(self):
+        """같은 버전과 파라미터는 같은 약한 ETag을 만드는지 테스트"""
+        start = datetime(2024, 1, 1)
+        etag = make_etag('abc.3', 'cpu', start, 100)
+
+        assert etag == make_etag('abc.3', 'cpu', start, 100)
+        assert etag.startswith('W/"abc.3-')
+
+    def test_differs_by_version_and_query(self):
+        """버전이나 파라미터가 다르면 ETag도 다른지 테스트"""
+        etag = make_etag('abc.3', 'cpu', 100)
+
+        assert etag != make_etag('abc.4', 'cpu', 100)
+        assert etag != make_etag('abc.3', 'cpu', 10)
+
+
+class TestEtagMatches:
+    """If-None-Match 비교 테스트"""
+
+    def test_weak_comparison(self):
+        """W/ 접두사와 관계없이 비교하는지 테스트"""
+        etag = 'W/"abc.3-0123"'
+
+        assert etag_matches(etag, etag)
+        assert etag_matches('"abc.3-0123"', etag)
+        assert etag_matches('"other", W/"abc.3-0123"', etag)
+
+    def test_no_match(self):
+        """헤더가 없거나 다른 ETag이면 False인지 테스트"""
+        etag = 'W/"abc.3-0123"'
+
+        assert not etag_matches(None, etag)
+        assert not etag_matches('W/"abc.4-0123"', etag)
+
+    def test_wildcard(self):
+        """*는 항상 일치하는지 테스트"""
+        assert etag_matches('*', 'W/"abc.3-0123"')
+
+    def test_not_modified_response(self):
+        """304 응답에 ETag과 추가 헤더가 포함되는지 테스트"""
+        response = not_modified('W/"x"', {'Vary': 'Accept'})
+
+        assert response.status_code == 304
+        assert response.headers['etag'] == 'W/"x"'
+        assert response.headers['vary'] == 'Accept'
+        assert response.body == b''
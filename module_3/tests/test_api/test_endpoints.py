@@ -1,16 +1,28 @@
 """API 엔드포인트 테스트"""
 import pytest
+from unittest.mock import patch
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 from datetime import datetime
 
-from app.main import app
+from app.main import app, instrumentation
 from app.collectors.cpu_collector import CPUCollector
 from app.collectors.memory_collector import MemoryCollector
 from app.collectors.disk_collector import DiskCollector
 from app.collectors.network_collector import NetworkCollector
 from app.collectors.process_collector import ProcessCollector
 from app.storage.memory_storage import MemoryStorage
-from app.api.routes import metrics
+from app.storage.snapshot_cache import Snapshot, SnapshotCache
+from app.streaming.hub import StreamHub
+from app.alerts.anomaly import AnomalyDetector
+from app.alerts.engine import AlertEngine
+from app.alerts.loader import RuleFileLoader
+from app.alerts.rules import parse_rule
+from app.api import responses
+from app.api.responses import COLUMNS_MEDIA_TYPE, unpack_columns
+from app.api.compression import EncodedBodyCache
+from app.api.exposition import PROMETHEUS_MEDIA_TYPE
+from app.api.routes import alerts, debug, metrics, prometheus, stream
 
 
 @pytest.fixture
@@ -77,6 +89,70 @@ class TestMetricsEndpoints:
         assert 'memory' in data
         assert 'disk' in data
         assert 'network' in data
+        assert float(response.headers['X-Snapshot-Age']) >= 0
+
+    def test_get_current_metrics_uses_snapshot_cache(self, client):
+        """현재 메트릭이 스냅샷 캐시에서 제공되는지 테스트"""
+        first = client.get("/api/v1/metrics/current").json()
+        second = client.get("/api/v1/metrics/current").json()
+
+        # 같은 스냅샷이므로 수집 시각이 동일해야 함
+        assert first['timestamp'] == second['timestamp']
+
+    def test_get_current_metrics_precompressed(self, client):
+        """같은 스냅샷의 압축 본문을 재사용하는지 테스트"""
+        first = client.get("/api/v1/metrics/current", headers={'Accept-Encoding': 'gzip'})
+        second = client.get("/api/v1/metrics/current", headers={'Accept-Encoding': 'gzip'})
+
+        assert first.headers['content-encoding'] == 'gzip'
+        assert 'Accept-Encoding' in first.headers['vary']
+        assert first.json() == second.json()
+        stats = metrics._body_cache.get_stats()
+        assert stats['renders'] == 1
+        assert stats['compressions'] == 1
+
+    def test_get_current_metrics_not_modified(self, client):
+        """같은 스냅샷에 대한 조건부 요청은 304를 반환하는지 테스트"""
+        first = client.get("/api/v1/metrics/current")
+        etag = first.headers['etag']
+
+        response = client.get("/api/v1/metrics/current", headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+
+    def test_get_current_metrics_marks_stale_types(self, client):
+        """이전 틱 값을 이어받은 타입이 X-Stale-Metrics로 표시되는지 테스트"""
+        first = client.get("/api/v1/metrics/current")
+        assert 'X-Stale-Metrics' not in first.headers
+
+        previous = metrics._snapshot_cache.peek()
+        metrics._snapshot_cache.update(dict(previous.data), carried=['disk', 'network'])
+        response = client.get("/api/v1/metrics/current")
+
+        assert response.headers['X-Stale-Metrics'] == 'disk,network'
+        # 이어받은 타입의 원래 수집 시각 기준이므로 처음 응답보다 작아지지 않음
+        assert float(response.headers['X-Snapshot-Age']) >= float(first.headers['X-Snapshot-Age'])
+
+    def test_get_collector_stats(self, client):
+        """수집기 실행 통계 조회 테스트"""
+        client.get("/api/v1/metrics/current")
+        response = client.get("/api/v1/collectors/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {'cpu', 'memory', 'disk', 'network'}
+        assert data['cpu']['runs'] >= 1
+        assert data['cpu']['failures'] == 0
+
+    def test_get_inventory(self, client):
+        """호스트 인벤토리 엔드포인트 테스트"""
+        response = client.get("/api/v1/inventory")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['cpu']['cpu_count_logical'] > 0
+        assert 'partitions' in data['disk']
 
     def test_get_cpu_metrics(self, client):
         """CPU 메트릭 조회 테스트"""
@@ -86,6 +162,18 @@ class TestMetricsEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
+    def test_get_anomaly_scores(self, client):
+        """이상 점수 시계열 조회 테스트"""
+        row = AnomalyDetector().score({'cpu': {'cpu_percent': 50.0, 'timestamp': datetime.now()}})
+        metrics._storage.save_metric('anomaly', row)
+
+        response = client.get("/api/v1/metrics/anomaly")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]['cpu']['cpu_percent'] == 0.0
+        assert 'max_score' in data[0]
+
     def test_get_cpu_metrics_with_limit(self, client):
         """CPU 메트릭 limit 파라미터 테스트"""
         response = client.get("/api/v1/metrics/cpu?limit=5")
@@ -95,6 +183,94 @@ class TestMetricsEndpoints:
         assert isinstance(data, list)
         assert len(data) <= 5
 
+    def test_get_cpu_metrics_downsampled(self, client):
+        """step/agg 파라미터로 집계된 데이터를 반환하는지 테스트"""
+        response = client.get("/api/v1/metrics/cpu?step=60&agg=max")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+        assert all('sample_count' in item for item in data)
+
+    def test_get_cpu_metrics_invalid_agg(self, client):
+        """잘못된 집계 방식은 검증 오류를 반환하는지 테스트"""
+        response = client.get("/api/v1/metrics/cpu?step=60&agg=median")
+
+        assert response.status_code == 422
+
+    def test_get_cpu_metrics_packed_columns(self, client):
+        """Accept 헤더로 컬럼 형식을 요청하면 JSON과 같은 값을 반환하는지 테스트"""
+        json_rows = client.get("/api/v1/metrics/cpu").json()
+        response = client.get("/api/v1/metrics/cpu", headers={'Accept': COLUMNS_MEDIA_TYPE})
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == COLUMNS_MEDIA_TYPE
+        assert 'Accept' in response.headers['vary']
+        header, columns = unpack_columns(response.content)
+        assert header['rows'] == len(json_rows)
+        assert columns[('cpu_percent',)] == [row['cpu_percent'] for row in json_rows]
+
+    def test_get_cpu_metrics_msgpack(self, client):
+        """MessagePack 응답 테스트 (msgpack 설치 시)"""
+        msgpack = pytest.importorskip('msgpack')
+        response = client.get("/api/v1/metrics/cpu", headers={'Accept': 'application/msgpack'})
+
+        assert response.status_code == 200
+        assert msgpack.unpackb(response.content) == client.get("/api/v1/metrics/cpu").json()
+
+    def test_get_cpu_metrics_not_acceptable(self, client):
+        """제공할 수 없는 형식을 요청하면 406을 반환하는지 테스트"""
+        with patch.object(responses, 'msgpack', None):
+            response = client.get("/api/v1/metrics/cpu", headers={'Accept': 'application/msgpack'})
+
+        assert response.status_code == 406
+
+    def test_get_cpu_metrics_not_modified(self, client):
+        """데이터가 바뀌지 않으면 304, 새 데이터가 저장되면 200을 반환하는지 테스트"""
+        first = client.get("/api/v1/metrics/cpu")
+        etag = first.headers['etag']
+        assert etag.startswith('W/"')
+
+        with patch.object(metrics._storage, 'get_range') as get_range:
+            response = client.get("/api/v1/metrics/cpu", headers={'If-None-Match': etag})
+            assert response.status_code == 304
+            get_range.assert_not_called()
+
+        # 파라미터나 형식이 다르면 다른 ETag
+        assert client.get("/api/v1/metrics/cpu?limit=5").headers['etag'] != etag
+        packed = client.get("/api/v1/metrics/cpu", headers={'Accept': COLUMNS_MEDIA_TYPE})
+        assert packed.headers['etag'] != etag
+
+        metrics._storage.save_metric('cpu', {'cpu_percent': 70.0})
+        response = client.get("/api/v1/metrics/cpu", headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+
+    def test_get_cpu_metrics_since_seq(self, client):
+        """since_seq 커서로 새 데이터만 받는지 테스트"""
+        first = client.get("/api/v1/metrics/cpu?since_seq=0").json()
+        assert len(first['items']) == 1
+        assert first['gap'] is False
+
+        metrics._storage.save_metric('cpu', {'cpu_percent': 70.0, 'timestamp': datetime.now()})
+        response = client.get(f"/api/v1/metrics/cpu?since_seq={first['next_seq']}")
+        data = response.json()
+        assert [item['cpu_percent'] for item in data['items']] == [70.0]
+        assert data['next_seq'] == first['next_seq'] + 1
+        assert response.headers['x-next-seq'] == str(data['next_seq'])
+
+        packed = client.get(f"/api/v1/metrics/cpu?since_seq={first['next_seq']}",
+                            headers={'Accept': COLUMNS_MEDIA_TYPE})
+        header, columns = unpack_columns(packed.content)
+        assert header['rows'] == 1
+        assert packed.headers['x-gap'] == 'false'
+
+    def test_get_cpu_metrics_since_seq_with_step(self, client):
+        """since_seq와 step을 함께 지정하면 400을 반환하는지 테스트"""
+        response = client.get("/api/v1/metrics/cpu?since_seq=0&step=60")
+
+        assert response.status_code == 400
+
     def test_get_memory_metrics(self, client):
         """메모리 메트릭 조회 테스트"""
         response = client.get("/api/v1/metrics/memory")
@@ -157,3 +333,198 @@ class TestMetricsEndpoints:
 
         # CORS 미들웨어가 정상 동작하는지 확인
         assert response.status_code in [200, 405]  # OPTIONS 메서드가 지원될 수 있음
+
+
+@pytest.fixture
+def stream_hub():
+    """스트림 허브 픽스처 (최신 스냅샷 1개 포함)"""
+    hub = StreamHub()
+    hub.publish(Snapshot({
+        'cpu': {'cpu_percent': 10.0},
+        'memory': {'memory_percent': 20.0},
+        'disk': {'partitions': []},
+        'network': {'bytes_sent': 1}
+    }, 1))
+    stream.set_dependencies(hub)
+    return hub
+
+
+class TestStreamEndpoints:
+    """실시간 스트림 엔드포인트 테스트"""
+
+    def test_websocket_stream(self, stream_hub):
+        """WebSocket 구독 시 최신 스냅샷과 이후 스냅샷을 받는지 테스트"""
+        client = TestClient(app)
+
+        with client.websocket_connect("/api/v1/stream/ws?types=cpu") as websocket:
+            first = websocket.receive_json()
+            assert first['version'] == 1
+            assert first['metrics'] == {'cpu': {'cpu_percent': 10.0}}
+
+            stream_hub.publish(Snapshot({'cpu': {'cpu_percent': 30.0}}, 2))
+            second = websocket.receive_json()
+            assert second['version'] == 2
+            assert second['metrics']['cpu']['cpu_percent'] == 30.0
+
+    def test_websocket_send_failure_closes_connection(self, stream_hub):
+        """프레임 전송이 실패하면 오류를 회수하고 1011로 연결을 닫는지 테스트"""
+        client = TestClient(app)
+
+        async def broken(self, timeout=None):
+            raise RuntimeError('encoder failed')
+
+        with patch('app.streaming.hub.Subscription.next', broken):
+            with client.websocket_connect("/api/v1/stream/ws?types=cpu") as websocket:
+                with pytest.raises(WebSocketDisconnect) as error:
+                    websocket.receive_text()
+                assert error.value.code == 1011
+
+        assert stream_hub.get_stats()['subscribers'] == 0
+
+    def test_websocket_delta_stream(self, stream_hub):
+        """encoding=delta 구독 시 키프레임 후 변경분만 받는지 테스트"""
+        client = TestClient(app)
+
+        with client.websocket_connect("/api/v1/stream/ws?types=cpu,memory&encoding=delta") as websocket:
+            keyframe = websocket.receive_json()
+            assert keyframe['type'] == 'keyframe'
+
+            stream_hub.publish(Snapshot({
+                'cpu': {'cpu_percent': 11.0},
+                'memory': {'memory_percent': 20.0}
+            }, 2))
+            delta = websocket.receive_json()
+            assert delta['type'] == 'delta'
+            assert delta['set'] == [[['cpu', 'cpu_percent'], 11.0]]
+
+    def test_sse_invalid_types(self, stream_hub):
+        """알 수 없는 메트릭 타입 구독은 400을 반환하는지 테스트"""
+        client = TestClient(app)
+        response = client.get("/api/v1/stream/sse?types=cpu,gpu")
+
+        assert response.status_code == 400
+
+    def test_stream_stats(self, stream_hub):
+        """스트림 통계 엔드포인트 테스트"""
+        client = TestClient(app)
+        response = client.get("/api/v1/stream/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['published'] == 1
+        assert data['subscribers'] == 0
+
+
+@pytest.fixture
+def alert_engine():
+    """알림 평가기 픽스처 (발생 중인 규칙 1개 포함)"""
+    engine = AlertEngine([parse_rule('cpu_percent > 90'), parse_rule('memory_percent > 90')])
+    engine.observe('cpu', {'cpu_percent': 95.0, 'timestamp': datetime.now()})
+    alerts.set_dependencies(engine)
+    return engine
+
+
+class TestAlertEndpoints:
+    """알림 엔드포인트 테스트"""
+
+    def test_get_alerts(self, alert_engine):
+        """규칙별 상태와 상태 필터 테스트"""
+        client = TestClient(app)
+
+        response = client.get("/api/v1/alerts")
+        assert response.status_code == 200
+        assert {alert['name']: alert['state'] for alert in response.json()} == {
+            'cpu_percent > 90': 'firing',
+            'memory_percent > 90': 'inactive',
+        }
+
+        response = client.get("/api/v1/alerts?state=firing")
+        assert [alert['value'] for alert in response.json()] == [95.0]
+
+        assert client.get("/api/v1/alerts?state=unknown").status_code == 422
+
+    def test_get_alert_events(self, alert_engine):
+        """상태 전이 이벤트와 since_id 커서 테스트"""
+        client = TestClient(app)
+
+        events = client.get("/api/v1/alerts/events").json()
+        assert [(event['from'], event['to']) for event in events] == [('inactive', 'firing')]
+        assert client.get(f"/api/v1/alerts/events?since_id={events[0]['id']}").json() == []
+
+        stats = client.get("/api/v1/alerts/stats").json()
+        assert (stats['rules'], stats['firing']) == (2, 1)
+
+    def test_reload_alert_rules(self, alert_engine, tmp_path):
+        """규칙 파일 다시 읽기: 파일 미설정 404, 형식 오류 400, 성공 시 로더 상태"""
+        client = TestClient(app)
+        assert client.post("/api/v1/alerts/reload").status_code == 404
+
+        path = tmp_path / 'rules.json'
+        path.write_text('["cpu_percent > 90", "cpu_percent > 99"]', encoding='utf-8')
+        alerts.set_dependencies(alert_engine, RuleFileLoader(alert_engine, str(path)))
+
+        response = client.post("/api/v1/alerts/reload")
+        assert response.status_code == 200
+        assert (response.json()['rules'], response.json()['reloads']) == (2, 1)
+        # 같은 이름의 규칙은 발생 상태 유지
+        assert [alert['name'] for alert in client.get("/api/v1/alerts?state=firing").json()] == ['cpu_percent > 90']
+
+        path.write_text('["cpu_percent >> 90"]', encoding='utf-8')
+        assert client.post("/api/v1/alerts/reload").status_code == 400
+        assert client.get("/api/v1/alerts/stats").json()['rules'] == 2
+
+
+class TestPrometheusEndpoint:
+    """Prometheus 스크랩 엔드포인트 테스트"""
+
+    def test_no_snapshot(self):
+        """스냅샷이 없으면 503을 반환하는지 테스트"""
+        prometheus.set_dependencies(SnapshotCache())
+
+        assert TestClient(app).get("/metrics").status_code == 503
+
+    def test_scrape_renders_once_per_snapshot(self):
+        """같은 스냅샷의 스크랩은 렌더링/압축 없이 저장된 본문을 반환하는지 테스트"""
+        snapshot_cache = SnapshotCache()
+        body_cache = EncodedBodyCache(minimum_size=0)
+        prometheus.set_dependencies(snapshot_cache, body_cache=body_cache)
+        snapshot_cache.update({'cpu': {'cpu_percent': 12.5, 'cpu_percent_per_core': [10.0, 15.0]}})
+        client = TestClient(app)
+
+        first = client.get("/metrics")
+        assert first.status_code == 200
+        assert first.headers['content-type'] == PROMETHEUS_MEDIA_TYPE
+        assert 'sysmon_cpu_core_usage_percent{core="1"} 15.0' in first.text
+
+        for _ in range(3):
+            assert client.get("/metrics").content == first.content
+            assert client.get("/metrics", headers={'Accept-Encoding': 'gzip'}).headers['content-encoding'] == 'gzip'
+        stats = body_cache.get_stats()
+        assert (stats['renders'], stats['compressions'], stats['hits']) == (1, 1, 6)
+
+        snapshot_cache.update({'cpu': {'cpu_percent': 99.0}})
+        assert 'sysmon_cpu_usage_percent 99.0' in client.get("/metrics").text
+        assert body_cache.get_stats()['renders'] == 2
+
+
+class TestDebugEndpoints:
+    """디버그 엔드포인트 테스트"""
+
+    def test_get_timings(self, client):
+        """라우트별 지연 시간이 경로 템플릿 이름으로 기록되고 그룹으로 거를 수 있는지 테스트"""
+        debug.set_dependencies(instrumentation)
+        for _ in range(3):
+            client.get("/api/v1/health")
+        client.get("/api/v1/does-not-exist")
+
+        response = client.get("/api/v1/debug/timings?group=route")
+        assert response.status_code == 200
+        data = response.json()
+        assert data['enabled'] is True
+        routes = data['timings']['route']
+        assert routes['GET /api/v1/health']['count'] >= 3
+        assert routes['GET /api/v1/health']['p99'] > 0
+        assert '<unmatched>' in routes
+        assert set(data['timings']) == {'route'}
+
+        assert client.get("/api/v1/debug/timings?group=unknown").status_code == 422
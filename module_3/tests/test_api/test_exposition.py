@@ -0,0 +1,77 @@
+"""Prometheus 텍스트 형식 렌더링 테스트"""
+import re
+
+from app.api.exposition import escape_label, format_value, render_exposition
+
+# 텍스트 형식의 샘플 줄: 이름{레이블} 값
+SAMPLE_LINE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_]\w*="([^"\\]|\\.)*",?)*\})? \S+$')
+
+DATA = {
+    'cpu': {'cpu_percent': 37.5, 'cpu_percent_per_core': [30.0, 45.0], 'cpu_count_logical': 2,
+            'cpu_freq_current': None},
+    'memory': {'memory_total': 8 * 2**30, 'memory_percent': 61.2},
+    'disk': {
+        'io_read_bytes': 1000, 'io_read_time': 2500, 'io_read_bytes_per_sec': 512.0,
+        'partitions': [{'device': '/dev/sda1', 'mountpoint': '/', 'fstype': 'ext4', 'total': 100, 'percent': 42.0}],
+        'disks': {'sda': {'read_bytes_per_sec': 512.0, 'write_bytes_per_sec': None}},
+    },
+    'network': {
+        'bytes_recv': 4096, 'bytes_recv_per_sec': None,
+        'interfaces': {'eth0': {'bytes_recv': 4000}, 'lo': {'bytes_recv': 96}},
+        'interface_rates': {'eth0': {'bytes_recv_per_sec': 10.5}},
+    },
+}
+
+
+class TestExposition:
+    """렌더링 테스트 클래스"""
+
+    def test_render(self):
+        """합계와 코어/디스크/인터페이스/파티션별 레이블 값이 형식에 맞게 렌더링되는지 테스트"""
+        text = render_exposition(DATA, collected_at=1_700_000_000.5).decode('utf-8')
+        lines = text.splitlines()
+
+        assert text.endswith('\n')
+        assert all(SAMPLE_LINE.match(line) for line in lines if not line.startswith('#'))
+        for expected in (
+            'sysmon_snapshot_timestamp_seconds 1700000000.5',
+            'sysmon_cpu_usage_percent 37.5',
+            'sysmon_cpu_logical_cores 2',
+            'sysmon_cpu_core_usage_percent{core="1"} 45.0',
+            'sysmon_memory_total_bytes 8589934592',
+            'sysmon_disk_read_time_seconds_total 2.5',
+            'sysmon_disk_device_read_bytes_per_second{device="sda"} 512.0',
+            'sysmon_network_interface_bytes_recv_total{interface="eth0"} 4000',
+            'sysmon_network_interface_bytes_recv_total{interface="lo"} 96',
+            'sysmon_network_interface_bytes_recv_per_second{interface="eth0"} 10.5',
+            'sysmon_filesystem_usage_percent{device="/dev/sda1",mountpoint="/",fstype="ext4"} 42.0',
+            '# TYPE sysmon_network_bytes_recv_total counter',
+        ):
+            assert expected in lines
+
+    def test_metric_type_timestamps(self):
+        """타입별 수집 시각이 type 레이블로 노출되는지 테스트"""
+        text = render_exposition(DATA, 1_700_000_010.0, {'cpu': 1_700_000_010.0, 'disk': 1_700_000_000.0})
+        lines = text.decode('utf-8').splitlines()
+
+        assert 'sysmon_metric_timestamp_seconds{type="cpu"} 1700000010.0' in lines
+        assert 'sysmon_metric_timestamp_seconds{type="disk"} 1700000000.0' in lines
+
+    def test_missing_values_are_omitted(self):
+        """값이 없는 필드는 메트릭 자체(HELP/TYPE 포함)를 생략하는지 테스트"""
+        text = render_exposition(DATA).decode('utf-8')
+
+        assert 'sysmon_cpu_frequency_mhz' not in text
+        assert 'sysmon_network_bytes_recv_per_second' not in text
+        assert 'sysmon_disk_device_write_bytes_per_second' not in text
+        assert 'sysmon_snapshot_timestamp_seconds' not in text
+        assert render_exposition({}) == b''
+
+    def test_value_and_label_formatting(self):
+        """특수 값과 레이블 이스케이프 테스트"""
+        assert format_value(float('nan')) == 'NaN'
+        assert format_value(float('-inf')) == '-Inf'
+        assert format_value(True) is None
+        assert format_value('12') is None
+        assert format_value(1500, 0.001) == '1.5'
+        assert escape_label('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
@@ -0,0 +1,130 @@
+"""빠른 JSON 응답 테스트"""
+import json
+import struct
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.api import responses
+from array import array
+
+from app.api.responses import (
+    FastJSONResponse, json_dumps, negotiate, pack_columns, unpack_columns,
+    JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, COLUMNS_MEDIA_TYPE
+)
+
+
+ROWS = [
+    {'cpu_percent': 12.5, 'cpu_percent_per_core': [1.0, 2.0], 'timestamp': datetime(2024, 1, 2, 3, 4, 5, 678901)},
+    {'cpu_percent': 0.0, 'name': '한글', 'timestamp': datetime(2024, 1, 2, 3, 4, 6)},
+]
+
+
+class TestJsonDumps:
+    """json_dumps 테스트"""
+
+    def test_datetime_iso_format(self):
+        """datetime이 ISO 8601 문자열로 직렬화되는지 테스트"""
+        data = json.loads(json_dumps(ROWS))
+
+        assert data[0]['timestamp'] == '2024-01-02T03:04:05.678901'
+        assert data[1]['timestamp'] == '2024-01-02T03:04:06'
+        assert data[1]['name'] == '한글'
+
+    def test_stdlib_fallback_matches(self):
+        """orjson이 없을 때도 같은 내용으로 직렬화되는지 테스트"""
+        expected = json.loads(json_dumps(ROWS))
+
+        with patch.object(responses, 'orjson', None):
+            assert json.loads(json_dumps(ROWS)) == expected
+
+    def test_non_finite_floats_are_null(self):
+        """NaN과 무한대가 orjson 유무와 관계없이 null로 직렬화되는지 테스트"""
+        content = {'score': float('nan'), 'rates': [float('inf'), 1.5, -float('inf')], 'pair': (float('nan'), 2)}
+        expected = {'score': None, 'rates': [None, 1.5, None], 'pair': [None, 2]}
+
+        if responses.orjson is not None:
+            assert json.loads(json_dumps(content)) == expected
+        with patch.object(responses, 'orjson', None):
+            assert json.loads(json_dumps(content)) == expected
+
+    def test_unsupported_type(self):
+        """직렬화할 수 없는 값은 TypeError를 발생시키는지 테스트"""
+        with patch.object(responses, 'orjson', None):
+            with pytest.raises(TypeError):
+                json_dumps({'value': object()})
+
+
+class TestFastJSONResponse:
+    """FastJSONResponse 테스트"""
+
+    def test_render(self):
+        """응답 본문과 미디어 타입 테스트"""
+        response = FastJSONResponse(ROWS)
+
+        assert response.media_type == 'application/json'
+        assert json.loads(response.body)[0]['cpu_percent'] == 12.5
+
+
+class TestNegotiate:
+    """Accept 헤더 협상 테스트"""
+
+    def test_default_json(self):
+        """Accept가 없거나 와일드카드이면 JSON인지 테스트"""
+        assert negotiate(None) == JSON_MEDIA_TYPE
+        assert negotiate('*/*') == JSON_MEDIA_TYPE
+        assert negotiate('text/html,application/xhtml+xml,*/*;q=0.8') == JSON_MEDIA_TYPE
+
+    def test_quality_order(self):
+        """q 값이 높은 형식을 고르는지 테스트"""
+        accept = f'application/json;q=0.5, {COLUMNS_MEDIA_TYPE}'
+        assert negotiate(accept) == COLUMNS_MEDIA_TYPE
+
+    def test_msgpack_requires_package(self):
+        """msgpack이 없으면 MessagePack을 고르지 않는지 테스트"""
+        with patch.object(responses, 'msgpack', None):
+            assert negotiate('application/msgpack') is None
+            assert negotiate('application/x-msgpack, application/json;q=0.1') == JSON_MEDIA_TYPE
+
+        with patch.object(responses, 'msgpack', object()):
+            assert negotiate('application/x-msgpack') == MSGPACK_MEDIA_TYPE
+
+    def test_unacceptable(self):
+        """제공할 수 없는 형식만 요청하면 None인지 테스트"""
+        assert negotiate('text/csv') is None
+        assert negotiate('application/json;q=0') is None
+
+
+class TestPackedColumns:
+    """패킹된 컬럼 형식 테스트"""
+
+    def test_roundtrip(self):
+        """인코딩한 컬럼을 그대로 복원하는지 테스트"""
+        timestamps = array('d', [1.0, 2.0, 3.0])
+        columns = {
+            ('cpu_percent',): array('d', [1.5, 2.5, 3.5]),
+            ('memory_total',): array('q', [1 << 40] * 3),
+            ('cores', 0): [1, 2, 3],
+            ('name',): ['a', 'b', 'c'],
+        }
+
+        body = pack_columns(timestamps, columns)
+        header, decoded = unpack_columns(body)
+
+        assert header['rows'] == 3
+        assert decoded[('timestamp',)] == [1.0, 2.0, 3.0]
+        assert decoded[('cpu_percent',)] == [1.5, 2.5, 3.5]
+        assert decoded[('memory_total',)] == [1 << 40] * 3
+        assert decoded[('cores', 0)] == [1, 2, 3]
+        assert decoded[('name',)] == ['a', 'b', 'c']
+        dtypes = {tuple(column['path']): column['dtype'] for column in header['columns']}
+        assert dtypes[('cores', 0)] == 'i8'
+        assert dtypes[('name',)] == 'json'
+
+    def test_data_is_aligned(self):
+        """데이터 영역이 8바이트 경계에서 시작하는지 테스트"""
+        body = pack_columns(array('d', [1.0]), {('x',): array('d', [2.0])})
+        (length,) = struct.unpack_from('<I', body)
+
+        assert (4 + length) % 8 == 0
@@ -1,6 +1,7 @@
 """CPU 수집기 테스트"""
+import psutil
 import pytest
-from app.collectors.cpu_collector import CPUCollector
+from app.collectors.cpu_collector import CPUCollector, CPUSampler
 
 
 class TestCPUCollector:
@@ -71,3 +72,52 @@ class TestCPUCollector:
         assert isinstance(metrics2, dict)
         assert 'cpu_percent' in metrics1
         assert 'cpu_percent' in metrics2
+
+    def test_collect_does_not_block(self):
+        """collect()가 대기 없이 즉시 반환되는지 테스트"""
+        import time
+
+        collector = CPUCollector()
+        started = time.perf_counter()
+        collector.collect()
+        assert time.perf_counter() - started < 0.5
+
+
+class TestCPUSampler:
+    """CPU 샘플러 테스트 클래스"""
+
+    @staticmethod
+    def _times(user, idle):
+        from collections import namedtuple
+        cputimes = namedtuple('scputimes', ['user', 'system', 'idle'])
+        return cputimes(user, 0.0, idle)
+
+    def test_first_sample_in_range(self):
+        """첫 샘플이 부팅 이후 평균으로 올바른 범위에 있는지 테스트"""
+        sampler = CPUSampler()
+        total, per_core = sampler.sample()
+
+        assert 0 <= total <= 100
+        assert len(per_core) == len(psutil.cpu_times(percpu=True))
+
+    def test_delta_calculation(self, monkeypatch):
+        """직전 스냅샷과의 델타로 사용률을 계산하는지 테스트"""
+        snapshots = iter([
+            [self._times(10.0, 90.0), self._times(0.0, 100.0)],
+            [self._times(20.0, 90.0), self._times(5.0, 105.0)],
+        ])
+        monkeypatch.setattr(psutil, 'cpu_times', lambda percpu=False: next(snapshots))
+
+        sampler = CPUSampler()
+        total, per_core = sampler.sample()
+
+        assert per_core == [100.0, 50.0]
+        assert total == 75.0
+
+    def test_repeated_sample_without_delta(self, monkeypatch):
+        """누적 시간 변화가 없으면 직전 값을 반환하는지 테스트"""
+        snapshot = [self._times(30.0, 70.0)]
+        monkeypatch.setattr(psutil, 'cpu_times', lambda percpu=False: snapshot)
+
+        sampler = CPUSampler()
+        assert sampler.sample() == (30.0, [30.0])
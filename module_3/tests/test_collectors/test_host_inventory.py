@@ -0,0 +1,96 @@
+"""호스트 인벤토리 테스트"""
+from unittest.mock import patch
+
+from app.collectors.host_inventory import HostInventory
+from app.collectors.cpu_collector import CPUCollector
+from app.collectors.disk_collector import DiskCollector
+from app.collectors.memory_collector import MemoryCollector
+
+
+class TestHostInventory:
+    """호스트 인벤토리 테스트 클래스"""
+
+    def test_get_has_static_facts(self):
+        """정적 정보가 포함되어 있는지 테스트"""
+        facts = HostInventory().get()
+
+        assert facts['cpu']['cpu_count_logical'] > 0
+        assert facts['memory']['memory_total'] > 0
+        assert isinstance(facts['disk']['partitions'], list)
+        assert isinstance(facts['network']['interfaces'], dict)
+        assert facts['hostname']
+
+    def test_get_is_cached_until_invalidated(self):
+        """주기 내에는 다시 읽지 않고, invalidate() 후 다시 읽는지 테스트"""
+        inventory = HostInventory(refresh_interval=3600)
+        first = inventory.get()
+
+        with patch.object(inventory, '_read', wraps=inventory._read) as read:
+            assert inventory.get() is first
+            assert read.call_count == 0
+
+            inventory.invalidate()
+            assert inventory.get() is not first
+            assert read.call_count == 1
+
+    def test_peek_does_not_read(self):
+        """peek()은 다시 읽어야 할 때 읽지 않고 None을 반환하는지 테스트"""
+        inventory = HostInventory(refresh_interval=3600)
+        assert inventory.peek() is None
+
+        facts = inventory.get()
+        assert inventory.peek() is facts
+
+        with patch.object(inventory, '_read', wraps=inventory._read) as read:
+            inventory.invalidate()
+            assert inventory.peek() is None
+            assert read.call_count == 0
+
+    def test_merge(self):
+        """샘플에 정적 값을 채우고 샘플 값이 우선하는지 테스트"""
+        inventory = HostInventory()
+        facts = inventory.get()
+
+        cpu = inventory.merge('cpu', {'cpu_percent': 10.0})
+        assert cpu['cpu_count_logical'] == facts['cpu']['cpu_count_logical']
+        assert cpu['cpu_percent'] == 10.0
+
+        if facts['disk']['partitions']:
+            mountpoint = facts['disk']['partitions'][0]['mountpoint']
+            disk = inventory.merge('disk', {'partitions': [{'mountpoint': mountpoint, 'used': 1}]})
+            assert disk['partitions'][0]['device'] == facts['disk']['partitions'][0]['device']
+            assert disk['partitions'][0]['used'] == 1
+
+
+class TestStaticFieldsExcluded:
+    """include_static=False 수집기 테스트"""
+
+    def test_cpu_collector_without_static(self):
+        """CPU 샘플에서 코어 수와 최소/최대 주파수가 빠지는지 테스트"""
+        inventory = HostInventory()
+        metrics = CPUCollector(inventory=inventory, include_static=False).collect()
+
+        assert 'cpu_percent' in metrics
+        assert 'cpu_freq_current' in metrics
+        for field in ('cpu_count_logical', 'cpu_count_physical', 'cpu_freq_min', 'cpu_freq_max'):
+            assert field not in metrics
+
+    def test_memory_collector_without_static(self):
+        """메모리 샘플에서 전체 메모리가 빠지는지 테스트"""
+        metrics = MemoryCollector(include_static=False).collect()
+
+        assert 'memory_total' not in metrics
+        assert 'memory_used' in metrics
+
+    def test_disk_collector_uses_inventory_partitions(self):
+        """디스크 수집기가 매 틱 파티션 목록을 다시 나열하지 않는지 테스트"""
+        inventory = HostInventory(refresh_interval=3600)
+        collector = DiskCollector(inventory=inventory, include_static=False)
+        inventory.get()
+
+        with patch('psutil.disk_partitions') as disk_partitions:
+            metrics = collector.collect()
+            assert disk_partitions.call_count == 0
+
+        for partition in metrics['partitions']:
+            assert set(partition) == {'mountpoint', 'used', 'free', 'percent'}
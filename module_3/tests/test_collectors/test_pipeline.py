@@ -0,0 +1,87 @@
+"""수집 파이프라인 테스트"""
+import threading
+import time
+from app.collectors.pipeline import CollectionPipeline
+
+
+class _StaticCollector:
+    def __init__(self, value, delay=0.0):
+        self.value = value
+        self.delay = delay
+
+    def collect(self):
+        time.sleep(self.delay)
+        return {'value': self.value}
+
+
+class _FailingCollector:
+    def collect(self):
+        raise RuntimeError("boom")
+
+
+class _BlockingCollector:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def collect(self):
+        self.release.wait(5)
+        return {'value': 'late'}
+
+
+class TestCollectionPipeline:
+    """수집 파이프라인 테스트 클래스"""
+
+    def test_run_returns_all_results(self):
+        """모든 수집기 결과를 반환하는지 테스트"""
+        pipeline = CollectionPipeline({'a': _StaticCollector(1), 'b': _StaticCollector(2)})
+        try:
+            assert pipeline.run() == {'a': {'value': 1}, 'b': {'value': 2}}
+        finally:
+            pipeline.shutdown()
+
+    def test_collectors_run_concurrently(self):
+        """수집기가 동시에 실행되어 소요 시간이 합이 아닌지 테스트"""
+        pipeline = CollectionPipeline(
+            {name: _StaticCollector(name, delay=0.2) for name in 'abcd'},
+            max_workers=4
+        )
+        try:
+            started = time.perf_counter()
+            results = pipeline.run()
+            assert len(results) == 4
+            assert time.perf_counter() - started < 0.6
+        finally:
+            pipeline.shutdown()
+
+    def test_failure_does_not_drop_others(self):
+        """실패한 수집기가 다른 결과에 영향을 주지 않는지 테스트"""
+        pipeline = CollectionPipeline({'ok': _StaticCollector(1), 'bad': _FailingCollector()})
+        try:
+            assert pipeline.run() == {'ok': {'value': 1}}
+
+            stats = pipeline.get_stats()
+            assert stats['bad']['failures'] == 1
+            assert 'boom' in stats['bad']['last_error']
+            assert stats['ok']['runs'] == 1
+        finally:
+            pipeline.shutdown()
+
+    def test_timeout_and_skip_in_flight(self):
+        """타임아웃된 수집기는 제외되고, 진행 중이면 다음 틱에 건너뛰는지 테스트"""
+        blocking = _BlockingCollector()
+        pipeline = CollectionPipeline(
+            {'fast': _StaticCollector(1), 'slow': blocking},
+            timeout=1.0,
+            timeouts={'slow': 0.05}
+        )
+        try:
+            assert pipeline.run() == {'fast': {'value': 1}}
+            assert pipeline.run() == {'fast': {'value': 1}}
+
+            stats = pipeline.get_stats()
+            assert stats['slow']['timeouts'] == 1
+            assert stats['slow']['skipped'] == 1
+            assert stats['fast']['runs'] == 2
+        finally:
+            blocking.release.set()
+            pipeline.shutdown()
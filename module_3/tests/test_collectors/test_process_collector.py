@@ -0,0 +1,83 @@
+"""프로세스 수집기 테스트"""
+import os
+import subprocess
+import sys
+import time
+import psutil
+from app.collectors.process_collector import ProcessCollector, _ProcessEntry
+
+
+def _busy_loop(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestProcessCollector:
+    """프로세스 수집기 테스트 클래스"""
+
+    def test_collect_respects_limit(self):
+        """limit 개수 이하로 반환하는지 테스트"""
+        collector = ProcessCollector()
+        processes = collector.collect(limit=5)
+
+        assert len(processes) <= 5
+
+    def test_collect_has_required_fields(self):
+        """프로세스 정보가 필수 필드를 포함하는지 테스트"""
+        collector = ProcessCollector()
+        processes = collector.collect(limit=3)
+
+        required_fields = ['pid', 'name', 'cpu_percent', 'memory_percent',
+                           'memory_info_rss', 'status', 'username', 'create_time']
+        for process in processes:
+            for field in required_fields:
+                assert field in process, f"Missing required field: {field}"
+
+    def test_sorted_by_memory(self):
+        """메모리 기준 내림차순으로 정렬되는지 테스트"""
+        collector = ProcessCollector()
+        processes = collector.collect(limit=10, sort_by='memory')
+        rss = [process['memory_info_rss'] for process in processes]
+
+        assert rss == sorted(rss, reverse=True)
+
+    def test_sorted_by_cpu(self):
+        """CPU 기준 내림차순으로 정렬되는지 테스트"""
+        collector = ProcessCollector()
+        processes = collector.collect(limit=10, sort_by='cpu')
+        cpu = [process['cpu_percent'] for process in processes]
+
+        assert cpu == sorted(cpu, reverse=True)
+
+    def test_cpu_percent_reflects_work(self):
+        """직전 수집 이후 CPU를 사용한 프로세스의 사용률이 0보다 큰지 테스트"""
+        collector = ProcessCollector()
+        _busy_loop(0.3)
+
+        processes = collector.collect(limit=100000)
+        own = [process for process in processes if process['pid'] == os.getpid()]
+
+        assert own and own[0]['cpu_percent'] > 0
+
+    def test_reused_pid_rebuilds_entry(self):
+        """같은 PID의 항목이 다른 프로세스의 것이면 새 항목으로 교체하는지 테스트"""
+        collector = ProcessCollector()
+        child = subprocess.Popen([sys.executable, '-c', 'pass'])
+        stale = _ProcessEntry(psutil.Process(child.pid))
+        child.wait()
+        stale.name = 'stale'
+        collector._table[os.getpid()] = stale
+
+        processes = collector.collect(limit=100000)
+        own = [process for process in processes if process['pid'] == os.getpid()]
+        entry = collector._table[os.getpid()]
+
+        assert entry is not stale
+        assert entry.key == (os.getpid(), psutil.Process().create_time())
+        assert own and own[0]['name'] != 'stale'
+
+    def test_get_metric_type(self):
+        """get_metric_type()이 올바른 타입을 반환하는지 테스트"""
+        collector = ProcessCollector()
+        assert collector.get_metric_type() == "process"
@@ -0,0 +1,73 @@
+"""카운터 변화율 계산 테스트"""
+import pytest
+from app.collectors.rates import CounterRates, counter_delta
+from app.collectors.disk_collector import DiskCollector
+from app.collectors.network_collector import NetworkCollector
+
+
+class TestCounterRates:
+    """카운터 변화율 계산기 테스트 클래스"""
+
+    def test_counter_delta(self):
+        """증가량 계산과 카운터 리셋 처리 테스트"""
+        assert counter_delta(100, 150) == 50
+        # 리셋 후에는 0부터 다시 증가한 것으로 취급
+        assert counter_delta(100, 30) == 30
+
+    def test_first_update_has_no_rate(self):
+        """처음 본 키는 변화율이 None인지 테스트"""
+        rates = CounterRates()
+        assert rates.update('eth0', {'bytes_sent': 100}, now=0.0) == {'bytes_sent_per_sec': None}
+
+    def test_rate_per_second(self):
+        """경과 시간으로 나눈 초당 변화율을 계산하는지 테스트"""
+        rates = CounterRates()
+        rates.update('eth0', {'bytes_sent': 100, 'errin': 0}, now=10.0)
+        result = rates.update('eth0', {'bytes_sent': 600, 'errin': 2}, now=15.0)
+
+        assert result == {'bytes_sent_per_sec': 100.0, 'errin_per_sec': 0.4}
+
+    def test_rate_after_reset(self):
+        """카운터가 리셋되면 음수 대신 리셋 이후 증가량으로 계산하는지 테스트"""
+        rates = CounterRates()
+        rates.update('eth0', {'bytes_sent': 1000}, now=0.0)
+        result = rates.update('eth0', {'bytes_sent': 200}, now=2.0)
+
+        assert result['bytes_sent_per_sec'] == 100.0
+
+    def test_keys_are_independent_and_prunable(self):
+        """키별로 독립적으로 계산되고 prune으로 정리되는지 테스트"""
+        rates = CounterRates()
+        rates.update('eth0', {'bytes_sent': 0}, now=0.0)
+        rates.update('eth1', {'bytes_sent': 0}, now=0.0)
+        rates.prune(['eth0'])
+
+        assert rates.update('eth0', {'bytes_sent': 10}, now=1.0)['bytes_sent_per_sec'] == 10.0
+        assert rates.update('eth1', {'bytes_sent': 10}, now=1.0)['bytes_sent_per_sec'] is None
+
+
+class TestCollectorRates:
+    """수집기의 변화율 필드 테스트 클래스"""
+
+    def test_network_rates(self):
+        """네트워크 수집기가 전체 및 인터페이스별 변화율을 포함하는지 테스트"""
+        metrics = NetworkCollector().collect()
+
+        for field in ('bytes_sent_per_sec', 'bytes_recv_per_sec', 'packets_sent_per_sec',
+                      'errin_per_sec', 'dropout_per_sec'):
+            assert field in metrics, f"Missing rate field: {field}"
+        assert set(metrics['interface_rates']) == set(metrics['interfaces'])
+        assert all(rate is None or rate >= 0
+                   for rates in metrics['interface_rates'].values()
+                   for rate in rates.values())
+
+    def test_disk_rates(self):
+        """디스크 수집기가 I/O 변화율을 포함하는지 테스트"""
+        metrics = DiskCollector().collect()
+
+        if metrics['io_read_bytes'] is None:
+            pytest.skip("Disk I/O counters not supported")
+        for field in ('io_read_bytes_per_sec', 'io_write_bytes_per_sec',
+                      'io_read_ops_per_sec', 'io_write_ops_per_sec'):
+            assert field in metrics, f"Missing rate field: {field}"
+        assert isinstance(metrics['disks'], dict)
@@ -0,0 +1,270 @@
+"""컬럼 기반 링 버퍼 테스트"""
+import marshal
+
+import pytest
+from datetime import datetime
+from app.storage.columnar import ColumnarSeries, columns_from_rows, flatten, unflatten
+
+
+class TestFlatten:
+    """평탄화 함수 테스트 클래스"""
+
+    def test_flatten_nested(self):
+        """중첩된 딕셔너리/리스트가 경로 튜플로 평탄화되는지 테스트"""
+        data = {
+            'cpu_percent': 1.0,
+            'cpu_percent_per_core': [2.0, 3.0],
+            'interfaces': {'eth0': {'bytes_sent': 4}},
+            'timestamp': datetime.now()
+        }
+
+        assert flatten(data) == {
+            ('cpu_percent',): 1.0,
+            ('cpu_percent_per_core', 0): 2.0,
+            ('cpu_percent_per_core', 1): 3.0,
+            ('interfaces', 'eth0', 'bytes_sent'): 4,
+        }
+
+
+    def test_unflatten_inverts_flatten(self):
+        """unflatten이 flatten의 역변환인지 테스트"""
+        data = {'a': [1, {'b': 2}], 'c': {'d': 'x'}, 'e': []}
+        assert unflatten(flatten(data)) == data
+
+
+class TestColumnarSeries:
+    """컬럼 기반 시계열 테스트 클래스"""
+
+    def test_roundtrip_nested_row(self):
+        """중첩 구조와 None, 빈 컨테이너가 그대로 복원되는지 테스트"""
+        series = ColumnarSeries(capacity=4)
+        data = {
+            'partitions': [
+                {'device': '/dev/sda1', 'mountpoint': '/', 'total': 100, 'percent': 12.5},
+            ],
+            'interfaces': {'eth0.100': {'bytes_sent': 1 << 40}},
+            'io_read_bytes': None,
+            'cpu_percent_per_core': [],
+            'extra': {},
+            'flag': True,
+        }
+        series.append(1700000000.25, data)
+
+        row = series.row(0)
+        timestamp = row.pop('timestamp')
+        assert row == data
+        assert isinstance(row['flag'], bool)
+        assert timestamp == datetime.fromtimestamp(1700000000.25)
+
+    def test_ring_buffer_overwrites_oldest(self):
+        """용량을 넘으면 가장 오래된 행을 덮어쓰는지 테스트"""
+        series = ColumnarSeries(capacity=3)
+        for i in range(5):
+            series.append(float(i), {'value': i})
+
+        assert len(series) == 3
+        assert [row['value'] for row in series.rows(0, 3)] == [2, 3, 4]
+        assert series.timestamp(0) == 2.0
+
+    def test_type_promotion(self):
+        """정수 컬럼에 실수/문자열이 들어오면 타입을 승격하는지 테스트"""
+        series = ColumnarSeries(capacity=4)
+        series.append(0.0, {'value': 1})
+        series.append(1.0, {'value': 1.5})
+        series.append(2.0, {'value': 'n/a'})
+
+        assert [row['value'] for row in series.rows(0, 3)] == [1.0, 1.5, 'n/a']
+
+    def test_schema_kind(self):
+        """스키마에 선언된 타입으로 컬럼이 생성되는지 테스트"""
+        series = ColumnarSeries(capacity=2, schema={('values', '*'): 'd'})
+        series.append(0.0, {'values': [1, 2]})
+
+        assert series.row(0)['values'] == [1.0, 2.0]
+        assert all(isinstance(value, float) for value in series.row(0)['values'])
+
+    def test_integer_schema_coerces_float(self):
+        """정수 스키마 컬럼에 float가 먼저 들어와도 이후 값을 저장할 수 있는지 테스트"""
+        series = ColumnarSeries(capacity=4, schema={('count',): 'q'})
+        series.append(0.0, {'count': 3.0})
+        series.append(1.0, {'count': 4})
+        series.append(2.0, {'count': 2.5})
+
+        assert [row['count'] for row in series.rows(0, 3)] == [3, 4, 2.5]
+
+        fractional = ColumnarSeries(capacity=4, schema={('count',): 'q'})
+        fractional.append(0.0, {'count': 1.5})
+        fractional.append(1.0, {'count': 2})
+        assert [row['count'] for row in fractional.rows(0, 2)] == [1.5, 2.0]
+
+    def test_changing_shape(self):
+        """행마다 필드 구성이 달라도 각 행이 원래대로 복원되는지 테스트"""
+        series = ColumnarSeries(capacity=4)
+        series.append(0.0, {'a': 1})
+        series.append(1.0, {'b': 2.0})
+
+        assert series.row(0) == {'a': 1, 'timestamp': datetime.fromtimestamp(0.0)}
+        assert series.row(1) == {'b': 2.0, 'timestamp': datetime.fromtimestamp(1.0)}
+
+    def test_evicted_paths_are_freed(self):
+        """밀려난 행에만 있던 경로의 컬럼과 shape이 삭제되어 메모리가 늘지 않는지 테스트"""
+        series = ColumnarSeries(capacity=3)
+        for i in range(100):
+            # 인터페이스 이름이 계속 바뀌는 경우 (veth 등)
+            series.append(float(i), {'total': i, 'interfaces': {f'veth{i}': {'bytes': i}}})
+
+        assert len(series._columns) == 4
+        assert len(series._shapes) <= 4
+        assert [row['interfaces'] for row in series.rows(0, 3)] == [
+            {'veth97': {'bytes': 97}}, {'veth98': {'bytes': 98}}, {'veth99': {'bytes': 99}}
+        ]
+
+        state = marshal.loads(marshal.dumps(series.get_state()))
+        restored = ColumnarSeries(capacity=2)
+        restored.load_state(state)
+        assert set(restored._columns) == {('total',), ('interfaces', 'veth98', 'bytes'),
+                                          ('interfaces', 'veth99', 'bytes')}
+        assert restored.rows(0, 2) == series.rows(1, 3)
+
+    def test_drop_last_keeps_shape_for_replacement(self):
+        """drop_last() 직후 같은 shape의 행이 들어오면 컬럼을 유지하는지 테스트"""
+        series = ColumnarSeries(capacity=4)
+        series.append(0.0, {'a': 1.0})
+        column = series._columns[('a',)]
+        series.drop_last()
+        series.append(0.0, {'a': 2.0})
+
+        assert series._columns[('a',)] is column
+        series.drop_last()
+        series.append(0.0, {'b': 3.0})
+        assert set(series._columns) == {('b',)}
+        assert series.rows(0, 1)[0]['b'] == 3.0
+
+    def test_search_time_range(self):
+        """이진 탐색이 포함 경계로 시간 범위를 찾는지 테스트"""
+        series = ColumnarSeries(capacity=5)
+        for i in range(8):  # 링 버퍼가 한 바퀴 돈 상태 (3~7 보관)
+            series.append(float(i), {'value': i})
+
+        assert series.search() == (0, 5)
+        assert series.search(4.0, 6.0) == (1, 4)
+        assert series.search(4.5, 6.5) == (2, 4)
+        assert series.search(start=100.0) == (5, 5)
+        assert series.search(end=1.0) == (0, 0)
+        assert series.search(6.0, 4.0) == (3, 3)
+
+    def test_downsample_aggregations(self):
+        """버킷별 avg/min/max/p95/last 집계 테스트"""
+        series = ColumnarSeries(capacity=100)
+        for i in range(20):  # 0~19초, 10초 버킷 2개
+            series.append(float(i), {'value': i, 'cores': [i, 2 * i], 'name': f'n{i}'})
+
+        avg = series.downsample(0, 20, step=10, agg='avg')
+        assert [row['value'] for row in avg] == [4.5, 14.5]
+        assert avg[0]['cores'] == [4.5, 9.0]
+        assert avg[0]['name'] == 'n9'
+        assert [row['sample_count'] for row in avg] == [10, 10]
+        assert avg[1]['timestamp'] == datetime.fromtimestamp(10.0)
+
+        assert [row['value'] for row in series.downsample(0, 20, 10, 'min')] == [0, 10]
+        assert [row['value'] for row in series.downsample(0, 20, 10, 'max')] == [9, 19]
+        assert [row['value'] for row in series.downsample(0, 20, 10, 'p95')] == [9, 19]
+        assert [row['value'] for row in series.downsample(0, 20, 10, 'last')] == [9, 19]
+
+    def test_downsample_skips_partial_columns(self):
+        """구간 내 일부 행에만 있는 컬럼은 집계하지 않는지 테스트"""
+        series = ColumnarSeries(capacity=10)
+        series.append(0.0, {'a': 1.0, 'b': 1.0})
+        series.append(1.0, {'a': 3.0, 'b': None})
+
+        rows = series.downsample(0, 2, step=10)
+        assert rows[0]['a'] == 2.0
+        assert 'b' not in rows[0]
+
+    def test_downsample_invalid_agg(self):
+        """알 수 없는 집계 방식은 ValueError를 발생시키는지 테스트"""
+        series = ColumnarSeries(capacity=2)
+        series.append(0.0, {'a': 1.0})
+
+        with pytest.raises(ValueError):
+            series.downsample(0, 1, step=10, agg='median')
+
+    def test_columns(self):
+        """행 복원 없이 공통 컬럼을 반환하는지 테스트"""
+        series = ColumnarSeries(capacity=3)
+        for i in range(4):  # 링 버퍼가 한 바퀴 돈 상태 (1~3 보관)
+            series.append(float(i), {'value': i, 'cores': [], 'name': 'host', 'extra': i if i > 1 else None})
+
+        timestamps, columns = series.columns(0, 3)
+
+        assert list(timestamps) == [1.0, 2.0, 3.0]
+        assert list(columns[('value',)]) == [1, 2, 3]
+        assert columns[('cores',)] == [[], [], []]
+        assert columns[('name',)] == ['host'] * 3
+        assert ('extra',) not in columns  # 첫 행에는 값이 없음
+
+    def test_columns_from_rows(self):
+        """복원된 행 목록을 컬럼 단위로 변환하는지 테스트"""
+        rows = [
+            {'value': 1.0, 'nested': {'a': 1}, 'timestamp': datetime.fromtimestamp(10.0)},
+            {'value': 2.0, 'nested': {'a': 2}, 'timestamp': datetime.fromtimestamp(20.0)},
+        ]
+
+        timestamps, columns = columns_from_rows(rows)
+
+        assert list(timestamps) == [10.0, 20.0]
+        assert columns == {('value',): [1.0, 2.0], ('nested', 'a'): [1, 2]}
+
+    def test_clear(self):
+        """clear() 후 비어 있는지 테스트"""
+        series = ColumnarSeries(capacity=2)
+        series.append(0.0, {'a': 1})
+        series.clear()
+
+        assert len(series) == 0
+
+    def test_nbytes_is_preallocated(self):
+        """값이 바뀌는 컬럼은 용량만큼 미리 할당되는지 테스트"""
+        series = ColumnarSeries(capacity=100)
+        series.append(0.0, {'a': 1.0})
+        before = series.nbytes()
+        series.append(1.0, {'a': 2.0})
+
+        assert series.nbytes() - before == 100 * 8
+
+    def test_constant_column_not_allocated(self):
+        """값이 변하지 않는 컬럼은 버퍼를 할당하지 않는지 테스트"""
+        series = ColumnarSeries(capacity=100)
+        series.append(0.0, {'count': 8, 'name': 'eth0'})
+        before = series.nbytes()
+        for i in range(1, 10):
+            series.append(float(i), {'count': 8, 'name': 'eth0'})
+
+        assert series.nbytes() == before
+
+    def test_constant_column_materialized_on_change(self):
+        """상수 컬럼에 다른 값이 들어오면 이전 행 값을 유지한 채 전환되는지 테스트"""
+        series = ColumnarSeries(capacity=4)
+        for i in range(3):
+            series.append(float(i), {'count': 8})
+        series.append(3.0, {'count': 16})
+
+        assert [row['count'] for row in series.rows(0, 4)] == [8, 8, 8, 16]
+
+    def test_state_roundtrip(self):
+        """get_state()/load_state()로 링 버퍼를 복원하는지 테스트 (작은 용량이면 최근 행만)"""
+        series = ColumnarSeries(capacity=4)
+        for i in range(6):
+            series.append(float(i), {'value': i, 'ratio': i / 2, 'name': f'n{i % 2}', 'count': 8, 'items': []})
+        state = marshal.loads(marshal.dumps(series.get_state()))
+
+        restored = ColumnarSeries(capacity=4)
+        restored.load_state(state)
+        assert restored.rows(0, 4) == series.rows(0, 4)
+        assert restored.rows(0, 4)[0]['items'] == []
+
+        smaller = ColumnarSeries(capacity=2)
+        smaller.load_state(state)
+        assert [row['value'] for row in smaller.rows(0, 2)] == [4, 5]
+        smaller.append(6.0, {'value': 6, 'ratio': 3.0, 'name': 'n0', 'count': 8, 'items': []})
+        assert [row['value'] for row in smaller.rows(0, 2)] == [5, 6]
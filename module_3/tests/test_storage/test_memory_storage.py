@@ -95,6 +95,126 @@ class TestMemoryStorage:
         )
         assert len(filtered_data) <= 3  # 2, 3, 4초 데이터
 
+    def test_get_range_with_start_end_and_limit(self):
+        """시간 범위와 limit을 함께 적용하면 범위 내 최근 N개를 반환하는지 테스트"""
+        storage = MemoryStorage(max_data_points=20)
+
+        now = datetime.now()
+        for i in range(30):
+            storage.save_metric('cpu', {
+                'cpu_percent': float(i),
+                'timestamp': now + timedelta(seconds=i)
+            })
+
+        data = storage.get_range(
+            'cpu',
+            start=now + timedelta(seconds=15),
+            end=now + timedelta(seconds=25),
+            limit=4
+        )
+
+        assert [item['cpu_percent'] for item in data] == [22.0, 23.0, 24.0, 25.0]
+
+    def test_get_downsampled(self):
+        """step 단위 버킷 집계와 버킷 수 limit 테스트"""
+        storage = MemoryStorage()
+
+        base = datetime.fromtimestamp(1_700_000_040)  # 60초 경계
+        for i in range(300):
+            storage.save_metric('cpu', {
+                'cpu_percent': float(i % 60),
+                'timestamp': base + timedelta(seconds=i)
+            })
+
+        data = storage.get_downsampled('cpu', step=60, agg='max')
+        assert len(data) == 5
+        assert all(item['cpu_percent'] == 59.0 for item in data)
+
+        limited = storage.get_downsampled('cpu', step=60, agg='avg', limit=2)
+        assert [item['timestamp'] for item in limited] == [
+            base + timedelta(seconds=180), base + timedelta(seconds=240)
+        ]
+        assert limited[0]['cpu_percent'] == 29.5
+
+    def test_rollup_tiers_incremental(self):
+        """롤업 계층이 저장 시점에 버킷 평균을 갱신하는지 테스트"""
+        storage = MemoryStorage(max_data_points=10, rollups=[(60, 10)])
+
+        base = datetime.fromtimestamp(1_700_000_040)  # 60초 경계
+        for i in range(90):
+            storage.save_metric('cpu', {
+                'cpu_percent': float(i),
+                'cpu_count_logical': 4 + i % 2,
+                'timestamp': base + timedelta(seconds=i)
+            })
+
+        # 원본은 최근 10개만 보관하므로 이전 시점 조회는 1분 계층에서 읽음
+        data = storage.get_range('cpu', start=base)
+        assert [item['timestamp'] for item in data] == [base, base + timedelta(seconds=60)]
+        assert data[0]['cpu_percent'] == 29.5
+        assert data[0]['cpu_count_logical'] == 4  # 정수 필드는 반올림한 정수 평균
+        assert data[0]['sample_count'] == 60
+        # 진행 중인 버킷도 지금까지의 평균으로 포함
+        assert data[1]['cpu_percent'] == 74.5
+        assert data[1]['sample_count'] == 30
+
+        # 원본 보관 범위 내 조회는 원본 그대로 반환
+        recent = storage.get_range('cpu', start=base + timedelta(seconds=85))
+        assert [item['cpu_percent'] for item in recent] == [85.0, 86.0, 87.0, 88.0, 89.0]
+
+    def test_rollup_tier_selection(self):
+        """시작 시점을 온전히 보관하는 가장 세밀한 계층을 고르는지 테스트"""
+        storage = MemoryStorage(max_data_points=5, rollups=[(60, 3), (600, 10)])
+
+        base = datetime.fromtimestamp(1_700_000_400)  # 600초 경계
+        for i in range(60):  # 10초 간격, 10분
+            storage.save_metric('memory', {
+                'memory_percent': 50.0,
+                'timestamp': base + timedelta(seconds=10 * i)
+            })
+
+        tiers = storage.get_tier_stats()['memory']
+        assert [tier['points'] for tier in tiers] == [5, 3, 1]
+
+        # 1분 계층은 최근 3분만 보관하므로 10분 전부터의 조회는 10분 계층에서 읽음
+        data = storage.get_range('memory', start=base)
+        assert len(data) == 1
+        assert data[0]['sample_count'] == 60
+
+        data = storage.get_range('memory', start=base + timedelta(seconds=420))
+        assert [item['sample_count'] for item in data] == [6, 6, 6]
+
+    def test_downsample_rollup_tier_is_weighted(self):
+        """롤업 계층을 다시 집계할 때 샘플 수를 합산하고 평균을 샘플 수로 가중하는지 테스트"""
+        storage = MemoryStorage(max_data_points=2, rollups=[(60, 10)])
+
+        base = datetime.fromtimestamp(1_700_000_400)
+        timestamps = [base + timedelta(seconds=10 * i) for i in range(6)]
+        timestamps += [base + timedelta(seconds=60), base + timedelta(seconds=90)]
+        values = [10.0] * 6 + [40.0] * 2
+        for timestamp, value in zip(timestamps, values):
+            storage.save_metric('cpu', {'cpu_percent': value, 'timestamp': timestamp})
+
+        # 원본은 최근 2개만 보관하므로 1분 계층의 두 버킷(6개, 2개)을 10분 버킷으로 합침
+        data = storage.get_downsampled('cpu', start=base, step=600)
+        assert len(data) == 1
+        assert data[0]['sample_count'] == 8
+        assert data[0]['cpu_percent'] == 17.5
+
+    def test_rollup_memory_is_bounded(self):
+        """보관 기간이 지나도 롤업 계층 메모리가 늘어나지 않는지 테스트"""
+        storage = MemoryStorage(max_data_points=10, rollups=[(60, 5)])
+
+        def fill(count, offset):
+            for i in range(count):
+                storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': offset + i * 30})
+
+        fill(100, 0)
+        usage = storage.get_memory_usage()['cpu']
+        fill(1000, 100 * 30)
+        assert storage.get_memory_usage()['cpu'] == usage
+        assert storage.get_tier_stats()['cpu'][1]['points'] == 5
+
     def test_get_all_latest(self):
         """모든 메트릭 타입의 최신 데이터 조회 테스트"""
         storage = MemoryStorage()
@@ -134,6 +254,77 @@ class TestMemoryStorage:
         assert storage.get_latest('cpu') is None
         assert storage.get_latest('memory') is None
 
+    def test_sequence_numbers(self):
+        """저장과 삭제 시 타입별 시퀀스 번호가 증가하는지 테스트"""
+        storage = MemoryStorage()
+        assert storage.get_sequence('cpu') == 0
+
+        storage.save_metric('cpu', {'cpu_percent': 1.0})
+        storage.save_metric('cpu', {'cpu_percent': 2.0})
+        assert storage.get_sequence('cpu') == 2
+        assert storage.get_sequence('memory') == 0
+
+        storage.clear('cpu')
+        assert storage.get_sequence('cpu') == 3
+        assert storage.get_sequence('invalid_type') == 0
+
+    def test_get_since(self):
+        """커서 이후의 새 행만 반환하는지 테스트"""
+        storage = MemoryStorage()
+        for i in range(5):
+            storage.save_metric('cpu', {'cpu_percent': float(i)})
+
+        rows, next_seq, gap = storage.get_since('cpu', 0)
+        assert [row['cpu_percent'] for row in rows] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert next_seq == 5
+        assert gap is False
+
+        storage.save_metric('cpu', {'cpu_percent': 5.0})
+        rows, next_seq, gap = storage.get_since('cpu', next_seq)
+        assert [row['cpu_percent'] for row in rows] == [5.0]
+        assert (next_seq, gap) == (6, False)
+
+        rows, next_seq, gap = storage.get_since('cpu', next_seq)
+        assert (rows, next_seq, gap) == ([], 6, False)
+
+    def test_get_since_gap(self):
+        """링 버퍼에서 밀려났거나 limit을 넘긴 행이 있으면 gap을 표시하는지 테스트"""
+        storage = MemoryStorage(max_data_points=3)
+        for i in range(6):
+            storage.save_metric('cpu', {'cpu_percent': float(i)})
+
+        rows, next_seq, gap = storage.get_since('cpu', 1)
+        assert [row['cpu_percent'] for row in rows] == [3.0, 4.0, 5.0]
+        assert (next_seq, gap) == (6, True)
+
+        rows, _, gap = storage.get_since('cpu', 3)
+        assert [row['cpu_percent'] for row in rows] == [3.0, 4.0, 5.0]
+        assert gap is False
+
+        rows, _, gap = storage.get_since('cpu', 3, limit=1)
+        assert [row['cpu_percent'] for row in rows] == [5.0]
+        assert gap is True
+
+        # 재시작 전 스토리지의 커서는 처음부터 다시 보냄
+        rows, _, gap = storage.get_since('cpu', 100)
+        assert len(rows) == 3
+        assert gap is True
+
+        storage.clear('cpu')
+        rows, next_seq, gap = storage.get_since('cpu', 6)
+        assert (rows, next_seq, gap) == ([], 7, True)
+
+    def test_get_since_columns(self):
+        """컬럼 형식으로 새 행을 반환하는지 테스트"""
+        storage = MemoryStorage()
+        for i in range(3):
+            storage.save_metric('cpu', {'cpu_percent': float(i)})
+
+        (timestamps, columns), next_seq, _ = storage.get_since('cpu', 1, columns=True)
+        assert len(timestamps) == 2
+        assert list(columns[('cpu_percent',)]) == [1.0, 2.0]
+        assert next_seq == 3
+
     def test_get_stats(self):
         """통계 조회 테스트"""
         storage = MemoryStorage()
@@ -188,3 +379,28 @@ class TestMemoryStorage:
         # 데이터가 정상적으로 저장되었는지 확인
         all_data = storage.get_range('cpu')
         assert len(all_data) > 0
+
+    def test_nested_metric_roundtrip(self):
+        """중첩된 메트릭 데이터가 그대로 복원되는지 테스트"""
+        storage = MemoryStorage()
+        data = {
+            'partitions': [{'device': '/dev/sda1', 'mountpoint': '/', 'total': 100,
+                            'used': 40, 'free': 60, 'percent': 40.0}],
+            'io_read_bytes': 1024,
+            'io_write_bytes': None,
+            'timestamp': datetime.now()
+        }
+        storage.save_metric('disk', dict(data))
+
+        assert storage.get_latest('disk') == data
+
+    def test_memory_usage(self):
+        """메트릭 타입별 메모리 사용량을 반환하는지 테스트"""
+        storage = MemoryStorage(max_data_points=10)
+        for i in range(3):
+            storage.save_metric('cpu', {'cpu_percent': float(i)})
+
+        usage = storage.get_memory_usage()
+
+        assert usage['cpu'] > 0
+        assert usage['memory'] == 0
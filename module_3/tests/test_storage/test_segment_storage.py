@@ -0,0 +1,232 @@
+"""세그먼트 스토리지 테스트"""
+import os
+
+import pytest
+from datetime import datetime, timedelta
+
+from app.storage.base import MetricStorage
+from app.storage.memory_storage import MemoryStorage
+from app.storage.segment_storage import SegmentStorage
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / 'segments')
+
+
+@pytest.fixture
+def storage(directory):
+    storage = SegmentStorage(directory)
+    yield storage
+    storage.close()
+
+
+def network_sample(value: int, timestamp: datetime) -> dict:
+    return {
+        'bytes_sent': value,
+        'interfaces': {'eth0': {'bytes_sent': value, 'is_up': True}},
+        'connections': [],
+        'timestamp': timestamp
+    }
+
+
+class TestSegmentStorage:
+    """세그먼트 스토리지 테스트 클래스"""
+
+    def test_implements_interface(self, storage):
+        """MetricStorage 인터페이스 구현 테스트"""
+        assert isinstance(storage, MetricStorage)
+
+    def test_save_and_get_latest(self, storage):
+        """중첩 구조, 상수 필드, 빈 컨테이너가 그대로 복원되는지 테스트"""
+        timestamp = datetime(2024, 1, 1)
+        assert storage.save_metric('network', network_sample(10, timestamp))
+        assert storage.save_metric('invalid_type', {'value': 1}) is False
+
+        latest = storage.get_latest('network')
+        assert latest == network_sample(10, timestamp)
+        assert storage.get_latest('cpu') is None
+
+    def test_get_range(self, storage):
+        """시간 범위와 limit 조회 테스트 (limit 초과 시 최근 행 우선, 시간순)"""
+        base = datetime(2024, 1, 1)
+        for i in range(10):
+            storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+
+        rows = storage.get_range('cpu', limit=3)
+        assert [row['cpu_percent'] for row in rows] == [7.0, 8.0, 9.0]
+
+        rows = storage.get_range('cpu', start=base + timedelta(seconds=2), end=base + timedelta(seconds=4))
+        assert [row['cpu_percent'] for row in rows] == [2.0, 3.0, 4.0]
+        assert rows[0]['timestamp'] == base + timedelta(seconds=2)
+
+    def test_rotates_on_shape_change(self, storage):
+        """필드 구성이나 상수 값이 바뀌면 새 세그먼트로 넘어가고 조회는 세그먼트를 이어서 하는지 테스트"""
+        base = datetime(2024, 1, 1)
+        storage.save_metric('cpu', {'cpu_percent': 1.0, 'cpu_count': 4, 'timestamp': base})
+        storage.save_metric('cpu', {'cpu_percent': 2.0, 'cpu_count': 4, 'timestamp': base + timedelta(seconds=1)})
+        storage.save_metric('cpu', {'cpu_percent': 3.0, 'timestamp': base + timedelta(seconds=2)})
+        storage.save_metric('cpu', {'cpu_percent': None, 'timestamp': base + timedelta(seconds=3)})
+
+        assert len(storage.get_segment_stats()['cpu']) == 2
+        rows = storage.get_range('cpu')
+        assert [row['cpu_percent'] for row in rows] == [1.0, 2.0, 3.0, None]
+        assert 'cpu_count' not in rows[2]
+
+        timestamps, columns = storage.get_columns('cpu', limit=3)
+        assert list(timestamps) == [(base + timedelta(seconds=i)).timestamp() for i in (1, 2, 3)]
+        # 누락 값이 있거나 일부 세그먼트에만 있는 필드는 제외
+        assert columns == {}
+
+        timestamps, columns = storage.get_columns('cpu', end=base + timedelta(seconds=2))
+        assert list(columns[('cpu_percent',)]) == [1.0, 2.0, 3.0]
+
+    def test_get_downsampled_matches_memory_storage(self, storage):
+        """세그먼트를 넘는 버킷 집계 결과가 MemoryStorage와 같은지 테스트"""
+        memory = MemoryStorage(max_data_points=1000)
+        base = datetime.fromtimestamp(1_700_000_400)  # 60초 경계
+        for i in range(300):
+            sample = network_sample(i, base + timedelta(seconds=i))
+            # 중간에 상수 필드가 바뀌어 세그먼트가 넘어감
+            sample['interfaces']['eth0']['is_up'] = i < 150
+            storage.save_metric('network', dict(sample))
+            memory.save_metric('network', dict(sample))
+
+        assert len(storage.get_segment_stats()['network']) == 2
+        for agg in ('avg', 'max', 'last'):
+            assert (storage.get_downsampled('network', step=60, agg=agg, limit=3)
+                    == memory.get_downsampled('network', step=60, agg=agg, limit=3))
+
+        buckets = storage.get_downsampled('network', step=60, agg='max')
+        assert [bucket['bytes_sent'] for bucket in buckets] == [59, 119, 179, 239, 299]
+        assert [bucket['interfaces']['eth0']['is_up'] for bucket in buckets] == [True, True, False, False, False]
+        assert buckets[0]['connections'] == []
+
+    def test_rotates_by_duration(self, directory):
+        """segment_duration이 지나면 새 세그먼트 파일을 시작하는지 테스트"""
+        storage = SegmentStorage(directory, segment_duration=0)
+        try:
+            for i in range(3):
+                storage.save_metric('memory', {'memory_percent': float(i)})
+            files = sorted(os.listdir(os.path.join(directory, 'memory')))
+            assert files == ['0000000000000001.seg', '0000000000000002.seg', '0000000000000003.seg']
+            assert [row['memory_percent'] for row in storage.get_range('memory', limit=2)] == [1.0, 2.0]
+        finally:
+            storage.close()
+
+    def test_mappings_are_bounded(self, directory):
+        """여러 세그먼트에 걸친 조회 후에도 매핑된 세그먼트 수가 제한되는지 테스트"""
+        storage = SegmentStorage(directory, segment_duration=0)
+        storage._maps.capacity = 4
+        try:
+            base = datetime.now() - timedelta(minutes=1)
+            for i in range(20):
+                storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+
+            assert [row['cpu_percent'] for row in storage.get_range('cpu')] == [float(i) for i in range(20)]
+            timestamps, columns = storage.get_columns('cpu', start=base + timedelta(seconds=5))
+            assert list(columns[('cpu_percent',)]) == [float(i) for i in range(5, 20)]
+
+            mapped = [segment for segment in storage._segments['cpu'] if segment._map is not None]
+            assert len(storage._maps) <= 4
+            assert len(mapped) <= 4
+        finally:
+            storage.close()
+
+    def test_get_since(self, storage):
+        """시퀀스 커서 이후의 행만 반환하는지 테스트"""
+        for i in range(5):
+            storage.save_metric('cpu', {'cpu_percent': float(i)})
+
+        rows, next_seq, gap = storage.get_since('cpu', 3)
+        assert [row['cpu_percent'] for row in rows] == [3.0, 4.0]
+        assert (next_seq, gap) == (5, False)
+
+        rows, _, gap = storage.get_since('cpu', 0, limit=2)
+        assert [row['cpu_percent'] for row in rows] == [3.0, 4.0]
+        assert gap is True
+
+        (timestamps, columns), _, _ = storage.get_since('cpu', 4, columns=True)
+        assert list(columns[('cpu_percent',)]) == [4.0]
+
+        rows, next_seq, gap = storage.get_since('cpu', 99)
+        assert (len(rows), next_seq, gap) == (5, 5, True)
+
+    def test_history_survives_restart(self, directory):
+        """다시 열어도 이력, 시퀀스 번호, epoch가 유지되는지 테스트"""
+        first = SegmentStorage(directory)
+        for i in range(3):
+            first.save_metric('cpu', {'cpu_percent': float(i)})
+        first.clear('memory')
+        epoch = first.epoch
+        first.close()
+
+        second = SegmentStorage(directory)
+        try:
+            assert [row['cpu_percent'] for row in second.get_range('cpu')] == [0.0, 1.0, 2.0]
+            assert second.get_sequence('cpu') == 3
+            assert second.get_sequence('memory') == 1
+            assert second.epoch == epoch
+
+            # 기존 세그먼트는 읽기 전용이므로 새 세그먼트에 이어서 기록
+            second.save_metric('cpu', {'cpu_percent': 3.0})
+            rows, next_seq, gap = second.get_since('cpu', 2)
+            assert [row['cpu_percent'] for row in rows] == [2.0, 3.0]
+            assert (next_seq, gap) == (4, False)
+            assert len(second.get_segment_stats()['cpu']) == 2
+        finally:
+            second.close()
+
+    def test_truncates_partial_record(self, directory):
+        """비정상 종료로 잘린 마지막 레코드를 버리고 여는지 테스트"""
+        first = SegmentStorage(directory)
+        for i in range(3):
+            first.save_metric('cpu', {'cpu_percent': float(i)})
+        first.close()
+
+        path = os.path.join(directory, 'cpu', '0000000000000001.seg')
+        with open(path, 'ab') as file:
+            file.write(b'\x00' * 5)
+
+        second = SegmentStorage(directory)
+        try:
+            assert second.get_stats()['cpu'] == 3
+            assert second.get_latest('cpu')['cpu_percent'] == 2.0
+        finally:
+            second.close()
+
+    def test_expire_unlinks_old_segments(self, directory, monkeypatch):
+        """보관 기간이 지난 세그먼트 파일이 삭제되는지 테스트"""
+        storage = SegmentStorage(directory, retention=3600, segment_duration=0)
+        try:
+            old = datetime.now() - timedelta(hours=2)
+            storage.save_metric('cpu', {'cpu_percent': 1.0, 'timestamp': old})
+            storage.save_metric('memory', {'memory_percent': 1.0})
+            version = storage.get_version('memory')
+            monkeypatch.setattr('app.storage.segment_storage._EXPIRE_INTERVAL', 0)
+            storage.save_metric('cpu', {'cpu_percent': 2.0})
+            # 만료된 타입만 버전이 바뀜 (시퀀스 번호와 별도)
+            assert storage.get_version('cpu').split('.')[1] == '1'
+            assert storage.get_version('memory') == version
+
+            assert os.listdir(os.path.join(directory, 'cpu')) == ['0000000000000002.seg']
+            assert [row['cpu_percent'] for row in storage.get_range('cpu')] == [2.0]
+
+            rows, _, gap = storage.get_since('cpu', 0)
+            assert len(rows) == 1 and gap is True
+        finally:
+            storage.close()
+
+    def test_clear(self, storage, directory):
+        """삭제 후 세그먼트 파일이 지워지고 시퀀스 번호가 증가하는지 테스트"""
+        storage.save_metric('cpu', {'cpu_percent': 1.0})
+        storage.save_metric('memory', {'memory_percent': 1.0})
+        storage.clear('cpu')
+
+        assert storage.get_latest('cpu') is None
+        assert storage.get_latest('memory') is not None
+        assert storage.get_sequence('cpu') == 2
+        assert os.listdir(os.path.join(directory, 'cpu')) == []
+
+        rows, next_seq, gap = storage.get_since('cpu', 1)
+        assert (rows, next_seq, gap) == ([], 2, True)
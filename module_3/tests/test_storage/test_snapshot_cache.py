@@ -0,0 +1,106 @@
+"""스냅샷 캐시 테스트"""
+import threading
+import time
+import pytest
+from app.storage.snapshot_cache import SnapshotCache
+
+
+class TestSnapshotCache:
+    """스냅샷 캐시 테스트 클래스"""
+
+    def test_empty_cache(self):
+        """비어 있는 캐시는 스냅샷이 없는지 테스트"""
+        cache = SnapshotCache()
+        assert cache.peek() is None
+        assert cache.get_fresh() is None
+
+    def test_update_and_get_fresh(self):
+        """갱신한 스냅샷을 그대로 반환하는지 테스트"""
+        cache = SnapshotCache(max_staleness=10.0)
+        snapshot = cache.update({'cpu': {'cpu_percent': 10.0}})
+
+        assert cache.get_fresh() is snapshot
+        assert snapshot.version == 1
+        assert snapshot.age() >= 0
+
+    def test_carried_types_keep_collection_time(self):
+        """이전 스냅샷에서 이어받은 타입은 원래 수집 시각을 유지하고 stale로 표시되는지 테스트"""
+        cache = SnapshotCache()
+        first = cache.update({'cpu': {'cpu_percent': 10.0}, 'disk': {'io_read_bytes': 1}})
+        time.sleep(0.02)
+        second = cache.update({'cpu': {'cpu_percent': 20.0}, 'disk': first.data['disk']}, carried=['disk'])
+
+        assert second.stale == ('disk',)
+        assert second.type_timestamps['disk'] == first.timestamp
+        assert second.type_timestamps['cpu'] == second.timestamp
+        assert second.age('disk') >= 0.02 > second.age('cpu')
+        assert second.age() == pytest.approx(second.age('disk'), abs=0.01)
+
+        # 다음 틱에도 수집되지 않으면 처음 수집 시각을 계속 유지
+        third = cache.update(dict(second.data), carried=['disk'])
+        assert third.type_timestamps['disk'] == first.timestamp
+        assert cache.update(dict(third.data)).stale == ()
+
+    def test_get_uses_fresh_snapshot(self):
+        """신선한 스냅샷이 있으면 refresh를 호출하지 않는지 테스트"""
+        cache = SnapshotCache(max_staleness=10.0)
+        cache.update({'cpu': {}})
+
+        def refresh():
+            raise AssertionError("refresh should not be called")
+
+        assert cache.get(refresh).data == {'cpu': {}}
+
+    def test_get_refreshes_stale_snapshot(self):
+        """오래된 스냅샷이면 refresh로 갱신하는지 테스트"""
+        cache = SnapshotCache(max_staleness=0.0)
+        cache.update({'value': 1})
+        time.sleep(0.01)
+
+        snapshot = cache.get(lambda: {'value': 2})
+        assert snapshot.data == {'value': 2}
+        assert snapshot.version == 2
+
+    def test_single_flight_refresh(self):
+        """동시 캐시 미스에서 refresh가 한 번만 호출되는지 테스트"""
+        cache = SnapshotCache(max_staleness=10.0)
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            time.sleep(0.05)
+            return {'value': len(calls)}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get(refresh)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(snapshot.data == {'value': 1} for snapshot in results)
+
+    def test_refresh_failure_serves_stale(self):
+        """refresh 실패 시 오래된 스냅샷을 반환하는지 테스트"""
+        cache = SnapshotCache(max_staleness=0.0)
+        cache.update({'value': 1})
+        time.sleep(0.01)
+
+        def refresh():
+            raise RuntimeError("collector failed")
+
+        assert cache.get(refresh).data == {'value': 1}
+
+    def test_refresh_failure_without_snapshot(self):
+        """스냅샷이 없을 때 refresh 실패는 예외를 전달하는지 테스트"""
+        cache = SnapshotCache()
+
+        def refresh():
+            raise RuntimeError("collector failed")
+
+        with pytest.raises(RuntimeError):
+            cache.get(refresh)
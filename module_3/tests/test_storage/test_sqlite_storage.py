@@ -0,0 +1,226 @@
+"""SQLite 스토리지 테스트"""
+import sqlite3
+import time
+
+import pytest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+from app.storage.base import MetricStorage
+from app.storage.memory_storage import MemoryStorage
+from app.storage.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'metrics.db')
+
+
+@pytest.fixture
+def storage(db_path):
+    # 테스트 중에는 쓰기 스레드가 먼저 기록하지 않도록 간격을 길게 설정
+    storage = SQLiteStorage(db_path, flush_interval=60)
+    yield storage
+    storage.close()
+
+
+class TestSQLiteStorage:
+    """SQLite 스토리지 테스트 클래스"""
+
+    def test_implements_interface(self, storage):
+        """두 스토리지가 같은 인터페이스를 구현하는지 테스트"""
+        assert isinstance(storage, MetricStorage)
+        assert isinstance(MemoryStorage(), MetricStorage)
+
+    def test_save_and_get_latest(self, storage):
+        """저장 직후(기록 전) 조회에서도 데이터가 보이는지 테스트"""
+        assert storage.save_metric('cpu', {'cpu_percent': 50.0, 'cpu_percent_per_core': [1.0, 2.0]})
+        assert storage.save_metric('invalid_type', {'value': 1}) is False
+
+        latest = storage.get_latest('cpu')
+        assert latest['cpu_percent'] == 50.0
+        assert latest['cpu_percent_per_core'] == [1.0, 2.0]
+        assert isinstance(latest['timestamp'], datetime)
+        assert storage.get_latest('memory') is None
+
+    def test_get_range(self, storage):
+        """시간 범위와 limit 조회 테스트 (limit 초과 시 최근 행 우선, 시간순)"""
+        base = datetime(2024, 1, 1)
+        for i in range(10):
+            storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+
+        rows = storage.get_range('cpu', limit=3)
+        assert [row['cpu_percent'] for row in rows] == [7.0, 8.0, 9.0]
+
+        rows = storage.get_range('cpu', start=base + timedelta(seconds=2), end=base + timedelta(seconds=4))
+        assert [row['cpu_percent'] for row in rows] == [2.0, 3.0, 4.0]
+        assert rows[0]['timestamp'] == base + timedelta(seconds=2)
+
+    def test_get_downsampled(self, storage):
+        """기본 구현의 버킷 집계 테스트"""
+        base = datetime.fromtimestamp(1_700_000_040)
+        for i in range(120):
+            storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+
+        buckets = storage.get_downsampled('cpu', step=60, agg='max')
+        assert [bucket['cpu_percent'] for bucket in buckets] == [59.0, 119.0]
+        assert buckets[0]['sample_count'] == 60
+
+    def test_get_downsampled_reads_only_limit_buckets(self, storage):
+        """limit이 있으면 최근 limit개 버킷 구간의 행만 읽는지 테스트"""
+        # 보관 기간 안의 60초 경계
+        base = datetime.fromtimestamp((time.time() // 60 - 20) * 60)
+        for i in range(600):
+            storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+
+        with patch.object(storage, 'get_range', wraps=storage.get_range) as get_range:
+            buckets = storage.get_downsampled('cpu', step=60, agg='max', limit=2)
+
+        start = get_range.call_args.kwargs['start']
+        assert start == base + timedelta(seconds=480)
+
+        assert [bucket['cpu_percent'] for bucket in buckets] == [539.0, 599.0]
+        assert [bucket['sample_count'] for bucket in buckets] == [60, 60]
+
+    def test_get_since(self, storage):
+        """시퀀스 커서 이후의 행만 반환하는지 테스트"""
+        for i in range(5):
+            storage.save_metric('cpu', {'cpu_percent': float(i)})
+
+        rows, next_seq, gap = storage.get_since('cpu', 3)
+        assert [row['cpu_percent'] for row in rows] == [3.0, 4.0]
+        assert (next_seq, gap) == (5, False)
+
+        rows, _, gap = storage.get_since('cpu', 0, limit=2)
+        assert [row['cpu_percent'] for row in rows] == [3.0, 4.0]
+        assert gap is True
+
+        (timestamps, columns), _, _ = storage.get_since('cpu', 4, columns=True)
+        assert list(columns[('cpu_percent',)]) == [4.0]
+
+    def test_get_since_keeps_cursor_on_failed_flush(self, storage):
+        """기록에 실패한 샘플을 건너뛰지 않고 다음 조회에서 돌려주는지 테스트"""
+        storage.save_metric('cpu', {'cpu_percent': 1.0})
+        storage.flush()
+        storage.save_metric('cpu', {'cpu_percent': 2.0})
+
+        writer = storage._writer
+
+        class FailingWriter:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def executemany(self, *args):
+                raise sqlite3.OperationalError('database is locked')
+
+        storage._writer = FailingWriter()
+        try:
+            rows, next_seq, gap = storage.get_since('cpu', 0)
+        finally:
+            storage._writer = writer
+        assert [row['cpu_percent'] for row in rows] == [1.0]
+        assert (next_seq, gap) == (1, False)
+
+        rows, next_seq, gap = storage.get_since('cpu', next_seq)
+        assert [row['cpu_percent'] for row in rows] == [2.0]
+        assert (next_seq, gap) == (2, False)
+
+    def test_writes_are_batched(self, storage):
+        """여러 샘플이 한 트랜잭션으로 기록되는지 테스트"""
+        for i in range(100):
+            storage.save_metric('memory', {'memory_percent': float(i)})
+
+        assert storage.get_write_stats()['pending'] == 100
+        assert storage.flush() == 100
+
+        stats = storage.get_write_stats()
+        assert stats['batches'] == 1
+        assert stats['written'] == 100
+        assert storage.get_stats()['memory'] == 100
+
+    def test_history_survives_restart(self, db_path):
+        """다시 열어도 이력, 시퀀스 번호, epoch가 유지되는지 테스트"""
+        first = SQLiteStorage(db_path, flush_interval=60)
+        for i in range(3):
+            first.save_metric('cpu', {'cpu_percent': float(i)})
+        first.clear('memory')
+        epoch = first.epoch
+        first.close()  # 남은 샘플 기록
+
+        second = SQLiteStorage(db_path, flush_interval=60)
+        try:
+            assert [row['cpu_percent'] for row in second.get_range('cpu')] == [0.0, 1.0, 2.0]
+            assert second.get_sequence('cpu') == 3
+            assert second.get_sequence('memory') == 1
+            assert second.epoch == epoch
+
+            second.save_metric('cpu', {'cpu_percent': 3.0})
+            rows, next_seq, gap = second.get_since('cpu', 3)
+            assert [row['cpu_percent'] for row in rows] == [3.0]
+            assert (next_seq, gap) == (4, False)
+        finally:
+            second.close()
+
+    def test_clear(self, storage):
+        """삭제 후 시퀀스 번호가 증가하고 대기 중인 샘플도 버려지는지 테스트"""
+        storage.save_metric('cpu', {'cpu_percent': 1.0})
+        storage.save_metric('memory', {'memory_percent': 1.0})
+        storage.clear('cpu')
+
+        assert storage.get_latest('cpu') is None
+        assert storage.get_latest('memory') is not None
+        assert storage.get_sequence('cpu') == 2
+
+        rows, next_seq, gap = storage.get_since('cpu', 1)
+        assert (rows, next_seq, gap) == ([], 2, True)
+
+    def test_expire_changes_version(self, db_path):
+        """보관 기간 만료로 행이 삭제되면 버전(ETag)이 바뀌고 재시작 후에도 유지되는지 테스트"""
+        storage = SQLiteStorage(db_path, retention=3600, flush_interval=60)
+        try:
+            now = datetime.now()
+            storage.save_metric('cpu', {'cpu_percent': 1.0, 'timestamp': now - timedelta(hours=2)})
+            storage.save_metric('cpu', {'cpu_percent': 2.0, 'timestamp': now})
+            storage.save_metric('memory', {'memory_percent': 1.0, 'timestamp': now})
+            storage.flush()
+            cpu_version, memory_version = storage.get_version('cpu'), storage.get_version('memory')
+
+            storage._last_expire = 0.0
+            storage._expire()
+
+            assert [row['cpu_percent'] for row in storage.get_range('cpu')] == [2.0]
+            assert storage.get_sequence('cpu') == 2
+            assert storage.get_version('cpu') != cpu_version
+            assert storage.get_version('memory') == memory_version
+            expired_version = storage.get_version('cpu')
+        finally:
+            storage.close()
+
+        reopened = SQLiteStorage(db_path, retention=3600, flush_interval=60)
+        try:
+            assert reopened.get_version('cpu') == expired_version
+        finally:
+            reopened.close()
+
+    def test_background_flush(self, db_path):
+        """쓰기 스레드가 주기적으로 기록하는지 테스트"""
+        storage = SQLiteStorage(db_path, flush_interval=0.01)
+        try:
+            storage.save_metric('cpu', {'cpu_percent': 1.0})
+            for _ in range(100):
+                if storage.get_write_stats()['written']:
+                    break
+                time.sleep(0.01)
+            assert storage.get_write_stats()['written'] == 1
+        finally:
+            storage.close()
+
+    def test_closed_storage_rejects_writes(self, db_path):
+        """닫힌 스토리지는 저장하지 않는지 테스트"""
+        storage = SQLiteStorage(db_path)
+        storage.close()
+
+        assert storage.save_metric('cpu', {'cpu_percent': 1.0}) is False
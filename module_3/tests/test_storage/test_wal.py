@@ -0,0 +1,135 @@
+"""WAL과 인메모리 스토리지 복원 테스트"""
+import os
+
+import pytest
+from datetime import datetime, timedelta
+
+from app.storage.memory_storage import MemoryStorage
+from app.storage.wal import WriteAheadLog
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / 'wal')
+
+
+def open_storage(directory: str, **kwargs) -> MemoryStorage:
+    storage = MemoryStorage(wal=WriteAheadLog(directory), **kwargs)
+    storage.restore()
+    return storage
+
+
+class TestWriteAheadLog:
+    """WAL 테스트 클래스"""
+
+    def test_replay_records(self, directory):
+        """기록한 레코드를 순서대로 재생하는지 테스트"""
+        wal = WriteAheadLog(directory)
+        wal.append(('save', 'cpu', 1.0, {'cpu_percent': 1.0}))
+        wal.append(('clear', None))
+        wal.close()
+
+        reopened = WriteAheadLog(directory)
+        assert list(reopened.replay()) == [('save', 'cpu', 1.0, {'cpu_percent': 1.0}), ('clear', None)]
+        assert reopened.generation == 2
+        reopened.close()
+
+    def test_truncates_damaged_tail(self, directory):
+        """잘린 마지막 레코드는 버리고 파일을 잘라내는지 테스트"""
+        wal = WriteAheadLog(directory)
+        wal.append(('save', 'cpu', 1.0, {'cpu_percent': 1.0}))
+        wal.append(('save', 'cpu', 2.0, {'cpu_percent': 2.0}))
+        wal.close()
+
+        path = os.path.join(directory, 'wal-00000001.log')
+        os.truncate(path, os.path.getsize(path) - 3)
+
+        reopened = WriteAheadLog(directory)
+        assert [record[2] for record in reopened.replay()] == [1.0]
+        assert [record[2] for record in reopened.replay()] == [1.0]
+        reopened.close()
+
+    def test_unserializable_record(self, directory):
+        """직렬화할 수 없는 값은 기록하지 않고 오류만 집계하는지 테스트"""
+        wal = WriteAheadLog(directory)
+        assert wal.append(('save', 'cpu', 1.0, {'value': object()})) is False
+        assert wal.get_stats()['errors'] == 1
+        wal.close()
+
+    def test_snapshot_removes_old_generations(self, directory):
+        """스냅샷 기록 후 이전 세대 로그가 삭제되는지 테스트"""
+        wal = WriteAheadLog(directory)
+        wal.append(('clear', None))
+        generation = wal.rotate()
+        wal.write_snapshot({'value': 1}, generation)
+
+        assert sorted(os.listdir(directory)) == ['snapshot.bin', 'wal-00000002.log']
+        snapshot = wal.load_snapshot()
+        assert (snapshot['generation'], snapshot['state']) == (2, {'value': 1})
+        wal.close()
+
+
+class TestMemoryStorageRestore:
+    """WAL을 사용하는 메모리 스토리지 복원 테스트 클래스"""
+
+    def test_restore_from_log(self, directory):
+        """스냅샷 없이 로그만으로 버퍼와 시퀀스 번호를 복원하는지 테스트"""
+        storage = MemoryStorage(wal=WriteAheadLog(directory))
+        base = datetime(2024, 1, 1)
+        for i in range(3):
+            storage.save_metric('cpu', {'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+        storage.save_metric('memory', {'memory_percent': 1.0, 'timestamp': base})
+        storage.clear('memory')
+        storage.wal.close()  # 비정상 종료 (스냅샷 없음)
+
+        restored = MemoryStorage(wal=WriteAheadLog(directory))
+        assert restored.restore() == 5
+        assert [row['cpu_percent'] for row in restored.get_range('cpu')] == [0.0, 1.0, 2.0]
+        assert restored.get_range('cpu')[0]['timestamp'] == base
+        assert restored.get_latest('memory') is None
+        assert restored.get_sequence('cpu') == 3
+        assert restored.get_sequence('memory') == 2
+        restored.close()
+
+    def test_restore_from_snapshot_and_tail(self, directory):
+        """스냅샷과 이후 로그를 합쳐 원본, 롤업 계층, 진행 중인 버킷까지 복원하는지 테스트"""
+        storage = open_storage(directory, max_data_points=50)
+        base = datetime.fromtimestamp(1_700_000_040)
+        sample = {'cpu_percent_per_core': [], 'cpu_count_logical': 8}
+        for i in range(90):
+            storage.save_metric('cpu', {**sample, 'cpu_percent': float(i), 'timestamp': base + timedelta(seconds=i)})
+            if i == 59:
+                assert storage.compact()
+        expected = storage.get_range('cpu')
+        expected_rollup = storage.get_range('cpu', start=base - timedelta(days=1))
+        storage.wal.close()
+
+        restored = MemoryStorage(max_data_points=50, wal=WriteAheadLog(directory))
+        assert restored.restore() == 30
+        assert restored.get_range('cpu') == expected
+        assert restored.get_range('cpu', start=base - timedelta(days=1)) == expected_rollup
+        assert restored.get_sequence('cpu') == 90
+
+        # 진행 중이던 1분 버킷에 이어서 집계
+        restored.save_metric('cpu', {**sample, 'cpu_percent': 90.0, 'timestamp': base + timedelta(seconds=90)})
+        buckets = restored.get_range('cpu', start=base - timedelta(days=1))
+        assert buckets[-1]['sample_count'] == 31
+        restored.close()
+
+    def test_close_writes_snapshot(self, directory):
+        """종료 시 스냅샷을 남겨 다음 시작에서는 로그를 재생하지 않는지 테스트"""
+        storage = open_storage(directory)
+        storage.save_metric('memory', {'memory_percent': 42.0})
+        storage.close()
+
+        restored = MemoryStorage(wal=WriteAheadLog(directory))
+        assert restored.restore() == 0
+        assert restored.get_latest('memory')['memory_percent'] == 42.0
+        restored.close()
+
+    def test_without_wal(self):
+        """WAL이 없으면 복원/스냅샷이 아무 일도 하지 않는지 테스트"""
+        storage = MemoryStorage()
+        assert storage.restore() == 0
+        assert storage.compact() is False
+        storage.close()
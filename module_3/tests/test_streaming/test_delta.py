@@ -0,0 +1,36 @@
+"""스냅샷 델타 테스트"""
+from app.streaming.delta import diff, apply_delta
+
+
+class TestDiff:
+    """diff/apply_delta 테스트"""
+
+    def test_unchanged_fields_are_omitted(self):
+        """변하지 않은 필드는 델타에 포함되지 않는지 테스트"""
+        previous = {'cpu': {'cpu_percent': 10.0, 'cpu_count_logical': 8, 'cpu_percent_per_core': [1.0, 2.0]}}
+        current = {'cpu': {'cpu_percent': 12.5, 'cpu_count_logical': 8, 'cpu_percent_per_core': [1.0, 3.0]}}
+
+        changes, removed = diff(previous, current)
+
+        assert changes == [(('cpu', 'cpu_percent'), 12.5), (('cpu', 'cpu_percent_per_core', 1), 3.0)]
+        assert removed == []
+
+    def test_added_removed_and_resized(self):
+        """키 추가/삭제와 길이가 바뀐 리스트 처리 테스트"""
+        previous = {'network': {'interfaces': {'eth0': {'bytes_sent': 1}, 'wlan0': {'bytes_sent': 2}}},
+                    'disk': {'partitions': [{'used': 1}]}}
+        current = {'network': {'interfaces': {'eth0': {'bytes_sent': 1}, 'docker0': {'bytes_sent': 0}}},
+                   'disk': {'partitions': [{'used': 1}, {'used': 2}]}}
+
+        changes, removed = diff(previous, current)
+
+        assert (('network', 'interfaces', 'docker0'), {'bytes_sent': 0}) in changes
+        assert (('disk', 'partitions'), [{'used': 1}, {'used': 2}]) in changes
+        assert removed == [('network', 'interfaces', 'wlan0')]
+        assert apply_delta(previous, changes, removed) == current
+
+    def test_type_change_is_replaced(self):
+        """같은 값이라도 타입이 바뀌면 교체되는지 테스트"""
+        changes, _ = diff({'a': 1}, {'a': 1.0})
+
+        assert changes == [(('a',), 1.0)]
@@ -0,0 +1,131 @@
+"""스트림 허브 테스트"""
+import asyncio
+import json
+import threading
+
+from app.storage.snapshot_cache import Snapshot
+from app.streaming.hub import StreamHub, Subscription, encode_snapshot
+
+
+def make_snapshot(version: int = 1) -> Snapshot:
+    return Snapshot({
+        'cpu': {'cpu_percent': float(version)},
+        'memory': {'memory_percent': 50.0},
+    }, version)
+
+
+class TestEncodeSnapshot:
+    """스냅샷 인코딩 테스트"""
+
+    def test_encode_selected_types(self):
+        """선택한 메트릭 타입만 포함하는지 테스트"""
+        frame = json.loads(encode_snapshot(make_snapshot(3), {'cpu'}))
+
+        assert frame['type'] == 'snapshot'
+        assert frame['version'] == 3
+        assert frame['metrics'] == {'cpu': {'cpu_percent': 3.0}}
+        assert isinstance(frame['timestamp'], str)
+
+
+class TestSubscription:
+    """구독 큐 테스트"""
+
+    def test_drop_oldest_when_full(self):
+        """큐가 가득 차면 가장 오래된 프레임을 버리는지 테스트"""
+        async def scenario():
+            subscription = Subscription(frozenset({'cpu'}), queue_size=2)
+            for frame in ('a', 'b', 'c'):
+                subscription.offer(frame)
+            return subscription.dropped, [await subscription.next(), await subscription.next()]
+
+        dropped, frames = asyncio.run(scenario())
+        assert dropped == 1
+        assert frames == ['b', 'c']
+
+    def test_next_timeout(self):
+        """타임아웃 시 None을 반환하는지 테스트"""
+        async def scenario():
+            subscription = Subscription(frozenset({'cpu'}), queue_size=1)
+            return await subscription.next(timeout=0.01)
+
+        assert asyncio.run(scenario()) is None
+
+
+class TestStreamHub:
+    """스트림 허브 테스트"""
+
+    def test_subscribe_receives_latest(self):
+        """구독 직후 최신 스냅샷을 받는지 테스트"""
+        hub = StreamHub()
+        hub.publish(make_snapshot(1))
+
+        async def scenario():
+            subscription = hub.subscribe(['cpu'])
+            return json.loads(await subscription.next(timeout=1))
+
+        assert asyncio.run(scenario())['version'] == 1
+
+    def test_publish_from_thread_encodes_once_per_type_set(self):
+        """다른 스레드의 publish가 구독 조합당 한 번만 인코딩되는지 테스트"""
+        hub = StreamHub()
+
+        async def scenario():
+            cpu_a = hub.subscribe(['cpu'])
+            cpu_b = hub.subscribe(['cpu'])
+            both = hub.subscribe(['cpu', 'memory'])
+
+            thread = threading.Thread(target=hub.publish, args=(make_snapshot(2),))
+            thread.start()
+            thread.join()
+
+            frames = [await sub.next(timeout=1) for sub in (cpu_a, cpu_b, both)]
+            for sub in (cpu_a, cpu_b, both):
+                hub.unsubscribe(sub)
+            return frames
+
+        frames = asyncio.run(scenario())
+        assert frames[0] is frames[1]  # 같은 조합은 같은 프레임 객체를 공유
+        assert set(json.loads(frames[2])['metrics']) == {'cpu', 'memory'}
+
+        stats = hub.get_stats()
+        assert stats['encoded'] == 2
+        assert stats['subscribers'] == 0
+
+    def test_delta_subscription(self):
+        """델타 구독이 키프레임 후 변경분만 받고 주기적으로 키프레임을 받는지 테스트"""
+        hub = StreamHub(keyframe_interval=3)
+        hub.publish(make_snapshot(1))
+
+        async def scenario():
+            subscription = hub.subscribe(['cpu', 'memory'], encoding='delta')
+            frames = [json.loads(await subscription.next(timeout=1))]
+            for version in (2, 3):
+                hub.publish(make_snapshot(version))
+                frames.append(json.loads(await subscription.next(timeout=1)))
+            return frames
+
+        keyframe, delta, periodic = asyncio.run(scenario())
+        assert keyframe['type'] == 'keyframe'
+        assert delta['type'] == 'delta'
+        assert delta['base'] == 1
+        assert delta['set'] == [[['cpu', 'cpu_percent'], 2.0]]  # memory는 변하지 않음
+        assert periodic['type'] == 'keyframe'
+        assert periodic['version'] == 3
+
+    def test_delta_resync_after_overflow(self):
+        """느린 델타 구독자는 프레임을 버리고 키프레임으로 재동기화하는지 테스트"""
+        hub = StreamHub(queue_size=2, keyframe_interval=100)
+        hub.publish(make_snapshot(1))
+
+        async def scenario():
+            subscription = hub.subscribe(['cpu'], encoding='delta')
+            for version in (2, 3, 4):
+                hub.publish(make_snapshot(version))
+            await asyncio.sleep(0.05)  # call_soon_threadsafe로 예약된 전달 처리
+            return [json.loads(subscription.queue.get_nowait()) for _ in range(subscription.queue.qsize())]
+
+        frames = asyncio.run(scenario())
+        assert [frame['type'] for frame in frames] == ['keyframe', 'delta']
+        assert frames[0]['version'] == 3
+        assert frames[1]['base'] == 3
+        assert hub.get_stats()['resyncs'] == 1
@@ -0,0 +1,100 @@
+"""자체 계측 테스트"""
+import random
+import threading
+import time
+
+from app.collectors.pipeline import CollectionPipeline
+from app.storage.memory_storage import MemoryStorage
+from app.utils.instrumentation import Instrumentation, LatencyHistogram, TimedLock
+
+
+class FastCollector:
+    """즉시 반환하는 테스트용 수집기"""
+
+    def collect(self):
+        return {'value': 1}
+
+
+class TestLatencyHistogram:
+    """히스토그램 테스트 클래스"""
+
+    def test_percentiles(self):
+        """백분위가 실제 값 이상, 1/16 오차 이내인지 테스트"""
+        rng = random.Random(0)
+        values = sorted(rng.lognormvariate(-7, 1.5) for _ in range(10000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 90, 99, 99.9):
+            exact = values[int(len(values) * percent / 100) - 1]
+            reported = histogram.percentile(percent)
+            assert exact <= reported <= exact * (1 + 1 / 16) + 1e-12
+
+        summary = histogram.to_dict()
+        assert summary['count'] == 10000
+        assert summary['max'] == values[-1]
+        assert histogram.percentile(100) == values[-1]
+
+    def test_extremes(self):
+        """기록이 없을 때와 범위를 벗어난 값 테스트"""
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        assert histogram.to_dict()['mean'] is None
+
+        for value in (0.0, 1e-12, 1e6):
+            histogram.record(value)
+        assert histogram.count == 3
+        assert histogram.percentile(100) == 1e6
+
+
+class TestInstrumentation:
+    """계측 지점 테스트 클래스"""
+
+    def test_disabled(self):
+        """비활성화하면 히스토그램을 만들지 않고 원래 잠금을 그대로 쓰는지 테스트"""
+        instrumentation = Instrumentation(enabled=False)
+        lock = threading.Lock()
+
+        assert instrumentation.histogram('route', 'GET /') is None
+        assert TimedLock(lock, instrumentation, 'storage')('get_range') is lock
+        assert TimedLock(lock, None, 'storage')('get_range') is lock
+        assert instrumentation.get_timings() == {}
+
+    def test_timed_lock_wait_and_hold(self):
+        """다른 스레드가 잠금을 쥐고 있으면 대기 시간이, 쥐고 있는 동안은 보유 시간이 기록되는지 테스트"""
+        instrumentation = Instrumentation()
+        timed = TimedLock(threading.Lock(), instrumentation, 'storage')
+        held = threading.Event()
+
+        def holder():
+            with timed('compact'):
+                held.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait()
+        with timed('get_range'):
+            pass
+        thread.join()
+
+        timings = instrumentation.get_timings('storage')['storage']
+        assert timings['compact.hold']['max'] >= 0.04
+        assert timings['get_range.wait']['max'] >= 0.02
+        assert timings['get_range.hold']['max'] < 0.02
+
+    def test_storage_and_pipeline(self):
+        """스토리지 메서드별 잠금 시간과 수집기별 collect() 시간이 기록되는지 테스트"""
+        instrumentation = Instrumentation()
+        storage = MemoryStorage(instrumentation=instrumentation)
+        storage.save_metric('cpu', {'cpu_percent': 10.0})
+        storage.get_range('cpu')
+        pipeline = CollectionPipeline({'cpu': FastCollector()}, instrumentation=instrumentation)
+        pipeline.run()
+        pipeline.shutdown()
+
+        timings = instrumentation.get_timings()
+        assert timings['storage']['save_metric.hold']['count'] == 1
+        assert timings['storage']['get_range.wait']['count'] == 1
+        assert timings['collector']['cpu']['count'] == 1